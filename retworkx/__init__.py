@@ -136,6 +136,8 @@ def distance_matrix(graph, parallel_threshold=300):
     defaults to 300). If the function will be running in parallel the env var
     ``RAYON_NUM_THREADS`` can be used to adjust how many threads will be used.
 
+    This function can release the GIL while it runs, see :ref:`gil-release`.
+
     :param graph: The graph to get the distance matrix for, can be either a
         :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`.
     :param int parallel_threshold: The number of nodes to calculate the
@@ -190,6 +192,8 @@ def adjacency_matrix(graph, weight_fn=None, default_weight=1.0):
         to cast the edge object as a float as the weight. If this is not
         specified a default value (either ``default_weight`` or 1) will be used
         for all edges.
+        It can also be an edge data key or a weight array, see
+        :ref:`edge-weights`.
     :param float default_weight: If ``weight_fn`` is not used this can be
         optionally used to specify a default weight to use for all edges.
 
@@ -213,6 +217,47 @@ def _graph_adjacency_matrix(graph, weight_fn=None, default_weight=1.0):
     )
 
 
+@functools.singledispatch
+def sparse_adjacency_matrix(graph, weight_fn=None, default_weight=1.0):
+    """Return the adjacency matrix for a graph object as sparse CSR arrays
+
+    This returns the same matrix as :func:`~retworkx.adjacency_matrix` but in
+    compressed sparse row (CSR) form, so the memory used scales with the
+    number of edges instead of the square of the number of nodes. In the case
+    where there are multiple edges between nodes the value in the output
+    matrix will be the sum of the edges' weights.
+
+    :param graph: The graph used to generate the adjacency matrix from. Can
+        either be a :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
+    :param weight_fn: A callable object (function, lambda, etc) which
+        will be passed the edge object and expected to return a ``float``.
+        It can also be an edge data key or a weight array, see
+        :ref:`edge-weights`. If this is not specified ``default_weight`` will
+        be used for all edges.
+    :param float default_weight: If ``weight_fn`` is not used this can be
+        optionally used to specify a default weight to use for all edges.
+
+    :return: A tuple ``(data, indices, indptr)`` of numpy arrays which can be
+        passed directly to :class:`scipy.sparse.csr_matrix`
+    :rtype: tuple
+    """
+    raise TypeError("Invalid Input Type %s for graph" % type(graph))
+
+
+@sparse_adjacency_matrix.register(PyDiGraph)
+def _digraph_sparse_adjacency_matrix(graph, weight_fn=None, default_weight=1.0):
+    return digraph_sparse_adjacency_matrix(
+        graph, weight_fn=weight_fn, default_weight=default_weight
+    )
+
+
+@sparse_adjacency_matrix.register(PyGraph)
+def _graph_sparse_adjacency_matrix(graph, weight_fn=None, default_weight=1.0):
+    return graph_sparse_adjacency_matrix(
+        graph, weight_fn=weight_fn, default_weight=default_weight
+    )
+
+
 @functools.singledispatch
 def all_simple_paths(graph, from_, to, min_depth=None, cutoff=None):
     """Return all simple paths between 2 nodes in a PyGraph object
@@ -269,6 +314,8 @@ def floyd_warshall(
     environment variable. For example, setting ``RAYON_NUM_THREADS=4`` would
     limit the thread pool to 4 threads if parallelization was enabled.
 
+    This function can release the GIL while it runs, see :ref:`gil-release`.
+
     :param graph: The graph to run Floyd's algorithm on. Can
         either be a :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
     :param callable weight_fn: A callable object (function, lambda, etc) which
@@ -285,6 +332,8 @@ def floyd_warshall(
         to cast the edge object as a float as the weight. If this is not
         specified a default value (either ``default_weight`` or 1) will be used
         for all edges.
+        It can also be an edge data key or a weight array, see
+        :ref:`edge-weights`.
     :param float default_weight: If ``weight_fn`` is not used this can be
         optionally used to specify a default weight to use for all edges.
     :param int parallel_threshold: The number of nodes to execute
@@ -355,6 +404,8 @@ def floyd_warshall_numpy(
     environment variable. For example, setting ``RAYON_NUM_THREADS=4`` would
     limit the thread pool to 4 threads if parallelization was enabled.
 
+    This function can release the GIL while it runs, see :ref:`gil-release`.
+
     :param graph: The graph to run Floyd's algorithm on. Can
         either be a :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
     :param callable weight_fn: A callable object (function, lambda, etc) which
@@ -371,6 +422,8 @@ def floyd_warshall_numpy(
         to cast the edge object as a float as the weight. If this is not
         specified a default value (either ``default_weight`` or 1) will be used
         for all edges.
+        It can also be an edge data key or a weight array, see
+        :ref:`edge-weights`.
     :param float default_weight: If ``weight_fn`` is not used this can be
         optionally used to specify a default weight to use for all edges.
     :param int parallel_threshold: The number of nodes to execute
@@ -422,6 +475,8 @@ def astar_shortest_path(graph, node, goal_fn, edge_cost_fn, estimate_cost_fn):
     :param edge_cost_fn: A python callable that will take in 1 parameter, an
         edge's data object and will return a float that represents the cost
         of that edge. It must be non-negative.
+        It can also be an edge data key or a weight array, see
+        :ref:`edge-weights`.
     :param estimate_cost_fn: A python callable that will take in 1 parameter, a
         node's data object and will return a float which represents the
         estimated cost for the next node. The return must be non-negative. For
@@ -474,7 +529,9 @@ def dijkstra_shortest_paths(
     :param int target: An optional target to find a path to
     :param weight_fn: An optional weight function for an edge. It will accept
         a single argument, the edge's weight object and will return a float
-        which will be used to represent the weight/cost of the edge
+        which will be used to represent the weight/cost of the edge.
+        It can also be an edge data key or a weight array, see
+        :ref:`edge-weights`.
     :param float default_weight: If ``weight_fn`` isn't specified this optional
         float value will be used for the weight/cost of each edge.
     :param bool as_undirected: If set to true the graph will be treated as
@@ -531,12 +588,16 @@ def all_pairs_dijkstra_shortest_paths(graph, edge_cost_fn):
     environment variable. For example, setting ``RAYON_NUM_THREADS=4`` would
     limit the thread pool to 4 threads.
 
+    This function can release the GIL while it runs, see :ref:`gil-release`.
+
     :param graph: The input graph to use. Can either be a
         :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
     :param edge_cost_fn: A callable object that acts as a weight function for
         an edge. It will accept a single positional argument, the edge's weight
         object and will return a float which will be used to represent the
-        weight/cost of the edge
+        weight/cost of the edge.
+        It can also be an edge data key or a weight array, see
+        :ref:`edge-weights`.
 
     :return: A read-only dictionary of paths. The keys are destination node
         indices and the values are a dict of target node indices and a list
@@ -574,12 +635,16 @@ def all_pairs_dijkstra_path_lengths(graph, edge_cost_fn):
     environment variable. For example, setting ``RAYON_NUM_THREADS=4`` would
     limit the thread pool to 4 threads.
 
+    This function can release the GIL while it runs, see :ref:`gil-release`.
+
     :param graph: The input graph to use. Can either be a
         :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
     :param edge_cost_fn: A callable object that acts as a weight function for
         an edge. It will accept a single positional argument, the edge's weight
         object and will return a float which will be used to represent the
-        weight/cost of the edge
+        weight/cost of the edge.
+        It can also be an edge data key or a weight array, see
+        :ref:`edge-weights`.
 
     :return: A read-only dictionary of path lengths. The keys are the source
         node indices and the values are a dict of the target node and the
@@ -606,6 +671,328 @@ def _graph_all_pairs_dijkstra_path_lengths(graph, edge_cost_fn):
     return graph_all_pairs_dijkstra_path_lengths(graph, edge_cost_fn)
 
 
+@functools.singledispatch
+def all_pairs_dijkstra_path_lengths_numpy(graph, edge_cost_fn):
+    """Find the shortest path lengths between all nodes as a distance matrix
+
+    This computes the same path lengths as
+    :func:`~retworkx.all_pairs_dijkstra_path_lengths` but returns them as a
+    dense numpy array instead of a mapping of mappings, which for large graphs
+    uses much less memory. A Dijkstra search is run from each node and writes
+    its lengths directly into the matching row of the matrix. This function is
+    multithreaded and will launch a thread pool with threads equal to the
+    number of CPUs by default. You can tune the number of threads with the
+    ``RAYON_NUM_THREADS`` environment variable. For example, setting
+    ``RAYON_NUM_THREADS=4`` would limit the thread pool to 4 threads.
+
+    Like :func:`~retworkx.floyd_warshall_numpy` the rows and columns are in
+    node index order with the indices of removed nodes skipped, the diagonal
+    is ``0`` and the entry for a pair of nodes without a path is ``np.inf``.
+
+    This function can release the GIL while it runs, see :ref:`gil-release`.
+
+    :param graph: The input graph to use. Can either be a
+        :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
+    :param edge_cost_fn: A callable object that acts as a weight function for
+        an edge. It will accept a single positional argument, the edge's weight
+        object and will return a float which will be used to represent the
+        weight/cost of the edge.
+        It can also be an edge data key or a weight array, see
+        :ref:`edge-weights`.
+
+    :returns: A matrix of shortest path lengths between nodes
+    :rtype: numpy.ndarray
+    """
+    raise TypeError("Invalid Input Type %s for graph" % type(graph))
+
+
+@all_pairs_dijkstra_path_lengths_numpy.register(PyDiGraph)
+def _digraph_all_pairs_dijkstra_path_lengths_numpy(graph, edge_cost_fn):
+    return digraph_all_pairs_dijkstra_path_lengths_numpy(graph, edge_cost_fn)
+
+
+@all_pairs_dijkstra_path_lengths_numpy.register(PyGraph)
+def _graph_all_pairs_dijkstra_path_lengths_numpy(graph, edge_cost_fn):
+    return graph_all_pairs_dijkstra_path_lengths_numpy(graph, edge_cost_fn)
+
+
+@functools.singledispatch
+def all_pairs_dijkstra_predecessors(graph, edge_cost_fn):
+    """Find the shortest paths between all nodes as a predecessor matrix
+
+    This finds the same paths as
+    :func:`~retworkx.all_pairs_dijkstra_shortest_paths` but instead of storing
+    every path it returns a dense numpy array where the entry in row ``i`` and
+    column ``j`` is the node before ``j`` on the shortest path from ``i`` to
+    ``j``. This only needs memory quadratic in the number of nodes, and any
+    single path can be rebuilt with :func:`~retworkx.path_from_predecessors`.
+    The searches from each node run in parallel, you can tune the number of
+    threads with the ``RAYON_NUM_THREADS`` environment variable.
+
+    Like :func:`~retworkx.all_pairs_dijkstra_path_lengths_numpy` the rows and
+    columns, and the values of the entries, are positions in node index order
+    with the indices of removed nodes skipped. These are the node indices
+    themselves unless nodes have been removed from the graph, in which case
+    ``graph.node_indexes()[position]`` is the node index at a position. The
+    diagonal and the entries for pairs of nodes without a path are ``-1``.
+
+    For example::
+
+        import retworkx
+
+        graph = retworkx.generators.path_graph(5)
+        predecessors = retworkx.all_pairs_dijkstra_predecessors(
+            graph, lambda _: 1.0
+        )
+        path = retworkx.path_from_predecessors(predecessors, 4, 1)
+
+    This function can release the GIL while it runs, see :ref:`gil-release`.
+
+    :param graph: The input graph to use. Can either be a
+        :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
+    :param edge_cost_fn: A callable object that acts as a weight function for
+        an edge. It will accept a single positional argument, the edge's weight
+        object and will return a float which will be used to represent the
+        weight/cost of the edge.
+        It can also be an edge data key or a weight array, see
+        :ref:`edge-weights`.
+
+    :returns: A matrix of the predecessors on the shortest paths
+    :rtype: numpy.ndarray
+    """
+    raise TypeError("Invalid Input Type %s for graph" % type(graph))
+
+
+@all_pairs_dijkstra_predecessors.register(PyDiGraph)
+def _digraph_all_pairs_dijkstra_predecessors(graph, edge_cost_fn):
+    return digraph_all_pairs_dijkstra_predecessors(graph, edge_cost_fn)
+
+
+@all_pairs_dijkstra_predecessors.register(PyGraph)
+def _graph_all_pairs_dijkstra_predecessors(graph, edge_cost_fn):
+    return graph_all_pairs_dijkstra_predecessors(graph, edge_cost_fn)
+
+
+@functools.singledispatch
+def batch_dijkstra_path_lengths(graph, sources, edge_cost_fn):
+    """Compute the shortest path lengths from several source nodes
+
+    This is equivalent to calling :func:`~retworkx.dijkstra_shortest_path_lengths`
+    for each source, but the edge weights are only computed once and the
+    searches from the different sources run in parallel without holding the
+    GIL. This function is multithreaded and will launch a thread pool with
+    threads equal to the number of CPUs by default. You can tune the number
+    of threads with the ``RAYON_NUM_THREADS`` environment variable.
+
+    This function can release the GIL while it runs, see :ref:`gil-release`.
+
+    :param graph: The input graph to use. Can either be a
+        :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
+    :param list sources: The node indices to find the shortest path lengths
+        from
+    :param edge_cost_fn: A callable object that acts as a weight function for
+        an edge. It will accept a single positional argument, the edge's weight
+        object and will return a float which will be used to represent the
+        weight/cost of the edge. It must be non-negative.
+        It can also be an edge data key or a weight array, see
+        :ref:`edge-weights`.
+
+    :return: A read-only dictionary of path lengths. The keys are the source
+        node indices and the values are a dict of the target node and the
+        length of the shortest path to that node.
+    :rtype: AllPairsPathLengthMapping
+    :raises IndexError: If a source is not a node in the graph
+    """
+    raise TypeError("Invalid Input Type %s for graph" % type(graph))
+
+
+@batch_dijkstra_path_lengths.register(PyDiGraph)
+def _digraph_batch_dijkstra_path_lengths(graph, sources, edge_cost_fn):
+    return digraph_batch_dijkstra_path_lengths(graph, sources, edge_cost_fn)
+
+
+@batch_dijkstra_path_lengths.register(PyGraph)
+def _graph_batch_dijkstra_path_lengths(graph, sources, edge_cost_fn):
+    return graph_batch_dijkstra_path_lengths(graph, sources, edge_cost_fn)
+
+
+@functools.singledispatch
+def batch_dijkstra_path_lengths_numpy(graph, sources, edge_cost_fn):
+    """Compute the shortest path lengths from several source nodes as a
+    numpy array
+
+    This is the same as :func:`~retworkx.batch_dijkstra_path_lengths` but the
+    output is a dense numpy array with a row for each source.
+
+    This function can release the GIL while it runs, see :ref:`gil-release`.
+
+    :param graph: The input graph to use. Can either be a
+        :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
+    :param list sources: The node indices to find the shortest path lengths
+        from
+    :param edge_cost_fn: A callable object that acts as a weight function for
+        an edge. It will accept a single positional argument, the edge's weight
+        object and will return a float which will be used to represent the
+        weight/cost of the edge. It must be non-negative.
+        It can also be an edge data key or a weight array, see
+        :ref:`edge-weights`.
+
+    :return: A 2 dimensional ``float64`` array of shape
+        ``(len(sources), len(graph))``. Element ``[i, j]`` is the length of
+        the shortest path from ``sources[i]`` to the node at position ``j`` of
+        ``graph.node_indexes()``, or ``inf`` if there is no path.
+    :rtype: numpy.ndarray
+    :raises IndexError: If a source is not a node in the graph
+    """
+    raise TypeError("Invalid Input Type %s for graph" % type(graph))
+
+
+@batch_dijkstra_path_lengths_numpy.register(PyDiGraph)
+def _digraph_batch_dijkstra_path_lengths_numpy(graph, sources, edge_cost_fn):
+    return digraph_batch_dijkstra_path_lengths_numpy(
+        graph, sources, edge_cost_fn
+    )
+
+
+@batch_dijkstra_path_lengths_numpy.register(PyGraph)
+def _graph_batch_dijkstra_path_lengths_numpy(graph, sources, edge_cost_fn):
+    return graph_batch_dijkstra_path_lengths_numpy(graph, sources, edge_cost_fn)
+
+
+@functools.singledispatch
+def multi_source_dijkstra_path_lengths(graph, sources, edge_cost_fn):
+    """Compute the length of the shortest path from the closest of several
+    source nodes to every node
+
+    This runs a single Dijkstra search which starts from all the sources at
+    once, as if from a virtual node with a zero cost edge to each source. It
+    can be used for nearest facility queries.
+
+    :param graph: The input graph to use. Can either be a
+        :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
+    :param list sources: The node indices to start the search from
+    :param edge_cost_fn: A callable object that acts as a weight function for
+        an edge. It will accept a single positional argument, the edge's weight
+        object and will return a float which will be used to represent the
+        weight/cost of the edge. It must be non-negative.
+        It can also be an edge data key or a weight array, see
+        :ref:`edge-weights`.
+
+    :return: A read-only dictionary where the keys are the node indices
+        reachable from a source and the values are the length of the shortest
+        path from any source to that node. The sources themselves are not
+        included.
+    :rtype: PathLengthMapping
+    :raises IndexError: If a source is not a node in the graph
+    """
+    raise TypeError("Invalid Input Type %s for graph" % type(graph))
+
+
+@multi_source_dijkstra_path_lengths.register(PyDiGraph)
+def _digraph_multi_source_dijkstra_path_lengths(graph, sources, edge_cost_fn):
+    return digraph_multi_source_dijkstra_path_lengths(
+        graph, sources, edge_cost_fn
+    )
+
+
+@multi_source_dijkstra_path_lengths.register(PyGraph)
+def _graph_multi_source_dijkstra_path_lengths(graph, sources, edge_cost_fn):
+    return graph_multi_source_dijkstra_path_lengths(
+        graph, sources, edge_cost_fn
+    )
+
+
+@functools.singledispatch
+def bidirectional_dijkstra(
+    graph, source, target, weight_fn=None, default_weight=1.0
+):
+    """Find the shortest path between two nodes with bidirectional Dijkstra's
+    algorithm
+
+    A search forward from ``source`` and a search backward from ``target`` are
+    run in alternation until they meet, which explores far fewer nodes than
+    :func:`~retworkx.dijkstra_shortest_paths` with a ``target`` for most point
+    to point queries.
+
+    :param graph: The input graph to use. Can either be a
+        :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
+    :param int source: The node index to find the path from
+    :param int target: The node index to find the path to
+    :param weight_fn: An optional weight function for an edge. It will accept
+        a single argument, the edge's weight object and will return a float
+        which will be used to represent the weight/cost of the edge. It must
+        be non-negative.
+        It can also be an edge data key or a weight array, see
+        :ref:`edge-weights`.
+    :param float default_weight: If ``weight_fn`` isn't specified this optional
+        float value will be used for the weight/cost of each edge.
+
+    :return: A tuple of the length of the shortest path and the node indices
+        of the path from ``source`` to ``target``
+    :rtype: tuple
+    :raises IndexError: If ``source`` or ``target`` is not in the graph
+    :raises NoPathFound: If there is no path from ``source`` to ``target``
+    """
+    raise TypeError("Invalid Input Type %s for graph" % type(graph))
+
+
+@bidirectional_dijkstra.register(PyDiGraph)
+def _digraph_bidirectional_dijkstra(
+    graph, source, target, weight_fn=None, default_weight=1.0
+):
+    return digraph_bidirectional_dijkstra(
+        graph,
+        source,
+        target,
+        weight_fn=weight_fn,
+        default_weight=default_weight,
+    )
+
+
+@bidirectional_dijkstra.register(PyGraph)
+def _graph_bidirectional_dijkstra(
+    graph, source, target, weight_fn=None, default_weight=1.0
+):
+    return graph_bidirectional_dijkstra(
+        graph,
+        source,
+        target,
+        weight_fn=weight_fn,
+        default_weight=default_weight,
+    )
+
+
+@functools.singledispatch
+def bidirectional_bfs(graph, source, target):
+    """Find a path with the fewest edges between two nodes with a
+    bidirectional breadth first search
+
+    This function can release the GIL while it runs, see :ref:`gil-release`.
+
+    :param graph: The input graph to use. Can either be a
+        :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
+    :param int source: The node index to find the path from
+    :param int target: The node index to find the path to
+
+    :return: A tuple of the number of edges in the shortest path and the node
+        indices of the path from ``source`` to ``target``
+    :rtype: tuple
+    :raises IndexError: If ``source`` or ``target`` is not in the graph
+    :raises NoPathFound: If there is no path from ``source`` to ``target``
+    """
+    raise TypeError("Invalid Input Type %s for graph" % type(graph))
+
+
+@bidirectional_bfs.register(PyDiGraph)
+def _digraph_bidirectional_bfs(graph, source, target):
+    return digraph_bidirectional_bfs(graph, source, target)
+
+
+@bidirectional_bfs.register(PyGraph)
+def _graph_bidirectional_bfs(graph, source, target):
+    return graph_bidirectional_bfs(graph, source, target)
+
+
 @functools.singledispatch
 def dijkstra_shortest_path_lengths(graph, node, edge_cost_fn, goal=None):
     """Compute the lengths of the shortest paths for a graph object using
@@ -617,7 +1004,9 @@ def dijkstra_shortest_path_lengths(graph, node, edge_cost_fn, goal=None):
         shortest paths from
     :param edge_cost_fn: A python callable that will take in 1 parameter, an
         edge's data object and will return a float that represents the
-        cost/weight of that edge. It must be non-negative
+        cost/weight of that edge. It must be non-negative.
+        It can also be an edge data key or a weight array, see
+        :ref:`edge-weights`.
     :param int goal: An optional node index to use as the end of the path.
         When specified the traversal will stop when the goal is reached and
         the output dictionary will only have a single entry with the length
@@ -661,7 +1050,9 @@ def k_shortest_path_lengths(graph, start, k, edge_cost, goal=None):
     :param int start: The node index to find the shortest paths from
     :param int k: The kth shortest path to find the lengths of
     :param edge_cost: A python callable that will receive an edge payload and
-        return a float for the cost of that eedge
+        return a float for the cost of that eedge.
+        It can also be an edge data key or a weight array, see
+        :ref:`edge-weights`.
     :param int goal: An optional goal node index, if specified the output
         dictionary
 
@@ -715,7 +1106,13 @@ def _graph_dfs_edges(graph, source):
 
 @functools.singledispatch
 def is_isomorphic(
-    first, second, node_matcher=None, edge_matcher=None, id_order=True
+    first,
+    second,
+    node_matcher=None,
+    edge_matcher=None,
+    id_order=True,
+    node_key=None,
+    edge_key=None,
 ):
     """Determine if 2 graphs are isomorphic
 
@@ -734,6 +1131,8 @@ def is_isomorphic(
         For better performance on large graphs, consider setting
         `id_order=False`.
 
+    This function can release the GIL while it runs, see :ref:`gil-release`.
+
     :param first: The first graph to compare. Can either be a
         :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`.
     :param second: The second graph to compare. Can either be a
@@ -750,6 +1149,12 @@ def is_isomorphic(
     :param bool id_order: If set to ``False`` this function will use a
         heuristic matching order based on [VF2]_ paper. Otherwise it will
         default to matching the nodes in order specified by their ids.
+    :param callable node_key: A python callable object that takes a node data
+        object and returns a hashable key for it, only nodes with equal keys
+        are matched.
+    :param callable edge_key: A python callable object that takes an edge data
+        object and returns a hashable key for it, only edges with equal keys
+        are matched.
 
     :returns: ``True`` if the 2 graphs are isomorphic, ``False`` if they are
         not.
@@ -763,19 +1168,43 @@ def is_isomorphic(
 
 @is_isomorphic.register(PyDiGraph)
 def _digraph_is_isomorphic(
-    first, second, node_matcher=None, edge_matcher=None, id_order=True
+    first,
+    second,
+    node_matcher=None,
+    edge_matcher=None,
+    id_order=True,
+    node_key=None,
+    edge_key=None,
 ):
     return digraph_is_isomorphic(
-        first, second, node_matcher, edge_matcher, id_order
+        first,
+        second,
+        node_matcher,
+        edge_matcher,
+        id_order,
+        node_key,
+        edge_key,
     )
 
 
 @is_isomorphic.register(PyGraph)
 def _graph_is_isomorphic(
-    first, second, node_matcher=None, edge_matcher=None, id_order=True
+    first,
+    second,
+    node_matcher=None,
+    edge_matcher=None,
+    id_order=True,
+    node_key=None,
+    edge_key=None,
 ):
     return graph_is_isomorphic(
-        first, second, node_matcher, edge_matcher, id_order
+        first,
+        second,
+        node_matcher,
+        edge_matcher,
+        id_order,
+        node_key,
+        edge_key,
     )
 
 
@@ -836,6 +1265,8 @@ def is_subgraph_isomorphic(
     edge_matcher=None,
     id_order=False,
     induced=True,
+    node_key=None,
+    edge_key=None,
 ):
     """Determine if 2 graphs are subgraph isomorphic
 
@@ -854,6 +1285,8 @@ def is_subgraph_isomorphic(
                                             lambda x, y: x == y)
 
 
+    This function can release the GIL while it runs, see :ref:`gil-release`.
+
     :param first: The first graph to compare. Can either be a
         :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`.
     :param second: The second graph to compare. Can either be a
@@ -873,6 +1306,12 @@ def is_subgraph_isomorphic(
     :param bool induced: If set to ``True`` this function will check the existence
         of a node-induced subgraph of first isomorphic to second graph.
         Default: ``True``.
+    :param callable node_key: A python callable object that takes a node data
+        object and returns a hashable key for it, only nodes with equal keys
+        are matched.
+    :param callable edge_key: A python callable object that takes an edge data
+        object and returns a hashable key for it, only edges with equal keys
+        are matched.
 
     :returns: ``True`` if there is a subgraph of `first` isomorphic to `second`
         , ``False`` if there is not.
@@ -889,9 +1328,18 @@ def _digraph_is_subgraph_isomorphic(
     edge_matcher=None,
     id_order=False,
     induced=True,
+    node_key=None,
+    edge_key=None,
 ):
     return digraph_is_subgraph_isomorphic(
-        first, second, node_matcher, edge_matcher, id_order, induced
+        first,
+        second,
+        node_matcher,
+        edge_matcher,
+        id_order,
+        induced,
+        node_key,
+        edge_key,
     )
 
 
@@ -903,9 +1351,207 @@ def _graph_is_subgraph_isomorphic(
     edge_matcher=None,
     id_order=False,
     induced=True,
+    node_key=None,
+    edge_key=None,
 ):
     return graph_is_subgraph_isomorphic(
-        first, second, node_matcher, edge_matcher, id_order, induced
+        first,
+        second,
+        node_matcher,
+        edge_matcher,
+        id_order,
+        induced,
+        node_key,
+        edge_key,
+    )
+
+
+@functools.singledispatch
+def vf2_mapping(
+    first,
+    second,
+    node_matcher=None,
+    edge_matcher=None,
+    id_order=True,
+    subgraph=False,
+    induced=True,
+    limit=None,
+    node_key=None,
+    edge_key=None,
+):
+    """Return an iterator over all the VF2 mappings between 2 graphs
+
+    This runs the same search as :func:`~retworkx.is_isomorphic` (or
+    :func:`~retworkx.is_subgraph_isomorphic` if ``subgraph`` is set) but
+    instead of stopping at the first mapping found it can be resumed to find
+    every mapping. The search is lazy, each mapping is only computed when the
+    iterator is advanced, so taking the first few mappings of a large search
+    space is cheap::
+
+            graph_a = retworkx.generators.path_graph(3)
+            graph_b = retworkx.generators.path_graph(2)
+            mappings = retworkx.vf2_mapping(graph_a, graph_b, subgraph=True)
+            first_mapping = next(mappings)
+
+    :param first: The first graph to find the mappings for. Can either be a
+        :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`.
+    :param second: The second graph to find the mappings for. Can either be a
+        :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`.
+        It should be the same type as the first graph.
+    :param callable node_matcher: A python callable object that takes 2
+        positional one for each node data object. If the return of this
+        function evaluates to True then the nodes passed to it are viewed
+        as matching.
+    :param callable edge_matcher: A python callable object that takes 2
+        positional one for each edge data object. If the return of this
+        function evaluates to True then the edges passed to it are viewed
+        as matching.
+    :param bool id_order: If set to ``False`` this function will use a
+        heuristic matching order based on [VF2]_ paper. Otherwise it will
+        default to matching the nodes in order specified by their ids.
+    :param bool subgraph: If set to ``True`` the mappings are between
+        subgraphs of ``first`` and the whole of ``second`` instead of between
+        the 2 whole graphs.
+    :param bool induced: If set to ``True`` and ``subgraph`` is set the
+        subgraphs of ``first`` are node-induced subgraphs. Default: ``True``.
+    :param int limit: The maximum number of mappings to return, if not set
+        every mapping is returned.
+    :param callable node_key: A python callable object that takes a node data
+        object and returns a hashable key for it, only nodes with equal keys
+        are matched.
+    :param callable edge_key: A python callable object that takes an edge data
+        object and returns a hashable key for it, only edges with equal keys
+        are matched.
+
+    :returns: An iterator of :class:`~retworkx.NodeMap` objects mapping the
+        node indices of ``first`` to the node indices of ``second``. It is
+        empty if there are no mappings.
+    :rtype: iterable
+    """
+    raise TypeError("Invalid Input Type %s for graph" % type(first))
+
+
+@vf2_mapping.register(PyDiGraph)
+def _digraph_vf2_mapping(
+    first,
+    second,
+    node_matcher=None,
+    edge_matcher=None,
+    id_order=True,
+    subgraph=False,
+    induced=True,
+    limit=None,
+    node_key=None,
+    edge_key=None,
+):
+    return digraph_vf2_mapping(
+        first,
+        second,
+        node_matcher=node_matcher,
+        edge_matcher=edge_matcher,
+        id_order=id_order,
+        subgraph=subgraph,
+        induced=induced,
+        limit=limit,
+        node_key=node_key,
+        edge_key=edge_key,
+    )
+
+
+@vf2_mapping.register(PyGraph)
+def _graph_vf2_mapping(
+    first,
+    second,
+    node_matcher=None,
+    edge_matcher=None,
+    id_order=True,
+    subgraph=False,
+    induced=True,
+    limit=None,
+    node_key=None,
+    edge_key=None,
+):
+    return graph_vf2_mapping(
+        first,
+        second,
+        node_matcher=node_matcher,
+        edge_matcher=edge_matcher,
+        id_order=id_order,
+        subgraph=subgraph,
+        induced=induced,
+        limit=limit,
+        node_key=node_key,
+        edge_key=edge_key,
+    )
+
+
+@functools.singledispatch
+def weisfeiler_lehman_graph_hash(
+    graph, node_key=None, edge_key=None, iterations=3
+):
+    """Return the Weisfeiler-Lehman hash of a graph
+
+    The hash is an isomorphism invariant fingerprint: isomorphic graphs always
+    have the same hash, so it can be used to bucket many graphs and only run
+    :func:`~retworkx.is_isomorphic` on graphs within the same bucket. Graphs
+    with the same hash are very likely, but not guaranteed, to be isomorphic.
+    The hash is stable between runs and platforms. For example::
+
+        import collections
+
+        import retworkx
+
+        graphs = [
+            retworkx.generators.cycle_graph(4),
+            retworkx.generators.path_graph(4),
+            retworkx.generators.grid_graph(2, 2),
+        ]
+        buckets = collections.defaultdict(list)
+        for graph in graphs:
+            buckets[retworkx.weisfeiler_lehman_graph_hash(graph)].append(graph)
+
+    Each node starts with a label, which is ``str(node_key(data))`` if
+    ``node_key`` is set and its degree otherwise. Every iteration then
+    replaces the label of each node with a hash of its label and the labels of
+    its neighbors (successors and predecessors for a
+    :class:`~retworkx.PyDiGraph`), including ``str(edge_key(data))`` for the
+    edges to them if ``edge_key`` is set.
+
+    :param graph: The graph to hash. Can either be a
+        :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`.
+    :param callable node_key: A python callable object that takes a node data
+        object and returns the key to label the node with. The ``str()`` of
+        the key is hashed so keys should have a deterministic string
+        representation.
+    :param callable edge_key: A python callable object that takes an edge data
+        object and returns the key to label the edge with. The ``str()`` of
+        the key is hashed so keys should have a deterministic string
+        representation.
+    :param int iterations: The number of iterations to run, each iteration
+        includes the structure of the graph one more step away from each
+        node. Defaults to 3.
+
+    :returns: The hash as a hexadecimal string
+    :rtype: str
+    """
+    raise TypeError("Invalid Input Type %s for graph" % type(graph))
+
+
+@weisfeiler_lehman_graph_hash.register(PyDiGraph)
+def _digraph_weisfeiler_lehman_graph_hash(
+    graph, node_key=None, edge_key=None, iterations=3
+):
+    return digraph_weisfeiler_lehman_graph_hash(
+        graph, node_key=node_key, edge_key=edge_key, iterations=iterations
+    )
+
+
+@weisfeiler_lehman_graph_hash.register(PyGraph)
+def _graph_weisfeiler_lehman_graph_hash(
+    graph, node_key=None, edge_key=None, iterations=3
+):
+    return graph_weisfeiler_lehman_graph_hash(
+        graph, node_key=node_key, edge_key=edge_key, iterations=iterations
     )
 
 
@@ -925,6 +1571,8 @@ def transitivity(graph):
         or self loops. It may produce incorrect/unexpected results if the
         input graph has self loops or parallel edges.
 
+    This function can release the GIL while it runs, see :ref:`gil-release`.
+
     :param graph: The graph to be used. Can either be a
         :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`.
 
@@ -957,6 +1605,8 @@ def core_number(graph):
         or self loops. It may produce incorrect/unexpected results if the
         input graph has self loops or parallel edges.
 
+    This function can release the GIL while it runs, see :ref:`gil-release`.
+
     :param graph: The graph to get core numbers. Can either be a
         :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
 
@@ -977,6 +1627,66 @@ def _graph_core_number(graph):
     return graph_core_number(graph)
 
 
+@functools.singledispatch
+def triangles(graph):
+    """Return the number of triangles each node in the graph is part of.
+
+    For a :class:`~retworkx.PyDiGraph` every combination of edge directions
+    a triangle can be formed with is counted, as in
+    :func:`~retworkx.digraph_triangles`. Self loops and parallel edges are
+    ignored.
+
+    This function can release the GIL while it runs, see :ref:`gil-release`.
+
+    :param graph: The graph to count the triangles of. Can either be a
+        :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`
+
+    :returns: A dictionary keyed by node index to the number of triangles
+    :rtype: dict
+    """
+    raise TypeError("Invalid Input Type %s for graph" % type(graph))
+
+
+@triangles.register(PyDiGraph)
+def _digraph_triangles(graph):
+    return digraph_triangles(graph)
+
+
+@triangles.register(PyGraph)
+def _graph_triangles(graph):
+    return graph_triangles(graph)
+
+
+@functools.singledispatch
+def local_clustering_coefficient(graph):
+    """Return the local clustering coefficient of each node in the graph.
+
+    The local clustering coefficient of a node is the ratio of the triangles
+    it is part of to the triangles it could be part of. Self loops and
+    parallel edges are ignored.
+
+    This function can release the GIL while it runs, see :ref:`gil-release`.
+
+    :param graph: The graph to compute the clustering coefficients of. Can
+        either be a :class:`~retworkx.PyGraph` or
+        :class:`~retworkx.PyDiGraph`
+
+    :returns: A dictionary keyed by node index to the clustering coefficient
+    :rtype: dict
+    """
+    raise TypeError("Invalid Input Type %s for graph" % type(graph))
+
+
+@local_clustering_coefficient.register(PyDiGraph)
+def _digraph_local_clustering_coefficient(graph):
+    return digraph_local_clustering_coefficient(graph)
+
+
+@local_clustering_coefficient.register(PyGraph)
+def _graph_local_clustering_coefficient(graph):
+    return graph_local_clustering_coefficient(graph)
+
+
 @functools.singledispatch
 def complement(graph):
     """Compute the complement of a graph.
@@ -1044,6 +1754,7 @@ def spring_layout(
     scale=1,
     center=None,
     seed=None,
+    theta=None,
 ):
     """
     Position nodes using Fruchterman-Reingold force-directed algorithm.
@@ -1053,6 +1764,8 @@ def spring_layout(
     as repelling objects, sometimes called an anti-gravity force.
     Simulation continues until the positions are close to an equilibrium.
 
+    This function can release the GIL while it runs, see :ref:`gil-release`.
+
     :param graph: Graph to be used. Can either be a
         :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`.
     :param dict pos:
@@ -1079,6 +1792,8 @@ def spring_layout(
     :param weight_fn: An optional weight function for an edge. It will accept
         a single argument, the edge's weight object and will return a float
         which will be used to represent the weight of the edge.
+        It can also be an edge data key or a weight array, see
+        :ref:`edge-weights`.
     :param float (default=1) default_weight: If ``weight_fn`` isn't specified
         this optional float value will be used for the weight/cost of each edge
     :param float|None scale: Scale factor for positions.
@@ -1087,6 +1802,14 @@ def spring_layout(
     :param list center: Coordinate pair around which to center
         the layout. Not used unless fixed is ``None``. (``default=None``)
     :param int seed: An optional seed to use for the random number generator
+    :param float theta: If set, approximate the repulsive forces with the
+        Barnes-Hut algorithm instead of computing them between every pair of
+        nodes. Groups of nodes whose extent divided by their distance from a
+        node is less than ``theta`` are treated as a single node, so larger
+        values are faster but less accurate, a typical value is ``0.5``. In
+        this mode the forces on all nodes are computed in parallel from the
+        positions at the start of each iteration. If ``None`` the exact
+        forces are used. (``default=None``)
 
     :returns: A dictionary of positions keyed by node id.
     :rtype: dict
@@ -1109,6 +1832,7 @@ def _digraph_spring_layout(
     scale=1,
     center=None,
     seed=None,
+    theta=None,
 ):
     return digraph_spring_layout(
         graph,
@@ -1124,6 +1848,7 @@ def _digraph_spring_layout(
         scale,
         center,
         seed,
+        theta,
     )
 
 
@@ -1142,6 +1867,7 @@ def _graph_spring_layout(
     scale=1,
     center=None,
     seed=None,
+    theta=None,
 ):
     return graph_spring_layout(
         graph,
@@ -1157,6 +1883,129 @@ def _graph_spring_layout(
         scale,
         center,
         seed,
+        theta,
+    )
+
+
+@functools.singledispatch
+def multilevel_layout(
+    graph,
+    k=None,
+    repulsive_exponent=2,
+    num_iter=50,
+    tol=1e-6,
+    weight_fn=None,
+    default_weight=1.0,
+    scale=1.0,
+    center=None,
+    seed=None,
+    theta=None,
+):
+    """
+    Position nodes with a multilevel force-directed layout.
+
+    The graph is repeatedly coarsened by merging the endpoints of a heavy
+    edge matching until it has only a few nodes. The coarsest graph is laid
+    out with the Fruchterman-Reingold force-directed algorithm used by
+    :func:`~retworkx.spring_layout`, then the positions are carried back to
+    each finer graph, placing every node close to the node it was merged
+    into, and refined there. This untangles large graphs in far fewer
+    iterations than starting the spring layout from random positions.
+
+    This function can release the GIL while it runs, see :ref:`gil-release`.
+
+    :param graph: Graph to be used. Can either be a
+        :class:`~retworkx.PyGraph` or :class:`~retworkx.PyDiGraph`.
+    :param float k:
+        Optimal distance between nodes. If ``None`` the distance is set to
+        :math:`\\frac{1}{\\sqrt{n}}` where :math:`n` is the number of nodes.
+        Increase this value to move nodes farther apart. (``default=None``)
+    :param int repulsive_exponent:
+        Repulsive force exponent. (``default=2``)
+    :param int num_iter:
+        Maximum number of iterations at each level. (``default=50``)
+    :param float tol:
+        Threshold for relative error in node position changes.
+        The iterations at a level stop if the error is below this threshold.
+        (``default = 1e-6``)
+    :param weight_fn: An optional weight function for an edge. It will accept
+        a single argument, the edge's weight object and will return a float
+        which will be used to represent the weight of the edge.
+        It can also be an edge data key or a weight array, see
+        :ref:`edge-weights`.
+    :param float default_weight: If ``weight_fn`` isn't specified
+        this optional float value will be used for the weight of each edge.
+        (``default=1.0``)
+    :param float|None scale: Scale factor for positions. If scale is
+        ``None``, no re-scaling is performed. (``default=1.0``)
+    :param list center: Coordinate pair around which to center
+        the layout. (``default=None``)
+    :param int seed: An optional seed to use for the random number generator
+    :param float theta: If set, approximate the repulsive forces with the
+        Barnes-Hut algorithm, see :func:`~retworkx.spring_layout`.
+        (``default=None``)
+
+    :returns: A dictionary of positions keyed by node id.
+    :rtype: Pos2DMapping
+    """
+    raise TypeError("Invalid Input Type %s for graph" % type(graph))
+
+
+@multilevel_layout.register(PyDiGraph)
+def _digraph_multilevel_layout(
+    graph,
+    k=None,
+    repulsive_exponent=2,
+    num_iter=50,
+    tol=1e-6,
+    weight_fn=None,
+    default_weight=1.0,
+    scale=1.0,
+    center=None,
+    seed=None,
+    theta=None,
+):
+    return digraph_multilevel_layout(
+        graph,
+        k=k,
+        repulsive_exponent=repulsive_exponent,
+        num_iter=num_iter,
+        tol=tol,
+        weight_fn=weight_fn,
+        default_weight=default_weight,
+        scale=scale,
+        center=center,
+        seed=seed,
+        theta=theta,
+    )
+
+
+@multilevel_layout.register(PyGraph)
+def _graph_multilevel_layout(
+    graph,
+    k=None,
+    repulsive_exponent=2,
+    num_iter=50,
+    tol=1e-6,
+    weight_fn=None,
+    default_weight=1.0,
+    scale=1.0,
+    center=None,
+    seed=None,
+    theta=None,
+):
+    return graph_multilevel_layout(
+        graph,
+        k=k,
+        repulsive_exponent=repulsive_exponent,
+        num_iter=num_iter,
+        tol=tol,
+        weight_fn=weight_fn,
+        default_weight=default_weight,
+        scale=scale,
+        center=center,
+        seed=seed,
+        theta=theta,
     )
 
 
@@ -0,0 +1,130 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+use std::collections::BTreeSet;
+use std::sync::{Arc, Mutex};
+
+/// The results of the analyses which can be cached, ``None`` until an
+/// analysis has been run on the current generation of the graph
+///
+/// Results which grow with the graph are shared behind an ``Arc``, so a hit
+/// doesn't copy them. Converting them to Python objects is still linear in
+/// their size.
+#[derive(Default)]
+pub struct CachedAnalyses {
+    /// The topological sort of the node indices or ``None`` if the graph
+    /// has a cycle
+    pub topological_sort: Option<Option<Arc<Vec<usize>>>>,
+    pub is_directed_acyclic_graph: Option<bool>,
+    pub weakly_connected_components: Option<Arc<Vec<BTreeSet<usize>>>>,
+    pub transitivity: Option<f64>,
+}
+
+#[derive(Default)]
+struct CacheState {
+    enabled: bool,
+    generation: u64,
+    entries_generation: u64,
+    hits: u64,
+    misses: u64,
+    entries: CachedAnalyses,
+}
+
+/// An opt-in cache of analysis results for a graph
+///
+/// Every method which changes the structure of the graph has to call
+/// ``invalidate``, which only bumps the generation counter. The cached
+/// results are tagged with the generation they were computed for and are
+/// dropped on the next lookup after the generation changed.
+///
+/// The analysis functions only get a shared reference to the graph, so the
+/// state is behind a mutex. It is never held while a result is computed,
+/// which may release the GIL.
+#[derive(Default)]
+pub struct AnalysisCache {
+    state: Mutex<CacheState>,
+}
+
+impl AnalysisCache {
+    pub fn enabled(&self) -> bool {
+        self.state.lock().unwrap().enabled
+    }
+
+    /// Turn the cache on or off, turning it off drops the cached results
+    pub fn set_enabled(&mut self, enabled: bool) {
+        let state = self.state.get_mut().unwrap();
+        state.enabled = enabled;
+        if !enabled {
+            state.entries = CachedAnalyses::default();
+        }
+    }
+
+    /// Mark every cached result as stale
+    pub fn invalidate(&mut self) {
+        let state = self.state.get_mut().unwrap();
+        state.generation = state.generation.wrapping_add(1);
+    }
+
+    /// Return the ``(hits, misses, generation)`` counters
+    pub fn counters(&self) -> (u64, u64, u64) {
+        let state = self.state.lock().unwrap();
+        (state.hits, state.misses, state.generation)
+    }
+
+    /// Return the cached result of an analysis, or compute and cache it
+    ///
+    /// ``entry`` selects the analysis from ``CachedAnalyses``. If the cache
+    /// is disabled the result is always computed and not counted.
+    pub fn get_or_insert_with<T, F>(
+        &self,
+        entry: fn(&mut CachedAnalyses) -> &mut Option<T>,
+        compute: F,
+    ) -> T
+    where
+        T: Clone,
+        F: FnOnce() -> T,
+    {
+        {
+            let mut state = self.state.lock().unwrap();
+            if !state.enabled {
+                drop(state);
+                return compute();
+            }
+            if state.entries_generation != state.generation {
+                state.entries = CachedAnalyses::default();
+                state.entries_generation = state.generation;
+            }
+            let cached = entry(&mut state.entries).clone();
+            if let Some(value) = cached {
+                state.hits += 1;
+                return value;
+            }
+            state.misses += 1;
+        }
+        let value = compute();
+        // The graph can't change while it is borrowed for the analysis, so
+        // the generation is still the same
+        let mut state = self.state.lock().unwrap();
+        *entry(&mut state.entries) = Some(value.clone());
+        value
+    }
+}
+
+/// A copy of a graph starts with an empty cache, since the copy can be
+/// changed without invalidating it
+impl Clone for AnalysisCache {
+    fn clone(&self) -> Self {
+        let mut cache = AnalysisCache::default();
+        cache.set_enabled(self.enabled());
+        cache
+    }
+}
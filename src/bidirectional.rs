@@ -0,0 +1,234 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+use std::collections::BinaryHeap;
+
+use hashbrown::{HashMap, HashSet};
+
+use petgraph::stable_graph::{EdgeReference, NodeIndex, StableGraph};
+use petgraph::visit::EdgeRef;
+use petgraph::{Direction, EdgeType, Incoming, Outgoing};
+
+use pyo3::prelude::*;
+
+use crate::astar::MinScored;
+
+/// The direction each of the two searches follows the edges in, the forward
+/// search from the start node uses the out edges and the backward search from
+/// the goal node uses the in edges.
+const DIRECTIONS: [Direction; 2] = [Outgoing, Incoming];
+
+/// Return the neighbors of `node` in direction `dir` along with the edge used
+/// to reach them. If `as_undirected` is set the edges of a directed graph are
+/// followed in both directions.
+fn neighbors<'a, Ty: EdgeType>(
+    graph: &'a StableGraph<PyObject, PyObject, Ty>,
+    node: NodeIndex,
+    dir: Direction,
+    as_undirected: bool,
+) -> impl Iterator<Item = (NodeIndex, EdgeReference<'a, PyObject>)> {
+    let reverse = if as_undirected && Ty::is_directed() {
+        Some(graph.edges_directed(node, dir.opposite()))
+    } else {
+        None
+    };
+    graph
+        .edges_directed(node, dir)
+        .chain(reverse.into_iter().flatten())
+        .map(move |edge| {
+            let next = if edge.source() == node {
+                edge.target()
+            } else {
+                edge.source()
+            };
+            (next, edge)
+        })
+}
+
+/// Join the predecessor chains of the two searches at `meet` into a path
+/// from the start node to the goal node.
+fn join_paths(
+    meet: NodeIndex,
+    forward: &HashMap<NodeIndex, NodeIndex>,
+    backward: &HashMap<NodeIndex, NodeIndex>,
+) -> Vec<NodeIndex> {
+    let mut path = vec![meet];
+    let mut node = meet;
+    while let Some(prev) = forward.get(&node) {
+        path.push(*prev);
+        node = *prev;
+    }
+    path.reverse();
+    node = meet;
+    while let Some(next) = backward.get(&node) {
+        path.push(*next);
+        node = *next;
+    }
+    path
+}
+
+struct DijkstraSearch {
+    scores: HashMap<NodeIndex, f64>,
+    predecessors: HashMap<NodeIndex, NodeIndex>,
+    visited: HashSet<NodeIndex>,
+    visit_next: BinaryHeap<MinScored<f64, NodeIndex>>,
+}
+
+impl DijkstraSearch {
+    fn new(start: NodeIndex) -> Self {
+        let mut scores = HashMap::new();
+        scores.insert(start, 0.);
+        let mut visit_next = BinaryHeap::new();
+        visit_next.push(MinScored(0., start));
+        DijkstraSearch {
+            scores,
+            predecessors: HashMap::new(),
+            visited: HashSet::new(),
+            visit_next,
+        }
+    }
+}
+
+/// Bidirectional Dijkstra's shortest path algorithm.
+///
+/// Compute the shortest path from `start` to `goal` by running one search
+/// forward from `start` and one backward from `goal`, always advancing the
+/// search whose next node is closer. The searches stop once the sum of their
+/// next scores is no smaller than the best path found through a node seen by
+/// both, which typically settles far fewer nodes than a single search from
+/// `start`. Edge costs must be non-negative.
+///
+/// Returns the length and the nodes of the path or `None` if `goal` is not
+/// reachable from `start`.
+pub fn bidirectional_dijkstra<Ty, F>(
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    start: NodeIndex,
+    goal: NodeIndex,
+    as_undirected: bool,
+    mut edge_cost: F,
+) -> PyResult<Option<(f64, Vec<NodeIndex>)>>
+where
+    Ty: EdgeType,
+    F: FnMut(EdgeReference<PyObject>) -> PyResult<f64>,
+{
+    if start == goal {
+        return Ok(Some((0., vec![start])));
+    }
+    let mut searches = [DijkstraSearch::new(start), DijkstraSearch::new(goal)];
+    let mut best = f64::INFINITY;
+    let mut meet: Option<NodeIndex> = None;
+    loop {
+        let (forward_next, backward_next) = match (
+            searches[0].visit_next.peek(),
+            searches[1].visit_next.peek(),
+        ) {
+            (Some(forward), Some(backward)) => (forward.0, backward.0),
+            _ => break,
+        };
+        if forward_next + backward_next >= best {
+            break;
+        }
+        let side = if forward_next <= backward_next { 0 } else { 1 };
+        let MinScored(node_score, node) =
+            searches[side].visit_next.pop().unwrap();
+        if !searches[side].visited.insert(node) {
+            continue;
+        }
+        for (next, edge) in
+            neighbors(graph, node, DIRECTIONS[side], as_undirected)
+        {
+            if searches[side].visited.contains(&next) {
+                continue;
+            }
+            let next_score = node_score + edge_cost(edge)?;
+            let search = &mut searches[side];
+            let improves = search
+                .scores
+                .get(&next)
+                .map_or(true, |score| next_score < *score);
+            if !improves {
+                continue;
+            }
+            search.scores.insert(next, next_score);
+            search.predecessors.insert(next, node);
+            search.visit_next.push(MinScored(next_score, next));
+            if let Some(other_score) = searches[1 - side].scores.get(&next) {
+                if next_score + other_score < best {
+                    best = next_score + other_score;
+                    meet = Some(next);
+                }
+            }
+        }
+    }
+    Ok(meet.map(|meet| {
+        (
+            best,
+            join_paths(
+                meet,
+                &searches[0].predecessors,
+                &searches[1].predecessors,
+            ),
+        )
+    }))
+}
+
+/// Bidirectional breadth first search.
+///
+/// Find a path with the fewest edges from `start` to `goal` by expanding a
+/// level of the forward search from `start` or of the backward search from
+/// `goal`, whichever frontier is smaller, until the two searches meet.
+///
+/// Returns the nodes of the path or `None` if `goal` is not reachable from
+/// `start`.
+pub fn bidirectional_bfs<Ty: EdgeType>(
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    start: NodeIndex,
+    goal: NodeIndex,
+    as_undirected: bool,
+) -> Option<Vec<NodeIndex>> {
+    if start == goal {
+        return Some(vec![start]);
+    }
+    let mut seen: [HashSet<NodeIndex>; 2] = Default::default();
+    seen[0].insert(start);
+    seen[1].insert(goal);
+    let mut predecessors: [HashMap<NodeIndex, NodeIndex>; 2] =
+        Default::default();
+    let mut frontiers = [vec![start], vec![goal]];
+    while !frontiers[0].is_empty() && !frontiers[1].is_empty() {
+        let side = if frontiers[0].len() <= frontiers[1].len() {
+            0
+        } else {
+            1
+        };
+        let frontier = std::mem::take(&mut frontiers[side]);
+        for node in frontier {
+            for (next, _) in
+                neighbors(graph, node, DIRECTIONS[side], as_undirected)
+            {
+                if !seen[side].insert(next) {
+                    continue;
+                }
+                predecessors[side].insert(next, node);
+                if seen[1 - side].contains(&next) {
+                    return Some(join_paths(
+                        next,
+                        &predecessors[0],
+                        &predecessors[1],
+                    ));
+                }
+                frontiers[side].push(next);
+            }
+        }
+    }
+    None
+}
@@ -0,0 +1,441 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+// Binary graph file format used by ``write_binary`` and ``read_binary``.
+//
+// All integers are little endian. The file starts with a fixed size header:
+//
+//   magic        8 bytes  b"RXGRAPH\0"
+//   version      u32      currently 1
+//   flags        u32      bit 0: directed, bit 1: multigraph,
+//                         bit 2: weight column, bit 3: payload blob
+//   node_bound   u64
+//   node_count   u64
+//   edge_bound   u64
+//   edge_count   u64
+//   payload_len  u64
+//
+// followed by these arrays, each of which starts at an offset that is a
+// multiple of 8 so they can be memory mapped directly (for example with
+// ``numpy.memmap``):
+//
+//   nodes        u64[node_count]      indices of the nodes in the graph
+//   indptr       u64[node_bound + 1]  CSR row offsets by source node
+//   indices      u64[edge_count]      target node of each edge
+//   edge_ids     u64[edge_count]      edge index of each edge
+//   weights      f64[edge_count]      only if the weight column flag is set
+//   payload      u8[payload_len]      pickle of a ``(nodes, edges)`` tuple of
+//                                     the node data payloads in ``nodes``
+//                                     order and the edge data payloads in
+//                                     CSR order
+//
+// For undirected graphs every edge is stored once, under the source node it
+// was added with.
+
+use std::convert::TryInto;
+use std::fs::File;
+use std::io::prelude::*;
+use std::io::{BufReader, BufWriter};
+
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyList, PyTuple};
+
+use petgraph::graph::{EdgeIndex, NodeIndex};
+use petgraph::stable_graph::StableGraph;
+use petgraph::visit::{EdgeRef, IntoEdgeReferences};
+use petgraph::EdgeType;
+
+use super::weights::EdgeWeights;
+
+const MAGIC: &[u8; 8] = b"RXGRAPH\0";
+const VERSION: u32 = 1;
+
+const FLAG_DIRECTED: u32 = 1;
+const FLAG_MULTIGRAPH: u32 = 1 << 1;
+const FLAG_WEIGHTS: u32 = 1 << 2;
+const FLAG_PAYLOADS: u32 = 1 << 3;
+
+/// Number of array elements read from the file at once
+const READ_CHUNK: usize = 8192;
+
+/// Size of the fixed header in bytes
+const HEADER_LEN: u64 = 56;
+
+fn corrupt_file(path: &str, reason: &str) -> PyErr {
+    PyValueError::new_err(format!(
+        "{} is not a valid retworkx binary graph file: {}",
+        path, reason
+    ))
+}
+
+fn write_u64s<W: Write>(writer: &mut W, values: &[u64]) -> PyResult<()> {
+    for value in values {
+        writer.write_all(&value.to_le_bytes())?;
+    }
+    Ok(())
+}
+
+fn read_u64<R: Read>(reader: &mut R) -> PyResult<u64> {
+    let mut buf = [0u8; 8];
+    reader.read_exact(&mut buf)?;
+    Ok(u64::from_le_bytes(buf))
+}
+
+fn read_u32<R: Read>(reader: &mut R) -> PyResult<u32> {
+    let mut buf = [0u8; 4];
+    reader.read_exact(&mut buf)?;
+    Ok(u32::from_le_bytes(buf))
+}
+
+/// Read ``count`` 8 byte little endian values without buffering the raw
+/// bytes of the whole array.
+fn read_array<R: Read, T, F>(
+    reader: &mut R,
+    count: usize,
+    convert: F,
+) -> PyResult<Vec<T>>
+where
+    F: Fn([u8; 8]) -> T,
+{
+    let mut out: Vec<T> = Vec::with_capacity(count);
+    let mut buf: Vec<u8> = vec![0; 8 * std::cmp::min(count, READ_CHUNK)];
+    let mut remaining = count;
+    while remaining > 0 {
+        let chunk = std::cmp::min(remaining, READ_CHUNK);
+        reader.read_exact(&mut buf[..8 * chunk])?;
+        out.extend(
+            buf[..8 * chunk]
+                .chunks_exact(8)
+                .map(|bytes| convert(bytes.try_into().unwrap())),
+        );
+        remaining -= chunk;
+    }
+    Ok(out)
+}
+
+/// Write ``graph`` to ``path`` in the binary graph format
+pub fn write_binary<Ty: EdgeType>(
+    py: Python,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    multigraph: bool,
+    path: &str,
+    weight_fn: Option<PyObject>,
+    payloads: bool,
+) -> PyResult<()> {
+    let node_bound = graph.node_bound();
+    let edge_count = graph.edge_count();
+    let nodes: Vec<u64> =
+        graph.node_indices().map(|n| n.index() as u64).collect();
+    // Bucket the edges by source node, within a row edges are in edge
+    // index order.
+    let mut indptr: Vec<u64> = vec![0; node_bound + 1];
+    for edge in graph.edge_references() {
+        indptr[edge.source().index() + 1] += 1;
+    }
+    for i in 0..node_bound {
+        indptr[i + 1] += indptr[i];
+    }
+    let mut next: Vec<u64> = indptr[..node_bound].to_vec();
+    let mut indices: Vec<u64> = vec![0; edge_count];
+    let mut edge_ids: Vec<u64> = vec![0; edge_count];
+    for edge in graph.edge_references() {
+        let pos = next[edge.source().index()] as usize;
+        next[edge.source().index()] += 1;
+        indices[pos] = edge.target().index() as u64;
+        edge_ids[pos] = edge.id().index() as u64;
+    }
+
+    let weights: Option<Vec<f64>> = match weight_fn {
+        Some(weight_fn) => {
+            let edge_weights =
+                EdgeWeights::new(py, graph, Some(weight_fn), 1.0)?;
+            let mut weights: Vec<f64> = Vec::with_capacity(edge_count);
+            for edge_id in &edge_ids {
+                let edge = EdgeIndex::new(*edge_id as usize);
+                weights.push(edge_weights.weight(py, edge, &graph[edge])?);
+            }
+            Some(weights)
+        }
+        None => None,
+    };
+
+    let payload: Option<PyObject> = if payloads {
+        let node_data: Vec<&PyObject> =
+            graph.node_indices().map(|node| &graph[node]).collect();
+        let edge_data: Vec<&PyObject> = edge_ids
+            .iter()
+            .map(|edge| &graph[EdgeIndex::new(*edge as usize)])
+            .collect();
+        let pickle = py.import("pickle")?;
+        let protocol = pickle.getattr("HIGHEST_PROTOCOL")?;
+        let state = PyTuple::new(
+            py,
+            &[PyList::new(py, node_data), PyList::new(py, edge_data)],
+        );
+        Some(pickle.call_method1("dumps", (state, protocol))?.into())
+    } else {
+        None
+    };
+    let payload_bytes: &[u8] = match &payload {
+        Some(payload) => payload.cast_as::<PyBytes>(py)?.as_bytes(),
+        None => &[],
+    };
+
+    let mut flags: u32 = 0;
+    if Ty::is_directed() {
+        flags |= FLAG_DIRECTED;
+    }
+    if multigraph {
+        flags |= FLAG_MULTIGRAPH;
+    }
+    if weights.is_some() {
+        flags |= FLAG_WEIGHTS;
+    }
+    if payloads {
+        flags |= FLAG_PAYLOADS;
+    }
+
+    let file = File::create(path)?;
+    let mut buf_writer = BufWriter::new(file);
+    buf_writer.write_all(MAGIC)?;
+    buf_writer.write_all(&VERSION.to_le_bytes())?;
+    buf_writer.write_all(&flags.to_le_bytes())?;
+    write_u64s(
+        &mut buf_writer,
+        &[
+            node_bound as u64,
+            nodes.len() as u64,
+            graph.edge_bound() as u64,
+            edge_count as u64,
+            payload_bytes.len() as u64,
+        ],
+    )?;
+    write_u64s(&mut buf_writer, &nodes)?;
+    write_u64s(&mut buf_writer, &indptr)?;
+    write_u64s(&mut buf_writer, &indices)?;
+    write_u64s(&mut buf_writer, &edge_ids)?;
+    if let Some(weights) = weights {
+        for weight in weights {
+            buf_writer.write_all(&weight.to_le_bytes())?;
+        }
+    }
+    buf_writer.write_all(payload_bytes)?;
+    buf_writer.flush()?;
+    Ok(())
+}
+
+/// Read a graph from ``path`` in the binary graph format
+///
+/// Returns the graph, whether it is a multigraph and whether any node
+/// indices are unused.
+pub fn read_binary<Ty: EdgeType>(
+    py: Python,
+    path: &str,
+    payloads: bool,
+) -> PyResult<(StableGraph<PyObject, PyObject, Ty>, bool, bool)> {
+    let file = File::open(path)?;
+    let file_len = file.metadata()?.len();
+    let mut reader = BufReader::new(file);
+    let mut magic = [0u8; 8];
+    if file_len >= 8 {
+        reader.read_exact(&mut magic)?;
+    }
+    if &magic != MAGIC {
+        return Err(PyValueError::new_err(format!(
+            "{} is not a retworkx binary graph file",
+            path
+        )));
+    }
+    if file_len < HEADER_LEN {
+        return Err(corrupt_file(path, "the header is truncated"));
+    }
+    let version = read_u32(&mut reader)?;
+    if version != VERSION {
+        return Err(PyValueError::new_err(format!(
+            "Unsupported binary graph file version {}",
+            version
+        )));
+    }
+    let flags = read_u32(&mut reader)?;
+    if (flags & FLAG_DIRECTED != 0) != Ty::is_directed() {
+        return Err(PyValueError::new_err(if Ty::is_directed() {
+            "File contains an undirected graph, use PyGraph.read_binary()"
+        } else {
+            "File contains a directed graph, use PyDiGraph.read_binary()"
+        }));
+    }
+    let node_bound = read_u64(&mut reader)?;
+    let node_count = read_u64(&mut reader)?;
+    let edge_bound = read_u64(&mut reader)?;
+    let edge_count = read_u64(&mut reader)?;
+    let payload_len = read_u64(&mut reader)?;
+
+    // Check the counts against the size of the file before anything is
+    // allocated for them. Indices have to fit the graph's index type, where
+    // the maximum value is reserved.
+    let max_bound = u64::from(u32::MAX);
+    if node_bound > max_bound || edge_bound > max_bound {
+        return Err(corrupt_file(path, "the node or edge bound is too large"));
+    }
+    if node_count > node_bound || edge_count > edge_bound {
+        return Err(corrupt_file(
+            path,
+            "there are more nodes or edges than the bound allows",
+        ));
+    }
+    let edge_columns = if flags & FLAG_WEIGHTS != 0 { 3 } else { 2 };
+    let expected_len = edge_count
+        .checked_mul(edge_columns)
+        .and_then(|len| len.checked_add(node_count))
+        .and_then(|len| len.checked_add(node_bound + 1))
+        .and_then(|len| len.checked_mul(8))
+        .and_then(|len| len.checked_add(HEADER_LEN))
+        .and_then(|len| len.checked_add(payload_len));
+    match expected_len {
+        Some(len) if len <= file_len => (),
+        _ => {
+            return Err(corrupt_file(
+                path,
+                "the file is shorter than its header describes",
+            ))
+        }
+    }
+    let node_bound = node_bound as usize;
+    let node_count = node_count as usize;
+    let edge_bound = edge_bound as usize;
+    let edge_count = edge_count as usize;
+    let payload_len = payload_len as usize;
+
+    let nodes = read_array(&mut reader, node_count, u64::from_le_bytes)?;
+    let indptr = read_array(&mut reader, node_bound + 1, u64::from_le_bytes)?;
+    let indices = read_array(&mut reader, edge_count, u64::from_le_bytes)?;
+    let edge_ids = read_array(&mut reader, edge_count, u64::from_le_bytes)?;
+    let weights: Option<Vec<f64>> = if flags & FLAG_WEIGHTS != 0 {
+        Some(read_array(&mut reader, edge_count, f64::from_le_bytes)?)
+    } else {
+        None
+    };
+
+    // The nodes are in increasing index order and the last one sets the
+    // bound
+    let mut present: Vec<Option<usize>> = vec![None; node_bound];
+    for (position, node) in nodes.iter().enumerate() {
+        if position > 0 && *node <= nodes[position - 1] {
+            return Err(corrupt_file(path, "the node indices are not sorted"));
+        }
+        if *node as usize >= node_bound {
+            return Err(corrupt_file(path, "a node index is out of bounds"));
+        }
+        present[*node as usize] = Some(position);
+    }
+    if nodes.last().map_or(0, |node| *node as usize + 1) != node_bound {
+        return Err(corrupt_file(path, "the node bound is wrong"));
+    }
+    if indptr[0] != 0
+        || indptr[node_bound] as usize != edge_count
+        || indptr.windows(2).any(|pair| pair[0] > pair[1])
+    {
+        return Err(corrupt_file(path, "the edge offsets are invalid"));
+    }
+
+    // Edges in edge index order as (edge index, source, target, position in
+    // CSR order)
+    let mut edges: Vec<(usize, usize, usize, usize)> =
+        Vec::with_capacity(edge_count);
+    for source in 0..node_bound {
+        let (start, end) =
+            (indptr[source] as usize, indptr[source + 1] as usize);
+        if start != end && present[source].is_none() {
+            return Err(corrupt_file(path, "an edge source is not a node"));
+        }
+        for pos in start..end {
+            let target = indices[pos];
+            if target as usize >= node_bound
+                || present[target as usize].is_none()
+            {
+                return Err(corrupt_file(path, "an edge target is not a node"));
+            }
+            edges.push((edge_ids[pos] as usize, source, target as usize, pos));
+        }
+    }
+    edges.sort_unstable();
+    if edges.windows(2).any(|pair| pair[0].0 == pair[1].0) {
+        return Err(corrupt_file(path, "an edge index is used twice"));
+    }
+    if edges.last().map_or(0, |edge| edge.0 + 1) != edge_bound {
+        return Err(corrupt_file(path, "the edge bound is wrong"));
+    }
+
+    let (node_data, edge_data): (Vec<PyObject>, Vec<PyObject>) =
+        if payloads && flags & FLAG_PAYLOADS != 0 {
+            let mut blob: Vec<u8> = vec![0; payload_len];
+            reader.read_exact(&mut blob)?;
+            let pickle = py.import("pickle")?;
+            let (node_data, edge_data): (Vec<PyObject>, Vec<PyObject>) = pickle
+                .call_method1("loads", (PyBytes::new(py, &blob),))?
+                .extract()?;
+            if node_data.len() != node_count || edge_data.len() != edge_count {
+                return Err(corrupt_file(
+                    path,
+                    "the payloads don't match the nodes and edges",
+                ));
+            }
+            (node_data, edge_data)
+        } else {
+            (Vec::new(), Vec::new())
+        };
+
+    let mut graph = StableGraph::<PyObject, PyObject, Ty>::with_capacity(
+        node_bound, edge_count,
+    );
+    for position in &present {
+        let data = match position {
+            Some(position) if !node_data.is_empty() => {
+                node_data[*position].clone_ref(py)
+            }
+            _ => py.None(),
+        };
+        graph.add_node(data);
+    }
+    // Unused edge indices are filled with self loops on an existing node
+    // which are removed once all the edges are added. There are edges, and
+    // so nodes, whenever this is needed.
+    let filler = NodeIndex::new(nodes.first().map_or(0, |node| *node as usize));
+    let mut tmp_edges: Vec<EdgeIndex> = Vec::new();
+    for (edge_id, source, target, pos) in edges {
+        while graph.edge_count() < edge_id {
+            tmp_edges.push(graph.add_edge(filler, filler, py.None()));
+        }
+        let data = if !edge_data.is_empty() {
+            edge_data[pos].clone_ref(py)
+        } else if let Some(weights) = &weights {
+            weights[pos].into_py(py)
+        } else {
+            py.None()
+        };
+        graph.add_edge(NodeIndex::new(source), NodeIndex::new(target), data);
+    }
+    for tmp_edge in tmp_edges {
+        graph.remove_edge(tmp_edge);
+    }
+    for (index, position) in present.iter().enumerate() {
+        if position.is_none() {
+            graph.remove_node(NodeIndex::new(index));
+        }
+    }
+    Ok((
+        graph,
+        flags & FLAG_MULTIGRAPH != 0,
+        node_count != node_bound,
+    ))
+}
@@ -15,7 +15,7 @@ use std::cmp::Ordering;
 use std::collections::BTreeMap;
 use std::fs::File;
 use std::io::prelude::*;
-use std::io::{BufReader, BufWriter};
+use std::io::BufWriter;
 use std::ops::{Index, IndexMut};
 use std::str;
 
@@ -30,7 +30,7 @@ use pyo3::PyTraverseError;
 use pyo3::Python;
 
 use ndarray::prelude::*;
-use numpy::PyReadonlyArray2;
+use numpy::{IntoPyArray, PyReadonlyArray1, PyReadonlyArray2};
 
 use petgraph::algo;
 use petgraph::graph::{EdgeIndex, NodeIndex};
@@ -45,15 +45,27 @@ use petgraph::visit::{
     NodeFiltered, NodeIndexable, Visitable,
 };
 
+use super::analysis_cache::AnalysisCache;
+use super::binary;
 use super::dot_utils::build_dot;
+use super::edge_array;
+use super::edge_list;
 use super::iterators::{
     EdgeIndexMap, EdgeIndices, EdgeList, NodeIndices, NodeMap, WeightedEdgeList,
 };
+use super::sparse;
+use super::topological_order::{sort_with_edges, TopologicalOrder};
 use super::{
     is_directed_acyclic_graph, DAGHasCycle, DAGWouldCycle, NoEdgeBetweenNodes,
     NoSuitableNeighbors, NodesRemoved,
 };
 
+// A batch of edges added to a graph which checks for cycles is only added one
+// edge at a time through the maintained topological order if the graph has at
+// least this many times as many nodes as there are edges, otherwise the whole
+// graph is sorted once with the new edges
+const INCREMENTAL_BATCH_RATIO: usize = 8;
+
 /// A class for creating directed graphs
 ///
 /// The ``PyDiGraph`` class is used to create a directed graph. It can be a
@@ -160,6 +172,8 @@ pub struct PyDiGraph {
     pub check_cycle: bool,
     pub node_removed: bool,
     pub multigraph: bool,
+    pub topo_order: Option<TopologicalOrder>,
+    pub cache: AnalysisCache,
 }
 
 pub type Edges<'a, E> =
@@ -353,34 +367,191 @@ impl PyDiGraph {
     ) -> PyResult<usize> {
         // Only check for cycles if instance attribute is set to true
         if self.check_cycle {
-            // Only check for a cycle (by running has_path_connecting) if
-            // the new edge could potentially add a cycle
-            let cycle_check_required =
-                is_cycle_check_required(self, p_index, c_index);
-            let state = Some(&mut self.cycle_state);
-            if cycle_check_required
-                && algo::has_path_connecting(
-                    &self.graph,
-                    c_index,
-                    p_index,
-                    state,
-                )
-            {
-                return Err(DAGWouldCycle::new_err(
-                    "Adding an edge would cycle",
-                ));
+            if self.topo_order.is_none() {
+                self.topo_order = TopologicalOrder::new(&self.graph);
+            }
+            match self.topo_order.as_mut() {
+                // The maintained topological order only has to search the
+                // nodes between the two endpoints
+                Some(order) => {
+                    if !order.add_edge(&self.graph, p_index, c_index) {
+                        return Err(DAGWouldCycle::new_err(
+                            "Adding an edge would cycle",
+                        ));
+                    }
+                }
+                // The graph already has a cycle so there is no order, only
+                // check for a cycle (by running has_path_connecting) if the
+                // new edge could potentially add a cycle
+                None => {
+                    let cycle_check_required =
+                        is_cycle_check_required(self, p_index, c_index);
+                    let state = Some(&mut self.cycle_state);
+                    if cycle_check_required
+                        && algo::has_path_connecting(
+                            &self.graph,
+                            c_index,
+                            p_index,
+                            state,
+                        )
+                    {
+                        return Err(DAGWouldCycle::new_err(
+                            "Adding an edge would cycle",
+                        ));
+                    }
+                }
             }
+        } else {
+            // Edges added without cycle checking aren't tracked by the order
+            self.topo_order = None;
         }
+        Ok(self._insert_edge(p_index, c_index, edge))
+    }
+
+    fn _insert_edge(
+        &mut self,
+        p_index: NodeIndex,
+        c_index: NodeIndex,
+        edge: PyObject,
+    ) -> usize {
         if !self.multigraph {
             let exists = self.graph.find_edge(p_index, c_index);
             if let Some(index) = exists {
                 let edge_weight = self.graph.edge_weight_mut(index).unwrap();
                 *edge_weight = edge;
-                return Ok(index.index());
+                return index.index();
             }
         }
-        let edge = self.graph.add_edge(p_index, c_index, edge);
-        Ok(edge.index())
+        self.cache.invalidate();
+        self.graph.add_edge(p_index, c_index, edge).index()
+    }
+
+    /// Add a batch of edges, if the graph checks for cycles either all of
+    /// them are added or none are
+    ///
+    /// With cycle checking a batch which is small compared to the graph is
+    /// added one edge at a time through the maintained topological order and
+    /// rolled back if one of them would create a cycle. A larger batch is
+    /// checked by sorting the graph and the new edges once before anything is
+    /// added, instead of searching the graph for every edge, and the result
+    /// becomes the maintained topological order.
+    fn _add_edges(
+        &mut self,
+        edges: Vec<(NodeIndex, NodeIndex, PyObject)>,
+    ) -> PyResult<Vec<usize>> {
+        if !self.check_cycle || edges.len() < 2 {
+            return edges
+                .into_iter()
+                .map(|(p_index, c_index, edge)| {
+                    self._add_edge(p_index, c_index, edge)
+                })
+                .collect();
+        }
+        for (p_index, c_index, _) in &edges {
+            if !self.graph.contains_node(*p_index)
+                || !self.graph.contains_node(*c_index)
+            {
+                return Err(PyIndexError::new_err("No node found for index"));
+            }
+        }
+        if self.topo_order.is_some()
+            && edges.len() * INCREMENTAL_BATCH_RATIO <= self.graph.node_count()
+        {
+            return self._add_edges_incremental(edges);
+        }
+        let pairs: Vec<(NodeIndex, NodeIndex)> = edges
+            .iter()
+            .map(|(p_index, c_index, _)| (*p_index, *c_index))
+            .collect();
+        let nodes = match sort_with_edges(&self.graph, &pairs) {
+            Ok(nodes) => nodes,
+            Err(pos) => return Err(would_cycle_error(pairs[pos])),
+        };
+        let out_list: Vec<usize> = edges
+            .into_iter()
+            .map(|(p_index, c_index, edge)| {
+                self._insert_edge(p_index, c_index, edge)
+            })
+            .collect();
+        self.topo_order =
+            Some(TopologicalOrder::from_sorted(&self.graph, nodes));
+        Ok(out_list)
+    }
+
+    /// Add a batch of edges which have been checked to connect existing nodes
+    /// one at a time through the maintained topological order, if one of
+    /// them would create a cycle the ones before it are removed again
+    fn _add_edges_incremental(
+        &mut self,
+        edges: Vec<(NodeIndex, NodeIndex, PyObject)>,
+    ) -> PyResult<Vec<usize>> {
+        // The edges added so far, with the weight they replaced if they
+        // already existed in a graph without parallel edges
+        let mut added: Vec<(EdgeIndex, Option<PyObject>)> =
+            Vec::with_capacity(edges.len());
+        let mut failed: Option<(NodeIndex, NodeIndex)> = None;
+        for (p_index, c_index, edge) in edges {
+            let order = self.topo_order.as_mut().unwrap();
+            if !order.add_edge(&self.graph, p_index, c_index) {
+                failed = Some((p_index, c_index));
+                break;
+            }
+            let exists = if self.multigraph {
+                None
+            } else {
+                self.graph.find_edge(p_index, c_index)
+            };
+            match exists {
+                Some(index) => {
+                    let old = std::mem::replace(&mut self.graph[index], edge);
+                    added.push((index, Some(old)));
+                }
+                None => {
+                    let index = self.graph.add_edge(p_index, c_index, edge);
+                    added.push((index, None));
+                }
+            }
+        }
+        match failed {
+            None => {
+                self.cache.invalidate();
+                Ok(added.iter().map(|(index, _)| index.index()).collect())
+            }
+            Some(pair) => {
+                // Undo in reverse so the removed edge indices are handed out
+                // again in the same order. The order stays valid for the
+                // remaining edges.
+                for (index, old) in added.into_iter().rev() {
+                    match old {
+                        Some(weight) => self.graph[index] = weight,
+                        None => {
+                            self.graph.remove_edge(index);
+                        }
+                    }
+                }
+                Err(would_cycle_error(pair))
+            }
+        }
+    }
+
+    /// Add the edges for an ``extend_from_*`` method, if they are rejected
+    /// the nodes which were added for them are removed again
+    fn _extend_edges(
+        &mut self,
+        new_nodes: Vec<NodeIndex>,
+        edges: Vec<(NodeIndex, NodeIndex, PyObject)>,
+    ) -> PyResult<()> {
+        if !new_nodes.is_empty() {
+            self.cache.invalidate();
+        }
+        if let Err(err) = self._add_edges(edges) {
+            // Remove in reverse so the lowest index is reused first again
+            for node in new_nodes.into_iter().rev() {
+                self.graph.remove_node(node);
+            }
+            return Err(err);
+        }
+        Ok(())
     }
 
     fn insert_between(
@@ -425,6 +596,7 @@ impl PyDiGraph {
                 )?;
             }
             self.graph.remove_edge(edge_index);
+            self.cache.invalidate();
         }
         Ok(())
     }
@@ -438,8 +610,10 @@ impl PyDiGraph {
         PyDiGraph {
             graph: StableDiGraph::<PyObject, PyObject>::new(),
             cycle_state: algo::DfsSpace::default(),
+            topo_order: None,
             check_cycle,
             node_removed: false,
+            cache: AnalysisCache::default(),
             multigraph,
         }
     }
@@ -471,6 +645,8 @@ impl PyDiGraph {
 
     fn __setstate__(&mut self, py: Python, state: PyObject) -> PyResult<()> {
         self.graph = StableDiGraph::<PyObject, PyObject>::new();
+        self.cache.invalidate();
+        self.topo_order = None;
         let dict_state = state.cast_as::<PyDict>(py)?;
 
         let nodes_dict =
@@ -546,10 +722,53 @@ impl PyDiGraph {
         if !self.check_cycle && value && !is_directed_acyclic_graph(self) {
             return Err(DAGHasCycle::new_err("PyDiGraph object has a cycle"));
         }
+        if !self.check_cycle && value {
+            // The order is built again from the graph on the next edge
+            self.topo_order = None;
+        }
         self.check_cycle = value;
         Ok(())
     }
 
+    /// Whether the results of analyses on the graph are cached
+    ///
+    /// If set to ``True`` the results of :func:`~retworkx.topological_sort`,
+    /// :func:`~retworkx.is_directed_acyclic_graph`,
+    /// :func:`~retworkx.weakly_connected_components` (which is also used by
+    /// :func:`~retworkx.number_weakly_connected_components` and
+    /// :func:`~retworkx.is_weakly_connected`) and
+    /// :func:`~retworkx.transitivity` are stored on the graph
+    /// and returned again by later calls until the graph is changed. Adding
+    /// or removing nodes or edges invalidates every cached result, changing
+    /// node or edge weights does not. Setting it to ``False`` drops the
+    /// cached results.
+    #[getter]
+    fn get_analysis_cache(&self) -> bool {
+        self.cache.enabled()
+    }
+
+    #[setter]
+    fn set_analysis_cache(&mut self, value: bool) {
+        self.cache.set_enabled(value);
+    }
+
+    /// Return the statistics of the analysis cache
+    ///
+    /// :returns: A dictionary with the number of cache ``"hits"`` and
+    ///     ``"misses"`` of the analyses run on the graph while
+    ///     :attr:`analysis_cache` was set, and the ``"generation"``, the
+    ///     number of times the structure of the graph was changed
+    /// :rtype: dict
+    #[pyo3(text_signature = "(self)")]
+    pub fn analysis_cache_info(&self) -> HashMap<&'static str, u64> {
+        let (hits, misses, generation) = self.cache.counters();
+        let mut info = HashMap::with_capacity(3);
+        info.insert("hits", hits);
+        info.insert("misses", misses);
+        info.insert("generation", generation);
+        info
+    }
+
     /// Whether the graph is a multigraph (allows multiple edges between
     /// nodes) or not
     ///
@@ -940,6 +1159,81 @@ impl PyDiGraph {
         }
     }
 
+    /// Return the edges of the graph as compressed sparse row (CSR) arrays
+    ///
+    /// Rows and columns of the matrix are the positions of the nodes in
+    /// :meth:`node_indexes`, so graphs with removed nodes give a compact
+    /// matrix.
+    /// Each row of the matrix holds the outgoing edges of a node.
+    /// The arrays can be passed directly to :class:`scipy.sparse.csr_matrix`,
+    /// no data payloads are copied.
+    ///
+    /// :param weight_fn: An optional callable which will be passed the data
+    ///     payload of each edge and is expected to return a ``float`` weight
+    ///     for the edge. It can also be an edge data key or a weight array,
+    ///     see :ref:`edge-weights`.
+    ///
+    /// :returns: A tuple ``(indptr, indices, edge_ids, weights, node_map)``
+    ///     of 1 dimensional numpy arrays. The entries of row ``i`` are at
+    ///     positions ``indptr[i]:indptr[i + 1]`` of ``indices`` (the column of
+    ///     each entry), ``edge_ids`` (the edge index of each entry) and
+    ///     ``weights`` (the weight of each entry, this is ``None`` if no
+    ///     ``weight_fn`` is specified). ``node_map[i]`` is the node index of
+    ///     row and column ``i``.
+    /// :rtype: tuple
+    ///
+    /// For example:
+    ///
+    /// .. jupyter-execute::
+    ///
+    ///   import retworkx
+    ///
+    ///   graph = retworkx.PyDiGraph()
+    ///   graph.add_nodes_from(range(3))
+    ///   graph.add_edges_from([(0, 1, 2.0), (1, 2, 3.0)])
+    ///   indptr, indices, edge_ids, weights, node_map = graph.to_csr(float)
+    ///   print(indptr)
+    ///   print(indices)
+    ///   print(weights)
+    ///
+    #[pyo3(text_signature = "(self, /, weight_fn=None)")]
+    pub fn to_csr(
+        &self,
+        py: Python,
+        weight_fn: Option<PyObject>,
+    ) -> PyResult<PyObject> {
+        sparse::to_csr(py, &self.graph, weight_fn)
+    }
+
+    /// Return the edges of the graph as coordinate format (COO) arrays
+    ///
+    /// Rows and columns of the matrix are the positions of the nodes in
+    /// :meth:`node_indexes`, so graphs with removed nodes give a compact
+    /// matrix.
+    /// Each entry is an edge from the node at position ``row[i]`` to the node
+    /// at position ``col[i]``.
+    /// The entries are in the same order as :meth:`to_csr`.
+    ///
+    /// :param weight_fn: An optional callable which will be passed the data
+    ///     payload of each edge and is expected to return a ``float`` weight
+    ///     for the edge. It can also be an edge data key or a weight array,
+    ///     see :ref:`edge-weights`.
+    ///
+    /// :returns: A tuple ``(row, col, edge_ids, weights, node_map)`` of 1
+    ///     dimensional numpy arrays with the row, column, edge index and
+    ///     weight of each entry (``weights`` is ``None`` if no ``weight_fn``
+    ///     is specified). ``node_map[i]`` is the node index of row and column
+    ///     ``i``.
+    /// :rtype: tuple
+    #[pyo3(text_signature = "(self, /, weight_fn=None)")]
+    pub fn to_coo(
+        &self,
+        py: Python,
+        weight_fn: Option<PyObject>,
+    ) -> PyResult<PyObject> {
+        sparse::to_coo(py, &self.graph, weight_fn)
+    }
+
     /// Get an edge index map
     ///
     /// Returns a read only mapping from edge indices to the weighted edge
@@ -976,6 +1270,7 @@ impl PyDiGraph {
     pub fn remove_node(&mut self, node: usize) -> PyResult<()> {
         let index = NodeIndex::new(node);
         self.graph.remove_node(index);
+        self.cache.invalidate();
         self.node_removed = true;
         Ok(())
     }
@@ -1050,6 +1345,7 @@ impl PyDiGraph {
             self._add_edge(source, target, weight)?;
         }
         self.graph.remove_node(index);
+        self.cache.invalidate();
         self.node_removed = true;
         Ok(())
     }
@@ -1090,6 +1386,10 @@ impl PyDiGraph {
     ///     ``child`` are integer indexes describing where an edge should be
     ///     added, and obj is the python object for the edge data.
     ///
+    /// If the graph checks for cycles and any of the edges would create a
+    /// cycle a :class:`~retworkx.DAGWouldCycle` exception is raised and none
+    /// of the edges are added.
+    ///
     /// :returns: A list of int indices of the newly created edges
     /// :rtype: list
     #[pyo3(text_signature = "(self, obj_list, /)")]
@@ -1097,14 +1397,14 @@ impl PyDiGraph {
         &mut self,
         obj_list: Vec<(usize, usize, PyObject)>,
     ) -> PyResult<Vec<usize>> {
-        let mut out_list: Vec<usize> = Vec::with_capacity(obj_list.len());
-        for obj in obj_list {
-            let p_index = NodeIndex::new(obj.0);
-            let c_index = NodeIndex::new(obj.1);
-            let edge = self._add_edge(p_index, c_index, obj.2)?;
-            out_list.push(edge);
-        }
-        Ok(out_list)
+        self._add_edges(
+            obj_list
+                .into_iter()
+                .map(|(parent, child, obj)| {
+                    (NodeIndex::new(parent), NodeIndex::new(child), obj)
+                })
+                .collect(),
+        )
     }
 
     /// Add new edges to the dag without python data.
@@ -1115,6 +1415,10 @@ impl PyDiGraph {
     ///     added. Unlike :meth:`add_edges_from` there is no data payload and
     ///     when the edge is created None will be used.
     ///
+    /// If the graph checks for cycles and any of the edges would create a
+    /// cycle a :class:`~retworkx.DAGWouldCycle` exception is raised and none
+    /// of the edges are added.
+    ///
     /// :returns: A list of int indices of the newly created edges
     /// :rtype: list
     #[pyo3(text_signature = "(self, obj_list, /)")]
@@ -1123,14 +1427,14 @@ impl PyDiGraph {
         py: Python,
         obj_list: Vec<(usize, usize)>,
     ) -> PyResult<Vec<usize>> {
-        let mut out_list: Vec<usize> = Vec::with_capacity(obj_list.len());
-        for obj in obj_list {
-            let p_index = NodeIndex::new(obj.0);
-            let c_index = NodeIndex::new(obj.1);
-            let edge = self._add_edge(p_index, c_index, py.None())?;
-            out_list.push(edge);
-        }
-        Ok(out_list)
+        self._add_edges(
+            obj_list
+                .into_iter()
+                .map(|(parent, child)| {
+                    (NodeIndex::new(parent), NodeIndex::new(child), py.None())
+                })
+                .collect(),
+        )
     }
 
     /// Extend graph from an edge list
@@ -1142,24 +1446,30 @@ impl PyDiGraph {
     ///     where source and target are integer node indices. If the node index
     ///     is not present in the graph, nodes will be added (with a node
     ///     weight of ``None``) to that index.
+    ///
+    /// If the graph checks for cycles and any of the edges would create a
+    /// cycle a :class:`~retworkx.DAGWouldCycle` exception is raised and none
+    /// of the edges or nodes are added.
     #[pyo3(text_signature = "(self, edge_list, /)")]
     pub fn extend_from_edge_list(
         &mut self,
         py: Python,
         edge_list: Vec<(usize, usize)>,
     ) -> PyResult<()> {
+        let mut new_nodes: Vec<NodeIndex> = Vec::new();
+        let mut edges = Vec::with_capacity(edge_list.len());
         for (source, target) in edge_list {
             let max_index = cmp::max(source, target);
             while max_index >= self.node_count() {
-                self.graph.add_node(py.None());
+                new_nodes.push(self.graph.add_node(py.None()));
             }
-            self._add_edge(
+            edges.push((
                 NodeIndex::new(source),
                 NodeIndex::new(target),
                 py.None(),
-            )?;
+            ));
         }
-        Ok(())
+        self._extend_edges(new_nodes, edges)
     }
 
     /// Extend graph from a weighted edge list
@@ -1171,24 +1481,126 @@ impl PyDiGraph {
     ///     ``(source, target, weight)`` where source and target are integer
     ///     node indices. If the node index is not present in the graph
     ///     nodes will be added (with a node weight of ``None``) to that index.
+    ///
+    /// If the graph checks for cycles and any of the edges would create a
+    /// cycle a :class:`~retworkx.DAGWouldCycle` exception is raised and none
+    /// of the edges or nodes are added.
     #[pyo3(text_signature = "(self, edge_lsit, /)")]
     pub fn extend_from_weighted_edge_list(
         &mut self,
         py: Python,
         edge_list: Vec<(usize, usize, PyObject)>,
     ) -> PyResult<()> {
+        let mut new_nodes: Vec<NodeIndex> = Vec::new();
+        let mut edges = Vec::with_capacity(edge_list.len());
         for (source, target, weight) in edge_list {
             let max_index = cmp::max(source, target);
             while max_index >= self.node_count() {
-                self.graph.add_node(py.None());
+                new_nodes.push(self.graph.add_node(py.None()));
             }
-            self._add_edge(
+            edges.push((
                 NodeIndex::new(source),
                 NodeIndex::new(target),
                 weight,
-            )?;
+            ));
         }
-        Ok(())
+        self._extend_edges(new_nodes, edges)
+    }
+
+    /// Extend graph from a numpy array of edges
+    ///
+    /// This is the same as :meth:`extend_from_edge_list` and
+    /// :meth:`extend_from_weighted_edge_list` but the edges are read directly
+    /// from numpy arrays, which avoids creating a Python tuple for each edge.
+    ///
+    /// :param numpy.ndarray edge_array: A 2 dimensional integer array of shape
+    ///     ``(m, 2)`` where each row is the source and target node index of an
+    ///     edge. If a node index is not present in the graph, nodes will be
+    ///     added (with a node weight of ``None``) to that index. A
+    ///     ``ValueError`` is raised if that would add more than ``2 * m``
+    ///     nodes past the end of the graph.
+    /// :param numpy.ndarray weights: An optional 1 dimensional ``float64`` or
+    ///     ``int64`` array of length ``m`` with the weight of each edge. If it
+    ///     is not specified the edges will have a weight of ``None``.
+    ///
+    /// If the graph checks for cycles and any of the edges would create a
+    /// cycle a :class:`~retworkx.DAGWouldCycle` exception is raised and none
+    /// of the edges or nodes are added.
+    #[pyo3(text_signature = "(self, edge_array, /, weights=None)")]
+    pub fn extend_from_edge_array(
+        &mut self,
+        py: Python,
+        edge_array: &PyAny,
+        weights: Option<&PyAny>,
+    ) -> PyResult<()> {
+        let edges = edge_array::extract_edges(edge_array)?;
+        let weights = edge_array::extract_weights(py, weights, edges.len())?;
+        let required =
+            edge_array::required_nodes(&edges, self.graph.node_bound())?;
+        let mut new_nodes: Vec<NodeIndex> = Vec::with_capacity(
+            required.saturating_sub(self.graph.node_count()),
+        );
+        let mut new_edges = Vec::with_capacity(edges.len());
+        for ((source, target), weight) in edges.into_iter().zip(weights) {
+            // New nodes fill any removed node indices before the node
+            // bound grows, so this stops once the index exists.
+            for index in [source, target].iter() {
+                while !self.graph.contains_node(NodeIndex::new(*index)) {
+                    new_nodes.push(self.graph.add_node(py.None()));
+                }
+            }
+            new_edges.push((
+                NodeIndex::new(source),
+                NodeIndex::new(target),
+                weight,
+            ));
+        }
+        self._extend_edges(new_nodes, new_edges)
+    }
+
+    /// Create a new :class:`~retworkx.PyDiGraph` object from a numpy array of
+    /// edges
+    ///
+    /// :param numpy.ndarray edge_array: A 2 dimensional integer array of shape
+    ///     ``(m, 2)`` where each row is the source and target node index of an
+    ///     edge. The graph will have a node (with a node weight of ``None``)
+    ///     for every index up to the largest index in the array, which can't
+    ///     be more than ``2 * m`` nodes or a ``ValueError`` is raised.
+    /// :param numpy.ndarray weights: An optional 1 dimensional ``float64`` or
+    ///     ``int64`` array of length ``m`` with the weight of each edge. If it
+    ///     is not specified the edges will have a weight of ``None``.
+    ///
+    /// :returns: A new graph object with the edges from the array
+    /// :rtype: PyDiGraph
+    ///
+    /// For example:
+    ///
+    /// .. jupyter-execute::
+    ///
+    ///   import numpy as np
+    ///   import retworkx
+    ///
+    ///   edges = np.array([[0, 1], [1, 2], [2, 0]])
+    ///   weights = np.array([0.5, 1.5, 2.5])
+    ///   graph = retworkx.PyDiGraph.from_edge_array(edges, weights)
+    ///   print(graph.weighted_edge_list())
+    ///
+    #[staticmethod]
+    #[pyo3(text_signature = "(edge_array, /, weights=None)")]
+    pub fn from_edge_array(
+        py: Python,
+        edge_array: &PyAny,
+        weights: Option<&PyAny>,
+    ) -> PyResult<PyDiGraph> {
+        Ok(PyDiGraph {
+            graph: edge_array::graph_from_edge_array(py, edge_array, weights)?,
+            cycle_state: algo::DfsSpace::default(),
+            topo_order: None,
+            check_cycle: false,
+            node_removed: false,
+            cache: AnalysisCache::default(),
+            multigraph: true,
+        })
     }
 
     /// Insert a node between a list of reference nodes and all their predecessors
@@ -1310,6 +1722,7 @@ impl PyDiGraph {
             }
         };
         self.graph.remove_edge(edge_index);
+        self.cache.invalidate();
         Ok(())
     }
 
@@ -1320,6 +1733,7 @@ impl PyDiGraph {
     pub fn remove_edge_from_index(&mut self, edge: usize) -> PyResult<()> {
         let edge_index = EdgeIndex::new(edge);
         self.graph.remove_edge(edge_index);
+        self.cache.invalidate();
         Ok(())
     }
 
@@ -1348,6 +1762,7 @@ impl PyDiGraph {
                 }
             };
             self.graph.remove_edge(edge_index);
+            self.cache.invalidate();
         }
         Ok(())
     }
@@ -1361,6 +1776,7 @@ impl PyDiGraph {
     #[pyo3(text_signature = "(self, obj, /)")]
     pub fn add_node(&mut self, obj: PyObject) -> PyResult<usize> {
         let index = self.graph.add_node(obj);
+        self.cache.invalidate();
         Ok(index.index())
     }
 
@@ -1487,6 +1903,10 @@ impl PyDiGraph {
         let index = NodeIndex::new(parent);
         let child_node = self.graph.add_node(obj);
         self.graph.add_edge(index, child_node, edge);
+        self.cache.invalidate();
+        if let Some(order) = self.topo_order.as_mut() {
+            order.place_last(&self.graph, child_node);
+        }
         Ok(child_node.index())
     }
 
@@ -1511,6 +1931,10 @@ impl PyDiGraph {
         let index = NodeIndex::new(child);
         let parent_node = self.graph.add_node(obj);
         self.graph.add_edge(parent_node, index, edge);
+        self.cache.invalidate();
+        if let Some(order) = self.topo_order.as_mut() {
+            order.place_first(&self.graph, parent_node);
+        }
         Ok(parent_node.index())
     }
 
@@ -1720,6 +2144,7 @@ impl PyDiGraph {
     /// :rtype: NodeIndices
     #[pyo3(text_signature = "(self, obj_list, /)")]
     pub fn add_nodes_from(&mut self, obj_list: Vec<PyObject>) -> NodeIndices {
+        self.cache.invalidate();
         let out_list: Vec<usize> = obj_list
             .into_iter()
             .map(|obj| self.graph.add_node(obj).index())
@@ -1742,6 +2167,7 @@ impl PyDiGraph {
         for node in index_list.iter().map(|x| NodeIndex::new(*x)) {
             self.graph.remove_node(node);
         }
+        self.cache.invalidate();
         Ok(())
     }
 
@@ -1772,6 +2198,63 @@ impl PyDiGraph {
         neighbors.count()
     }
 
+    /// Get the inbound degree of every node
+    ///
+    /// :returns: An ``int64`` numpy array of length ``node_bound``, the
+    ///     largest node index plus one, where position ``i`` is the
+    ///     inbound degree of node ``i``. Positions of indices which are not in
+    ///     the graph are ``0``.
+    /// :rtype: numpy.ndarray
+    #[pyo3(text_signature = "(self)")]
+    pub fn in_degrees(&self, py: Python) -> PyObject {
+        let mut degrees: Vec<i64> = vec![0; self.graph.node_bound()];
+        for edge in self.graph.edge_references() {
+            degrees[edge.target().index()] += 1;
+        }
+        degrees.into_pyarray(py).into()
+    }
+
+    /// Get the outbound degree of every node
+    ///
+    /// :returns: An ``int64`` numpy array of length ``node_bound``, the
+    ///     largest node index plus one, where position ``i`` is the
+    ///     outbound degree of node ``i``. Positions of indices which are not in
+    ///     the graph are ``0``.
+    /// :rtype: numpy.ndarray
+    #[pyo3(text_signature = "(self)")]
+    pub fn out_degrees(&self, py: Python) -> PyObject {
+        let mut degrees: Vec<i64> = vec![0; self.graph.node_bound()];
+        for edge in self.graph.edge_references() {
+            degrees[edge.source().index()] += 1;
+        }
+        degrees.into_pyarray(py).into()
+    }
+
+    /// Get the neighbors of many nodes at once
+    ///
+    /// This is the same as calling :meth:`neighbors` for every node but
+    /// the result is returned as two numpy arrays in compressed sparse row
+    /// (CSR) form instead of a list per node.
+    ///
+    /// :param nodes: A sequence or 1 dimensional numpy integer array of the
+    ///     node indices to get the neighbors of
+    ///
+    /// :returns: A tuple of two ``int64`` numpy arrays ``(offsets, indices)``
+    ///     where the neighbors of ``nodes[i]`` are
+    ///     ``indices[offsets[i]:offsets[i + 1]]`` (the successors
+    ///     of ``nodes[i]``), sorted in ascending
+    ///     order and without duplicates. A node index which is not in the
+    ///     graph has no neighbors.
+    /// :rtype: tuple
+    #[pyo3(text_signature = "(self, nodes, /)")]
+    pub fn neighbors_of(
+        &self,
+        py: Python,
+        nodes: &PyAny,
+    ) -> PyResult<PyObject> {
+        sparse::neighbors_of(py, &self.graph, nodes)
+    }
+
     /// Find a target node with a specific edge
     ///
     /// This method is used to find a target node that is a adjacent to a given
@@ -1898,11 +2381,19 @@ impl PyDiGraph {
     /// of deliminated node ids. If there are more than 3 elements on
     /// a line the 3rd on will be treated as a string weight for the edge
     ///
+    /// The file is parsed in parallel chunks without holding the GIL, so
+    /// large edge lists can be loaded quickly. Gzip compressed files are
+    /// detected and decompressed automatically.
+    ///
     /// :param str path: The path of the file to open
     /// :param str comment: Optional character to use as a comment by default
     ///     there are no comment characters
     /// :param str deliminator: Optional character to use as a deliminator by
     ///     default any whitespace will be used
+    /// :param str weight_type: Optional type to parse the edge weights as,
+    ///     either ``"float"`` or ``"int"``. By default the weights are stored
+    ///     as strings. A ``ValueError`` is raised if a weight can't be parsed
+    ///     as the requested type.
     ///
     /// For example:
     ///
@@ -1925,66 +2416,29 @@ impl PyDiGraph {
     ///   mpl_draw(graph)
     ///
     #[staticmethod]
-    #[pyo3(text_signature = "(path, /, comment=None, deliminator=None)")]
+    #[pyo3(
+        text_signature = "(path, /, comment=None, deliminator=None, weight_type=None)"
+    )]
     pub fn read_edge_list(
         py: Python,
         path: &str,
         comment: Option<String>,
         deliminator: Option<String>,
+        weight_type: Option<&str>,
     ) -> PyResult<PyDiGraph> {
-        let file = File::open(path)?;
-        let buf_reader = BufReader::new(file);
-        let mut out_graph = StableDiGraph::<PyObject, PyObject>::new();
-        for line_raw in buf_reader.lines() {
-            let line = line_raw?;
-            let skip = match &comment {
-                Some(comm) => line.trim().starts_with(comm),
-                None => line.trim().is_empty(),
-            };
-            if skip {
-                continue;
-            }
-            let line_no_comments = match &comment {
-                Some(comm) => line
-                    .find(comm)
-                    .map(|idx| &line[..idx])
-                    .unwrap_or(&line)
-                    .trim()
-                    .to_string(),
-                None => line,
-            };
-            let pieces: Vec<&str> = match &deliminator {
-                Some(del) => line_no_comments.split(del).collect(),
-                None => line_no_comments.split_whitespace().collect(),
-            };
-            let src = pieces[0].parse::<usize>()?;
-            let target = pieces[1].parse::<usize>()?;
-            let max_index = cmp::max(src, target);
-            // Add nodes to graph
-            while max_index >= out_graph.node_count() {
-                out_graph.add_node(py.None());
-            }
-            // Add edges to graph
-            let weight = if pieces.len() > 2 {
-                let weight_str = match &deliminator {
-                    Some(del) => pieces[2..].join(del),
-                    None => pieces[2..].join(&' '.to_string()),
-                };
-                PyString::new(py, &weight_str).into()
-            } else {
-                py.None()
-            };
-            out_graph.add_edge(
-                NodeIndex::new(src),
-                NodeIndex::new(target),
-                weight,
-            );
-        }
         Ok(PyDiGraph {
-            graph: out_graph,
+            graph: edge_list::read_edge_list(
+                py,
+                path,
+                comment,
+                deliminator,
+                weight_type,
+            )?,
             cycle_state: algo::DfsSpace::default(),
+            topo_order: None,
             check_cycle: false,
             node_removed: false,
+            cache: AnalysisCache::default(),
             multigraph: true,
         })
     }
@@ -2064,6 +2518,101 @@ impl PyDiGraph {
         Ok(())
     }
 
+    /// Write the PyDiGraph object to a binary graph file
+    ///
+    /// The binary format stores the structure of the graph as compressed
+    /// sparse row (CSR) index arrays, an optional column of ``float64`` edge
+    /// weights and a pickle of the node and edge data payloads. Node and edge
+    /// indices are preserved when the file is read back with
+    /// :meth:`~retworkx.PyDiGraph.read_binary`. The index arrays and weight
+    /// column are stored uncompressed and 8 byte aligned, so for very large
+    /// graphs writing and reading them is much faster than pickling the
+    /// graph.
+    ///
+    /// :param str path: The path to write the output file to
+    /// :param weight_fn: An optional callable which will be passed the data
+    ///     payload of each edge and is expected to return a ``float`` weight
+    ///     for the edge. It can also be an edge data key or a weight array,
+    ///     see :ref:`edge-weights`.
+    ///     If specified the weights are stored in a separate column of the
+    ///     file.
+    /// :param bool payloads: If set to ``False`` the node and edge data
+    ///     payloads are not written to the file. Defaults to ``True``, in
+    ///     which case all the payloads must be picklable.
+    ///
+    /// For example:
+    ///
+    /// .. jupyter-execute::
+    ///
+    ///   import os
+    ///   import tempfile
+    ///
+    ///   import retworkx
+    ///
+    ///   graph = retworkx.generators.directed_path_graph(5)
+    ///   path = os.path.join(tempfile.gettempdir(), "graph.rxg")
+    ///   graph.write_binary(path)
+    ///   new_graph = retworkx.PyDiGraph.read_binary(path)
+    ///   print(new_graph.edge_list())
+    ///
+    #[args(payloads = "true")]
+    #[pyo3(text_signature = "(self, path, /, weight_fn=None, payloads=True)")]
+    pub fn write_binary(
+        &self,
+        py: Python,
+        path: &str,
+        weight_fn: Option<PyObject>,
+        payloads: bool,
+    ) -> PyResult<()> {
+        binary::write_binary(
+            py,
+            &self.graph,
+            self.multigraph,
+            path,
+            weight_fn,
+            payloads,
+        )
+    }
+
+    /// Read a binary graph file and create a new PyDiGraph object from the
+    /// contents
+    ///
+    /// The file must have been written by
+    /// :meth:`~retworkx.PyDiGraph.write_binary`.
+    ///
+    /// :param str path: The path of the file to open
+    /// :param bool payloads: If set to ``False`` the node and edge data
+    ///     payloads stored in the file are not unpickled, which skips the
+    ///     slowest part of reading a large graph. Nodes will then have a data
+    ///     payload of ``None`` and edges will have their ``float`` weight from
+    ///     the weight column of the file as their data payload, or ``None`` if
+    ///     the file has no weight column. Defaults to ``True``.
+    ///
+    /// :returns: A new graph object with the contents of the file
+    /// :rtype: PyDiGraph
+    /// :raises ValueError: If the file is not a binary graph file, is
+    ///     truncated or corrupted, or contains a graph of the other type
+    #[staticmethod]
+    #[args(payloads = "true")]
+    #[pyo3(text_signature = "(path, /, payloads=True)")]
+    pub fn read_binary(
+        py: Python,
+        path: &str,
+        payloads: bool,
+    ) -> PyResult<PyDiGraph> {
+        let (graph, multigraph, node_removed) =
+            binary::read_binary(py, path, payloads)?;
+        Ok(PyDiGraph {
+            graph,
+            cycle_state: algo::DfsSpace::default(),
+            topo_order: None,
+            check_cycle: false,
+            node_removed,
+            cache: AnalysisCache::default(),
+            multigraph,
+        })
+    }
+
     /// Create a new :class:`~retworkx.PyDiGraph` object from an adjacency matrix
     ///
     /// This method can be used to construct a new :class:`~retworkx.PyDiGraph`
@@ -2109,12 +2658,54 @@ impl PyDiGraph {
         PyDiGraph {
             graph: out_graph,
             cycle_state: algo::DfsSpace::default(),
+            topo_order: None,
             check_cycle: false,
             node_removed: false,
+            cache: AnalysisCache::default(),
             multigraph: true,
         }
     }
 
+    /// Create a new :class:`~retworkx.PyDiGraph` object from a sparse adjacency
+    /// matrix
+    ///
+    /// This is the same as :meth:`from_adjacency_matrix` but the matrix is
+    /// passed as compressed sparse row (CSR) arrays, for example the
+    /// ``data``, ``indices`` and ``indptr`` attributes of a
+    /// :class:`scipy.sparse.csr_matrix`. The node weights will be the index
+    /// from the matrix and every entry greater than 0 becomes an edge with a
+    /// float weight of the value from the matrix. Duplicate entries in a row
+    /// are summed.
+    ///
+    /// :param ndarray data: The ``float64`` values of the matrix entries
+    /// :param ndarray indices: The integer column index of each entry
+    /// :param ndarray indptr: The integer offsets of the entries of each row
+    ///     in ``indices`` and ``data``, it has one more element than the
+    ///     matrix has rows
+    ///
+    /// :returns: A new graph object generated from the adjacency matrix
+    /// :rtype: PyDiGraph
+    #[staticmethod]
+    #[pyo3(text_signature = "(data, indices, indptr, /)")]
+    pub fn from_sparse_adjacency_matrix(
+        py: Python,
+        data: PyReadonlyArray1<f64>,
+        indices: &PyAny,
+        indptr: &PyAny,
+    ) -> PyResult<PyDiGraph> {
+        Ok(PyDiGraph {
+            graph: sparse::from_sparse_adjacency_matrix(
+                py, data, indices, indptr,
+            )?,
+            cycle_state: algo::DfsSpace::default(),
+            topo_order: None,
+            check_cycle: false,
+            node_removed: false,
+            cache: AnalysisCache::default(),
+            multigraph: true,
+        })
+    }
+
     /// Add another PyDiGraph object into this PyDiGraph
     ///
     /// :param PyDiGraph other: The other PyDiGraph object to add onto this
@@ -2190,6 +2781,7 @@ impl PyDiGraph {
         let mut new_node_map: HashMap<NodeIndex, NodeIndex> =
             HashMap::with_capacity(other.node_count());
 
+        self.cache.invalidate();
         // TODO: Reimplement this without looping over the graphs
         // Loop over other nodes add add to self graph
         for node in other.graph.node_indices() {
@@ -2299,6 +2891,7 @@ impl PyDiGraph {
                 node
             )));
         }
+        self.cache.invalidate();
         // Copy nodes from other to self
         let mut out_map: HashMap<usize, usize> =
             HashMap::with_capacity(other.node_count());
@@ -2420,7 +3013,9 @@ impl PyDiGraph {
         PyDiGraph {
             graph: out_graph,
             node_removed: false,
+            cache: AnalysisCache::default(),
             cycle_state: algo::DfsSpace::default(),
+            topo_order: None,
             check_cycle: self.check_cycle,
             multigraph: self.multigraph,
         }
@@ -2536,6 +3131,7 @@ impl PyDiGraph {
         Ok(crate::graph::PyGraph {
             graph: new_graph,
             node_removed: false,
+            cache: AnalysisCache::default(),
             multigraph,
         })
     }
@@ -2578,6 +3174,7 @@ impl PyMappingProtocol for PyDiGraph {
     }
 
     fn __delitem__(&'p mut self, idx: usize) -> PyResult<()> {
+        self.cache.invalidate();
         match self.graph.remove_node(NodeIndex::new(idx as usize)) {
             Some(_) => Ok(()),
             None => Err(PyIndexError::new_err("No node found for index")),
@@ -2601,6 +3198,14 @@ fn is_cycle_check_required(
         && dag.graph.find_edge(a, b).is_none()
 }
 
+fn would_cycle_error(edge: (NodeIndex, NodeIndex)) -> PyErr {
+    DAGWouldCycle::new_err(format!(
+        "Adding the edge from {} to {} would cycle",
+        edge.0.index(),
+        edge.1.index()
+    ))
+}
+
 fn weight_transform_callable(
     py: Python,
     map_fn: &Option<PyObject>,
@@ -2649,6 +3254,8 @@ impl PyGCProtocol for PyDiGraph {
     // [2] https://pyo3.rs/v0.12.4/class/protocols.html#garbage-collector-integration
     fn __clear__(&mut self) {
         self.graph = StableDiGraph::<PyObject, PyObject>::new();
+        self.cache.invalidate();
         self.node_removed = false;
+        self.topo_order = None;
     }
 }
@@ -101,6 +101,27 @@ pub fn dijkstra<G, F, K>(
     graph: G,
     start: G::NodeId,
     goal: Option<G::NodeId>,
+    edge_cost: F,
+    path: Option<&mut HashMap<G::NodeId, Vec<G::NodeId>>>,
+) -> PyResult<HashMap<G::NodeId, K>>
+where
+    G: IntoEdges + Visitable,
+    G::NodeId: Eq + Hash,
+    F: FnMut(G::EdgeRef) -> PyResult<K>,
+    K: Measure + Copy,
+{
+    multi_source_dijkstra(graph, &[start], goal, edge_cost, path)
+}
+
+/// Dijkstra's algorithm starting from every node in ``starts`` at once
+///
+/// This is the same as running Dijkstra's algorithm from a virtual node
+/// with a zero cost edge to every start node, the score of each node is the
+/// length of the shortest path from the closest start node.
+pub fn multi_source_dijkstra<G, F, K>(
+    graph: G,
+    starts: &[G::NodeId],
+    goal: Option<G::NodeId>,
     mut edge_cost: F,
     mut path: Option<&mut HashMap<G::NodeId, Vec<G::NodeId>>>,
 ) -> PyResult<HashMap<G::NodeId, K>>
@@ -114,10 +135,12 @@ where
     let mut scores = HashMap::new();
     let mut visit_next = BinaryHeap::new();
     let zero_score = K::default();
-    scores.insert(start, zero_score);
-    visit_next.push(MinScored(zero_score, start));
-    if path.is_some() {
-        path.as_mut().unwrap().insert(start, vec![start]);
+    for start in starts {
+        scores.insert(*start, zero_score);
+        visit_next.push(MinScored(zero_score, *start));
+        if path.is_some() {
+            path.as_mut().unwrap().insert(*start, vec![*start]);
+        }
     }
     while let Some(MinScored(node_score, node)) = visit_next.pop() {
         if visited.is_visited(&node) {
@@ -160,3 +183,58 @@ where
     }
     Ok(scores)
 }
+
+/// Dijkstra's algorithm recording the predecessor of every reached node
+///
+/// Instead of building the whole path to every node this returns a map from
+/// each node reachable from ``start``, other than ``start`` itself, to the
+/// node before it on its shortest path. Any single path can then be followed
+/// back from its target, so the output only grows linearly with the number
+/// of reachable nodes.
+pub fn dijkstra_predecessors<G, F, K>(
+    graph: G,
+    start: G::NodeId,
+    mut edge_cost: F,
+) -> PyResult<HashMap<G::NodeId, G::NodeId>>
+where
+    G: IntoEdges + Visitable,
+    G::NodeId: Eq + Hash,
+    F: FnMut(G::EdgeRef) -> PyResult<K>,
+    K: Measure + Copy,
+{
+    let mut visited = graph.visit_map();
+    let mut scores = HashMap::new();
+    let mut predecessors = HashMap::new();
+    let mut visit_next = BinaryHeap::new();
+    let zero_score = K::default();
+    scores.insert(start, zero_score);
+    visit_next.push(MinScored(zero_score, start));
+    while let Some(MinScored(node_score, node)) = visit_next.pop() {
+        if visited.is_visited(&node) {
+            continue;
+        }
+        for edge in graph.edges(node) {
+            let next = edge.target();
+            if visited.is_visited(&next) {
+                continue;
+            }
+            let next_score = node_score + edge_cost(edge)?;
+            match scores.entry(next) {
+                Occupied(ent) => {
+                    if next_score < *ent.get() {
+                        *ent.into_mut() = next_score;
+                        visit_next.push(MinScored(next_score, next));
+                        predecessors.insert(next, node);
+                    }
+                }
+                Vacant(ent) => {
+                    ent.insert(next_score);
+                    visit_next.push(MinScored(next_score, next));
+                    predecessors.insert(next, node);
+                }
+            }
+        }
+        visited.visit(node);
+    }
+    Ok(predecessors)
+}
@@ -0,0 +1,145 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+use std::cmp;
+use std::convert::TryInto;
+
+use ndarray::ArrayView2;
+use numpy::{PyReadonlyArray1, PyReadonlyArray2};
+use pyo3::exceptions::{PyTypeError, PyValueError};
+use pyo3::prelude::*;
+
+use petgraph::graph::NodeIndex;
+use petgraph::stable_graph::StableGraph;
+use petgraph::EdgeType;
+
+fn edges_from_view<T>(array: ArrayView2<T>) -> PyResult<Vec<(usize, usize)>>
+where
+    T: Copy + TryInto<usize>,
+{
+    if array.shape()[1] != 2 {
+        return Err(PyValueError::new_err(format!(
+            "Edge array must have shape (m, 2), not ({}, {})",
+            array.shape()[0],
+            array.shape()[1]
+        )));
+    }
+    let index = |value: T| -> PyResult<usize> {
+        value.try_into().map_err(|_| {
+            PyValueError::new_err("Edge array contains a negative node index")
+        })
+    };
+    array
+        .outer_iter()
+        .map(|row| Ok((index(row[0])?, index(row[1])?)))
+        .collect()
+}
+
+/// Extract the ``(source, target)`` pairs from a ``(m, 2)`` integer array
+pub fn extract_edges(edge_array: &PyAny) -> PyResult<Vec<(usize, usize)>> {
+    if let Ok(array) = edge_array.extract::<PyReadonlyArray2<i64>>() {
+        edges_from_view(array.as_array())
+    } else if let Ok(array) = edge_array.extract::<PyReadonlyArray2<u64>>() {
+        edges_from_view(array.as_array())
+    } else if let Ok(array) = edge_array.extract::<PyReadonlyArray2<i32>>() {
+        edges_from_view(array.as_array())
+    } else if let Ok(array) = edge_array.extract::<PyReadonlyArray2<u32>>() {
+        edges_from_view(array.as_array())
+    } else {
+        Err(PyTypeError::new_err(
+            "Edge array must be a 2 dimensional numpy array with an integer \
+             data type",
+        ))
+    }
+}
+
+/// Extract the edge data payloads from an optional 1 dimensional array of
+/// weights, if there is no array every payload is ``None``
+pub fn extract_weights(
+    py: Python,
+    weights: Option<&PyAny>,
+    num_edges: usize,
+) -> PyResult<Vec<PyObject>> {
+    let weights = match weights {
+        Some(weights) => weights,
+        None => return Ok((0..num_edges).map(|_| py.None()).collect()),
+    };
+    let out: Vec<PyObject> =
+        if let Ok(array) = weights.extract::<PyReadonlyArray1<f64>>() {
+            array.as_array().iter().map(|w| w.to_object(py)).collect()
+        } else if let Ok(array) = weights.extract::<PyReadonlyArray1<i64>>() {
+            array.as_array().iter().map(|w| w.to_object(py)).collect()
+        } else {
+            return Err(PyTypeError::new_err(
+                "Weights must be a 1 dimensional numpy array with a float64 \
+                 or int64 data type",
+            ));
+        };
+    if out.len() != num_edges {
+        return Err(PyValueError::new_err(format!(
+            "Weights array has {} elements but there are {} edges",
+            out.len(),
+            num_edges
+        )));
+    }
+    Ok(out)
+}
+
+/// Return the number of nodes needed for every index in ``edges`` to exist in
+/// a graph whose node indices end at ``node_bound``
+///
+/// An index past the end of the graph adds a node for every index up to it,
+/// a ``ValueError`` is raised if that would be more nodes than the array has
+/// edge endpoints since it's almost certainly a stray value in the array.
+pub fn required_nodes(
+    edges: &[(usize, usize)],
+    node_bound: usize,
+) -> PyResult<usize> {
+    let required = edges
+        .iter()
+        .map(|(source, target)| cmp::max(*source, *target) + 1)
+        .max()
+        .unwrap_or(0);
+    let limit = cmp::min(node_bound + 2 * edges.len(), u32::MAX as usize);
+    if required > limit {
+        return Err(PyValueError::new_err(format!(
+            "Edge array node index {} is too far past the end of the graph, \
+             {} edges can add at most {} new nodes",
+            required - 1,
+            edges.len(),
+            limit.saturating_sub(node_bound)
+        )));
+    }
+    Ok(required)
+}
+
+/// Build a new graph from an edge array and optional weights array
+pub fn graph_from_edge_array<Ty: EdgeType>(
+    py: Python,
+    edge_array: &PyAny,
+    weights: Option<&PyAny>,
+) -> PyResult<StableGraph<PyObject, PyObject, Ty>> {
+    let edges = extract_edges(edge_array)?;
+    let weights = extract_weights(py, weights, edges.len())?;
+    let node_count = required_nodes(&edges, 0)?;
+    let mut graph = StableGraph::<PyObject, PyObject, Ty>::with_capacity(
+        node_count,
+        edges.len(),
+    );
+    for _ in 0..node_count {
+        graph.add_node(py.None());
+    }
+    for ((source, target), weight) in edges.into_iter().zip(weights) {
+        graph.add_edge(NodeIndex::new(source), NodeIndex::new(target), weight);
+    }
+    Ok(graph)
+}
@@ -0,0 +1,246 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+use std::str;
+
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyString};
+
+use petgraph::graph::NodeIndex;
+use petgraph::stable_graph::StableGraph;
+use petgraph::EdgeType;
+
+use rayon::prelude::*;
+
+/// Files smaller than this are parsed as a single chunk
+const PARALLEL_THRESHOLD: usize = 1 << 20;
+
+/// First two bytes of a gzip stream
+const GZIP_MAGIC: [u8; 2] = [0x1f, 0x8b];
+
+/// How the weight column of an edge list is stored in the edge data payloads
+#[derive(Clone, Copy)]
+pub enum WeightType {
+    Str,
+    Float,
+    Int,
+}
+
+impl WeightType {
+    pub fn from_option(weight_type: Option<&str>) -> PyResult<Self> {
+        match weight_type {
+            None => Ok(WeightType::Str),
+            Some("float") => Ok(WeightType::Float),
+            Some("int") => Ok(WeightType::Int),
+            Some(other) => Err(PyValueError::new_err(format!(
+                "Invalid weight_type '{}', it must be None, 'float' or 'int'",
+                other
+            ))),
+        }
+    }
+}
+
+enum Weight<'a> {
+    Empty,
+    Str(String),
+    Slice(&'a str),
+    Float(f64),
+    Int(i64),
+}
+
+impl<'a> Weight<'a> {
+    fn into_py(self, py: Python) -> PyObject {
+        match self {
+            Weight::Empty => py.None(),
+            Weight::Str(weight) => PyString::new(py, &weight).into(),
+            Weight::Slice(weight) => PyString::new(py, weight).into(),
+            Weight::Float(weight) => weight.into_py(py),
+            Weight::Int(weight) => weight.into_py(py),
+        }
+    }
+}
+
+/// Parse the lines in ``text`` into a list of ``(source, target, weight)``
+fn parse_chunk<'a>(
+    text: &'a str,
+    comment: &Option<String>,
+    deliminator: &Option<String>,
+    weight_type: WeightType,
+) -> PyResult<Vec<(usize, usize, Weight<'a>)>> {
+    let mut edges = Vec::new();
+    for line in text.lines() {
+        let line = match comment {
+            Some(comm) => line
+                .find(comm.as_str())
+                .map(|idx| &line[..idx])
+                .unwrap_or(line),
+            None => line,
+        };
+        let line = line.trim();
+        if line.is_empty() {
+            continue;
+        }
+        // With a deliminator everything after the target is the weight,
+        // which is what joining the rest of the pieces back together gives
+        let edge = match deliminator {
+            Some(del) => {
+                parse_line(line, line.splitn(3, del.as_str()), weight_type)?
+            }
+            None => parse_line(line, line.split_whitespace(), weight_type)?,
+        };
+        edges.push(edge);
+    }
+    Ok(edges)
+}
+
+/// Parse the source, target and optional weight of a line from its pieces
+fn parse_line<'a, I>(
+    line: &str,
+    mut pieces: I,
+    weight_type: WeightType,
+) -> PyResult<(usize, usize, Weight<'a>)>
+where
+    I: Iterator<Item = &'a str>,
+{
+    let src = pieces.next().unwrap_or("").trim().parse::<usize>()?;
+    let target = match pieces.next() {
+        Some(target) => target.trim().parse::<usize>()?,
+        None => {
+            return Err(PyValueError::new_err(format!(
+                "Edge list line '{}' has no target node",
+                line
+            )))
+        }
+    };
+    let first = match pieces.next() {
+        Some(first) => first,
+        None => return Ok((src, target, Weight::Empty)),
+    };
+    let weight = match pieces.next() {
+        None => match weight_type {
+            WeightType::Str => Weight::Slice(first),
+            WeightType::Float => Weight::Float(parse_weight(first)?),
+            WeightType::Int => Weight::Int(parse_weight(first)?),
+        },
+        // A weight containing whitespace is joined back with single spaces
+        Some(second) => {
+            let mut weight = [first, second].join(" ");
+            for piece in pieces {
+                weight.push(' ');
+                weight.push_str(piece);
+            }
+            match weight_type {
+                WeightType::Str => Weight::Str(weight),
+                WeightType::Float => Weight::Float(parse_weight(&weight)?),
+                WeightType::Int => Weight::Int(parse_weight(&weight)?),
+            }
+        }
+    };
+    Ok((src, target, weight))
+}
+
+fn parse_weight<T: str::FromStr>(weight: &str) -> PyResult<T> {
+    weight.trim().parse::<T>().map_err(|_| {
+        PyValueError::new_err(format!("Invalid edge weight '{}'", weight))
+    })
+}
+
+/// Split ``data`` into roughly ``num_chunks`` pieces on line boundaries
+fn split_lines(data: &[u8], num_chunks: usize) -> Vec<&[u8]> {
+    let chunk_size = data.len() / num_chunks + 1;
+    let mut chunks = Vec::with_capacity(num_chunks);
+    let mut start = 0;
+    while start < data.len() {
+        let mut end = std::cmp::min(start + chunk_size, data.len());
+        while end < data.len() && data[end - 1] != b'\n' {
+            end += 1;
+        }
+        chunks.push(&data[start..end]);
+        start = end;
+    }
+    chunks
+}
+
+/// Read an edge list file into a new graph
+///
+/// The file is read into memory (decompressing it first if it is gzip
+/// compressed) and split into chunks of lines which are parsed in parallel
+/// without holding the GIL. The graph is then built in a single pass with
+/// its node and edge storage sized up front.
+pub fn read_edge_list<Ty: EdgeType>(
+    py: Python,
+    path: &str,
+    comment: Option<String>,
+    deliminator: Option<String>,
+    weight_type: Option<&str>,
+) -> PyResult<StableGraph<PyObject, PyObject, Ty>> {
+    let weight_type = WeightType::from_option(weight_type)?;
+    let raw = std::fs::read(path)?;
+    let decompressed: Option<&PyBytes> = if raw.starts_with(&GZIP_MAGIC) {
+        let gzip = py.import("gzip")?;
+        Some(
+            gzip.call_method1("decompress", (PyBytes::new(py, &raw),))?
+                .downcast::<PyBytes>()?,
+        )
+    } else {
+        None
+    };
+    let data: &[u8] = match decompressed {
+        Some(bytes) => bytes.as_bytes(),
+        None => &raw,
+    };
+
+    let chunks: Vec<Vec<(usize, usize, Weight)>> = py.allow_threads(|| {
+        let num_chunks = if data.len() < PARALLEL_THRESHOLD {
+            1
+        } else {
+            4 * rayon::current_num_threads()
+        };
+        split_lines(data, num_chunks)
+            .into_par_iter()
+            .map(|chunk| {
+                let text = str::from_utf8(chunk).map_err(|err| {
+                    PyValueError::new_err(format!(
+                        "Edge list file is not valid UTF-8: {}",
+                        err
+                    ))
+                })?;
+                parse_chunk(text, &comment, &deliminator, weight_type)
+            })
+            .collect::<PyResult<_>>()
+    })?;
+
+    let edge_count: usize = chunks.iter().map(|chunk| chunk.len()).sum();
+    let node_count = chunks
+        .iter()
+        .flat_map(|chunk| chunk.iter())
+        .map(|(src, target, _)| std::cmp::max(*src, *target) + 1)
+        .max()
+        .unwrap_or(0);
+    let mut graph = StableGraph::<PyObject, PyObject, Ty>::with_capacity(
+        node_count, edge_count,
+    );
+    for _ in 0..node_count {
+        graph.add_node(py.None());
+    }
+    for chunk in chunks {
+        for (src, target, weight) in chunk {
+            graph.add_edge(
+                NodeIndex::new(src),
+                NodeIndex::new(target),
+                weight.into_py(py),
+            );
+        }
+    }
+    Ok(graph)
+}
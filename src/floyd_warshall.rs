@@ -0,0 +1,101 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+use ndarray::prelude::*;
+use rayon::prelude::*;
+
+/// Number of rows (and intermediate nodes) processed together in a single
+/// round of the blocked algorithm.
+const BLOCK_SIZE: usize = 64;
+
+/// Number of columns of a row swept at once, this keeps the slice of the
+/// pivot band in use small enough to stay in cache.
+const TILE_SIZE: usize = 256;
+
+/// Relax the rows of ``rows`` through every intermediate node in
+/// ``k_start..k_start + band.len() / n`` using the pivot rows in ``band``.
+///
+/// ``band`` holds a finished copy of the pivot rows, so every row in
+/// ``rows`` can be updated independently of all the others.
+fn relax_rows(rows: &mut [f64], band: &[f64], k_start: usize, n: usize) {
+    let num_k = band.len() / n;
+    let mut col_start = 0;
+    while col_start < n {
+        let col_end = std::cmp::min(col_start + TILE_SIZE, n);
+        for row in rows.chunks_mut(n) {
+            for k_offset in 0..num_k {
+                let m_ik = row[k_start + k_offset];
+                if m_ik == std::f64::INFINITY {
+                    continue;
+                }
+                let row_k =
+                    &band[k_offset * n + col_start..k_offset * n + col_end];
+                row[col_start..col_end]
+                    .iter_mut()
+                    .zip(row_k.iter())
+                    .for_each(|(m_ij, m_kj)| {
+                        let d_ikj = m_ik + *m_kj;
+                        if d_ikj < *m_ij {
+                            *m_ij = d_ikj;
+                        }
+                    });
+            }
+        }
+        col_start = col_end;
+    }
+}
+
+/// Run the Floyd-Warshall algorithm in place on a dense distance matrix
+///
+/// ``mat`` must be a square matrix in standard (row major) layout where
+/// ``mat[[i, j]]`` is the weight of the edge from ``i`` to ``j`` (``inf`` if
+/// there is no edge) and the diagonal is set to 0. On return it contains the
+/// shortest path length between every pair of nodes.
+///
+/// The matrix is processed in bands of ``BLOCK_SIZE`` rows. For each band the
+/// intermediate nodes it contains are first applied to the band itself, which
+/// only reads rows from that band, then a copy of the finished band is used
+/// to relax all the other rows. Those rows don't depend on each other, so if
+/// ``parallel`` is set they are split into blocks and updated in parallel.
+pub fn floyd_warshall_dense(mat: &mut Array2<f64>, parallel: bool) {
+    let n = mat.shape()[0];
+    if n == 0 {
+        return;
+    }
+    let dist = mat
+        .as_slice_mut()
+        .expect("Distance matrix is not in standard layout");
+    let mut row_k: Vec<f64> = vec![0.; n];
+    let mut band: Vec<f64> = Vec::with_capacity(BLOCK_SIZE * n);
+    for (block, k_start) in (0..n).step_by(BLOCK_SIZE).enumerate() {
+        let k_end = std::cmp::min(k_start + BLOCK_SIZE, n);
+        // Close the band over its own intermediate nodes
+        for k in k_start..k_end {
+            row_k.copy_from_slice(&dist[k * n..(k + 1) * n]);
+            relax_rows(&mut dist[k_start * n..k_end * n], &row_k, k, n);
+        }
+        band.clear();
+        band.extend_from_slice(&dist[k_start * n..k_end * n]);
+        // Relax every other row through the band
+        if parallel {
+            dist.par_chunks_mut(BLOCK_SIZE * n)
+                .enumerate()
+                .filter(|(index, _)| *index != block)
+                .for_each(|(_, rows)| relax_rows(rows, &band, k_start, n));
+        } else {
+            dist.chunks_mut(BLOCK_SIZE * n)
+                .enumerate()
+                .filter(|(index, _)| *index != block)
+                .for_each(|(_, rows)| relax_rows(rows, &band, k_start, n));
+        }
+    }
+}
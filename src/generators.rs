@@ -22,6 +22,7 @@ use pyo3::prelude::*;
 use pyo3::wrap_pyfunction;
 use pyo3::Python;
 
+use super::analysis_cache::AnalysisCache;
 use super::digraph;
 use super::graph;
 
@@ -115,8 +116,10 @@ pub fn directed_cycle_graph(
     Ok(digraph::PyDiGraph {
         graph,
         node_removed: false,
+        cache: AnalysisCache::default(),
         check_cycle: false,
         cycle_state: algo::DfsSpace::default(),
+        topo_order: None,
         multigraph,
     })
 }
@@ -190,6 +193,7 @@ pub fn cycle_graph(
     Ok(graph::PyGraph {
         graph,
         node_removed: false,
+        cache: AnalysisCache::default(),
         multigraph,
     })
 }
@@ -265,8 +269,10 @@ pub fn directed_path_graph(
     Ok(digraph::PyDiGraph {
         graph,
         node_removed: false,
+        cache: AnalysisCache::default(),
         check_cycle: false,
         cycle_state: algo::DfsSpace::default(),
+        topo_order: None,
         multigraph,
     })
 }
@@ -332,6 +338,7 @@ pub fn path_graph(
     Ok(graph::PyGraph {
         graph,
         node_removed: false,
+        cache: AnalysisCache::default(),
         multigraph,
     })
 }
@@ -419,8 +426,10 @@ pub fn directed_star_graph(
     Ok(digraph::PyDiGraph {
         graph,
         node_removed: false,
+        cache: AnalysisCache::default(),
         check_cycle: false,
         cycle_state: algo::DfsSpace::default(),
+        topo_order: None,
         multigraph,
     })
 }
@@ -483,6 +492,7 @@ pub fn star_graph(
     Ok(graph::PyGraph {
         graph,
         node_removed: false,
+        cache: AnalysisCache::default(),
         multigraph,
     })
 }
@@ -548,6 +558,7 @@ pub fn mesh_graph(
     Ok(graph::PyGraph {
         graph,
         node_removed: false,
+        cache: AnalysisCache::default(),
         multigraph,
     })
 }
@@ -613,8 +624,10 @@ pub fn directed_mesh_graph(
     Ok(digraph::PyDiGraph {
         graph,
         node_removed: false,
+        cache: AnalysisCache::default(),
         check_cycle: false,
         cycle_state: algo::DfsSpace::default(),
+        topo_order: None,
         multigraph,
     })
 }
@@ -722,6 +735,7 @@ pub fn grid_graph(
     Ok(graph::PyGraph {
         graph,
         node_removed: false,
+        cache: AnalysisCache::default(),
         multigraph,
     })
 }
@@ -848,8 +862,10 @@ pub fn directed_grid_graph(
     Ok(digraph::PyDiGraph {
         graph,
         node_removed: false,
+        cache: AnalysisCache::default(),
         check_cycle: false,
         cycle_state: algo::DfsSpace::default(),
+        topo_order: None,
         multigraph,
     })
 }
@@ -944,6 +960,7 @@ pub fn binomial_tree_graph(
     Ok(graph::PyGraph {
         graph,
         node_removed: false,
+        cache: AnalysisCache::default(),
         multigraph,
     })
 }
@@ -1066,8 +1083,10 @@ pub fn directed_binomial_tree_graph(
     Ok(digraph::PyDiGraph {
         graph,
         node_removed: false,
+        cache: AnalysisCache::default(),
         check_cycle: false,
         cycle_state: algo::DfsSpace::default(),
+        topo_order: None,
         multigraph,
     })
 }
@@ -1151,6 +1170,7 @@ pub fn hexagonal_lattice_graph(
     Ok(graph::PyGraph {
         graph,
         node_removed: true,
+        cache: AnalysisCache::default(),
         multigraph,
     })
 }
@@ -1253,8 +1273,10 @@ pub fn directed_hexagonal_lattice_graph(
     Ok(digraph::PyDiGraph {
         graph,
         node_removed: true,
+        cache: AnalysisCache::default(),
         check_cycle: false,
         cycle_state: algo::DfsSpace::default(),
+        topo_order: None,
         multigraph,
     })
 }
@@ -14,7 +14,7 @@ use std::cmp;
 use std::collections::BTreeMap;
 use std::fs::File;
 use std::io::prelude::*;
-use std::io::{BufReader, BufWriter};
+use std::io::BufWriter;
 use std::ops::{Index, IndexMut};
 use std::str;
 
@@ -29,12 +29,17 @@ use pyo3::PyTraverseError;
 use pyo3::Python;
 
 use ndarray::prelude::*;
-use numpy::PyReadonlyArray2;
+use numpy::{IntoPyArray, PyReadonlyArray1, PyReadonlyArray2};
 
+use super::analysis_cache::AnalysisCache;
+use super::binary;
 use super::dot_utils::build_dot;
+use super::edge_array;
+use super::edge_list;
 use super::iterators::{
     EdgeIndexMap, EdgeIndices, EdgeList, NodeIndices, WeightedEdgeList,
 };
+use super::sparse;
 use super::{NoEdgeBetweenNodes, NodesRemoved};
 
 use petgraph::graph::{EdgeIndex, NodeIndex};
@@ -120,6 +125,7 @@ pub struct PyGraph {
     pub graph: StableUnGraph<PyObject, PyObject>,
     pub node_removed: bool,
     pub multigraph: bool,
+    pub cache: AnalysisCache,
 }
 
 pub type Edges<'a, E> =
@@ -300,6 +306,7 @@ impl PyGraph {
         PyGraph {
             graph: StableUnGraph::<PyObject, PyObject>::default(),
             node_removed: false,
+            cache: AnalysisCache::default(),
             multigraph,
         }
     }
@@ -331,6 +338,7 @@ impl PyGraph {
 
     fn __setstate__(&mut self, py: Python, state: PyObject) -> PyResult<()> {
         self.graph = StableUnGraph::<PyObject, PyObject>::default();
+        self.cache.invalidate();
         let dict_state = state.cast_as::<PyDict>(py)?;
         let nodes_dict =
             dict_state.get_item("nodes").unwrap().downcast::<PyDict>()?;
@@ -388,6 +396,40 @@ impl PyGraph {
         Ok(())
     }
 
+    /// Whether the results of analyses on the graph are cached
+    ///
+    /// If set to ``True`` the results of :func:`~retworkx.transitivity` are stored on the graph
+    /// and returned again by later calls until the graph is changed. Adding
+    /// or removing nodes or edges invalidates every cached result, changing
+    /// node or edge weights does not. Setting it to ``False`` drops the
+    /// cached results.
+    #[getter]
+    fn get_analysis_cache(&self) -> bool {
+        self.cache.enabled()
+    }
+
+    #[setter]
+    fn set_analysis_cache(&mut self, value: bool) {
+        self.cache.set_enabled(value);
+    }
+
+    /// Return the statistics of the analysis cache
+    ///
+    /// :returns: A dictionary with the number of cache ``"hits"`` and
+    ///     ``"misses"`` of the analyses run on the graph while
+    ///     :attr:`analysis_cache` was set, and the ``"generation"``, the
+    ///     number of times the structure of the graph was changed
+    /// :rtype: dict
+    #[pyo3(text_signature = "(self)")]
+    pub fn analysis_cache_info(&self) -> HashMap<&'static str, u64> {
+        let (hits, misses, generation) = self.cache.counters();
+        let mut info = HashMap::with_capacity(3);
+        info.insert("hits", hits);
+        info.insert("misses", misses);
+        info.insert("generation", generation);
+        info
+    }
+
     /// Whether the graph is a multigraph (allows multiple edges between
     /// nodes) or not
     ///
@@ -646,6 +688,83 @@ impl PyGraph {
         }
     }
 
+    /// Return the edges of the graph as compressed sparse row (CSR) arrays
+    ///
+    /// Rows and columns of the matrix are the positions of the nodes in
+    /// :meth:`node_indexes`, so graphs with removed nodes give a compact
+    /// matrix.
+    /// Each row of the matrix holds the edges incident to a node, so every
+    /// edge which isn't a self loop is present in two rows.
+    /// The arrays can be passed directly to :class:`scipy.sparse.csr_matrix`,
+    /// no data payloads are copied.
+    ///
+    /// :param weight_fn: An optional callable which will be passed the data
+    ///     payload of each edge and is expected to return a ``float`` weight
+    ///     for the edge. It can also be an edge data key or a weight array,
+    ///     see :ref:`edge-weights`.
+    ///
+    /// :returns: A tuple ``(indptr, indices, edge_ids, weights, node_map)``
+    ///     of 1 dimensional numpy arrays. The entries of row ``i`` are at
+    ///     positions ``indptr[i]:indptr[i + 1]`` of ``indices`` (the column of
+    ///     each entry), ``edge_ids`` (the edge index of each entry) and
+    ///     ``weights`` (the weight of each entry, this is ``None`` if no
+    ///     ``weight_fn`` is specified). ``node_map[i]`` is the node index of
+    ///     row and column ``i``.
+    /// :rtype: tuple
+    ///
+    /// For example:
+    ///
+    /// .. jupyter-execute::
+    ///
+    ///   import retworkx
+    ///
+    ///   graph = retworkx.PyGraph()
+    ///   graph.add_nodes_from(range(3))
+    ///   graph.add_edges_from([(0, 1, 2.0), (1, 2, 3.0)])
+    ///   indptr, indices, edge_ids, weights, node_map = graph.to_csr(float)
+    ///   print(indptr)
+    ///   print(indices)
+    ///   print(weights)
+    ///
+    #[pyo3(text_signature = "(self, /, weight_fn=None)")]
+    pub fn to_csr(
+        &self,
+        py: Python,
+        weight_fn: Option<PyObject>,
+    ) -> PyResult<PyObject> {
+        sparse::to_csr(py, &self.graph, weight_fn)
+    }
+
+    /// Return the edges of the graph as coordinate format (COO) arrays
+    ///
+    /// Rows and columns of the matrix are the positions of the nodes in
+    /// :meth:`node_indexes`, so graphs with removed nodes give a compact
+    /// matrix.
+    /// Each entry is an edge between the nodes at positions ``row[i]`` and
+    /// ``col[i]``. Every edge which isn't a self loop is present twice, once
+    /// in each direction.
+    /// The entries are in the same order as :meth:`to_csr`.
+    ///
+    /// :param weight_fn: An optional callable which will be passed the data
+    ///     payload of each edge and is expected to return a ``float`` weight
+    ///     for the edge. It can also be an edge data key or a weight array,
+    ///     see :ref:`edge-weights`.
+    ///
+    /// :returns: A tuple ``(row, col, edge_ids, weights, node_map)`` of 1
+    ///     dimensional numpy arrays with the row, column, edge index and
+    ///     weight of each entry (``weights`` is ``None`` if no ``weight_fn``
+    ///     is specified). ``node_map[i]`` is the node index of row and column
+    ///     ``i``.
+    /// :rtype: tuple
+    #[pyo3(text_signature = "(self, /, weight_fn=None)")]
+    pub fn to_coo(
+        &self,
+        py: Python,
+        weight_fn: Option<PyObject>,
+    ) -> PyResult<PyObject> {
+        sparse::to_coo(py, &self.graph, weight_fn)
+    }
+
     /// Get an edge index map
     ///
     /// Returns a read only mapping from edge indices to the weighted edge
@@ -683,6 +802,7 @@ impl PyGraph {
         let index = NodeIndex::new(node);
         self.graph.remove_node(index);
         self.node_removed = true;
+        self.cache.invalidate();
         Ok(())
     }
 
@@ -718,6 +838,7 @@ impl PyGraph {
             }
         }
         let edge = self.graph.add_edge(p_index, c_index, edge);
+        self.cache.invalidate();
         Ok(edge.index())
     }
 
@@ -741,6 +862,7 @@ impl PyGraph {
         &mut self,
         obj_list: Vec<(usize, usize, PyObject)>,
     ) -> PyResult<Vec<usize>> {
+        self.cache.invalidate();
         let mut out_list: Vec<usize> = Vec::with_capacity(obj_list.len());
         for obj in obj_list {
             let p_index = NodeIndex::new(obj.0);
@@ -781,6 +903,7 @@ impl PyGraph {
         py: Python,
         obj_list: Vec<(usize, usize)>,
     ) -> PyResult<Vec<usize>> {
+        self.cache.invalidate();
         let mut out_list: Vec<usize> = Vec::with_capacity(obj_list.len());
         for obj in obj_list {
             let p_index = NodeIndex::new(obj.0);
@@ -820,6 +943,7 @@ impl PyGraph {
         py: Python,
         edge_list: Vec<(usize, usize)>,
     ) {
+        self.cache.invalidate();
         for (source, target) in edge_list {
             let max_index = cmp::max(source, target);
             while max_index >= self.node_count() {
@@ -861,6 +985,7 @@ impl PyGraph {
         py: Python,
         edge_list: Vec<(usize, usize, PyObject)>,
     ) {
+        self.cache.invalidate();
         for (source, target, weight) in edge_list {
             let max_index = cmp::max(source, target);
             while max_index >= self.node_count() {
@@ -881,6 +1006,98 @@ impl PyGraph {
         }
     }
 
+    /// Extend graph from a numpy array of edges
+    ///
+    /// This is the same as :meth:`extend_from_edge_list` and
+    /// :meth:`extend_from_weighted_edge_list` but the edges are read directly
+    /// from numpy arrays, which avoids creating a Python tuple for each edge.
+    ///
+    /// :param numpy.ndarray edge_array: A 2 dimensional integer array of shape
+    ///     ``(m, 2)`` where each row is the source and target node index of an
+    ///     edge. If a node index is not present in the graph, nodes will be
+    ///     added (with a node weight of ``None``) to that index. A
+    ///     ``ValueError`` is raised if that would add more than ``2 * m``
+    ///     nodes past the end of the graph.
+    /// :param numpy.ndarray weights: An optional 1 dimensional ``float64`` or
+    ///     ``int64`` array of length ``m`` with the weight of each edge. If it
+    ///     is not specified the edges will have a weight of ``None``.
+    #[pyo3(text_signature = "(self, edge_array, /, weights=None)")]
+    pub fn extend_from_edge_array(
+        &mut self,
+        py: Python,
+        edge_array: &PyAny,
+        weights: Option<&PyAny>,
+    ) -> PyResult<()> {
+        let edges = edge_array::extract_edges(edge_array)?;
+        let weights = edge_array::extract_weights(py, weights, edges.len())?;
+        edge_array::required_nodes(&edges, self.graph.node_bound())?;
+        self.cache.invalidate();
+        for ((source, target), weight) in edges.into_iter().zip(weights) {
+            // New nodes fill any removed node indices before the node
+            // bound grows, so this stops once the index exists.
+            for index in [source, target].iter() {
+                while !self.graph.contains_node(NodeIndex::new(*index)) {
+                    self.graph.add_node(py.None());
+                }
+            }
+            let source_index = NodeIndex::new(source);
+            let target_index = NodeIndex::new(target);
+            if !self.multigraph {
+                let exists = self.graph.find_edge(source_index, target_index);
+                if let Some(index) = exists {
+                    let edge_weight =
+                        self.graph.edge_weight_mut(index).unwrap();
+                    *edge_weight = weight;
+                    continue;
+                }
+            }
+            self.graph.add_edge(source_index, target_index, weight);
+        }
+        Ok(())
+    }
+
+    /// Create a new :class:`~retworkx.PyGraph` object from a numpy array of
+    /// edges
+    ///
+    /// :param numpy.ndarray edge_array: A 2 dimensional integer array of shape
+    ///     ``(m, 2)`` where each row is the source and target node index of an
+    ///     edge. The graph will have a node (with a node weight of ``None``)
+    ///     for every index up to the largest index in the array, which can't
+    ///     be more than ``2 * m`` nodes or a ``ValueError`` is raised.
+    /// :param numpy.ndarray weights: An optional 1 dimensional ``float64`` or
+    ///     ``int64`` array of length ``m`` with the weight of each edge. If it
+    ///     is not specified the edges will have a weight of ``None``.
+    ///
+    /// :returns: A new graph object with the edges from the array
+    /// :rtype: PyGraph
+    ///
+    /// For example:
+    ///
+    /// .. jupyter-execute::
+    ///
+    ///   import numpy as np
+    ///   import retworkx
+    ///
+    ///   edges = np.array([[0, 1], [1, 2], [2, 0]])
+    ///   weights = np.array([0.5, 1.5, 2.5])
+    ///   graph = retworkx.PyGraph.from_edge_array(edges, weights)
+    ///   print(graph.weighted_edge_list())
+    ///
+    #[staticmethod]
+    #[pyo3(text_signature = "(edge_array, /, weights=None)")]
+    pub fn from_edge_array(
+        py: Python,
+        edge_array: &PyAny,
+        weights: Option<&PyAny>,
+    ) -> PyResult<PyGraph> {
+        Ok(PyGraph {
+            graph: edge_array::graph_from_edge_array(py, edge_array, weights)?,
+            node_removed: false,
+            cache: AnalysisCache::default(),
+            multigraph: true,
+        })
+    }
+
     /// Remove an edge between 2 nodes.
     ///
     /// Note if there are multiple edges between the specified nodes only one
@@ -908,6 +1125,7 @@ impl PyGraph {
             }
         };
         self.graph.remove_edge(edge_index);
+        self.cache.invalidate();
         Ok(())
     }
 
@@ -918,6 +1136,7 @@ impl PyGraph {
     pub fn remove_edge_from_index(&mut self, edge: usize) -> PyResult<()> {
         let edge_index = EdgeIndex::new(edge);
         self.graph.remove_edge(edge_index);
+        self.cache.invalidate();
         Ok(())
     }
 
@@ -946,6 +1165,7 @@ impl PyGraph {
                 }
             };
             self.graph.remove_edge(edge_index);
+            self.cache.invalidate();
         }
         Ok(())
     }
@@ -959,6 +1179,7 @@ impl PyGraph {
     #[pyo3(text_signature = "(self, obj, /)")]
     pub fn add_node(&mut self, obj: PyObject) -> PyResult<usize> {
         let index = self.graph.add_node(obj);
+        self.cache.invalidate();
         Ok(index.index())
     }
 
@@ -970,6 +1191,7 @@ impl PyGraph {
     /// :rtype: NodeIndices
     #[pyo3(text_signature = "(self, obj_list, /)")]
     pub fn add_nodes_from(&mut self, obj_list: Vec<PyObject>) -> NodeIndices {
+        self.cache.invalidate();
         let out_list: Vec<usize> = obj_list
             .into_iter()
             .map(|obj| self.graph.add_node(obj).index())
@@ -992,6 +1214,7 @@ impl PyGraph {
         for node in index_list.iter().map(|x| NodeIndex::new(*x)) {
             self.graph.remove_node(node);
         }
+        self.cache.invalidate();
         Ok(())
     }
 
@@ -1057,6 +1280,50 @@ impl PyGraph {
         neighbors.count()
     }
 
+    /// Get the degree of every node
+    ///
+    /// :returns: An ``int64`` numpy array of length ``node_bound``, the
+    ///     largest node index plus one, where position ``i`` is the
+    ///     degree of node ``i``. Positions of indices which are not in
+    ///     the graph are ``0``.
+    /// :rtype: numpy.ndarray
+    #[pyo3(text_signature = "(self)")]
+    pub fn degrees(&self, py: Python) -> PyObject {
+        let mut degrees: Vec<i64> = vec![0; self.graph.node_bound()];
+        for edge in self.graph.edge_references() {
+            degrees[edge.source().index()] += 1;
+            // A self loop is only counted once, like in :meth:`degree`
+            if edge.source() != edge.target() {
+                degrees[edge.target().index()] += 1;
+            }
+        }
+        degrees.into_pyarray(py).into()
+    }
+
+    /// Get the neighbors of many nodes at once
+    ///
+    /// This is the same as calling :meth:`neighbors` for every node but
+    /// the result is returned as two numpy arrays in compressed sparse row
+    /// (CSR) form instead of a list per node.
+    ///
+    /// :param nodes: A sequence or 1 dimensional numpy integer array of the
+    ///     node indices to get the neighbors of
+    ///
+    /// :returns: A tuple of two ``int64`` numpy arrays ``(offsets, indices)``
+    ///     where the neighbors of ``nodes[i]`` are
+    ///     ``indices[offsets[i]:offsets[i + 1]]``, sorted in ascending
+    ///     order and without duplicates. A node index which is not in the
+    ///     graph has no neighbors.
+    /// :rtype: tuple
+    #[pyo3(text_signature = "(self, nodes, /)")]
+    pub fn neighbors_of(
+        &self,
+        py: Python,
+        nodes: &PyAny,
+    ) -> PyResult<PyObject> {
+        sparse::neighbors_of(py, &self.graph, nodes)
+    }
+
     /// Generate a dot file from the graph
     ///
     /// :param node_attr: A callable that will take in a node data object
@@ -1147,11 +1414,19 @@ impl PyGraph {
     /// of deliminated node ids. If there are more than 3 elements on
     /// a line the 3rd on will be treated as a string weight for the edge
     ///
+    /// The file is parsed in parallel chunks without holding the GIL, so
+    /// large edge lists can be loaded quickly. Gzip compressed files are
+    /// detected and decompressed automatically.
+    ///
     /// :param str path: The path of the file to open
     /// :param str comment: Optional character to use as a comment by default
     ///     there are no comment characters
     /// :param str deliminator: Optional character to use as a deliminator by
     ///     default any whitespace will be used
+    /// :param str weight_type: Optional type to parse the edge weights as,
+    ///     either ``"float"`` or ``"int"``. By default the weights are stored
+    ///     as strings. A ``ValueError`` is raised if a weight can't be parsed
+    ///     as the requested type.
     ///
     /// For example:
     ///
@@ -1174,64 +1449,26 @@ impl PyGraph {
     ///   mpl_draw(graph)
     ///
     #[staticmethod]
-    #[pyo3(text_signature = "(path, /, comment=None, deliminator=None)")]
+    #[pyo3(
+        text_signature = "(path, /, comment=None, deliminator=None, weight_type=None)"
+    )]
     pub fn read_edge_list(
         py: Python,
         path: &str,
         comment: Option<String>,
         deliminator: Option<String>,
+        weight_type: Option<&str>,
     ) -> PyResult<PyGraph> {
-        let file = File::open(path)?;
-        let buf_reader = BufReader::new(file);
-        let mut out_graph = StableUnGraph::<PyObject, PyObject>::default();
-        for line_raw in buf_reader.lines() {
-            let line = line_raw?;
-            let skip = match &comment {
-                Some(comm) => line.trim().starts_with(comm),
-                None => line.trim().is_empty(),
-            };
-            if skip {
-                continue;
-            }
-            let line_no_comments = match &comment {
-                Some(comm) => line
-                    .find(comm)
-                    .map(|idx| &line[..idx])
-                    .unwrap_or(&line)
-                    .trim()
-                    .to_string(),
-                None => line,
-            };
-            let pieces: Vec<&str> = match &deliminator {
-                Some(del) => line_no_comments.split(del).collect(),
-                None => line_no_comments.split_whitespace().collect(),
-            };
-            let src = pieces[0].parse::<usize>()?;
-            let target = pieces[1].parse::<usize>()?;
-            let max_index = cmp::max(src, target);
-            // Add nodes to graph
-            while max_index >= out_graph.node_count() {
-                out_graph.add_node(py.None());
-            }
-            // Add edges tp graph
-            let weight = if pieces.len() > 2 {
-                let weight_str = match &deliminator {
-                    Some(del) => pieces[2..].join(del),
-                    None => pieces[2..].join(&' '.to_string()),
-                };
-                PyString::new(py, &weight_str).into()
-            } else {
-                py.None()
-            };
-            out_graph.add_edge(
-                NodeIndex::new(src),
-                NodeIndex::new(target),
-                weight,
-            );
-        }
         Ok(PyGraph {
-            graph: out_graph,
+            graph: edge_list::read_edge_list(
+                py,
+                path,
+                comment,
+                deliminator,
+                weight_type,
+            )?,
             node_removed: false,
+            cache: AnalysisCache::default(),
             multigraph: true,
         })
     }
@@ -1311,6 +1548,98 @@ impl PyGraph {
         Ok(())
     }
 
+    /// Write the PyGraph object to a binary graph file
+    ///
+    /// The binary format stores the structure of the graph as compressed
+    /// sparse row (CSR) index arrays, an optional column of ``float64`` edge
+    /// weights and a pickle of the node and edge data payloads. Node and edge
+    /// indices are preserved when the file is read back with
+    /// :meth:`~retworkx.PyGraph.read_binary`. The index arrays and weight
+    /// column are stored uncompressed and 8 byte aligned, so for very large
+    /// graphs writing and reading them is much faster than pickling the
+    /// graph.
+    ///
+    /// :param str path: The path to write the output file to
+    /// :param weight_fn: An optional callable which will be passed the data
+    ///     payload of each edge and is expected to return a ``float`` weight
+    ///     for the edge. It can also be an edge data key or a weight array,
+    ///     see :ref:`edge-weights`.
+    ///     If specified the weights are stored in a separate column of the
+    ///     file.
+    /// :param bool payloads: If set to ``False`` the node and edge data
+    ///     payloads are not written to the file. Defaults to ``True``, in
+    ///     which case all the payloads must be picklable.
+    ///
+    /// For example:
+    ///
+    /// .. jupyter-execute::
+    ///
+    ///   import os
+    ///   import tempfile
+    ///
+    ///   import retworkx
+    ///
+    ///   graph = retworkx.generators.path_graph(5)
+    ///   path = os.path.join(tempfile.gettempdir(), "graph.rxg")
+    ///   graph.write_binary(path)
+    ///   new_graph = retworkx.PyGraph.read_binary(path)
+    ///   print(new_graph.edge_list())
+    ///
+    #[args(payloads = "true")]
+    #[pyo3(text_signature = "(self, path, /, weight_fn=None, payloads=True)")]
+    pub fn write_binary(
+        &self,
+        py: Python,
+        path: &str,
+        weight_fn: Option<PyObject>,
+        payloads: bool,
+    ) -> PyResult<()> {
+        binary::write_binary(
+            py,
+            &self.graph,
+            self.multigraph,
+            path,
+            weight_fn,
+            payloads,
+        )
+    }
+
+    /// Read a binary graph file and create a new PyGraph object from the
+    /// contents
+    ///
+    /// The file must have been written by
+    /// :meth:`~retworkx.PyGraph.write_binary`.
+    ///
+    /// :param str path: The path of the file to open
+    /// :param bool payloads: If set to ``False`` the node and edge data
+    ///     payloads stored in the file are not unpickled, which skips the
+    ///     slowest part of reading a large graph. Nodes will then have a data
+    ///     payload of ``None`` and edges will have their ``float`` weight from
+    ///     the weight column of the file as their data payload, or ``None`` if
+    ///     the file has no weight column. Defaults to ``True``.
+    ///
+    /// :returns: A new graph object with the contents of the file
+    /// :rtype: PyGraph
+    /// :raises ValueError: If the file is not a binary graph file, is
+    ///     truncated or corrupted, or contains a graph of the other type
+    #[staticmethod]
+    #[args(payloads = "true")]
+    #[pyo3(text_signature = "(path, /, payloads=True)")]
+    pub fn read_binary(
+        py: Python,
+        path: &str,
+        payloads: bool,
+    ) -> PyResult<PyGraph> {
+        let (graph, multigraph, node_removed) =
+            binary::read_binary(py, path, payloads)?;
+        Ok(PyGraph {
+            graph,
+            node_removed,
+            cache: AnalysisCache::default(),
+            multigraph,
+        })
+    }
+
     /// Create a new :class:`~retworkx.PyGraph` object from an adjacency matrix
     ///
     /// This method can be used to construct a new :class:`~retworkx.PyGraph`
@@ -1357,10 +1686,50 @@ impl PyGraph {
         PyGraph {
             graph: out_graph,
             node_removed: false,
+            cache: AnalysisCache::default(),
             multigraph: true,
         }
     }
 
+    /// Create a new :class:`~retworkx.PyGraph` object from a sparse adjacency
+    /// matrix
+    ///
+    /// This is the same as :meth:`from_adjacency_matrix` but the matrix is
+    /// passed as compressed sparse row (CSR) arrays, for example the
+    /// ``data``, ``indices`` and ``indptr`` attributes of a
+    /// :class:`scipy.sparse.csr_matrix`. The node weights will be the index
+    /// from the matrix and every entry greater than 0 becomes an edge with a
+    /// float weight of the value from the matrix. Duplicate entries in a row
+    /// are summed.
+    /// Only the entries on or above the diagonal are used, so the matrix is
+    /// expected to be symmetric.
+    ///
+    /// :param ndarray data: The ``float64`` values of the matrix entries
+    /// :param ndarray indices: The integer column index of each entry
+    /// :param ndarray indptr: The integer offsets of the entries of each row
+    ///     in ``indices`` and ``data``, it has one more element than the
+    ///     matrix has rows
+    ///
+    /// :returns: A new graph object generated from the adjacency matrix
+    /// :rtype: PyGraph
+    #[staticmethod]
+    #[pyo3(text_signature = "(data, indices, indptr, /)")]
+    pub fn from_sparse_adjacency_matrix(
+        py: Python,
+        data: PyReadonlyArray1<f64>,
+        indices: &PyAny,
+        indptr: &PyAny,
+    ) -> PyResult<PyGraph> {
+        Ok(PyGraph {
+            graph: sparse::from_sparse_adjacency_matrix(
+                py, data, indices, indptr,
+            )?,
+            node_removed: false,
+            cache: AnalysisCache::default(),
+            multigraph: true,
+        })
+    }
+
     /// Add another PyGraph object into this PyGraph
     ///
     /// :param PyGraph other: The other PyGraph object to add onto this
@@ -1442,6 +1811,7 @@ impl PyGraph {
         let mut new_node_map: HashMap<NodeIndex, NodeIndex> =
             HashMap::with_capacity(other.node_count());
 
+        self.cache.invalidate();
         // TODO: Reimplement this without looping over the graphs
         // Loop over other nodes add add to self graph
         for node in other.graph.node_indices() {
@@ -1515,6 +1885,7 @@ impl PyGraph {
         PyGraph {
             graph: out_graph,
             node_removed: false,
+            cache: AnalysisCache::default(),
             multigraph: self.multigraph,
         }
     }
@@ -1554,6 +1925,7 @@ impl PyMappingProtocol for PyGraph {
     }
 
     fn __delitem__(&'p mut self, idx: usize) -> PyResult<()> {
+        self.cache.invalidate();
         match self.graph.remove_node(NodeIndex::new(idx as usize)) {
             Some(_) => Ok(()),
             None => Err(PyIndexError::new_err("No node found for index")),
@@ -1595,6 +1967,7 @@ impl PyGCProtocol for PyGraph {
     // [2] https://pyo3.rs/v0.12.4/class/protocols.html#garbage-collector-integration
     fn __clear__(&mut self) {
         self.graph = StableUnGraph::<PyObject, PyObject>::default();
+        self.cache.invalidate();
         self.node_removed = false;
     }
 }
@@ -0,0 +1,185 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+use petgraph::stable_graph::{NodeIndex, StableGraph};
+use petgraph::visit::EdgeRef;
+use petgraph::{EdgeType, Incoming, Outgoing};
+
+use pyo3::prelude::*;
+
+use rayon::prelude::*;
+
+const FNV_OFFSET: u64 = 0xcbf2_9ce4_8422_2325;
+const FNV_PRIME: u64 = 0x0000_0100_0000_01b3;
+
+/// A 64 bit FNV-1a hash.
+///
+/// Unlike the hashers in the standard library and hashbrown the output only
+/// depends on the input bytes, so hashes are stable between processes,
+/// platforms and releases and can be stored.
+struct Fnv(u64);
+
+impl Fnv {
+    fn new() -> Self {
+        Fnv(FNV_OFFSET)
+    }
+
+    fn write(&mut self, bytes: &[u8]) {
+        for byte in bytes {
+            self.0 ^= *byte as u64;
+            self.0 = self.0.wrapping_mul(FNV_PRIME);
+        }
+    }
+
+    fn write_u64(&mut self, value: u64) {
+        self.write(&value.to_le_bytes());
+    }
+
+    fn finish(&self) -> u64 {
+        self.0
+    }
+}
+
+fn hash_str(value: &str) -> u64 {
+    let mut hasher = Fnv::new();
+    hasher.write(value.as_bytes());
+    hasher.finish()
+}
+
+/// Return the hash of `str(key(weight))` for every weight
+fn key_hashes<'a>(
+    py: Python,
+    key: &PyObject,
+    weights: impl Iterator<Item = &'a PyObject>,
+) -> PyResult<Vec<u64>> {
+    weights
+        .map(|weight| {
+            let key = key.call1(py, (weight,))?;
+            Ok(hash_str(key.as_ref(py).str()?.to_str()?))
+        })
+        .collect()
+}
+
+/// Return the Weisfeiler-Lehman hash of a graph as a hex string
+///
+/// Every node starts with a label: the hash of ``str(node_key(weight))`` or,
+/// without a ``node_key``, of its degree. Each iteration replaces the label
+/// of every node with the hash of its label and the sorted labels of its
+/// neighbors, paired with the hash of ``str(edge_key(weight))`` of the edge
+/// to them. For directed graphs the successors and predecessors are hashed
+/// separately. The result hashes the sorted labels of every iteration, so it
+/// doesn't depend on the node indices: isomorphic graphs always have the same
+/// hash, while graphs with the same hash are very likely, but not certain, to
+/// be isomorphic.
+///
+/// The keys are the only part which needs the GIL, the iterations run in
+/// parallel over the nodes without it.
+pub fn weisfeiler_lehman_graph_hash<Ty>(
+    py: Python,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    node_key: Option<PyObject>,
+    edge_key: Option<PyObject>,
+    iterations: usize,
+) -> PyResult<String>
+where
+    Ty: EdgeType + Sync,
+{
+    let nodes: Vec<NodeIndex> = graph.node_indices().collect();
+    let mut position: Vec<usize> = vec![0; graph.node_bound()];
+    for (pos, node) in nodes.iter().enumerate() {
+        position[node.index()] = pos;
+    }
+    let mut labels: Vec<u64> = match node_key {
+        Some(key) => {
+            key_hashes(py, &key, nodes.iter().map(|node| &graph[*node]))?
+        }
+        None => nodes
+            .iter()
+            .map(|node| {
+                let mut hasher = Fnv::new();
+                hasher.write_u64(
+                    graph.edges_directed(*node, Outgoing).count() as u64
+                );
+                if Ty::is_directed() {
+                    hasher.write_u64(
+                        graph.edges_directed(*node, Incoming).count() as u64,
+                    );
+                }
+                hasher.finish()
+            })
+            .collect(),
+    };
+    let mut edge_labels: Vec<u64> = vec![0; graph.edge_bound()];
+    if let Some(key) = edge_key {
+        let edges: Vec<_> = graph.edge_indices().collect();
+        let hashes =
+            key_hashes(py, &key, edges.iter().map(|edge| &graph[*edge]))?;
+        for (edge, hash) in edges.iter().zip(hashes) {
+            edge_labels[edge.index()] = hash;
+        }
+    }
+
+    let digest = py.allow_threads(move || {
+        let mut hasher = Fnv::new();
+        hasher.write_u64(nodes.len() as u64);
+        hasher.write_u64(graph.edge_count() as u64);
+        let mut hash_labels = |labels: &[u64]| {
+            let mut sorted = labels.to_vec();
+            sorted.par_sort_unstable();
+            for label in sorted {
+                hasher.write_u64(label);
+            }
+        };
+        hash_labels(&labels);
+        let directions = if Ty::is_directed() {
+            vec![Outgoing, Incoming]
+        } else {
+            vec![Outgoing]
+        };
+        for _ in 0..iterations {
+            labels = nodes
+                .par_iter()
+                .map(|node| {
+                    let mut hasher = Fnv::new();
+                    hasher.write_u64(labels[position[node.index()]]);
+                    let mut neighbors: Vec<(u64, u64)> = Vec::new();
+                    for dir in &directions {
+                        neighbors.clear();
+                        neighbors.extend(
+                            graph.edges_directed(*node, *dir).map(|edge| {
+                                let neighbor = if edge.source() == *node {
+                                    edge.target()
+                                } else {
+                                    edge.source()
+                                };
+                                (
+                                    edge_labels[edge.id().index()],
+                                    labels[position[neighbor.index()]],
+                                )
+                            }),
+                        );
+                        neighbors.sort_unstable();
+                        hasher.write_u64(neighbors.len() as u64);
+                        for (edge_label, label) in &neighbors {
+                            hasher.write_u64(*edge_label);
+                            hasher.write_u64(*label);
+                        }
+                    }
+                    hasher.finish()
+                })
+                .collect();
+            hash_labels(&labels);
+        }
+        hasher.finish()
+    });
+    Ok(format!("{:016x}", digest))
+}
@@ -14,71 +14,248 @@
 // It has then been modified to function with PyDiGraph inputs instead of Graph.
 
 use fixedbitset::FixedBitSet;
-use std::cmp::Ordering;
+use std::borrow::Cow;
+use std::cmp::{Ordering, Reverse};
 use std::marker;
+use std::ops::Index;
+use std::sync::atomic::{AtomicBool, Ordering as AtomicOrdering};
 
 use hashbrown::HashMap;
 
-use super::NodesRemoved;
+use crate::iterators::NodeMap;
 
+use pyo3::class::iter::PyIterProtocol;
+use pyo3::gc::{PyGCProtocol, PyVisit};
 use pyo3::prelude::*;
+use pyo3::types::PyDict;
+use pyo3::PyTraverseError;
 
+use petgraph::stable_graph::EdgeIndex;
 use petgraph::stable_graph::NodeIndex;
 use petgraph::stable_graph::StableGraph;
-use petgraph::visit::{
-    EdgeRef, GetAdjacencyMatrix, IntoEdgeReferences, NodeIndexable,
-};
+use petgraph::visit::{EdgeRef, IntoEdgeReferences};
 use petgraph::EdgeType;
-use petgraph::{Directed, Incoming, Outgoing};
+use petgraph::{Directed, Direction, Incoming, Outgoing, Undirected};
 
-use rayon::slice::ParallelSliceMut;
+use rayon::prelude::*;
 
 type StablePyGraph<Ty> = StableGraph<PyObject, PyObject, Ty>;
+type NoMatcher = fn(&PyObject, &PyObject) -> PyResult<bool>;
 
-// NOTE: assumes contiguous node ids.
-trait NodeSorter<Ty>
+/// Searches on graphs with at least this many nodes in the first graph and
+/// no semantic matchers are split across threads
+const PARALLEL_THRESHOLD: usize = 64;
+
+/// A read only view of a graph with its nodes numbered `0..node_count()` in
+/// a chosen order.
+///
+/// VF2 needs contiguous node indices and tries the nodes in index order, so
+/// instead of copying the graph to compact or reorder its nodes the search
+/// runs on a view which maps its indices to the nodes of the graph. Edge
+/// indices are the ones of the graph.
+struct GraphView<'a, Ty>
 where
     Ty: EdgeType,
 {
-    fn sort(&self, _: &StablePyGraph<Ty>) -> Vec<usize>;
+    graph: Cow<'a, StablePyGraph<Ty>>,
+    /// The graph node at each index of the view
+    order: Vec<NodeIndex>,
+    /// The index in the view of each graph node, by graph node index
+    position: Vec<usize>,
+}
 
-    fn reorder(
-        &self,
-        py: Python,
-        graph: &StablePyGraph<Ty>,
-    ) -> StablePyGraph<Ty> {
-        let order = self.sort(graph);
+impl<'a, Ty> GraphView<'a, Ty>
+where
+    Ty: EdgeType,
+{
+    /// Return a view with the nodes of `graph` in index order
+    fn new(graph: Cow<'a, StablePyGraph<Ty>>) -> Self {
+        let order = graph.node_indices().collect();
+        GraphView::with_order(graph, order)
+    }
+
+    fn with_order(
+        graph: Cow<'a, StablePyGraph<Ty>>,
+        order: Vec<NodeIndex>,
+    ) -> Self {
+        let mut position: Vec<usize> = vec![usize::MAX; graph.node_bound()];
+        for (index, node) in order.iter().enumerate() {
+            position[node.index()] = index;
+        }
+        GraphView {
+            graph,
+            order,
+            position,
+        }
+    }
 
-        let mut new_graph = StablePyGraph::<Ty>::default();
-        let mut id_map: Vec<usize> = vec![0; graph.node_count()];
-        for node in order {
-            let node_index = graph.from_index(node);
-            let node_data = graph.node_weight(node_index).unwrap();
-            let new_index = new_graph.add_node(node_data.clone_ref(py));
-            id_map[node] = graph.to_index(new_index);
+    /// Renumber the nodes so node `i` is the node which was `order[i]`
+    fn reorder(&mut self, order: &[usize]) {
+        self.order = order.iter().map(|&index| self.order[index]).collect();
+        for (index, node) in self.order.iter().enumerate() {
+            self.position[node.index()] = index;
         }
-        for edge in graph.edge_references() {
-            let edge_w = edge.weight();
-            let p = id_map[graph.to_index(edge.source())];
-            let c = id_map[graph.to_index(edge.target())];
-            let p_index = graph.from_index(p);
-            let c_index = graph.from_index(c);
-            new_graph.add_edge(p_index, c_index, edge_w.clone_ref(py));
+    }
+
+    #[inline]
+    fn node_count(&self) -> usize {
+        self.order.len()
+    }
+
+    #[inline]
+    fn edge_count(&self) -> usize {
+        self.graph.edge_count()
+    }
+
+    #[inline]
+    fn is_directed(&self) -> bool {
+        Ty::is_directed()
+    }
+
+    #[inline]
+    fn from_index(&self, index: usize) -> NodeIndex {
+        NodeIndex::new(index)
+    }
+
+    #[inline]
+    fn to_index(&self, node: NodeIndex) -> usize {
+        node.index()
+    }
+
+    /// Return the original index of `node` in the graph
+    #[inline]
+    fn graph_index(&self, node: NodeIndex) -> usize {
+        self.order[node.index()].index()
+    }
+
+    #[inline]
+    fn view_index(&self, node: NodeIndex) -> NodeIndex {
+        NodeIndex::new(self.position[node.index()])
+    }
+
+    /// Return the neighbors of `node`, only its successors if the graph is
+    /// directed
+    fn neighbors(
+        &self,
+        node: NodeIndex,
+    ) -> impl Iterator<Item = NodeIndex> + '_ {
+        self.neighbors_directed(node, Outgoing)
+    }
+
+    fn neighbors_directed(
+        &self,
+        node: NodeIndex,
+        dir: Direction,
+    ) -> impl Iterator<Item = NodeIndex> + '_ {
+        self.graph
+            .neighbors_directed(self.order[node.index()], dir)
+            .map(move |neighbor| self.view_index(neighbor))
+    }
+
+    /// Return the edges of `node` in direction `dir` along with the node at
+    /// their other end
+    fn edges_directed(
+        &self,
+        node: NodeIndex,
+        dir: Direction,
+    ) -> impl Iterator<Item = (EdgeIndex, NodeIndex)> + '_ {
+        let graph_node = self.order[node.index()];
+        self.graph.edges_directed(graph_node, dir).map(move |edge| {
+            let neighbor = if edge.source() == graph_node {
+                edge.target()
+            } else {
+                edge.source()
+            };
+            (edge.id(), self.view_index(neighbor))
+        })
+    }
+
+    fn find_edge(&self, a: NodeIndex, b: NodeIndex) -> Option<EdgeIndex> {
+        self.graph
+            .find_edge(self.order[a.index()], self.order[b.index()])
+    }
+
+    /// Return the adjacency matrix of the view, the bit for the edge from
+    /// `a` to `b` is `a * node_count() + b`
+    fn adjacency_matrix(&self) -> FixedBitSet {
+        let n = self.node_count();
+        let mut matrix = FixedBitSet::with_capacity(n * n);
+        for edge in self.graph.edge_references() {
+            let a = self.position[edge.source().index()];
+            let b = self.position[edge.target().index()];
+            matrix.insert(a * n + b);
+            if !self.is_directed() {
+                matrix.insert(b * n + a);
+            }
         }
+        matrix
+    }
+
+    #[inline]
+    fn is_adjacent(
+        &self,
+        matrix: &FixedBitSet,
+        a: NodeIndex,
+        b: NodeIndex,
+    ) -> bool {
+        matrix.contains(a.index() * self.node_count() + b.index())
+    }
+}
+
+impl<'a, Ty> Index<NodeIndex> for GraphView<'a, Ty>
+where
+    Ty: EdgeType,
+{
+    type Output = PyObject;
+
+    fn index(&self, node: NodeIndex) -> &PyObject {
+        &self.graph[self.order[node.index()]]
+    }
+}
+
+impl<'a, Ty> Index<EdgeIndex> for GraphView<'a, Ty>
+where
+    Ty: EdgeType,
+{
+    type Output = PyObject;
 
-        new_graph
+    fn index(&self, edge: EdgeIndex) -> &PyObject {
+        &self.graph[edge]
     }
 }
 
-struct Vf2ppSorter;
+trait NodeSorter<Ty>
+where
+    Ty: EdgeType,
+{
+    /// Return the indices of the nodes of `graph` in the order to match them
+    fn sort(&self, graph: &GraphView<Ty>) -> Vec<usize>;
+}
+
+/// The VF2++ matching order.
+///
+/// `rarity[node]` is the number of nodes of the other graph with the same
+/// label as `node`, nodes with rarer labels are matched first as they have
+/// fewer candidates. It is empty if the nodes aren't labelled.
+struct Vf2ppSorter {
+    rarity: Vec<usize>,
+}
 
 impl<Ty> NodeSorter<Ty> for Vf2ppSorter
 where
     Ty: EdgeType,
 {
-    fn sort(&self, graph: &StablePyGraph<Ty>) -> Vec<usize> {
+    fn sort(&self, graph: &GraphView<Ty>) -> Vec<usize> {
         let n = graph.node_count();
 
+        let rarity = |node: usize| -> Reverse<usize> {
+            Reverse(if self.rarity.is_empty() {
+                0
+            } else {
+                self.rarity[node]
+            })
+        };
+
         let dout: Vec<usize> = (0..n)
             .map(|idx| {
                 graph
@@ -111,7 +288,13 @@ where
                     .iter()
                     .enumerate()
                     .max_by_key(|&(_, &node)| {
-                        (conn_in[node], dout[node], conn_out[node], din[node])
+                        (
+                            conn_in[node],
+                            rarity(node),
+                            dout[node],
+                            conn_out[node],
+                            din[node],
+                        )
                     })
                     .unwrap();
 
@@ -168,7 +351,8 @@ where
         };
 
         let mut sorted_nodes: Vec<usize> = (0..n).collect();
-        sorted_nodes.par_sort_by_key(|&node| (dout[node], din[node]));
+        sorted_nodes
+            .par_sort_by_key(|&node| (rarity(node), dout[node], din[node]));
         sorted_nodes.reverse();
 
         for node in sorted_nodes {
@@ -179,21 +363,11 @@ where
     }
 }
 
-impl<'a, Ty> NodesRemoved for &'a StablePyGraph<Ty>
-where
-    Ty: EdgeType,
-{
-    fn nodes_removed(&self) -> bool {
-        self.node_bound() != self.node_count()
-    }
-}
-
 #[derive(Debug)]
-struct Vf2State<'a, Ty>
+struct Vf2State<Ty>
 where
     Ty: EdgeType,
 {
-    graph: &'a StablePyGraph<Ty>,
     /// The current mapping M(s) of nodes from G0 → G1 and G1 → G0,
     /// NodeIndex::end() for no mapping.
     mapping: Vec<NodeIndex>,
@@ -210,17 +384,46 @@ where
     ins_size: usize,
     adjacency_matrix: FixedBitSet,
     generation: usize,
-    _etype: marker::PhantomData<Directed>,
+    /// The label of every node, empty if the nodes aren't labelled.
+    node_labels: Vec<usize>,
+    /// The label of every edge by edge index, empty if the edges aren't
+    /// labelled.
+    edge_labels: Vec<usize>,
+    _etype: marker::PhantomData<Ty>,
+}
+
+// Implemented by hand as deriving it would require `Ty: Clone`
+impl<Ty> Clone for Vf2State<Ty>
+where
+    Ty: EdgeType,
+{
+    fn clone(&self) -> Self {
+        Vf2State {
+            mapping: self.mapping.clone(),
+            out: self.out.clone(),
+            ins: self.ins.clone(),
+            out_size: self.out_size,
+            ins_size: self.ins_size,
+            adjacency_matrix: self.adjacency_matrix.clone(),
+            generation: self.generation,
+            node_labels: self.node_labels.clone(),
+            edge_labels: self.edge_labels.clone(),
+            _etype: marker::PhantomData,
+        }
+    }
 }
 
-impl<'a, Ty> Vf2State<'a, Ty>
+impl<Ty> Vf2State<Ty>
 where
     Ty: EdgeType,
 {
-    pub fn new(g: &'a StablePyGraph<Ty>) -> Self {
+    pub fn new(
+        g: &GraphView<Ty>,
+        node_labels: Vec<usize>,
+        edge_labels: Vec<usize>,
+    ) -> Self {
         let c0 = g.node_count();
         Vf2State {
-            graph: g,
             mapping: vec![NodeIndex::end(); c0],
             out: vec![0; c0],
             ins: vec![0; c0 * (g.is_directed() as usize)],
@@ -228,6 +431,8 @@ where
             ins_size: 0,
             adjacency_matrix: g.adjacency_matrix(),
             generation: 0,
+            node_labels,
+            edge_labels,
             _etype: marker::PhantomData,
         }
     }
@@ -238,21 +443,26 @@ where
     }
 
     /// Add mapping **from** <-> **to** to the state.
-    pub fn push_mapping(&mut self, from: NodeIndex, to: NodeIndex) {
+    pub fn push_mapping(
+        &mut self,
+        graph: &GraphView<Ty>,
+        from: NodeIndex,
+        to: NodeIndex,
+    ) {
         self.generation += 1;
         let s = self.generation;
         self.mapping[from.index()] = to;
         // update T0 & T1 ins/outs
         // T0out: Node in G0 not in M0 but successor of a node in M0.
         // st.out[0]: Node either in M0 or successor of M0
-        for ix in self.graph.neighbors(from) {
+        for ix in graph.neighbors(from) {
             if self.out[ix.index()] == 0 {
                 self.out[ix.index()] = s;
                 self.out_size += 1;
             }
         }
-        if self.graph.is_directed() {
-            for ix in self.graph.neighbors_directed(from, Incoming) {
+        if graph.is_directed() {
+            for ix in graph.neighbors_directed(from, Incoming) {
                 if self.ins[ix.index()] == 0 {
                     self.ins[ix.index()] = s;
                     self.ins_size += 1;
@@ -262,7 +472,7 @@ where
     }
 
     /// Restore the state to before the last added mapping
-    pub fn pop_mapping(&mut self, from: NodeIndex) {
+    pub fn pop_mapping(&mut self, graph: &GraphView<Ty>, from: NodeIndex) {
         let s = self.generation;
         self.generation -= 1;
 
@@ -270,14 +480,14 @@ where
         self.mapping[from.index()] = NodeIndex::end();
 
         // unmark in ins and outs
-        for ix in self.graph.neighbors(from) {
+        for ix in graph.neighbors(from) {
             if self.out[ix.index()] == s {
                 self.out[ix.index()] = 0;
                 self.out_size -= 1;
             }
         }
-        if self.graph.is_directed() {
-            for ix in self.graph.neighbors_directed(from, Incoming) {
+        if graph.is_directed() {
+            for ix in graph.neighbors_directed(from, Incoming) {
                 if self.ins[ix.index()] == s {
                     self.ins[ix.index()] = 0;
                     self.ins_size -= 1;
@@ -318,32 +528,190 @@ where
     }
 }
 
-fn reindex_graph<Ty>(py: Python, graph: &StablePyGraph<Ty>) -> StablePyGraph<Ty>
+/// Return the label of every object in `weights` given by `key`.
+///
+/// The keys are interned in `interned` so that objects with equal keys, in
+/// either graph, get the same label.
+fn key_labels<'a>(
+    py: Python,
+    key: &PyObject,
+    weights: impl Iterator<Item = &'a PyObject>,
+    interned: &PyDict,
+) -> PyResult<Vec<usize>> {
+    weights
+        .map(|weight| {
+            let key = key.call1(py, (weight,))?;
+            match interned.get_item(&key) {
+                Some(label) => label.extract(),
+                None => {
+                    let label = interned.len();
+                    interned.set_item(key, label)?;
+                    Ok(label)
+                }
+            }
+        })
+        .collect()
+}
+
+/// Return the number of nodes (or edges) with each label.
+fn label_counts(labels: impl Iterator<Item = usize>) -> HashMap<usize, usize> {
+    let mut counts: HashMap<usize, usize> = HashMap::new();
+    for label in labels {
+        *counts.entry(label).or_insert(0) += 1;
+    }
+    counts
+}
+
+/// Return `true` if the number of nodes (or edges) with each label in the 2
+/// graphs allows a mapping with the given `ordering`.
+fn label_counts_feasible(
+    counts: &[HashMap<usize, usize>; 2],
+    ordering: Ordering,
+) -> bool {
+    let count = |j: usize, label: &usize| *counts[j].get(label).unwrap_or(&0);
+    counts[0].keys().chain(counts[1].keys()).all(|label| {
+        count(0, label).cmp(&count(1, label)).then(ordering) == ordering
+    })
+}
+
+/// Return the number of nodes in `other` with the same label as each node in
+/// `labels`.
+fn label_rarity(labels: &[usize], other: &[usize]) -> Vec<usize> {
+    let counts = label_counts(other.iter().copied());
+    labels
+        .iter()
+        .map(|label| *counts.get(label).unwrap_or(&0))
+        .collect()
+}
+
+/// The graphs and initial state of a VF2 search
+struct Vf2Setup<'a, Ty>
 where
     Ty: EdgeType,
 {
-    // NOTE: this is a hacky workaround to handle non-contiguous node ids in
-    // VF2. The code which was forked from petgraph was written assuming the
-    // Graph type and not StableGraph so it makes an implicit assumption on
-    // node_bound() == node_count() which isn't true with removals on
-    // StableGraph. This compacts the node ids as a workaround until VF2State
-    // and try_match can be rewitten to handle this (and likely contributed
-    // upstream to petgraph too).
-    let mut new_graph = StablePyGraph::<Ty>::default();
-    let mut id_map: HashMap<NodeIndex, NodeIndex> = HashMap::new();
-    for node_index in graph.node_indices() {
-        let node_data = graph.node_weight(node_index).unwrap();
-        let new_index = new_graph.add_node(node_data.clone_ref(py));
-        id_map.insert(node_index, new_index);
-    }
-    for edge in graph.edge_references() {
-        let edge_w = edge.weight();
-        let p_index = id_map[&edge.source()];
-        let c_index = id_map[&edge.target()];
-        new_graph.add_edge(p_index, c_index, edge_w.clone_ref(py));
-    }
-
-    new_graph
+    /// Views of the graphs in the VF2++ matching order unless `id_order` is
+    /// set
+    views: [GraphView<'a, Ty>; 2],
+    st: [Vf2State<Ty>; 2],
+}
+
+/// Prepare `g0` and `g1` for a VF2 search.
+///
+/// If `node_key` or `edge_key` are set they're called once for every node or
+/// edge and the search only maps nodes and edges with equal keys to each
+/// other, comparing integer labels instead of calling back into Python.
+///
+/// Returns None if the number of nodes, edges, or nodes and edges with any
+/// label already rules out a mapping.
+#[allow(clippy::too_many_arguments)]
+fn setup<'a, Ty>(
+    py: Python,
+    g0: Cow<'a, StablePyGraph<Ty>>,
+    g1: Cow<'a, StablePyGraph<Ty>>,
+    id_order: bool,
+    ordering: Ordering,
+    node_key: Option<&PyObject>,
+    edge_key: Option<&PyObject>,
+) -> PyResult<Option<Vf2Setup<'a, Ty>>>
+where
+    Ty: EdgeType,
+{
+    let mut views = [GraphView::new(g0), GraphView::new(g1)];
+    if (views[0]
+        .node_count()
+        .cmp(&views[1].node_count())
+        .then(ordering)
+        != ordering)
+        || (views[0]
+            .edge_count()
+            .cmp(&views[1].edge_count())
+            .then(ordering)
+            != ordering)
+    {
+        return Ok(None);
+    }
+
+    let interned = PyDict::new(py);
+    let mut node_labels: [Vec<usize>; 2] = Default::default();
+    if let Some(key) = node_key {
+        for j in 0..2 {
+            let view = &views[j];
+            node_labels[j] = key_labels(
+                py,
+                key,
+                (0..view.node_count())
+                    .map(|index| &view[NodeIndex::new(index)]),
+                interned,
+            )?;
+        }
+        let counts = [
+            label_counts(node_labels[0].iter().copied()),
+            label_counts(node_labels[1].iter().copied()),
+        ];
+        if !label_counts_feasible(&counts, ordering) {
+            return Ok(None);
+        }
+    }
+
+    if !id_order {
+        let rarity = [
+            label_rarity(&node_labels[0], &node_labels[1]),
+            label_rarity(&node_labels[1], &node_labels[0]),
+        ];
+        for (j, rarity) in rarity.iter().enumerate() {
+            let sorter = Vf2ppSorter {
+                rarity: rarity.clone(),
+            };
+            let order = sorter.sort(&views[j]);
+            views[j].reorder(&order);
+            if !node_labels[j].is_empty() {
+                node_labels[j] =
+                    order.iter().map(|&node| node_labels[j][node]).collect();
+            }
+        }
+    }
+
+    let mut edge_labels: [Vec<usize>; 2] = Default::default();
+    if let Some(key) = edge_key {
+        for j in 0..2 {
+            let graph = &views[j].graph;
+            let labels = key_labels(
+                py,
+                key,
+                graph.edge_indices().map(|edge| &graph[edge]),
+                interned,
+            )?;
+            edge_labels[j] = vec![0; graph.edge_bound()];
+            for (edge, label) in graph.edge_indices().zip(labels) {
+                edge_labels[j][edge.index()] = label;
+            }
+        }
+        let counts = [
+            label_counts(
+                views[0]
+                    .graph
+                    .edge_indices()
+                    .map(|edge| edge_labels[0][edge.index()]),
+            ),
+            label_counts(
+                views[1]
+                    .graph
+                    .edge_indices()
+                    .map(|edge| edge_labels[1][edge.index()]),
+            ),
+        ];
+        if !label_counts_feasible(&counts, ordering) {
+            return Ok(None);
+        }
+    }
+
+    let [node_labels0, node_labels1] = node_labels;
+    let [edge_labels0, edge_labels1] = edge_labels;
+    let st = [
+        Vf2State::new(&views[0], node_labels0, edge_labels0),
+        Vf2State::new(&views[1], node_labels1, edge_labels1),
+    ];
+    Ok(Some(Vf2Setup { views, st }))
 }
 
 trait SemanticMatcher<T> {
@@ -366,12 +734,30 @@ where
     }
 }
 
+/// A Python callable used as a [`SemanticMatcher`] by the mapping
+/// iterators. It acquires the GIL when called so the search can run without
+/// holding it.
+struct PyMatcher(Option<PyObject>);
+
+impl SemanticMatcher<PyObject> for PyMatcher {
+    #[inline]
+    fn enabled(&self) -> bool {
+        self.0.is_some()
+    }
+    #[inline]
+    fn eq(&mut self, a: &PyObject, b: &PyObject) -> PyResult<bool> {
+        let matcher = self.0.as_ref().unwrap();
+        Python::with_gil(|py| matcher.call1(py, (a, b))?.is_true(py))
+    }
+}
+
 /// [Graph] Return `true` if the graphs `g0` and `g1` are (sub) graph isomorphic.
 ///
 /// Using the VF2 algorithm, examining both syntactic and semantic
 /// graph isomorphism (graph structure and matching node and edge weights).
 ///
-/// The graphs should not be multigraphs.
+/// The graphs should not be multigraphs. Nodes and edges are only matched if
+/// their `node_key` and `edge_key` labels are equal, see [`setup`].
 #[allow(clippy::too_many_arguments)]
 pub fn is_isomorphic<Ty, F, G>(
     py: Python,
@@ -382,78 +768,172 @@ pub fn is_isomorphic<Ty, F, G>(
     id_order: bool,
     ordering: Ordering,
     induced: bool,
+    node_key: Option<&PyObject>,
+    edge_key: Option<&PyObject>,
 ) -> PyResult<bool>
 where
-    Ty: EdgeType,
+    Ty: EdgeType + Sync,
     F: FnMut(&PyObject, &PyObject) -> PyResult<bool>,
     G: FnMut(&PyObject, &PyObject) -> PyResult<bool>,
 {
-    let mut inner_temp_g0: StablePyGraph<Ty>;
-    let mut inner_temp_g1: StablePyGraph<Ty>;
-    let g0_out = if g0.nodes_removed() {
-        inner_temp_g0 = reindex_graph(py, g0);
-        &inner_temp_g0
-    } else {
-        g0
-    };
-    let g1_out = if g1.nodes_removed() {
-        inner_temp_g1 = reindex_graph(py, g1);
-        &inner_temp_g1
-    } else {
-        g1
+    let Vf2Setup { views, mut st } = match setup(
+        py,
+        Cow::Borrowed(g0),
+        Cow::Borrowed(g1),
+        id_order,
+        ordering,
+        node_key,
+        edge_key,
+    )? {
+        Some(setup) => setup,
+        None => return Ok(false),
     };
+    let [g0, g1] = &views;
 
-    if (g0_out.node_count().cmp(&g1_out.node_count()).then(ordering)
-        != ordering)
-        || (g0_out.edge_count().cmp(&g1_out.edge_count()).then(ordering)
-            != ordering)
+    let mut stack = vec![Frame::Outer];
+    let res = if !node_match.enabled()
+        && !edge_match.enabled()
+        && g0.node_count() >= PARALLEL_THRESHOLD
+        && g1.node_count() > 0
     {
-        return Ok(false);
-    }
-
-    let g0 = if !id_order {
-        inner_temp_g0 = Vf2ppSorter.reorder(py, g0_out);
-        &inner_temp_g0
+        let st = &st;
+        Some(py.allow_threads(|| par_try_match(st, g0, g1, ordering, induced))?)
+    } else if !node_match.enabled() && !edge_match.enabled() {
+        // Without semantic matchers the search never calls back into Python,
+        // so run it without holding the GIL.
+        let mut no_match: Option<NoMatcher> = None;
+        let mut no_edge_match: Option<NoMatcher> = None;
+        py.allow_threads(|| {
+            try_match(
+                &mut st,
+                g0,
+                g1,
+                &mut no_match,
+                &mut no_edge_match,
+                ordering,
+                induced,
+                &mut stack,
+                None,
+            )
+        })?
     } else {
-        g0_out
+        try_match(
+            &mut st,
+            g0,
+            g1,
+            &mut node_match,
+            &mut edge_match,
+            ordering,
+            induced,
+            &mut stack,
+            None,
+        )?
     };
+    Ok(res.unwrap_or(false))
+}
 
-    let g1 = if !id_order {
-        inner_temp_g1 = Vf2ppSorter.reorder(py, g1_out);
-        &inner_temp_g1
-    } else {
-        g1_out
-    };
+/// Run the search for a single mapping in parallel.
+///
+/// With an empty mapping the first node of `g1` is always matched first, and
+/// every node of `g0` is a candidate for it. Each of those candidates roots an
+/// independent subtree of the search which is explored on its own copy of the
+/// state, with rayon balancing the subtrees across threads. Once one subtree
+/// finds a mapping the others are cancelled.
+fn par_try_match<Ty>(
+    st: &[Vf2State<Ty>; 2],
+    g0: &GraphView<Ty>,
+    g1: &GraphView<Ty>,
+    ordering: Ordering,
+    induced: bool,
+) -> PyResult<bool>
+where
+    Ty: EdgeType + Sync,
+{
+    let found = AtomicBool::new(false);
+    let mx = NodeIndex::new(st[1].next_rest_index(0).unwrap());
+    (0..g0.node_count())
+        .into_par_iter()
+        .map_init(
+            || st.clone(),
+            |st, nx| -> PyResult<()> {
+                if found.load(AtomicOrdering::Relaxed) {
+                    return Ok(());
+                }
+                let mut stack = vec![Frame::Inner {
+                    nodes: [NodeIndex::new(nx), mx],
+                    open_list: OpenList::Single,
+                }];
+                let res = try_match(
+                    st,
+                    g0,
+                    g1,
+                    &mut None::<NoMatcher>,
+                    &mut None::<NoMatcher>,
+                    ordering,
+                    induced,
+                    &mut stack,
+                    Some(&found),
+                )?;
+                if res == Some(true) {
+                    found.store(true, AtomicOrdering::Relaxed);
+                }
+                Ok(())
+            },
+        )
+        .collect::<PyResult<()>>()?;
+    Ok(found.load(AtomicOrdering::Relaxed))
+}
 
-    let mut st = [Vf2State::new(g0), Vf2State::new(g1)];
-    let res = try_match(
-        &mut st,
-        g0,
-        g1,
-        &mut node_match,
-        &mut edge_match,
-        ordering,
-        induced,
-    )?;
-    Ok(res.unwrap_or(false))
+#[derive(Copy, Clone, PartialEq, Debug)]
+enum OpenList {
+    Out,
+    In,
+    Other,
+    /// The candidate pair is the only one to try, used to root the subtrees
+    /// of a parallel search
+    Single,
+}
+
+#[derive(Clone, PartialEq, Debug)]
+enum Frame<N: marker::Copy> {
+    Outer,
+    Inner { nodes: [N; 2], open_list: OpenList },
+    Unwind { nodes: [N; 2], open_list: OpenList },
 }
 
-/// Return Some(bool) if isomorphism is decided, else None.
+/// Return Some(true) when a mapping is found, else None once the search
+/// space is exhausted.
+///
+/// The search is a depth first search driven by `stack`, which starts as
+/// `vec![Frame::Outer]`. When a mapping is found the frame to undo it is left
+/// on the stack, so calling this again with the same state and stack resumes
+/// the search and finds the next mapping.
+///
+/// If `cancel` is set the search gives up and returns None as soon as it is
+/// set to true by another thread.
+#[allow(clippy::too_many_arguments)]
 fn try_match<Ty, F, G>(
     mut st: &mut [Vf2State<Ty>; 2],
-    g0: &StablePyGraph<Ty>,
-    g1: &StablePyGraph<Ty>,
+    g0: &GraphView<Ty>,
+    g1: &GraphView<Ty>,
     node_match: &mut F,
     edge_match: &mut G,
     ordering: Ordering,
     induced: bool,
+    stack: &mut Vec<Frame<NodeIndex>>,
+    cancel: Option<&AtomicBool>,
 ) -> PyResult<Option<bool>>
 where
     Ty: EdgeType,
     F: SemanticMatcher<PyObject>,
     G: SemanticMatcher<PyObject>,
 {
-    if st[1].is_complete() {
+    if stack.is_empty() {
+        return Ok(None);
+    }
+    // the empty graph maps into any graph
+    if st[1].mapping.is_empty() {
+        stack.clear();
         return Ok(Some(true));
     }
 
@@ -466,22 +946,8 @@ where
     // F(s, n, m) -- evaluate state s and add mapping n <-> m
 
     // Find least T1out node (in st.out[1] but not in M[1])
-    #[derive(Copy, Clone, PartialEq, Debug)]
-    enum OpenList {
-        Out,
-        In,
-        Other,
-    }
-
-    #[derive(Clone, PartialEq, Debug)]
-    enum Frame<N: marker::Copy> {
-        Outer,
-        Inner { nodes: [N; 2], open_list: OpenList },
-        Unwind { nodes: [N; 2], open_list: OpenList },
-    }
-
     let next_candidate =
-        |st: &mut [Vf2State<'_, Ty>; 2]| -> Option<(NodeIndex, NodeIndex, OpenList)> {
+        |st: &mut [Vf2State<Ty>; 2]| -> Option<(NodeIndex, NodeIndex, OpenList)> {
             let mut to_index;
             let mut from_index = None;
             let mut open_list = OpenList::Out;
@@ -517,7 +983,7 @@ where
                 _ => None,
             }
         };
-    let next_from_ix = |st: &mut [Vf2State<'_, Ty>; 2],
+    let next_from_ix = |st: &mut [Vf2State<Ty>; 2],
                         nx: NodeIndex,
                         open_list: OpenList|
      -> Option<NodeIndex> {
@@ -527,6 +993,7 @@ where
             OpenList::Out => st[0].next_out_index(start),
             OpenList::In => st[0].next_in_index(start),
             OpenList::Other => st[0].next_rest_index(start),
+            OpenList::Single => None,
         }
         .map(|c| c + start); // compensate for start offset.
         match cand0 {
@@ -538,23 +1005,31 @@ where
         }
     };
     //fn pop_state(nodes: [NodeIndex<Ix>; 2]) {
-    let pop_state = |st: &mut [Vf2State<'_, Ty>; 2], nodes: [NodeIndex; 2]| {
+    let pop_state = |st: &mut [Vf2State<Ty>; 2], nodes: [NodeIndex; 2]| {
         // Restore state.
         for j in graph_indices.clone() {
-            st[j].pop_mapping(nodes[j]);
+            st[j].pop_mapping(g[j], nodes[j]);
         }
     };
     //fn push_state(nodes: [NodeIndex<Ix>; 2]) {
-    let push_state = |st: &mut [Vf2State<'_, Ty>; 2], nodes: [NodeIndex; 2]| {
+    let push_state = |st: &mut [Vf2State<Ty>; 2], nodes: [NodeIndex; 2]| {
         // Add mapping nx <-> mx to the state
         for j in graph_indices.clone() {
-            st[j].push_mapping(nodes[j], nodes[1 - j]);
+            st[j].push_mapping(g[j], nodes[j], nodes[1 - j]);
         }
     };
     //fn is_feasible(nodes: [NodeIndex<Ix>; 2]) -> bool {
-    let mut is_feasible = |st: &mut [Vf2State<'_, Ty>; 2],
+    let mut is_feasible = |st: &mut [Vf2State<Ty>; 2],
                            nodes: [NodeIndex; 2]|
      -> PyResult<bool> {
+        // Nodes with different labels can never be mapped, this is the
+        // cheapest check so do it first.
+        if !st[0].node_labels.is_empty()
+            && st[0].node_labels[nodes[0].index()]
+                != st[1].node_labels[nodes[1].index()]
+        {
+            return Ok(false);
+        }
         // Check syntactic feasibility of mapping by ensuring adjacencies
         // of nx map to adjacencies of mx.
         //
@@ -712,12 +1187,31 @@ where
         {
             return Ok(false);
         }
-        // semantic feasibility: compare associated data for edges
-        if edge_match.enabled() {
+        // semantic feasibility: compare associated data for edges, the labels
+        // are compared first so the matcher is only called for edges with
+        // equal labels
+        let edge_labels = !st[0].edge_labels.is_empty();
+        let mut edges_match = |st: &[Vf2State<Ty>; 2],
+                               j: usize,
+                               n_edge: EdgeIndex,
+                               m_edge: EdgeIndex|
+         -> PyResult<bool> {
+            if edge_labels
+                && st[j].edge_labels[n_edge.index()]
+                    != st[1 - j].edge_labels[m_edge.index()]
+            {
+                return Ok(false);
+            }
+            if edge_match.enabled() {
+                return edge_match.eq(&g[j][n_edge], &g[1 - j][m_edge]);
+            }
+            Ok(true)
+        };
+        if edge_match.enabled() || edge_labels {
             // outgoing edges
             for j in graph_indices.clone() {
-                let mut edges = g[j].neighbors(nodes[j]).detach();
-                while let Some((n_edge, n_neigh)) = edges.next(g[j]) {
+                for (n_edge, n_neigh) in g[j].edges_directed(nodes[j], Outgoing)
+                {
                     // handle the self loop case; it's not in the mapping (yet)
                     let m_neigh = if nodes[j] != n_neigh {
                         st[j].mapping[n_neigh.index()]
@@ -729,12 +1223,13 @@ where
                     }
                     match g[1 - j].find_edge(nodes[1 - j], m_neigh) {
                         Some(m_edge) => {
-                            let match_result = edge_match
-                                .eq(&g[j][n_edge], &g[1 - j][m_edge])?;
-                            if !match_result {
+                            if !edges_match(st, j, n_edge, m_edge)? {
                                 return Ok(false);
                             }
                         }
+                        // with induced=False an edge of the first graph need
+                        // not have a counterpart in the second one
+                        None if !induced => continue,
                         None => unreachable!(), // covered by syntactic check
                     }
                 }
@@ -742,9 +1237,9 @@ where
             // incoming edges
             if g[0].is_directed() {
                 for j in graph_indices.clone() {
-                    let mut edges =
-                        g[j].neighbors_directed(nodes[j], Incoming).detach();
-                    while let Some((n_edge, n_neigh)) = edges.next(g[j]) {
+                    for (n_edge, n_neigh) in
+                        g[j].edges_directed(nodes[j], Incoming)
+                    {
                         // the self loop case is handled in outgoing
                         let m_neigh = st[j].mapping[n_neigh.index()];
                         if m_neigh == end {
@@ -752,12 +1247,11 @@ where
                         }
                         match g[1 - j].find_edge(m_neigh, nodes[1 - j]) {
                             Some(m_edge) => {
-                                let match_result = edge_match
-                                    .eq(&g[j][n_edge], &g[1 - j][m_edge])?;
-                                if !match_result {
+                                if !edges_match(st, j, n_edge, m_edge)? {
                                     return Ok(false);
                                 }
                             }
+                            None if !induced => continue,
                             None => unreachable!(), // covered by syntactic check
                         }
                     }
@@ -766,9 +1260,10 @@ where
         }
         Ok(true)
     };
-    let mut stack: Vec<Frame<NodeIndex>> = vec![Frame::Outer];
-
     while let Some(frame) = stack.pop() {
+        if cancel.map_or(false, |cancel| cancel.load(AtomicOrdering::Relaxed)) {
+            return Ok(None);
+        }
         match frame {
             Frame::Unwind {
                 nodes,
@@ -805,6 +1300,10 @@ where
                 if feasible {
                     push_state(&mut st, nodes);
                     if st[1].is_complete() {
+                        stack.push(Frame::Unwind {
+                            nodes,
+                            open_list: ol,
+                        });
                         return Ok(Some(true));
                     }
                     // Check cardinalities of Tin, Tout sets
@@ -838,3 +1337,243 @@ where
     }
     Ok(None)
 }
+
+/// A VF2 search which owns copies of its graphs and can be resumed to find
+/// every mapping between them one at a time
+struct Vf2Algorithm<Ty, F, G>
+where
+    Ty: EdgeType,
+    F: SemanticMatcher<PyObject>,
+    G: SemanticMatcher<PyObject>,
+{
+    views: [GraphView<'static, Ty>; 2],
+    st: [Vf2State<Ty>; 2],
+    node_match: F,
+    edge_match: G,
+    ordering: Ordering,
+    induced: bool,
+    stack: Vec<Frame<NodeIndex>>,
+}
+
+impl<Ty, F, G> Vf2Algorithm<Ty, F, G>
+where
+    Ty: EdgeType,
+    F: SemanticMatcher<PyObject>,
+    G: SemanticMatcher<PyObject>,
+{
+    #[allow(clippy::too_many_arguments)]
+    fn new(
+        py: Python,
+        g0: &StablePyGraph<Ty>,
+        g1: &StablePyGraph<Ty>,
+        node_match: F,
+        edge_match: G,
+        id_order: bool,
+        ordering: Ordering,
+        induced: bool,
+        node_key: Option<&PyObject>,
+        edge_key: Option<&PyObject>,
+    ) -> PyResult<Option<Self>> {
+        // The graphs are copied as they can be modified while the search is
+        // suspended.
+        let setup = match setup(
+            py,
+            Cow::Owned(g0.clone()),
+            Cow::Owned(g1.clone()),
+            id_order,
+            ordering,
+            node_key,
+            edge_key,
+        )? {
+            Some(setup) => setup,
+            None => return Ok(None),
+        };
+        Ok(Some(Vf2Algorithm {
+            views: setup.views,
+            st: setup.st,
+            node_match,
+            edge_match,
+            ordering,
+            induced,
+            stack: vec![Frame::Outer],
+        }))
+    }
+
+    /// Return the next mapping from the node indices of the first graph to
+    /// the node indices of the second graph, or `None` once every mapping has
+    /// been found.
+    fn next_mapping(&mut self) -> PyResult<Option<HashMap<usize, usize>>> {
+        let found = try_match(
+            &mut self.st,
+            &self.views[0],
+            &self.views[1],
+            &mut self.node_match,
+            &mut self.edge_match,
+            self.ordering,
+            self.induced,
+            &mut self.stack,
+            None,
+        )?;
+        if found != Some(true) {
+            return Ok(None);
+        }
+        let views = &self.views;
+        Ok(Some(
+            self.st[1]
+                .mapping
+                .iter()
+                .enumerate()
+                .map(|(n1, n0)| {
+                    (
+                        views[0].graph_index(*n0),
+                        views[1].graph_index(NodeIndex::new(n1)),
+                    )
+                })
+                .collect(),
+        ))
+    }
+}
+
+macro_rules! vf2_mapping_impl {
+    ($name:ident, $Ty:ty, $doc:literal) => {
+        #[doc = $doc]
+        #[pyclass(module = "retworkx", gc)]
+        pub struct $name {
+            vf2: Option<Vf2Algorithm<$Ty, PyMatcher, PyMatcher>>,
+            remaining: Option<usize>,
+        }
+
+        impl $name {
+            #[allow(clippy::too_many_arguments)]
+            pub fn new(
+                py: Python,
+                g0: &StablePyGraph<$Ty>,
+                g1: &StablePyGraph<$Ty>,
+                node_match: Option<PyObject>,
+                edge_match: Option<PyObject>,
+                id_order: bool,
+                ordering: Ordering,
+                induced: bool,
+                node_key: Option<PyObject>,
+                edge_key: Option<PyObject>,
+                limit: Option<usize>,
+            ) -> PyResult<Self> {
+                Ok($name {
+                    vf2: Vf2Algorithm::new(
+                        py,
+                        g0,
+                        g1,
+                        PyMatcher(node_match),
+                        PyMatcher(edge_match),
+                        id_order,
+                        ordering,
+                        induced,
+                        node_key.as_ref(),
+                        edge_key.as_ref(),
+                    )?,
+                    remaining: limit,
+                })
+            }
+        }
+
+        #[pyproto]
+        impl PyIterProtocol for $name {
+            fn __iter__(slf: PyRef<Self>) -> Py<$name> {
+                slf.into()
+            }
+
+            fn __next__(mut slf: PyRefMut<Self>) -> PyResult<Option<NodeMap>> {
+                let py = slf.py();
+                let this = &mut *slf;
+                if this.remaining == Some(0) {
+                    return Ok(None);
+                }
+                let vf2 = match this.vf2.as_mut() {
+                    Some(vf2) => vf2,
+                    None => return Ok(None),
+                };
+                let mapping =
+                    if vf2.node_match.enabled() || vf2.edge_match.enabled() {
+                        vf2.next_mapping()?
+                    } else {
+                        // Without matchers the search never calls back into
+                        // Python, so run it without holding the GIL.
+                        py.allow_threads(|| vf2.next_mapping())?
+                    };
+                match mapping {
+                    Some(node_map) => {
+                        if let Some(remaining) = this.remaining.as_mut() {
+                            *remaining -= 1;
+                        }
+                        Ok(Some(NodeMap { node_map }))
+                    }
+                    None => {
+                        this.vf2 = None;
+                        Ok(None)
+                    }
+                }
+            }
+        }
+
+        #[pyproto]
+        impl PyGCProtocol for $name {
+            fn __traverse__(
+                &self,
+                visit: PyVisit,
+            ) -> Result<(), PyTraverseError> {
+                if let Some(vf2) = &self.vf2 {
+                    for graph in vf2.views.iter().map(|view| &view.graph) {
+                        for node in graph
+                            .node_indices()
+                            .map(|node| graph.node_weight(node).unwrap())
+                        {
+                            visit.call(node)?;
+                        }
+                        for edge in graph
+                            .edge_indices()
+                            .map(|edge| graph.edge_weight(edge).unwrap())
+                        {
+                            visit.call(edge)?;
+                        }
+                    }
+                    for matcher in [&vf2.node_match.0, &vf2.edge_match.0]
+                        .iter()
+                        .filter_map(|matcher| matcher.as_ref())
+                    {
+                        visit.call(matcher)?;
+                    }
+                }
+                Ok(())
+            }
+
+            fn __clear__(&mut self) {
+                self.vf2 = None;
+            }
+        }
+    };
+}
+
+vf2_mapping_impl!(
+    DiGraphVf2Mapping,
+    Directed,
+    "An iterator over the VF2 mappings between two :class:`~retworkx.PyDiGraph`
+
+    Each step of the iteration resumes the VF2 search and returns the next
+    mapping as a :class:`~retworkx.NodeMap` from the node indices of the
+    first graph to the node indices of the second graph. This class is
+    returned by :func:`~retworkx.digraph_vf2_mapping` and is not meant to
+    be created directly.
+    "
+);
+vf2_mapping_impl!(
+    GraphVf2Mapping,
+    Undirected,
+    "An iterator over the VF2 mappings between two :class:`~retworkx.PyGraph`
+
+    Each step of the iteration resumes the VF2 search and returns the next
+    mapping as a :class:`~retworkx.NodeMap` from the node indices of the
+    first graph to the node indices of the second graph. This class is
+    returned by :func:`~retworkx.graph_vf2_mapping` and is not meant to
+    be created directly.
+    "
+);
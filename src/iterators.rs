@@ -34,6 +34,13 @@
 //
 // e.g `default_pygc_protocol_impl!(MyReadOnlyType);`
 //
+// Both macros take an optional trailing block of extra methods for the new type,
+// as pyo3 only allows a single `#[pymethods]` block per class.
+//
+// e.g `custom_vec_iter_impl!(MyReadOnlyType, data, usize, "Docs", {
+//          fn first(&self) -> Option<usize> { self.data.first().copied() }
+//      });`
+//
 // Types `T, K, V` above should implement `PyHash`, `PyEq`, `PyDisplay` traits.
 // These are arleady implemented for many primitive rust types and `PyObject`.
 
@@ -44,7 +51,9 @@ use std::convert::TryInto;
 use std::hash::Hasher;
 
 use hashbrown::HashMap;
+use ndarray::Array2;
 use num_bigint::BigUint;
+use numpy::IntoPyArray;
 
 use pyo3::class::iter::{IterNextOutput, PyIterProtocol};
 use pyo3::class::{PyMappingProtocol, PyObjectProtocol, PySequenceProtocol};
@@ -437,7 +446,7 @@ macro_rules! default_pygc_protocol_impl {
 }
 
 macro_rules! custom_vec_iter_impl {
-    ($name:ident, $data:ident, $T:ty, $doc:literal) => {
+    ($name:ident, $data:ident, $T:ty, $doc:literal $(, { $($methods:tt)* })?) => {
         #[doc = $doc]
         #[pyclass(module = "retworkx", gc)]
         #[derive(Clone)]
@@ -459,6 +468,8 @@ macro_rules! custom_vec_iter_impl {
             fn __setstate__(&mut self, state: Vec<$T>) {
                 self.$data = state;
             }
+
+            $($($methods)*)?
         }
 
         #[pyproto]
@@ -591,7 +602,25 @@ custom_vec_iter_impl!(
         first_element = next(nodes_iter)
         second_element = next(nodes_iter)
 
-    "
+    ",
+    {
+        /// Return the node indices as a 1 dimensional numpy array
+        ///
+        /// The array is an ``int64`` copy of the indices built in a single
+        /// pass, no python objects are created for the elements.
+        ///
+        /// :returns: An array of the node indices
+        /// :rtype: numpy.ndarray
+        #[pyo3(text_signature = "(self)")]
+        fn as_array(&self, py: Python) -> PyObject {
+            self.nodes
+                .iter()
+                .map(|index| *index as i64)
+                .collect::<Vec<i64>>()
+                .into_pyarray(py)
+                .into()
+        }
+    }
 );
 default_pygc_protocol_impl!(NodeIndices);
 
@@ -621,7 +650,26 @@ custom_vec_iter_impl!(
         first_element = next(edges_iter)
         second_element = next(edges_iter)
 
-    "
+    ",
+    {
+        /// Return the edges as a ``(m, 2)`` numpy array
+        ///
+        /// Row ``i`` of the array is the ``(source, target)`` pair of the
+        /// ``i`` th edge. The array is an ``int64`` copy of the edges built in
+        /// a single pass, no python objects are created for the elements.
+        ///
+        /// :returns: An array of the edges
+        /// :rtype: numpy.ndarray
+        #[pyo3(text_signature = "(self)")]
+        fn as_array(&self, py: Python) -> PyObject {
+            Array2::from_shape_fn((self.edges.len(), 2), |(row, col)| {
+                let edge = self.edges[row];
+                (if col == 0 { edge.0 } else { edge.1 }) as i64
+            })
+            .into_pyarray(py)
+            .into()
+        }
+    }
 );
 default_pygc_protocol_impl!(EdgeList);
 
@@ -694,7 +742,25 @@ custom_vec_iter_impl!(
         first_element = next(edges_iter)
         second_element = next(edges_iter)
 
-    "
+    ",
+    {
+        /// Return the edge indices as a 1 dimensional numpy array
+        ///
+        /// The array is an ``int64`` copy of the indices built in a single
+        /// pass, no python objects are created for the elements.
+        ///
+        /// :returns: An array of the edge indices
+        /// :rtype: numpy.ndarray
+        #[pyo3(text_signature = "(self)")]
+        fn as_array(&self, py: Python) -> PyObject {
+            self.edges
+                .iter()
+                .map(|index| *index as i64)
+                .collect::<Vec<i64>>()
+                .into_pyarray(py)
+                .into()
+        }
+    }
 );
 default_pygc_protocol_impl!(EdgeIndices);
 
@@ -773,7 +839,7 @@ macro_rules! custom_hash_map_iter_impl {
     (
         $name:ident, $nameKeys:ident, $nameValues:ident, $nameItems:ident,
         $data:ident, $keys:ident, $values:ident, $items:ident,
-        $K:ty, $V:ty, $doc:literal
+        $K:ty, $V:ty, $doc:literal $(, { $($methods:tt)* })?
     ) => {
         #[doc = $doc]
         #[pyclass(module = "retworkx", gc)]
@@ -821,6 +887,8 @@ macro_rules! custom_hash_map_iter_impl {
                     iter_pos: 0,
                 }
             }
+
+            $($($methods)*)?
         }
 
         py_object_protocol_impl!($name, $data);
@@ -1106,7 +1174,27 @@ custom_hash_map_iter_impl!(
         second_target = next(edges_iter)
         second_path = edges[second_target]
 
-    "
+    ",
+    {
+        /// Return the targets and path lengths as two numpy arrays
+        ///
+        /// The ``int64`` array of target nodes and the ``float64`` array of
+        /// path lengths are in the same order, so ``lengths[i]`` is the length
+        /// of the path to ``targets[i]``. They are built in a single pass, no
+        /// python objects are created for the elements.
+        ///
+        /// :returns: A tuple of ``(targets, lengths)`` arrays
+        /// :rtype: tuple
+        #[pyo3(text_signature = "(self)")]
+        fn as_arrays(&self, py: Python) -> PyObject {
+            let (targets, lengths): (Vec<i64>, Vec<f64>) = self
+                .path_lengths
+                .iter()
+                .map(|(target, length)| (*target as i64, *length))
+                .unzip();
+            (targets.into_pyarray(py), lengths.into_pyarray(py)).into_py(py)
+        }
+    }
 );
 default_pygc_protocol_impl!(PathLengthMapping);
 
@@ -56,7 +56,7 @@ where
     G: IntoEdges + Visitable + NodeCount + NodeIndexable,
     G: Data<NodeWeight = PyObject, EdgeWeight = PyObject>,
     G::NodeId: Eq + Hash,
-    F: FnMut(&PyObject) -> PyResult<f64>,
+    F: FnMut(G::EdgeRef) -> PyResult<f64>,
 {
     let mut counter: Vec<usize> = vec![0; graph.node_count()];
     let mut scores = HashMap::with_capacity(graph.node_count());
@@ -83,10 +83,8 @@ where
         }
 
         for edge in graph.edges(node) {
-            visit_next.push(MinScored(
-                node_score + edge_cost(edge.weight())?,
-                edge.target(),
-            ));
+            visit_next
+                .push(MinScored(node_score + edge_cost(edge)?, edge.target()));
         }
     }
     Ok(scores)
@@ -16,6 +16,10 @@ use hashbrown::{HashMap, HashSet};
 
 use pyo3::prelude::*;
 
+use rand::prelude::*;
+use rand_pcg::Pcg64;
+use rayon::prelude::*;
+
 use petgraph::graph::NodeIndex;
 use petgraph::prelude::*;
 use petgraph::visit::NodeIndexable;
@@ -29,6 +33,14 @@ type Graph<Ty> = StableGraph<PyObject, PyObject, Ty>;
 
 const LBOUND: Nt = 1e-8;
 
+// Cells of the Barnes-Hut quadtree deeper than this are not split any
+// further, points which are (almost) on top of each other share a cell.
+const MAX_DEPTH: usize = 32;
+
+// Graphs with at most this many nodes aren't coarsened any further by
+// the multilevel layout.
+const COARSEST_SIZE: usize = 20;
+
 #[inline]
 fn l2norm(x: Point) -> Nt {
     (x[0] * x[0] + x[1] * x[1]).sqrt()
@@ -41,9 +53,9 @@ pub trait Force {
 
     // total force in Point x
     // from (points, weights) in ys.
-    fn total<'a, I>(&self, x: &Point, ys: I) -> [Nt; 2]
+    fn total<I>(&self, x: &Point, ys: I) -> [Nt; 2]
     where
-        I: Iterator<Item = (&'a Point, Nt)>,
+        I: Iterator<Item = (Point, Nt)>,
     {
         let mut ftot = [0.0, 0.0];
 
@@ -98,6 +110,190 @@ impl Force for AttractiveForce {
     }
 }
 
+struct Cell {
+    center: Point,
+    half_width: Nt,
+    // number of points in the cell
+    mass: usize,
+    // the sum of the positions until the tree is built, then the center
+    // of mass
+    com: Point,
+    // index of the first of the 4 children, 0 if the cell is a leaf
+    children: usize,
+    // the point in the cell if it is a leaf with a single point
+    point: Option<usize>,
+}
+
+impl Cell {
+    fn new(center: Point, half_width: Nt) -> Self {
+        Cell {
+            center,
+            half_width,
+            mass: 0,
+            com: [0.0, 0.0],
+            children: 0,
+            point: None,
+        }
+    }
+
+    fn quadrant(&self, x: &Point) -> usize {
+        (x[0] >= self.center[0]) as usize
+            + 2 * (x[1] >= self.center[1]) as usize
+    }
+}
+
+/// A quadtree over node positions used to approximate the repulsive forces
+/// with the Barnes-Hut algorithm. Every cell stores the number of points in
+/// it and their center of mass, cells which are far enough away from a point
+/// are treated as a single point with that mass.
+pub struct QuadTree {
+    cells: Vec<Cell>,
+}
+
+impl QuadTree {
+    pub fn new<I>(pos: &[Point], indices: I) -> Self
+    where
+        I: Iterator<Item = usize> + Clone,
+    {
+        let mut min = [std::f64::INFINITY, std::f64::INFINITY];
+        let mut max = [std::f64::NEG_INFINITY, std::f64::NEG_INFINITY];
+        for n in indices.clone() {
+            for axis in 0..2 {
+                min[axis] = min[axis].min(pos[n][axis]);
+                max[axis] = max[axis].max(pos[n][axis]);
+            }
+        }
+        let center = [(min[0] + max[0]) / 2.0, (min[1] + max[1]) / 2.0];
+        let half_width = ((max[0] - min[0]).max(max[1] - min[1]) / 2.0)
+            .max(LBOUND)
+            * (1.0 + 1e-6);
+        let mut tree = QuadTree {
+            cells: vec![Cell::new(center, half_width)],
+        };
+        for n in indices {
+            tree.insert(pos, n);
+        }
+        for cell in tree.cells.iter_mut() {
+            if cell.mass > 0 {
+                cell.com[0] /= cell.mass as Nt;
+                cell.com[1] /= cell.mass as Nt;
+            }
+        }
+        tree
+    }
+
+    fn insert(&mut self, pos: &[Point], n: usize) {
+        let x = pos[n];
+        let mut c = 0;
+        let mut depth = 0;
+        loop {
+            let cell = &mut self.cells[c];
+            cell.mass += 1;
+            cell.com[0] += x[0];
+            cell.com[1] += x[1];
+            if cell.children != 0 {
+                c = cell.children + cell.quadrant(&x);
+                depth += 1;
+                continue;
+            }
+            if cell.mass == 1 {
+                cell.point = Some(n);
+                return;
+            }
+            if depth >= MAX_DEPTH {
+                cell.point = None;
+                return;
+            }
+            // split the leaf and move its previous point into a child
+            let old = cell.point.take().unwrap();
+            let center = cell.center;
+            let half_width = cell.half_width / 2.0;
+            let first = self.cells.len();
+            self.cells[c].children = first;
+            for quadrant in 0..4 {
+                let dx = if quadrant & 1 == 1 {
+                    half_width
+                } else {
+                    -half_width
+                };
+                let dy = if quadrant & 2 == 2 {
+                    half_width
+                } else {
+                    -half_width
+                };
+                self.cells.push(Cell::new(
+                    [center[0] + dx, center[1] + dy],
+                    half_width,
+                ));
+            }
+            let quadrant = self.cells[c].quadrant(&pos[old]);
+            let child = &mut self.cells[first + quadrant];
+            child.mass = 1;
+            child.com = pos[old];
+            child.point = Some(old);
+            c = first + self.cells[c].quadrant(&x);
+            depth += 1;
+        }
+    }
+
+    /// Return the (center of mass, mass) pairs approximating every point
+    /// other than `n`, which is at position `x`. A cell is used as a whole
+    /// if its width divided by its distance from `x` is less than `theta`.
+    ///
+    /// The cells containing `n` are always opened instead, down to its leaf.
+    /// If `n` shares that leaf with other points, because they are too close
+    /// to split, its own mass is taken out of the leaf.
+    pub fn approximate<'a>(
+        &'a self,
+        n: usize,
+        x: &Point,
+        theta: Nt,
+    ) -> impl Iterator<Item = (Point, Nt)> + 'a {
+        // the cells to visit and whether `n` is in them
+        let mut stack = vec![(0, true)];
+        let x = *x;
+        std::iter::from_fn(move || {
+            while let Some((c, has_n)) = stack.pop() {
+                let cell = &self.cells[c];
+                if cell.mass == 0 {
+                    continue;
+                }
+                if has_n {
+                    if cell.children != 0 {
+                        let own = cell.children + cell.quadrant(&x);
+                        stack.extend(
+                            (cell.children..cell.children + 4)
+                                .map(|child| (child, child == own)),
+                        );
+                        continue;
+                    }
+                    if cell.point == Some(n) {
+                        continue;
+                    }
+                    let mass = (cell.mass - 1) as Nt;
+                    let total = cell.mass as Nt;
+                    let com = [
+                        (cell.com[0] * total - x[0]) / mass,
+                        (cell.com[1] * total - x[1]) / mass,
+                    ];
+                    return Some((com, mass));
+                }
+                let d = [cell.com[0] - x[0], cell.com[1] - x[1]];
+                if cell.children == 0
+                    || 2.0 * cell.half_width < theta * l2norm(d)
+                {
+                    return Some((cell.com, cell.mass as Nt));
+                }
+                stack.extend(
+                    (cell.children..cell.children + 4)
+                        .map(|child| (child, false)),
+                );
+            }
+            None
+        })
+    }
+}
+
 pub trait CoolingScheme {
     fn update_step(&mut self, cost: Nt) -> Nt;
 }
@@ -206,8 +402,8 @@ fn recenter(pos: &mut Vec<Point>, center: Point) {
 }
 
 #[allow(clippy::too_many_arguments)]
-pub fn evolve<Ty, Fa, Fr, C>(
-    graph: &Graph<Ty>,
+pub fn evolve<N, E, Ty, Fa, Fr, C>(
+    graph: &StableGraph<N, E, Ty>,
     mut pos: Vec<Point>,
     fixed: HashSet<usize>,
     f_a: Fa,
@@ -218,41 +414,37 @@ pub fn evolve<Ty, Fa, Fr, C>(
     weights: HashMap<(usize, usize), f64>,
     scale: Option<Nt>,
     center: Option<Point>,
+    theta: Option<Nt>,
 ) -> Vec<Point>
 where
-    Ty: EdgeType,
-    Fa: Force,
-    Fr: Force,
+    N: Sync,
+    E: Sync,
+    Ty: EdgeType + Sync,
+    Fa: Force + Sync,
+    Fr: Force + Sync,
     C: CoolingScheme,
 {
     let mut step = cs.update_step(std::f64::INFINITY);
 
+    // attractive forces
+    let attraction = |pos: &Vec<Point>, v: usize| {
+        let ys = graph.neighbors_undirected(NodeIndex::new(v)).map(|n| {
+            let n = n.index();
+            (pos[n], weights[&(v, n)])
+        });
+        f_a.total(&pos[v], ys)
+    };
+    let movable: Vec<usize> = graph
+        .node_indices()
+        .map(|n| n.index())
+        .filter(|v| !fixed.contains(v))
+        .collect();
+
     for _ in 0..num_iter {
         let mut energy = 0.0;
         let mut converged = true;
 
-        for v in graph.node_indices() {
-            let v = v.index();
-            if fixed.contains(&v) {
-                continue;
-            }
-            // attractive forces
-            let ys = graph.neighbors_undirected(NodeIndex::new(v)).map(|n| {
-                let n = n.index();
-                (&pos[n], weights[&(v, n)])
-            });
-            let fa = f_a.total(&pos[v], ys);
-
-            // repulsive forces
-            let ys =
-                graph.node_indices().filter(|&n| n.index() != v).map(|n| {
-                    let n = n.index();
-                    (&pos[n], 1.0)
-                });
-            let fr = f_r.total(&pos[v], ys);
-
-            // update current position
-            let f = [fa[0] + fr[0], fa[1] + fr[1]];
+        let mut update = |pos: &mut Vec<Point>, v: usize, f: Point| {
             let f2 = f[0] * f[0] + f[1] * f[1];
             energy += f2;
 
@@ -265,6 +457,50 @@ where
             if dx * dx + dy * dy > tol {
                 converged = false;
             }
+        };
+
+        match theta {
+            None => {
+                for &v in &movable {
+                    let fa = attraction(&pos, v);
+
+                    // repulsive forces
+                    let ys = graph
+                        .node_indices()
+                        .filter(|&n| n.index() != v)
+                        .map(|n| {
+                            let n = n.index();
+                            (pos[n], 1.0)
+                        });
+                    let fr = f_r.total(&pos[v], ys);
+
+                    // update current position
+                    update(&mut pos, v, [fa[0] + fr[0], fa[1] + fr[1]]);
+                }
+            }
+            Some(theta) => {
+                // approximate the repulsive forces with a quadtree and
+                // compute the forces on all nodes from the same positions in
+                // parallel before moving any of them
+                let tree = QuadTree::new(
+                    &pos,
+                    graph.node_indices().map(|n| n.index()),
+                );
+                let forces: Vec<Point> = movable
+                    .par_iter()
+                    .map(|&v| {
+                        let fa = attraction(&pos, v);
+                        let fr = f_r.total(
+                            &pos[v],
+                            tree.approximate(v, &pos[v], theta),
+                        );
+                        [fa[0] + fr[0], fa[1] + fr[1]]
+                    })
+                    .collect();
+                for (&v, f) in movable.iter().zip(forces) {
+                    update(&mut pos, v, f);
+                }
+            }
         }
 
         step = cs.update_step(energy);
@@ -290,6 +526,244 @@ where
     pos
 }
 
+type Level = StableGraph<(), Nt, Undirected>;
+
+/// Contract a heavy edge matching of `graph`. Nodes are visited in a random
+/// order and each unmatched node is merged with the unmatched neighbor it
+/// has the heaviest edge to. Returns the coarse graph, where the weights of
+/// the edges between merged nodes are summed, and the coarse node of every
+/// node of `graph`.
+fn coarsen(graph: &Level, rng: &mut Pcg64) -> (Level, Vec<usize>) {
+    let node_count = graph.node_count();
+    let mut order: Vec<usize> = (0..node_count).collect();
+    order.shuffle(rng);
+
+    let mut parent = vec![usize::MAX; node_count];
+    let mut coarse_count = 0;
+    for v in order {
+        if parent[v] != usize::MAX {
+            continue;
+        }
+        parent[v] = coarse_count;
+        let mate = graph
+            .edges(NodeIndex::new(v))
+            .map(|e| {
+                let u = if e.source().index() == v {
+                    e.target().index()
+                } else {
+                    e.source().index()
+                };
+                (u, *e.weight())
+            })
+            .filter(|&(u, _)| parent[u] == usize::MAX)
+            .max_by(|a, b| {
+                a.1.partial_cmp(&b.1).unwrap_or(std::cmp::Ordering::Equal)
+            });
+        if let Some((u, _)) = mate {
+            parent[u] = coarse_count;
+        }
+        coarse_count += 1;
+    }
+
+    let mut coarse = Level::with_capacity(coarse_count, graph.edge_count());
+    for _ in 0..coarse_count {
+        coarse.add_node(());
+    }
+    let mut coarse_edges: HashMap<(usize, usize), EdgeIndex> =
+        HashMap::with_capacity(graph.edge_count());
+    for e in graph.edge_references() {
+        let a = parent[e.source().index()];
+        let b = parent[e.target().index()];
+        if a == b {
+            continue;
+        }
+        match coarse_edges.get(&(a.min(b), a.max(b))) {
+            Some(edge) => coarse[*edge] += e.weight(),
+            None => {
+                let edge = coarse.add_edge(
+                    NodeIndex::new(a),
+                    NodeIndex::new(b),
+                    *e.weight(),
+                );
+                coarse_edges.insert((a.min(b), a.max(b)), edge);
+            }
+        }
+    }
+    (coarse, parent)
+}
+
+/// Run the spring layout on one level of the multilevel layout
+#[allow(clippy::too_many_arguments)]
+fn layout_level(
+    graph: &Level,
+    pos: Vec<Point>,
+    k: Nt,
+    repulsive_exponent: i32,
+    step: Nt,
+    num_iter: usize,
+    tol: f64,
+    theta: Option<Nt>,
+) -> Vec<Point> {
+    let mut weights: HashMap<(usize, usize), f64> =
+        HashMap::with_capacity(2 * graph.edge_count());
+    for e in graph.edge_references() {
+        let source = e.source().index();
+        let target = e.target().index();
+        weights.insert((source, target), *e.weight());
+        weights.insert((target, source), *e.weight());
+    }
+    evolve(
+        graph,
+        pos,
+        HashSet::new(),
+        AttractiveForce::new(k),
+        RepulsiveForce::new(k, repulsive_exponent),
+        AdaptiveCoolingScheme::new(step),
+        num_iter,
+        tol,
+        weights,
+        None,
+        None,
+        theta,
+    )
+}
+
+/// Multilevel force directed layout
+///
+/// The graph is repeatedly coarsened by contracting a heavy edge matching
+/// until it is small or stops shrinking. The coarsest graph is laid out from
+/// random positions with `evolve`, then the positions are prolonged to each
+/// finer level, placing every node near the coarse node it was merged into,
+/// and refined with `evolve` again. `edge_weights` is indexed by edge index.
+///
+/// Returns the positions indexed by node index.
+#[allow(clippy::too_many_arguments)]
+pub fn multilevel_layout<Ty: EdgeType>(
+    graph: &Graph<Ty>,
+    edge_weights: Vec<f64>,
+    k: Option<Nt>,
+    repulsive_exponent: i32,
+    num_iter: usize,
+    tol: f64,
+    scale: Option<Nt>,
+    center: Option<Point>,
+    seed: Option<u64>,
+    theta: Option<Nt>,
+) -> Vec<Point> {
+    let mut rng: Pcg64 = match seed {
+        Some(seed) => Pcg64::seed_from_u64(seed),
+        None => Pcg64::from_entropy(),
+    };
+
+    // the finest level is the input graph with compact node indices and
+    // the weights of parallel edges summed
+    let nodes: Vec<NodeIndex> = graph.node_indices().collect();
+    let node_count = nodes.len();
+    let mut position = vec![0; graph.node_bound()];
+    for (pos, node) in nodes.iter().enumerate() {
+        position[node.index()] = pos;
+    }
+    let mut finest = Level::with_capacity(node_count, graph.edge_count());
+    for _ in 0..node_count {
+        finest.add_node(());
+    }
+    let mut finest_edges: HashMap<(usize, usize), EdgeIndex> =
+        HashMap::with_capacity(graph.edge_count());
+    for e in graph.edge_references() {
+        let a = position[e.source().index()];
+        let b = position[e.target().index()];
+        if a == b {
+            continue;
+        }
+        let weight = edge_weights[e.id().index()];
+        match finest_edges.get(&(a.min(b), a.max(b))) {
+            Some(edge) => finest[*edge] += weight,
+            None => {
+                let edge = finest.add_edge(
+                    NodeIndex::new(a),
+                    NodeIndex::new(b),
+                    weight,
+                );
+                finest_edges.insert((a.min(b), a.max(b)), edge);
+            }
+        }
+    }
+
+    let mut levels = vec![finest];
+    let mut parents: Vec<Vec<usize>> = Vec::new();
+    loop {
+        let current = levels.last().unwrap();
+        if current.node_count() <= COARSEST_SIZE {
+            break;
+        }
+        let (coarse, parent) = coarsen(current, &mut rng);
+        // stop once the matching no longer shrinks the graph much, for
+        // example the leaves of a star can't be matched with each other
+        if 10 * coarse.node_count() > 9 * current.node_count() {
+            break;
+        }
+        levels.push(coarse);
+        parents.push(parent);
+    }
+
+    // the optimal distance at each level, chosen so that every level covers
+    // about the same area as the finest one
+    let k = k.unwrap_or(1.0 / (node_count as Nt).sqrt());
+    let level_k = |level: &Level| {
+        k * (node_count as Nt / level.node_count().max(1) as Nt).sqrt()
+    };
+
+    let coarsest = levels.last().unwrap();
+    let pos: Vec<Point> = (0..coarsest.node_count())
+        .map(|_| [rng.gen(), rng.gen()])
+        .collect();
+    let mut pos = layout_level(
+        coarsest,
+        pos,
+        level_k(coarsest),
+        repulsive_exponent,
+        0.1,
+        num_iter,
+        tol,
+        theta,
+    );
+    for (fine, parent) in levels.iter().zip(parents.iter()).rev() {
+        let fine_k = level_k(fine);
+        let prolonged: Vec<Point> = parent
+            .iter()
+            .map(|&p| {
+                [
+                    pos[p][0] + fine_k * (rng.gen::<Nt>() - 0.5),
+                    pos[p][1] + fine_k * (rng.gen::<Nt>() - 0.5),
+                ]
+            })
+            .collect();
+        pos = layout_level(
+            fine,
+            prolonged,
+            fine_k,
+            repulsive_exponent,
+            fine_k,
+            num_iter,
+            tol,
+            theta,
+        );
+    }
+
+    if let Some(scale) = scale {
+        rescale(&mut pos, scale, (0..node_count).collect());
+    }
+    if let Some(center) = center {
+        recenter(&mut pos, center);
+    }
+
+    let mut out = vec![[0.0, 0.0]; graph.node_bound()];
+    for (node, p) in nodes.into_iter().zip(pos) {
+        out[node.index()] = p;
+    }
+    out
+}
+
 pub fn bipartite_layout<Ty: EdgeType>(
     graph: &StableGraph<PyObject, PyObject, Ty>,
     first_nodes: HashSet<usize>,
@@ -12,21 +12,33 @@
 
 #![allow(clippy::float_cmp)]
 
+mod analysis_cache;
 mod astar;
+mod bidirectional;
+mod binary;
 mod digraph;
 mod dijkstra;
 mod dot_utils;
+mod edge_array;
+mod edge_list;
+mod floyd_warshall;
 mod generators;
 mod graph;
+mod graph_hash;
 mod isomorphism;
 mod iterators;
 mod k_shortest_path;
 mod layout;
 mod max_weight_matching;
+mod sparse;
+mod topological_order;
+mod triangles;
 mod union;
+mod weights;
 
 use std::cmp::{Ordering, Reverse};
 use std::collections::{BTreeSet, BinaryHeap};
+use std::sync::Arc;
 
 use hashbrown::{HashMap, HashSet};
 
@@ -52,18 +64,21 @@ use petgraph::EdgeType;
 
 use ndarray::prelude::*;
 use num_bigint::{BigUint, ToBigUint};
-use numpy::IntoPyArray;
+use numpy::{IntoPyArray, PyReadonlyArray2};
 use rand::distributions::{Distribution, Uniform};
 use rand::prelude::*;
 use rand_pcg::Pcg64;
 use rayon::prelude::*;
 
+use crate::analysis_cache::AnalysisCache;
 use crate::generators::PyInit_generators;
 use crate::iterators::{
     AllPairsPathLengthMapping, AllPairsPathMapping, EdgeList, NodeIndices,
     NodesCountMapping, PathLengthMapping, PathMapping, Pos2DMapping,
     WeightedEdgeList,
 };
+use crate::triangles::TriangleCounts;
+use crate::weights::EdgeWeights;
 
 trait NodesRemoved {
     fn nodes_removed(&self) -> bool;
@@ -169,6 +184,9 @@ fn dag_longest_path_length(graph: &digraph::PyDiGraph) -> PyResult<usize> {
 #[pyfunction]
 #[pyo3(text_signature = "(graph, /)")]
 fn number_weakly_connected_components(graph: &digraph::PyDiGraph) -> usize {
+    if graph.cache.enabled() {
+        return cached_weakly_connected_components(graph).len();
+    }
     algo::connected_components(graph)
 }
 
@@ -183,6 +201,22 @@ fn number_weakly_connected_components(graph: &digraph::PyDiGraph) -> usize {
 #[pyfunction]
 #[pyo3(text_signature = "(graph, /)")]
 pub fn weakly_connected_components(
+    py: Python,
+    graph: &digraph::PyDiGraph,
+) -> PyObject {
+    cached_weakly_connected_components(graph).to_object(py)
+}
+
+fn cached_weakly_connected_components(
+    graph: &digraph::PyDiGraph,
+) -> Arc<Vec<BTreeSet<usize>>> {
+    graph.cache.get_or_insert_with(
+        |entries| &mut entries.weakly_connected_components,
+        || Arc::new(_weakly_connected_components(graph)),
+    )
+}
+
+fn _weakly_connected_components(
     graph: &digraph::PyDiGraph,
 ) -> Vec<BTreeSet<usize>> {
     let mut seen: HashSet<NodeIndex> =
@@ -231,7 +265,8 @@ pub fn is_weakly_connected(graph: &digraph::PyDiGraph) -> PyResult<bool> {
     if graph.graph.node_count() == 0 {
         return Err(NullGraph::new_err("Invalid operation on a NullGraph"));
     }
-    Ok(weakly_connected_components(graph)[0].len() == graph.graph.node_count())
+    Ok(cached_weakly_connected_components(graph)[0].len()
+        == graph.graph.node_count())
 }
 
 /// Check that the PyDiGraph or PyDAG doesn't have a cycle
@@ -244,10 +279,13 @@ pub fn is_weakly_connected(graph: &digraph::PyDiGraph) -> PyResult<bool> {
 #[pyfunction]
 #[pyo3(text_signature = "(graph, /)")]
 fn is_directed_acyclic_graph(graph: &digraph::PyDiGraph) -> bool {
-    match algo::toposort(graph, None) {
-        Ok(_nodes) => true,
-        Err(_err) => false,
-    }
+    graph.cache.get_or_insert_with(
+        |entries| &mut entries.is_directed_acyclic_graph,
+        || match algo::toposort(graph, None) {
+            Ok(_nodes) => true,
+            Err(_err) => false,
+        },
+    )
 }
 
 /// Return a new PyDiGraph by forming a union from two input PyDiGraph objects
@@ -309,6 +347,8 @@ fn digraph_union(
 ///
 ///     For better performance on large graphs, consider setting `id_order=False`.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param PyDiGraph first: The first graph to compare
 /// :param PyDiGraph second: The second graph to compare
 /// :param callable node_matcher: A python callable object that takes 2 positional
@@ -322,13 +362,19 @@ fn digraph_union(
 /// :param bool id_order: If set to ``False`` this function will use a
 ///     heuristic matching order based on [VF2]_ paper. Otherwise it will
 ///     default to matching the nodes in order specified by their ids.
+/// :param callable node_key: A python callable object that takes a node data
+///     object and returns a hashable key for it, only nodes with equal keys
+///     are matched.
+/// :param callable edge_key: A python callable object that takes an edge data
+///     object and returns a hashable key for it, only edges with equal keys
+///     are matched.
 ///
 /// :returns: ``True`` if the 2 graphs are isomorphic ``False`` if they are
 ///     not.
 /// :rtype: bool
 #[pyfunction(id_order = "true")]
 #[pyo3(
-    text_signature = "(first, second, node_matcher=None, edge_matcher=None, id_order=True, /)"
+    text_signature = "(first, second, node_matcher=None, edge_matcher=None, id_order=True, node_key=None, edge_key=None, /)"
 )]
 fn digraph_is_isomorphic(
     py: Python,
@@ -337,6 +383,8 @@ fn digraph_is_isomorphic(
     node_matcher: Option<PyObject>,
     edge_matcher: Option<PyObject>,
     id_order: bool,
+    node_key: Option<PyObject>,
+    edge_key: Option<PyObject>,
 ) -> PyResult<bool> {
     let compare_nodes = node_matcher.map(|f| {
         move |a: &PyObject, b: &PyObject| -> PyResult<bool> {
@@ -361,6 +409,8 @@ fn digraph_is_isomorphic(
         id_order,
         Ordering::Equal,
         true,
+        node_key.as_ref(),
+        edge_key.as_ref(),
     )?;
     Ok(res)
 }
@@ -381,6 +431,8 @@ fn digraph_is_isomorphic(
 ///
 ///     For better performance on large graphs, consider setting `id_order=False`.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param PyGraph first: The first graph to compare
 /// :param PyGraph second: The second graph to compare
 /// :param callable node_matcher: A python callable object that takes 2 positional
@@ -394,13 +446,19 @@ fn digraph_is_isomorphic(
 /// :param bool (default=True) id_order:  If set to true, the algorithm matches the
 ///     nodes in order specified by their ids. Otherwise, it uses a heuristic
 ///     matching order based in [VF2]_ paper.
+/// :param callable node_key: A python callable object that takes a node data
+///     object and returns a hashable key for it, only nodes with equal keys
+///     are matched.
+/// :param callable edge_key: A python callable object that takes an edge data
+///     object and returns a hashable key for it, only edges with equal keys
+///     are matched.
 ///
 /// :returns: ``True`` if the 2 graphs are isomorphic ``False`` if they are
 ///     not.
 /// :rtype: bool
 #[pyfunction(id_order = "true")]
 #[pyo3(
-    text_signature = "(first, second, node_matcher=None, edge_matcher=None, id_order=True, /)"
+    text_signature = "(first, second, node_matcher=None, edge_matcher=None, id_order=True, node_key=None, edge_key=None, /)"
 )]
 fn graph_is_isomorphic(
     py: Python,
@@ -409,6 +467,8 @@ fn graph_is_isomorphic(
     node_matcher: Option<PyObject>,
     edge_matcher: Option<PyObject>,
     id_order: bool,
+    node_key: Option<PyObject>,
+    edge_key: Option<PyObject>,
 ) -> PyResult<bool> {
     let compare_nodes = node_matcher.map(|f| {
         move |a: &PyObject, b: &PyObject| -> PyResult<bool> {
@@ -433,6 +493,8 @@ fn graph_is_isomorphic(
         id_order,
         Ordering::Equal,
         true,
+        node_key.as_ref(),
+        edge_key.as_ref(),
     )?;
     Ok(res)
 }
@@ -457,6 +519,8 @@ fn graph_is_isomorphic(
 ///
 ///     For better performance on large graphs, consider setting `id_order=False`.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param PyDiGraph first: The first graph to compare
 /// :param PyDiGraph second: The second graph to compare
 /// :param callable node_matcher: A python callable object that takes 2 positional
@@ -473,13 +537,19 @@ fn graph_is_isomorphic(
 /// :param bool induced: If set to ``True`` this function will check the existence
 ///     of a node-induced subgraph of first isomorphic to second graph.
 ///     Default: ``True``.
+/// :param callable node_key: A python callable object that takes a node data
+///     object and returns a hashable key for it, only nodes with equal keys
+///     are matched.
+/// :param callable edge_key: A python callable object that takes an edge data
+///     object and returns a hashable key for it, only edges with equal keys
+///     are matched.
 ///
 /// :returns: ``True`` if there is a subgraph of `first` isomorphic to `second`,
 ///     ``False`` if there is not.
 /// :rtype: bool
 #[pyfunction(id_order = "false", induced = "true")]
 #[pyo3(
-    text_signature = "(first, second, /, node_matcher=None, edge_matcher=None, id_order=False, induced=True)"
+    text_signature = "(first, second, /, node_matcher=None, edge_matcher=None, id_order=False, induced=True, node_key=None, edge_key=None)"
 )]
 fn digraph_is_subgraph_isomorphic(
     py: Python,
@@ -489,6 +559,8 @@ fn digraph_is_subgraph_isomorphic(
     edge_matcher: Option<PyObject>,
     id_order: bool,
     induced: bool,
+    node_key: Option<PyObject>,
+    edge_key: Option<PyObject>,
 ) -> PyResult<bool> {
     let compare_nodes = node_matcher.map(|f| {
         move |a: &PyObject, b: &PyObject| -> PyResult<bool> {
@@ -513,6 +585,8 @@ fn digraph_is_subgraph_isomorphic(
         id_order,
         Ordering::Greater,
         induced,
+        node_key.as_ref(),
+        edge_key.as_ref(),
     )?;
     Ok(res)
 }
@@ -537,6 +611,8 @@ fn digraph_is_subgraph_isomorphic(
 ///
 ///     For better performance on large graphs, consider setting `id_order=False`.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param PyGraph first: The first graph to compare
 /// :param PyGraph second: The second graph to compare
 /// :param callable node_matcher: A python callable object that takes 2 positional
@@ -553,13 +629,19 @@ fn digraph_is_subgraph_isomorphic(
 /// :param bool induced: If set to ``True`` this function will check the existence
 ///     of a node-induced subgraph of first isomorphic to second graph.
 ///     Default: ``True``.
+/// :param callable node_key: A python callable object that takes a node data
+///     object and returns a hashable key for it, only nodes with equal keys
+///     are matched.
+/// :param callable edge_key: A python callable object that takes an edge data
+///     object and returns a hashable key for it, only edges with equal keys
+///     are matched.
 ///
 /// :returns: ``True`` if there is a subgraph of `first` isomorphic to `second`,
 ///     ``False`` if there is not.
 /// :rtype: bool
 #[pyfunction(id_order = "false", induced = "true")]
 #[pyo3(
-    text_signature = "(first, second, /, node_matcher=None, edge_matcher=None, id_order=False, induced=True)"
+    text_signature = "(first, second, /, node_matcher=None, edge_matcher=None, id_order=False, induced=True, node_key=None, edge_key=None)"
 )]
 fn graph_is_subgraph_isomorphic(
     py: Python,
@@ -569,6 +651,8 @@ fn graph_is_subgraph_isomorphic(
     edge_matcher: Option<PyObject>,
     id_order: bool,
     induced: bool,
+    node_key: Option<PyObject>,
+    edge_key: Option<PyObject>,
 ) -> PyResult<bool> {
     let compare_nodes = node_matcher.map(|f| {
         move |a: &PyObject, b: &PyObject| -> PyResult<bool> {
@@ -593,12 +677,284 @@ fn graph_is_subgraph_isomorphic(
         id_order,
         Ordering::Greater,
         induced,
+        node_key.as_ref(),
+        edge_key.as_ref(),
     )?;
     Ok(res)
 }
 
+/// Return an iterator over all the VF2 mappings between 2 directed graphs
+///
+/// This runs the same search as :func:`~retworkx.digraph_is_isomorphic` (or
+/// :func:`~retworkx.digraph_is_subgraph_isomorphic` if ``subgraph`` is set) but
+/// instead of stopping at the first mapping found it can be resumed to find
+/// every mapping. The search is lazy, each mapping is only computed when the
+/// iterator is advanced, so taking the first few mappings of a large search
+/// space is cheap::
+///
+///     graph_a = retworkx.generators.directed_path_graph(3)
+///     graph_b = retworkx.generators.directed_path_graph(2)
+///     mappings = retworkx.vf2_mapping(graph_a, graph_b, subgraph=True)
+///     first_mapping = next(mappings)
+///
+/// :param PyDiGraph first: The first graph to find the mappings for
+/// :param PyDiGraph second: The second graph to find the mappings for
+/// :param callable node_matcher: A python callable object that takes 2 positional
+///     one for each node data object. If the return of this
+///     function evaluates to True then the nodes passed to it are vieded
+///     as matching.
+/// :param callable edge_matcher: A python callable object that takes 2 positional
+///     one for each edge data object. If the return of this
+///     function evaluates to True then the edges passed to it are vieded
+///     as matching.
+/// :param bool id_order: If set to ``False`` this function will use a
+///     heuristic matching order based on [VF2]_ paper. Otherwise it will
+///     default to matching the nodes in order specified by their ids.
+/// :param bool subgraph: If set to ``True`` the mappings are between
+///     subgraphs of ``first`` and the whole of ``second`` instead of between
+///     the 2 whole graphs.
+/// :param bool induced: If set to ``True`` and ``subgraph`` is set the
+///     subgraphs of ``first`` are node-induced subgraphs. Default: ``True``.
+/// :param int limit: The maximum number of mappings to return, if not set
+///     every mapping is returned.
+/// :param callable node_key: A python callable object that takes a node data
+///     object and returns a hashable key for it, only nodes with equal keys
+///     are matched.
+/// :param callable edge_key: A python callable object that takes an edge data
+///     object and returns a hashable key for it, only edges with equal keys
+///     are matched.
+///
+/// :returns: An iterator of :class:`~retworkx.NodeMap` objects mapping the
+///     node indices of ``first`` to the node indices of ``second``. It is
+///     empty if there are no mappings.
+/// :rtype: DiGraphVf2Mapping
+#[pyfunction(id_order = "true", subgraph = "false", induced = "true")]
+#[pyo3(
+    text_signature = "(first, second, /, node_matcher=None, edge_matcher=None, id_order=True, subgraph=False, induced=True, limit=None, node_key=None, edge_key=None)"
+)]
+#[allow(clippy::too_many_arguments)]
+fn digraph_vf2_mapping(
+    py: Python,
+    first: &digraph::PyDiGraph,
+    second: &digraph::PyDiGraph,
+    node_matcher: Option<PyObject>,
+    edge_matcher: Option<PyObject>,
+    id_order: bool,
+    subgraph: bool,
+    induced: bool,
+    limit: Option<usize>,
+    node_key: Option<PyObject>,
+    edge_key: Option<PyObject>,
+) -> PyResult<isomorphism::DiGraphVf2Mapping> {
+    let ordering = if subgraph {
+        Ordering::Greater
+    } else {
+        Ordering::Equal
+    };
+    isomorphism::DiGraphVf2Mapping::new(
+        py,
+        &first.graph,
+        &second.graph,
+        node_matcher,
+        edge_matcher,
+        id_order,
+        ordering,
+        induced,
+        node_key,
+        edge_key,
+        limit,
+    )
+}
+
+/// Return an iterator over all the VF2 mappings between 2 undirected graphs
+///
+/// This runs the same search as :func:`~retworkx.graph_is_isomorphic` (or
+/// :func:`~retworkx.graph_is_subgraph_isomorphic` if ``subgraph`` is set) but
+/// instead of stopping at the first mapping found it can be resumed to find
+/// every mapping. The search is lazy, each mapping is only computed when the
+/// iterator is advanced, so taking the first few mappings of a large search
+/// space is cheap::
+///
+///     graph_a = retworkx.generators.path_graph(3)
+///     graph_b = retworkx.generators.path_graph(2)
+///     mappings = retworkx.vf2_mapping(graph_a, graph_b, subgraph=True)
+///     first_mapping = next(mappings)
+///
+/// :param PyGraph first: The first graph to find the mappings for
+/// :param PyGraph second: The second graph to find the mappings for
+/// :param callable node_matcher: A python callable object that takes 2 positional
+///     one for each node data object. If the return of this
+///     function evaluates to True then the nodes passed to it are vieded
+///     as matching.
+/// :param callable edge_matcher: A python callable object that takes 2 positional
+///     one for each edge data object. If the return of this
+///     function evaluates to True then the edges passed to it are vieded
+///     as matching.
+/// :param bool id_order: If set to ``False`` this function will use a
+///     heuristic matching order based on [VF2]_ paper. Otherwise it will
+///     default to matching the nodes in order specified by their ids.
+/// :param bool subgraph: If set to ``True`` the mappings are between
+///     subgraphs of ``first`` and the whole of ``second`` instead of between
+///     the 2 whole graphs.
+/// :param bool induced: If set to ``True`` and ``subgraph`` is set the
+///     subgraphs of ``first`` are node-induced subgraphs. Default: ``True``.
+/// :param int limit: The maximum number of mappings to return, if not set
+///     every mapping is returned.
+/// :param callable node_key: A python callable object that takes a node data
+///     object and returns a hashable key for it, only nodes with equal keys
+///     are matched.
+/// :param callable edge_key: A python callable object that takes an edge data
+///     object and returns a hashable key for it, only edges with equal keys
+///     are matched.
+///
+/// :returns: An iterator of :class:`~retworkx.NodeMap` objects mapping the
+///     node indices of ``first`` to the node indices of ``second``. It is
+///     empty if there are no mappings.
+/// :rtype: GraphVf2Mapping
+#[pyfunction(id_order = "true", subgraph = "false", induced = "true")]
+#[pyo3(
+    text_signature = "(first, second, /, node_matcher=None, edge_matcher=None, id_order=True, subgraph=False, induced=True, limit=None, node_key=None, edge_key=None)"
+)]
+#[allow(clippy::too_many_arguments)]
+fn graph_vf2_mapping(
+    py: Python,
+    first: &graph::PyGraph,
+    second: &graph::PyGraph,
+    node_matcher: Option<PyObject>,
+    edge_matcher: Option<PyObject>,
+    id_order: bool,
+    subgraph: bool,
+    induced: bool,
+    limit: Option<usize>,
+    node_key: Option<PyObject>,
+    edge_key: Option<PyObject>,
+) -> PyResult<isomorphism::GraphVf2Mapping> {
+    let ordering = if subgraph {
+        Ordering::Greater
+    } else {
+        Ordering::Equal
+    };
+    isomorphism::GraphVf2Mapping::new(
+        py,
+        &first.graph,
+        &second.graph,
+        node_matcher,
+        edge_matcher,
+        id_order,
+        ordering,
+        induced,
+        node_key,
+        edge_key,
+        limit,
+    )
+}
+
+/// Return the Weisfeiler-Lehman hash of a directed graph
+///
+/// The hash is an isomorphism invariant fingerprint: isomorphic graphs always
+/// have the same hash, so it can be used to bucket many graphs and only run
+/// :func:`~retworkx.digraph_is_isomorphic` on graphs within the same bucket.
+/// Graphs with the same hash are very likely, but not guaranteed, to be
+/// isomorphic. The hash is stable between runs and platforms.
+///
+/// Each node starts with a label, which is ``str(node_key(data))`` if
+/// ``node_key`` is set and its degree otherwise. Every iteration then replaces
+/// the label of each node with a hash of its label and the labels of its
+/// successors and predecessors, including ``str(edge_key(data))`` for the
+/// edges to them if ``edge_key`` is set.
+///
+/// :param PyDiGraph graph: The graph to hash
+/// :param callable node_key: A python callable object that takes a node data
+///     object and returns the key to label the node with. The ``str()`` of
+///     the key is hashed so keys should have a deterministic string
+///     representation.
+/// :param callable edge_key: A python callable object that takes an edge data
+///     object and returns the key to label the edge with. The ``str()`` of
+///     the key is hashed so keys should have a deterministic string
+///     representation.
+/// :param int iterations: The number of iterations to run, each iteration
+///     includes the structure of the graph one more step away from each node.
+///     Defaults to 3.
+///
+/// :returns: The hash as a hexadecimal string
+/// :rtype: str
+#[pyfunction(iterations = "3")]
+#[pyo3(
+    text_signature = "(graph, /, node_key=None, edge_key=None, iterations=3)"
+)]
+fn digraph_weisfeiler_lehman_graph_hash(
+    py: Python,
+    graph: &digraph::PyDiGraph,
+    node_key: Option<PyObject>,
+    edge_key: Option<PyObject>,
+    iterations: usize,
+) -> PyResult<String> {
+    graph_hash::weisfeiler_lehman_graph_hash(
+        py,
+        &graph.graph,
+        node_key,
+        edge_key,
+        iterations,
+    )
+}
+
+/// Return the Weisfeiler-Lehman hash of an undirected graph
+///
+/// The hash is an isomorphism invariant fingerprint: isomorphic graphs always
+/// have the same hash, so it can be used to bucket many graphs and only run
+/// :func:`~retworkx.graph_is_isomorphic` on graphs within the same bucket.
+/// Graphs with the same hash are very likely, but not guaranteed, to be
+/// isomorphic. The hash is stable between runs and platforms.
+///
+/// Each node starts with a label, which is ``str(node_key(data))`` if
+/// ``node_key`` is set and its degree otherwise. Every iteration then replaces
+/// the label of each node with a hash of its label and the labels of its
+/// neighbors, including ``str(edge_key(data))`` for the edges to them if
+/// ``edge_key`` is set.
+///
+/// :param PyGraph graph: The graph to hash
+/// :param callable node_key: A python callable object that takes a node data
+///     object and returns the key to label the node with. The ``str()`` of
+///     the key is hashed so keys should have a deterministic string
+///     representation.
+/// :param callable edge_key: A python callable object that takes an edge data
+///     object and returns the key to label the edge with. The ``str()`` of
+///     the key is hashed so keys should have a deterministic string
+///     representation.
+/// :param int iterations: The number of iterations to run, each iteration
+///     includes the structure of the graph one more step away from each node.
+///     Defaults to 3.
+///
+/// :returns: The hash as a hexadecimal string
+/// :rtype: str
+#[pyfunction(iterations = "3")]
+#[pyo3(
+    text_signature = "(graph, /, node_key=None, edge_key=None, iterations=3)"
+)]
+fn graph_weisfeiler_lehman_graph_hash(
+    py: Python,
+    graph: &graph::PyGraph,
+    node_key: Option<PyObject>,
+    edge_key: Option<PyObject>,
+    iterations: usize,
+) -> PyResult<String> {
+    graph_hash::weisfeiler_lehman_graph_hash(
+        py,
+        &graph.graph,
+        node_key,
+        edge_key,
+        iterations,
+    )
+}
+
 /// Return the topological sort of node indexes from the provided graph
 ///
+/// If cycle checking is enabled on the graph (its ``check_cycle`` attribute
+/// is ``True``) the topological order maintained while adding edges is
+/// returned instead of traversing the graph again.
+///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param PyDiGraph graph: The DAG to get the topological sort on
 ///
 /// :returns: A list of node indices topologically sorted.
@@ -607,16 +963,28 @@ fn graph_is_subgraph_isomorphic(
 /// :raises DAGHasCycle: if a cycle is encountered while sorting the graph
 #[pyfunction]
 #[pyo3(text_signature = "(graph, /)")]
-fn topological_sort(graph: &digraph::PyDiGraph) -> PyResult<NodeIndices> {
-    let nodes = match algo::toposort(graph, None) {
-        Ok(nodes) => nodes,
-        Err(_err) => {
-            return Err(DAGHasCycle::new_err("Sort encountered a cycle"))
-        }
-    };
-    Ok(NodeIndices {
-        nodes: nodes.iter().map(|node| node.index()).collect(),
-    })
+fn topological_sort(
+    py: Python,
+    graph: &digraph::PyDiGraph,
+) -> PyResult<NodeIndices> {
+    let nodes = graph.cache.get_or_insert_with(
+        |entries| &mut entries.topological_sort,
+        || {
+            let nodes = match (graph.check_cycle, &graph.topo_order) {
+                (true, Some(order)) => order.sorted_nodes(&graph.graph),
+                _ => py
+                    .allow_threads(|| algo::toposort(&graph.graph, None))
+                    .ok()?,
+            };
+            Some(Arc::new(nodes.iter().map(|node| node.index()).collect()))
+        },
+    );
+    match nodes {
+        Some(nodes) => Ok(NodeIndices {
+            nodes: nodes.to_vec(),
+        }),
+        None => Err(DAGHasCycle::new_err("Sort encountered a cycle")),
+    }
 }
 
 fn dfs_edges<G>(
@@ -973,7 +1341,9 @@ fn graph_greedy_color(
 /// :param int start: The node index to find the shortest paths from
 /// :param int k: The kth shortest path to find the lengths of
 /// :param edge_cost: A python callable that will receive an edge payload and
-///     return a float for the cost of that eedge
+///     return a float for the cost of that eedge.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 /// :param int goal: An optional goal node index, if specified the output
 ///     dictionary
 ///
@@ -991,17 +1361,15 @@ fn digraph_k_shortest_path_lengths(
     goal: Option<usize>,
 ) -> PyResult<PathLengthMapping> {
     let out_goal = goal.map(NodeIndex::new);
-    let edge_cost_callable = |edge: &PyObject| -> PyResult<f64> {
-        let res = edge_cost.call1(py, (edge,))?;
-        res.extract(py)
-    };
+    let edge_weights =
+        EdgeWeights::new(py, &graph.graph, Some(edge_cost), 1.0)?;
 
     let out_map = k_shortest_path::k_shortest_path(
         graph,
         NodeIndex::new(start),
         out_goal,
         k,
-        edge_cost_callable,
+        |e| edge_weights.weight(py, e.id(), e.weight()),
     )?;
     Ok(PathLengthMapping {
         path_lengths: out_map
@@ -1029,7 +1397,9 @@ fn digraph_k_shortest_path_lengths(
 /// :param int start: The node index to find the shortest paths from
 /// :param int k: The kth shortest path to find the lengths of
 /// :param edge_cost: A python callable that will receive an edge payload and
-///     return a float for the cost of that eedge
+///     return a float for the cost of that eedge.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 /// :param int goal: An optional goal node index, if specified the output
 ///     dictionary
 ///
@@ -1047,17 +1417,15 @@ fn graph_k_shortest_path_lengths(
     goal: Option<usize>,
 ) -> PyResult<PathLengthMapping> {
     let out_goal = goal.map(NodeIndex::new);
-    let edge_cost_callable = |edge: &PyObject| -> PyResult<f64> {
-        let res = edge_cost.call1(py, (edge,))?;
-        res.extract(py)
-    };
+    let edge_weights =
+        EdgeWeights::new(py, &graph.graph, Some(edge_cost), 1.0)?;
 
     let out_map = k_shortest_path::k_shortest_path(
         graph,
         NodeIndex::new(start),
         out_goal,
         k,
-        edge_cost_callable,
+        |e| edge_weights.weight(py, e.id(), e.weight()),
     )?;
     Ok(PathLengthMapping {
         path_lengths: out_map
@@ -1074,6 +1442,63 @@ fn graph_k_shortest_path_lengths(
     })
 }
 
+fn _floyd_warshall_dense<Ty: EdgeType>(
+    py: Python,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    edge_weights: &EdgeWeights,
+    as_undirected: bool,
+    parallel_threshold: usize,
+) -> PyResult<AllPairsPathLengthMapping> {
+    let node_indices: Vec<NodeIndex> = graph.node_indices().collect();
+    let n = node_indices.len();
+    // Map node indices to contiguous matrix indices
+    let mut matrix_index: Vec<usize> = vec![0; graph.node_bound()];
+    for (count, node) in node_indices.iter().enumerate() {
+        matrix_index[node.index()] = count;
+    }
+
+    // Allocate empty matrix and set the diagonal to 0
+    let mut mat = Array2::<f64>::from_elem((n, n), std::f64::INFINITY);
+    for x in mat.diag_mut() {
+        *x = 0.0;
+    }
+
+    // Build adjacency matrix
+    for edge in graph.edge_references() {
+        let i = matrix_index[edge.source().index()];
+        let j = matrix_index[edge.target().index()];
+        let edge_weight = edge_weights.weight(py, edge.id(), edge.weight())?;
+        mat[[i, j]] = mat[[i, j]].min(edge_weight);
+        if as_undirected {
+            mat[[j, i]] = mat[[j, i]].min(edge_weight);
+        }
+    }
+
+    py.allow_threads(|| {
+        floyd_warshall::floyd_warshall_dense(&mut mat, n >= parallel_threshold)
+    });
+
+    // Convert to return format
+    let out_map: HashMap<usize, PathLengthMapping> = node_indices
+        .iter()
+        .zip(mat.outer_iter())
+        .map(|(i, row)| {
+            let out_map = PathLengthMapping {
+                path_lengths: node_indices
+                    .iter()
+                    .zip(row.iter())
+                    .filter(|(_, dist)| **dist != std::f64::INFINITY)
+                    .map(|(j, dist)| (j.index(), *dist))
+                    .collect(),
+            };
+            (i.index(), out_map)
+        })
+        .collect();
+    Ok(AllPairsPathLengthMapping {
+        path_lengths: out_map,
+    })
+}
+
 fn _floyd_warshall<Ty: EdgeType>(
     py: Python,
     graph: &StableGraph<PyObject, PyObject, Ty>,
@@ -1082,6 +1507,7 @@ fn _floyd_warshall<Ty: EdgeType>(
     default_weight: f64,
     parallel_threshold: usize,
 ) -> PyResult<AllPairsPathLengthMapping> {
+    let edge_weights = EdgeWeights::new(py, graph, weight_fn, default_weight)?;
     if graph.node_count() == 0 {
         return Ok(AllPairsPathLengthMapping {
             path_lengths: HashMap::new(),
@@ -1101,6 +1527,18 @@ fn _floyd_warshall<Ty: EdgeType>(
                 .collect(),
         });
     }
+    // Use the dense matrix backend unless there are too few edges for the
+    // graph to be connected, the output of a connected graph has an entry
+    // for every pair of nodes so there is no benefit to storing it sparsely
+    if graph.edge_count() + 1 >= graph.node_count() {
+        return _floyd_warshall_dense(
+            py,
+            graph,
+            &edge_weights,
+            as_undirected,
+            parallel_threshold,
+        );
+    }
     let n = graph.node_bound();
 
     // Allocate empty matrix
@@ -1131,10 +1569,7 @@ fn _floyd_warshall<Ty: EdgeType>(
     for edge in graph.edge_references() {
         let i = NodeIndexable::to_index(&graph, edge.source());
         let j = NodeIndexable::to_index(&graph, edge.target());
-        let weight = edge.weight().clone();
-
-        let edge_weight =
-            weight_callable(py, &weight_fn, &weight, default_weight)?;
+        let edge_weight = edge_weights.weight(py, edge.id(), edge.weight())?;
         if let Some(row_i) = mat.get_mut(i) {
             insert_or_minimize!(row_i, j, edge_weight);
         }
@@ -1199,6 +1634,10 @@ fn _floyd_warshall<Ty: EdgeType>(
 /// Floyd's algorithm is used for finding shortest paths in dense graphs
 /// or graphs with negative weights (where Dijkstra's algorithm fails).
 ///
+/// Unless the graph has too few edges to be connected the distances are
+/// computed on a dense matrix with a blocked (cache tiled) version of the
+/// algorithm, otherwise a sparse representation is used.
+///
 /// This function is multithreaded and will launch a pool with threads equal
 /// to the number of CPUs by default if the number of nodes in the graph is
 /// above the value of ``parallel_threshold`` (it defaults to 300).
@@ -1206,6 +1645,8 @@ fn _floyd_warshall<Ty: EdgeType>(
 /// environment variable. For example, setting ``RAYON_NUM_THREADS=4`` would
 /// limit the thread pool to 4 threads if parallelization was enabled.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param PyDiGraph graph: The directed graph to run Floyd's algorithm on
 /// :param weight_fn: A callable object (function, lambda, etc) which
 ///     will be passed the edge object and expected to return a ``float``. This
@@ -1219,6 +1660,8 @@ fn _floyd_warshall<Ty: EdgeType>(
 ///         digraph_floyd_warshall(graph, weight_fn=float)
 ///
 ///     to cast the edge object as a float as the weight.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 /// :param as_undirected: If set to true each directed edge will be treated as
 ///     bidirectional/undirected.
 /// :param int parallel_threshold: The number of nodes to execute
@@ -1267,6 +1710,10 @@ fn digraph_floyd_warshall(
 /// Floyd's algorithm is used for finding shortest paths in dense graphs
 /// or graphs with negative weights (where Dijkstra's algorithm fails).
 ///
+/// Unless the graph has too few edges to be connected the distances are
+/// computed on a dense matrix with a blocked (cache tiled) version of the
+/// algorithm, otherwise a sparse representation is used.
+///
 /// This function is multithreaded and will launch a pool with threads equal
 /// to the number of CPUs by default if the number of nodes in the graph is
 /// above the value of ``parallel_threshold`` (it defaults to 300).
@@ -1274,6 +1721,8 @@ fn digraph_floyd_warshall(
 /// environment variable. For example, setting ``RAYON_NUM_THREADS=4`` would
 /// limit the thread pool to 4 threads if parallelization was enabled.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param PyGraph graph: The graph to run Floyd's algorithm on
 /// :param weight_fn: A callable object (function, lambda, etc) which
 ///     will be passed the edge object and expected to return a ``float``. This
@@ -1287,6 +1736,8 @@ fn digraph_floyd_warshall(
 ///         graph_floyd_warshall(graph, weight_fn=float)
 ///
 ///     to cast the edge object as a float as the weight.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 /// :param int parallel_threshold: The number of nodes to execute
 ///     the algorithm in parallel at. It defaults to 300, but this can
 ///     be tuned
@@ -1326,9 +1777,9 @@ fn graph_floyd_warshall(
 
 fn get_edge_iter_with_weights<G>(
     graph: G,
-) -> impl Iterator<Item = (usize, usize, PyObject)>
+) -> impl Iterator<Item = (usize, usize, EdgeIndex, PyObject)>
 where
-    G: GraphBase
+    G: GraphBase<EdgeId = EdgeIndex>
         + IntoEdgeReferences
         + IntoNodeIdentifiers
         + NodeIndexable
@@ -1366,10 +1817,51 @@ where
                 j = graph.to_index(edge.target());
             }
         }
-        (i, j, edge.weight().clone())
+        (i, j, edge.id(), edge.weight().clone())
     })
 }
 
+fn _floyd_warshall_numpy<G>(
+    py: Python,
+    graph: G,
+    edge_weights: &EdgeWeights,
+    as_undirected: bool,
+    parallel_threshold: usize,
+) -> PyResult<Array2<f64>>
+where
+    G: GraphBase<EdgeId = EdgeIndex>
+        + IntoEdgeReferences
+        + IntoNodeIdentifiers
+        + NodeIndexable
+        + NodeCount
+        + GraphProp
+        + NodesRemoved,
+    G: Data<NodeWeight = PyObject, EdgeWeight = PyObject>,
+{
+    let n = graph.node_count();
+    // Allocate empty matrix
+    let mut mat = Array2::<f64>::from_elem((n, n), std::f64::INFINITY);
+
+    // Build adjacency matrix
+    for (i, j, index, weight) in get_edge_iter_with_weights(graph) {
+        let edge_weight = edge_weights.weight(py, index, &weight)?;
+        mat[[i, j]] = mat[[i, j]].min(edge_weight);
+        if as_undirected {
+            mat[[j, i]] = mat[[j, i]].min(edge_weight);
+        }
+    }
+
+    // 0 out the diagonal
+    for x in mat.diag_mut() {
+        *x = 0.0;
+    }
+    // Perform the Floyd-Warshall algorithm.
+    py.allow_threads(|| {
+        floyd_warshall::floyd_warshall_dense(&mut mat, n >= parallel_threshold)
+    });
+    Ok(mat)
+}
+
 /// Find all-pairs shortest path lengths using Floyd's algorithm
 ///
 /// Floyd's algorithm is used for finding shortest paths in dense graphs
@@ -1382,6 +1874,8 @@ where
 /// environment variable. For example, setting ``RAYON_NUM_THREADS=4`` would
 /// limit the thread pool to 4 threads if parallelization was enabled.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param PyGraph graph: The graph to run Floyd's algorithm on
 /// :param weight_fn: A callable object (function, lambda, etc) which
 ///     will be passed the edge object and expected to return a ``float``. This
@@ -1395,6 +1889,8 @@ where
 ///         graph_floyd_warshall_numpy(graph, weight_fn: lambda x: float(x))
 ///
 ///     to cast the edge object as a float as the weight.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 /// :param int parallel_threshold: The number of nodes to execute
 ///     the algorithm in parallel at. It defaults to 300, but this can
 ///     be tuned
@@ -1414,54 +1910,16 @@ fn graph_floyd_warshall_numpy(
     default_weight: f64,
     parallel_threshold: usize,
 ) -> PyResult<PyObject> {
-    let n = graph.node_count();
-    // Allocate empty matrix
-    let mut mat = Array2::<f64>::from_elem((n, n), std::f64::INFINITY);
-
-    // Build adjacency matrix
-    for (i, j, weight) in get_edge_iter_with_weights(graph) {
-        let edge_weight =
-            weight_callable(py, &weight_fn, &weight, default_weight)?;
-        mat[[i, j]] = mat[[i, j]].min(edge_weight);
-        mat[[j, i]] = mat[[j, i]].min(edge_weight);
-    }
-
-    // 0 out the diagonal
-    for x in mat.diag_mut() {
-        *x = 0.0;
-    }
-    // Perform the Floyd-Warshall algorithm.
-    // In each loop, this finds the shortest path from point i
-    // to point j using intermediate nodes 0..k
-    if n < parallel_threshold {
-        for k in 0..n {
-            for i in 0..n {
-                for j in 0..n {
-                    let d_ijk = mat[[i, k]] + mat[[k, j]];
-                    if d_ijk < mat[[i, j]] {
-                        mat[[i, j]] = d_ijk;
-                    }
-                }
-            }
-        }
-    } else {
-        for k in 0..n {
-            let row_k = mat.slice(s![k, ..]).to_owned();
-            mat.axis_iter_mut(Axis(0))
-                .into_par_iter()
-                .for_each(|mut row_i| {
-                    let m_ik = row_i[k];
-                    row_i.iter_mut().zip(row_k.iter()).for_each(
-                        |(m_ij, m_kj)| {
-                            let d_ijk = m_ik + *m_kj;
-                            if d_ijk < *m_ij {
-                                *m_ij = d_ijk;
-                            }
-                        },
-                    )
-                })
-        }
-    }
+    let as_undirected = true;
+    let edge_weights =
+        EdgeWeights::new(py, &graph.graph, weight_fn, default_weight)?;
+    let mat = _floyd_warshall_numpy(
+        py,
+        graph,
+        &edge_weights,
+        as_undirected,
+        parallel_threshold,
+    )?;
     Ok(mat.into_pyarray(py).into())
 }
 
@@ -1477,6 +1935,8 @@ fn graph_floyd_warshall_numpy(
 /// environment variable. For example, setting ``RAYON_NUM_THREADS=4`` would
 /// limit the thread pool to 4 threads if parallelization was enabled.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param PyDiGraph graph: The directed graph to run Floyd's algorithm on
 /// :param weight_fn: A callable object (function, lambda, etc) which
 ///     will be passed the edge object and expected to return a ``float``. This
@@ -1490,6 +1950,8 @@ fn graph_floyd_warshall_numpy(
 ///         graph_floyd_warshall_numpy(graph, weight_fn: lambda x: float(x))
 ///
 ///     to cast the edge object as a float as the weight.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 /// :param as_undirected: If set to true each directed edge will be treated as
 ///     bidirectional/undirected.
 /// :param int parallel_threshold: The number of nodes to execute
@@ -1516,58 +1978,17 @@ fn digraph_floyd_warshall_numpy(
     default_weight: f64,
     parallel_threshold: usize,
 ) -> PyResult<PyObject> {
-    let n = graph.node_count();
-
-    // Allocate empty matrix
-    let mut mat = Array2::<f64>::from_elem((n, n), std::f64::INFINITY);
-
-    // Build adjacency matrix
-    for (i, j, weight) in get_edge_iter_with_weights(graph) {
-        let edge_weight =
-            weight_callable(py, &weight_fn, &weight, default_weight)?;
-        mat[[i, j]] = mat[[i, j]].min(edge_weight);
-        if as_undirected {
-            mat[[j, i]] = mat[[j, i]].min(edge_weight);
-        }
-    }
-    // 0 out the diagonal
-    for x in mat.diag_mut() {
-        *x = 0.0;
-    }
-    // Perform the Floyd-Warshall algorithm.
-    // In each loop, this finds the shortest path from point i
-    // to point j using intermediate nodes 0..k
-    if n < parallel_threshold {
-        for k in 0..n {
-            for i in 0..n {
-                for j in 0..n {
-                    let d_ijk = mat[[i, k]] + mat[[k, j]];
-                    if d_ijk < mat[[i, j]] {
-                        mat[[i, j]] = d_ijk;
-                    }
-                }
-            }
-        }
-    } else {
-        for k in 0..n {
-            let row_k = mat.slice(s![k, ..]).to_owned();
-            mat.axis_iter_mut(Axis(0))
-                .into_par_iter()
-                .for_each(|mut row_i| {
-                    let m_ik = row_i[k];
-                    row_i.iter_mut().zip(row_k.iter()).for_each(
-                        |(m_ij, m_kj)| {
-                            let d_ijk = m_ik + *m_kj;
-                            if d_ijk < *m_ij {
-                                *m_ij = d_ijk;
-                            }
-                        },
-                    )
-                })
-        }
-    }
-    Ok(mat.into_pyarray(py).into())
-}
+    let edge_weights =
+        EdgeWeights::new(py, &graph.graph, weight_fn, default_weight)?;
+    let mat = _floyd_warshall_numpy(
+        py,
+        graph,
+        &edge_weights,
+        as_undirected,
+        parallel_threshold,
+    )?;
+    Ok(mat.into_pyarray(py).into())
+}
 
 /// Collect runs that match a filter function
 ///
@@ -1742,6 +2163,8 @@ fn layers(
 /// defaults to 300). If the function will be running in parallel the env var
 /// ``RAYON_NUM_THREADS`` can be used to adjust how many threads will be used.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param PyDiGraph graph: The graph to get the distance matrix for
 /// :param int parallel_threshold: The number of nodes to calculate the
 ///     the distance matrix in parallel at. It defaults to 300, but this can
@@ -1763,59 +2186,62 @@ pub fn digraph_distance_matrix(
     as_undirected: bool,
 ) -> PyResult<PyObject> {
     let n = graph.node_count();
-    let mut matrix = Array2::<f64>::zeros((n, n));
-    let bfs_traversal = |index: usize, mut row: ArrayViewMut1<f64>| {
-        let mut seen: HashMap<NodeIndex, usize> = HashMap::with_capacity(n);
-        let start_index = NodeIndex::new(index);
-        let mut level = 0;
-        let mut next_level: HashSet<NodeIndex> = HashSet::new();
-        next_level.insert(start_index);
-        while !next_level.is_empty() {
-            let this_level = next_level;
-            next_level = HashSet::new();
-            let mut found: Vec<NodeIndex> = Vec::new();
-            for v in this_level {
-                if !seen.contains_key(&v) {
-                    seen.insert(v, level);
-                    found.push(v);
-                    row[[v.index()]] = level as f64;
+    let matrix = py.allow_threads(|| {
+        let mut matrix = Array2::<f64>::zeros((n, n));
+        let bfs_traversal = |index: usize, mut row: ArrayViewMut1<f64>| {
+            let mut seen: HashMap<NodeIndex, usize> = HashMap::with_capacity(n);
+            let start_index = NodeIndex::new(index);
+            let mut level = 0;
+            let mut next_level: HashSet<NodeIndex> = HashSet::new();
+            next_level.insert(start_index);
+            while !next_level.is_empty() {
+                let this_level = next_level;
+                next_level = HashSet::new();
+                let mut found: Vec<NodeIndex> = Vec::new();
+                for v in this_level {
+                    if !seen.contains_key(&v) {
+                        seen.insert(v, level);
+                        found.push(v);
+                        row[[v.index()]] = level as f64;
+                    }
                 }
-            }
-            if seen.len() == n {
-                return;
-            }
-            for node in found {
-                for v in graph
-                    .graph
-                    .neighbors_directed(node, petgraph::Direction::Outgoing)
-                {
-                    next_level.insert(v);
+                if seen.len() == n {
+                    return;
                 }
-                if as_undirected {
+                for node in found {
                     for v in graph
                         .graph
-                        .neighbors_directed(node, petgraph::Direction::Incoming)
+                        .neighbors_directed(node, petgraph::Direction::Outgoing)
                     {
                         next_level.insert(v);
                     }
+                    if as_undirected {
+                        for v in graph.graph.neighbors_directed(
+                            node,
+                            petgraph::Direction::Incoming,
+                        ) {
+                            next_level.insert(v);
+                        }
+                    }
                 }
+                level += 1
             }
-            level += 1
+        };
+        if n < parallel_threshold {
+            matrix
+                .axis_iter_mut(Axis(0))
+                .enumerate()
+                .for_each(|(index, row)| bfs_traversal(index, row));
+        } else {
+            // Parallelize by row and iterate from each row index in BFS order
+            matrix
+                .axis_iter_mut(Axis(0))
+                .into_par_iter()
+                .enumerate()
+                .for_each(|(index, row)| bfs_traversal(index, row));
         }
-    };
-    if n < parallel_threshold {
-        matrix
-            .axis_iter_mut(Axis(0))
-            .enumerate()
-            .for_each(|(index, row)| bfs_traversal(index, row));
-    } else {
-        // Parallelize by row and iterate from each row index in BFS order
         matrix
-            .axis_iter_mut(Axis(0))
-            .into_par_iter()
-            .enumerate()
-            .for_each(|(index, row)| bfs_traversal(index, row));
-    }
+    });
     Ok(matrix.into_pyarray(py).into())
 }
 
@@ -1830,6 +2256,8 @@ pub fn digraph_distance_matrix(
 /// defaults to 300). If the function will be running in parallel the env var
 /// ``RAYON_NUM_THREADS`` can be used to adjust how many threads will be used.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param PyGraph graph: The graph to get the distance matrix for
 /// :param int parallel_threshold: The number of nodes to calculate the
 ///     the distance matrix in parallel at. It defaults to 300, but this can
@@ -1845,48 +2273,51 @@ pub fn graph_distance_matrix(
     parallel_threshold: usize,
 ) -> PyResult<PyObject> {
     let n = graph.node_count();
-    let mut matrix = Array2::<f64>::zeros((n, n));
-    let bfs_traversal = |index: usize, mut row: ArrayViewMut1<f64>| {
-        let mut seen: HashMap<NodeIndex, usize> = HashMap::with_capacity(n);
-        let start_index = NodeIndex::new(index);
-        let mut level = 0;
-        let mut next_level: HashSet<NodeIndex> = HashSet::new();
-        next_level.insert(start_index);
-        while !next_level.is_empty() {
-            let this_level = next_level;
-            next_level = HashSet::new();
-            let mut found: Vec<NodeIndex> = Vec::new();
-            for v in this_level {
-                if !seen.contains_key(&v) {
-                    seen.insert(v, level);
-                    found.push(v);
-                    row[[v.index()]] = level as f64;
+    let matrix = py.allow_threads(|| {
+        let mut matrix = Array2::<f64>::zeros((n, n));
+        let bfs_traversal = |index: usize, mut row: ArrayViewMut1<f64>| {
+            let mut seen: HashMap<NodeIndex, usize> = HashMap::with_capacity(n);
+            let start_index = NodeIndex::new(index);
+            let mut level = 0;
+            let mut next_level: HashSet<NodeIndex> = HashSet::new();
+            next_level.insert(start_index);
+            while !next_level.is_empty() {
+                let this_level = next_level;
+                next_level = HashSet::new();
+                let mut found: Vec<NodeIndex> = Vec::new();
+                for v in this_level {
+                    if !seen.contains_key(&v) {
+                        seen.insert(v, level);
+                        found.push(v);
+                        row[[v.index()]] = level as f64;
+                    }
                 }
-            }
-            if seen.len() == n {
-                return;
-            }
-            for node in found {
-                for v in graph.graph.neighbors(node) {
-                    next_level.insert(v);
+                if seen.len() == n {
+                    return;
                 }
+                for node in found {
+                    for v in graph.graph.neighbors(node) {
+                        next_level.insert(v);
+                    }
+                }
+                level += 1
             }
-            level += 1
+        };
+        if n < parallel_threshold {
+            matrix
+                .axis_iter_mut(Axis(0))
+                .enumerate()
+                .for_each(|(index, row)| bfs_traversal(index, row));
+        } else {
+            // Parallelize by row and iterate from each row index in BFS order
+            matrix
+                .axis_iter_mut(Axis(0))
+                .into_par_iter()
+                .enumerate()
+                .for_each(|(index, row)| bfs_traversal(index, row));
         }
-    };
-    if n < parallel_threshold {
-        matrix
-            .axis_iter_mut(Axis(0))
-            .enumerate()
-            .for_each(|(index, row)| bfs_traversal(index, row));
-    } else {
-        // Parallelize by row and iterate from each row index in BFS order
         matrix
-            .axis_iter_mut(Axis(0))
-            .into_par_iter()
-            .enumerate()
-            .for_each(|(index, row)| bfs_traversal(index, row));
-    }
+    });
     Ok(matrix.into_pyarray(py).into())
 }
 
@@ -1911,6 +2342,8 @@ pub fn graph_distance_matrix(
 ///     to cast the edge object as a float as the weight. If this is not
 ///     specified a default value (either ``default_weight`` or 1) will be used
 ///     for all edges.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 /// :param float default_weight: If ``weight_fn`` is not used this can be
 ///     optionally used to specify a default weight to use for all edges.
 ///
@@ -1925,10 +2358,11 @@ fn digraph_adjacency_matrix(
     default_weight: f64,
 ) -> PyResult<PyObject> {
     let n = graph.node_count();
+    let edge_weights =
+        EdgeWeights::new(py, &graph.graph, weight_fn, default_weight)?;
     let mut matrix = Array2::<f64>::zeros((n, n));
-    for (i, j, weight) in get_edge_iter_with_weights(graph) {
-        let edge_weight =
-            weight_callable(py, &weight_fn, &weight, default_weight)?;
+    for (i, j, index, weight) in get_edge_iter_with_weights(graph) {
+        let edge_weight = edge_weights.weight(py, index, &weight)?;
         matrix[[i, j]] += edge_weight;
     }
     Ok(matrix.into_pyarray(py).into())
@@ -1954,6 +2388,8 @@ fn digraph_adjacency_matrix(
 ///     to cast the edge object as a float as the weight. If this is not
 ///     specified a default value (either ``default_weight`` or 1) will be used
 ///     for all edges.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 /// :param float default_weight: If ``weight_fn`` is not used this can be
 ///     optionally used to specify a default weight to use for all edges.
 ///
@@ -1968,16 +2404,83 @@ fn graph_adjacency_matrix(
     default_weight: f64,
 ) -> PyResult<PyObject> {
     let n = graph.node_count();
+    let edge_weights =
+        EdgeWeights::new(py, &graph.graph, weight_fn, default_weight)?;
     let mut matrix = Array2::<f64>::zeros((n, n));
-    for (i, j, weight) in get_edge_iter_with_weights(graph) {
-        let edge_weight =
-            weight_callable(py, &weight_fn, &weight, default_weight)?;
+    for (i, j, index, weight) in get_edge_iter_with_weights(graph) {
+        let edge_weight = edge_weights.weight(py, index, &weight)?;
         matrix[[i, j]] += edge_weight;
         matrix[[j, i]] += edge_weight;
     }
     Ok(matrix.into_pyarray(py).into())
 }
 
+/// Return the adjacency matrix for a PyDiGraph object as sparse CSR arrays
+///
+/// This returns the same matrix as :func:`~retworkx.digraph_adjacency_matrix`
+/// but in compressed sparse row (CSR) form, so the memory used scales with
+/// the number of edges instead of the square of the number of nodes. In the
+/// case where there are multiple edges between nodes the value in the
+/// output matrix will be the sum of the edges' weights. Rows and columns are
+/// the positions of the nodes in :meth:`~retworkx.PyDiGraph.node_indexes`.
+///
+/// :param PyDiGraph graph: The graph used to generate the adjacency matrix
+///     from
+/// :param weight_fn: A callable object (function, lambda, etc) which
+///     will be passed the edge object and expected to return a ``float``.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`. If this is not specified ``default_weight`` will
+///     be used for all edges.
+/// :param float default_weight: If ``weight_fn`` is not used this can be
+///     optionally used to specify a default weight to use for all edges.
+///
+/// :return: A tuple ``(data, indices, indptr)`` of numpy arrays which can be
+///     passed directly to :class:`scipy.sparse.csr_matrix`
+/// :rtype: tuple
+#[pyfunction(default_weight = "1.0")]
+#[pyo3(text_signature = "(graph, /, weight_fn=None, default_weight=1.0)")]
+fn digraph_sparse_adjacency_matrix(
+    py: Python,
+    graph: &digraph::PyDiGraph,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+) -> PyResult<PyObject> {
+    sparse::sparse_adjacency_matrix(py, &graph.graph, weight_fn, default_weight)
+}
+
+/// Return the adjacency matrix for a PyGraph object as sparse CSR arrays
+///
+/// This returns the same matrix as :func:`~retworkx.graph_adjacency_matrix`
+/// but in compressed sparse row (CSR) form, so the memory used scales with
+/// the number of edges instead of the square of the number of nodes. In the
+/// case where there are multiple edges between nodes the value in the
+/// output matrix will be the sum of the edges' weights. Rows and columns are
+/// the positions of the nodes in :meth:`~retworkx.PyGraph.node_indexes`.
+///
+/// :param PyGraph graph: The graph used to generate the adjacency matrix
+///     from
+/// :param weight_fn: A callable object (function, lambda, etc) which
+///     will be passed the edge object and expected to return a ``float``.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`. If this is not specified ``default_weight`` will
+///     be used for all edges.
+/// :param float default_weight: If ``weight_fn`` is not used this can be
+///     optionally used to specify a default weight to use for all edges.
+///
+/// :return: A tuple ``(data, indices, indptr)`` of numpy arrays which can be
+///     passed directly to :class:`scipy.sparse.csr_matrix`
+/// :rtype: tuple
+#[pyfunction(default_weight = "1.0")]
+#[pyo3(text_signature = "(graph, /, weight_fn=None, default_weight=1.0)")]
+fn graph_sparse_adjacency_matrix(
+    py: Python,
+    graph: &graph::PyGraph,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+) -> PyResult<PyObject> {
+    sparse::sparse_adjacency_matrix(py, &graph.graph, weight_fn, default_weight)
+}
+
 /// Return all simple paths between 2 nodes in a PyGraph object
 ///
 /// A simple path is a path with no repeated nodes.
@@ -2086,21 +2589,6 @@ fn digraph_all_simple_paths(
     Ok(result)
 }
 
-fn weight_callable(
-    py: Python,
-    weight_fn: &Option<PyObject>,
-    weight: &PyObject,
-    default: f64,
-) -> PyResult<f64> {
-    match weight_fn {
-        Some(weight_fn) => {
-            let res = weight_fn.call1(py, (weight,))?;
-            res.extract(py)
-        }
-        None => Ok(default),
-    }
-}
-
 /// Find the shortest path from a node
 ///
 /// This function will generate the shortest path from a source node using
@@ -2111,7 +2599,9 @@ fn weight_callable(
 /// :param int target: An optional target to find a path to
 /// :param weight_fn: An optional weight function for an edge. It will accept
 ///     a single argument, the edge's weight object and will return a float which
-///     will be used to represent the weight/cost of the edge
+///     will be used to represent the weight/cost of the edge.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 /// :param float default_weight: If ``weight_fn`` isn't specified this optional
 ///     float value will be used for the weight/cost of each edge.
 /// :param bool as_undirected: If set to true the graph will be treated as
@@ -2136,11 +2626,13 @@ pub fn graph_dijkstra_shortest_paths(
     let goal_index: Option<NodeIndex> = target.map(NodeIndex::new);
     let mut paths: HashMap<NodeIndex, Vec<NodeIndex>> =
         HashMap::with_capacity(graph.node_count());
+    let edge_weights =
+        EdgeWeights::new(py, &graph.graph, weight_fn, default_weight)?;
     dijkstra::dijkstra(
         graph,
         start,
         goal_index,
-        |e| weight_callable(py, &weight_fn, e.weight(), default_weight),
+        |e| edge_weights.weight(py, e.id(), e.weight()),
         Some(&mut paths),
     )?;
 
@@ -2174,7 +2666,9 @@ pub fn graph_dijkstra_shortest_paths(
 /// :param int target: An optional target path to find the path
 /// :param weight_fn: An optional weight function for an edge. It will accept
 ///     a single argument, the edge's weight object and will return a float which
-///     will be used to represent the weight/cost of the edge
+///     will be used to represent the weight/cost of the edge.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 /// :param float default_weight: If ``weight_fn`` isn't specified this optional
 ///     float value will be used for the weight/cost of each edge.
 /// :param bool as_undirected: If set to true the graph will be treated as
@@ -2200,7 +2694,12 @@ pub fn digraph_dijkstra_shortest_paths(
     let goal_index: Option<NodeIndex> = target.map(NodeIndex::new);
     let mut paths: HashMap<NodeIndex, Vec<NodeIndex>> =
         HashMap::with_capacity(graph.node_count());
+    let edge_weights =
+        EdgeWeights::new(py, &graph.graph, weight_fn, default_weight)?;
     if as_undirected {
+        // The undirected copy has the edges renumbered contiguously in the
+        // same order, map them back to look up the weights
+        let edge_indices: Vec<EdgeIndex> = graph.graph.edge_indices().collect();
         dijkstra::dijkstra(
             // TODO: Use petgraph undirected adapter after
             // https://github.com/petgraph/petgraph/pull/318 is available in
@@ -2208,7 +2707,13 @@ pub fn digraph_dijkstra_shortest_paths(
             &graph.to_undirected(py, true, None)?,
             start,
             goal_index,
-            |e| weight_callable(py, &weight_fn, e.weight(), default_weight),
+            |e| {
+                edge_weights.weight(
+                    py,
+                    edge_indices[e.id().index()],
+                    e.weight(),
+                )
+            },
             Some(&mut paths),
         )?;
     } else {
@@ -2216,7 +2721,7 @@ pub fn digraph_dijkstra_shortest_paths(
             graph,
             start,
             goal_index,
-            |e| weight_callable(py, &weight_fn, e.weight(), default_weight),
+            |e| edge_weights.weight(py, e.id(), e.weight()),
             Some(&mut paths),
         )?;
     }
@@ -2248,7 +2753,9 @@ pub fn digraph_dijkstra_shortest_paths(
 ///     shortest paths from
 /// :param edge_cost_fn: A python callable that will take in 1 parameter, an
 ///     edge's data object and will return a float that represents the
-///     cost/weight of that edge. It must be non-negative
+///     cost/weight of that edge. It must be non-negative.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 /// :param int goal: An optional node index to use as the end of the path.
 ///     When specified the traversal will stop when the goal is reached and
 ///     the output dictionary will only have a single entry with the length
@@ -2267,11 +2774,8 @@ fn graph_dijkstra_shortest_path_lengths(
     edge_cost_fn: PyObject,
     goal: Option<usize>,
 ) -> PyResult<PathLengthMapping> {
-    let edge_cost_callable = |a: &PyObject| -> PyResult<f64> {
-        let res = edge_cost_fn.call1(py, (a,))?;
-        let raw = res.to_object(py);
-        raw.extract(py)
-    };
+    let edge_weights =
+        EdgeWeights::new(py, &graph.graph, Some(edge_cost_fn), 1.0)?;
 
     let start = NodeIndex::new(node);
     let goal_index: Option<NodeIndex> = goal.map(NodeIndex::new);
@@ -2280,7 +2784,7 @@ fn graph_dijkstra_shortest_path_lengths(
         graph,
         start,
         goal_index,
-        |e| edge_cost_callable(e.weight()),
+        |e| edge_weights.weight(py, e.id(), e.weight()),
         None,
     )?;
     Ok(PathLengthMapping {
@@ -2306,7 +2810,9 @@ fn graph_dijkstra_shortest_path_lengths(
 ///     shortest paths from
 /// :param edge_cost_fn: A python callable that will take in 1 parameter, an
 ///     edge's data object and will return a float that represents the
-///     cost/weight of that edge. It must be non-negative
+///     cost/weight of that edge. It must be non-negative.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 /// :param int goal: An optional node index to use as the end of the path.
 ///     When specified the traversal will stop when the goal is reached and
 ///     the output dictionary will only have a single entry with the length
@@ -2325,11 +2831,8 @@ fn digraph_dijkstra_shortest_path_lengths(
     edge_cost_fn: PyObject,
     goal: Option<usize>,
 ) -> PyResult<PathLengthMapping> {
-    let edge_cost_callable = |a: &PyObject| -> PyResult<f64> {
-        let res = edge_cost_fn.call1(py, (a,))?;
-        let raw = res.to_object(py);
-        raw.extract(py)
-    };
+    let edge_weights =
+        EdgeWeights::new(py, &graph.graph, Some(edge_cost_fn), 1.0)?;
 
     let start = NodeIndex::new(node);
     let goal_index: Option<NodeIndex> = goal.map(NodeIndex::new);
@@ -2338,7 +2841,7 @@ fn digraph_dijkstra_shortest_path_lengths(
         graph,
         start,
         goal_index,
-        |e| edge_cost_callable(e.weight()),
+        |e| edge_weights.weight(py, e.id(), e.weight()),
         None,
     )?;
     Ok(PathLengthMapping {
@@ -2380,54 +2883,38 @@ fn _all_pairs_dijkstra_path_lengths<Ty: EdgeType + Sync>(
                 .collect(),
         });
     }
-    let edge_cost_callable = |a: &PyObject| -> PyResult<f64> {
-        let res = edge_cost_fn.call1(py, (a,))?;
-        let raw = res.to_object(py);
-        raw.extract(py)
-    };
-    let mut edge_weights: Vec<Option<f64>> =
-        Vec::with_capacity(graph.edge_bound());
-    for index in 0..=graph.edge_bound() {
-        let raw_weight = graph.edge_weight(EdgeIndex::new(index));
-        match raw_weight {
-            Some(weight) => {
-                edge_weights.push(Some(edge_cost_callable(weight)?))
-            }
-            None => edge_weights.push(None),
-        };
-    }
-    let edge_cost = |e: EdgeIndex| -> PyResult<f64> {
-        match edge_weights[e.index()] {
-            Some(weight) => Ok(weight),
-            None => Err(PyIndexError::new_err("No edge found for index")),
-        }
-    };
+    let edge_weights = EdgeWeights::new(py, graph, Some(edge_cost_fn), 1.0)?
+        .into_vec(py, graph)?;
+    let edge_cost =
+        |e: EdgeIndex| -> PyResult<f64> { Ok(edge_weights[e.index()]) };
     let node_indices: Vec<NodeIndex> = graph.node_indices().collect();
-    let out_map: HashMap<usize, PathLengthMapping> = node_indices
-        .into_par_iter()
-        .map(|x| {
-            let out_map = PathLengthMapping {
-                path_lengths: dijkstra::dijkstra(
-                    graph,
-                    x,
-                    None,
-                    |e| edge_cost(e.id()),
-                    None,
-                )
-                .unwrap()
-                .iter()
-                .filter_map(|(index, cost)| {
-                    if *index == x {
-                        None
-                    } else {
-                        Some((index.index(), *cost))
-                    }
-                })
-                .collect(),
-            };
-            (x.index(), out_map)
-        })
-        .collect();
+    let out_map: HashMap<usize, PathLengthMapping> = py.allow_threads(|| {
+        node_indices
+            .into_par_iter()
+            .map(|x| {
+                let out_map = PathLengthMapping {
+                    path_lengths: dijkstra::dijkstra(
+                        graph,
+                        x,
+                        None,
+                        |e| edge_cost(e.id()),
+                        None,
+                    )
+                    .unwrap()
+                    .iter()
+                    .filter_map(|(index, cost)| {
+                        if *index == x {
+                            None
+                        } else {
+                            Some((index.index(), *cost))
+                        }
+                    })
+                    .collect(),
+                };
+                (x.index(), out_map)
+            })
+            .collect()
+    });
     Ok(AllPairsPathLengthMapping {
         path_lengths: out_map,
     })
@@ -2457,31 +2944,13 @@ fn _all_pairs_dijkstra_shortest_paths<Ty: EdgeType + Sync>(
                 .collect(),
         });
     }
-    let edge_cost_callable = |a: &PyObject| -> PyResult<f64> {
-        let res = edge_cost_fn.call1(py, (a,))?;
-        let raw = res.to_object(py);
-        raw.extract(py)
-    };
-    let mut edge_weights: Vec<Option<f64>> =
-        Vec::with_capacity(graph.edge_bound());
-    for index in 0..=graph.edge_bound() {
-        let raw_weight = graph.edge_weight(EdgeIndex::new(index));
-        match raw_weight {
-            Some(weight) => {
-                edge_weights.push(Some(edge_cost_callable(weight)?))
-            }
-            None => edge_weights.push(None),
-        };
-    }
-    let edge_cost = |e: EdgeIndex| -> PyResult<f64> {
-        match edge_weights[e.index()] {
-            Some(weight) => Ok(weight),
-            None => Err(PyIndexError::new_err("No edge found for index")),
-        }
-    };
+    let edge_weights = EdgeWeights::new(py, graph, Some(edge_cost_fn), 1.0)?
+        .into_vec(py, graph)?;
+    let edge_cost =
+        |e: EdgeIndex| -> PyResult<f64> { Ok(edge_weights[e.index()]) };
     let node_indices: Vec<NodeIndex> = graph.node_indices().collect();
-    Ok(AllPairsPathMapping {
-        paths: node_indices
+    let paths: HashMap<usize, PathMapping> = py.allow_threads(|| {
+        node_indices
             .into_par_iter()
             .map(|x| {
                 let mut paths: HashMap<NodeIndex, Vec<NodeIndex>> =
@@ -2517,8 +2986,44 @@ fn _all_pairs_dijkstra_shortest_paths<Ty: EdgeType + Sync>(
                 };
                 (index, out_paths)
             })
-            .collect(),
-    })
+            .collect()
+    });
+    Ok(AllPairsPathMapping { paths })
+}
+
+fn _all_pairs_dijkstra_predecessors<Ty: EdgeType + Sync>(
+    py: Python,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    edge_cost_fn: PyObject,
+) -> PyResult<PyObject> {
+    let edge_weights = EdgeWeights::new(py, graph, Some(edge_cost_fn), 1.0)?
+        .into_vec(py, graph)?;
+    let node_indices: Vec<NodeIndex> = graph.node_indices().collect();
+    let mut position: Vec<usize> = vec![0; graph.node_bound()];
+    for (pos, node) in node_indices.iter().enumerate() {
+        position[node.index()] = pos;
+    }
+    let n = node_indices.len();
+    let mut matrix = Array2::<i64>::from_elem((n, n), -1);
+    py.allow_threads(|| {
+        matrix
+            .axis_iter_mut(Axis(0))
+            .into_par_iter()
+            .enumerate()
+            .for_each(|(row_index, mut row)| {
+                let predecessors = dijkstra::dijkstra_predecessors(
+                    graph,
+                    node_indices[row_index],
+                    |e| Ok(edge_weights[e.id().index()]),
+                )
+                .unwrap();
+                for (node, predecessor) in predecessors {
+                    row[[position[node.index()]]] =
+                        position[predecessor.index()] as i64;
+                }
+            })
+    });
+    Ok(matrix.into_pyarray(py).into())
 }
 
 /// Calculate the the shortest length from all nodes in a
@@ -2531,11 +3036,15 @@ fn _all_pairs_dijkstra_shortest_paths<Ty: EdgeType + Sync>(
 /// environment variable. For example, setting ``RAYON_NUM_THREADS=4`` would
 /// limit the thread pool to 4 threads.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param graph: The input :class:`~retworkx.PyDiGraph` to use
 /// :param edge_cost_fn: A callable object that acts as a weight function for
 ///     an edge. It will accept a single positional argument, the edge's weight
 ///     object and will return a float which will be used to represent the
-///     weight/cost of the edge
+///     weight/cost of the edge.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 ///
 /// :return: A read-only dictionary of path lengths. The keys are source
 ///     node indices and the values are dicts of the target node and the length
@@ -2558,6 +3067,47 @@ pub fn digraph_all_pairs_dijkstra_path_lengths(
     _all_pairs_dijkstra_path_lengths(py, &graph.graph, edge_cost_fn)
 }
 
+/// Calculate the shortest path lengths between all nodes in a
+/// :class:`~retworkx.PyDiGraph` object as a distance matrix
+///
+/// This computes the same path lengths as
+/// :func:`~retworkx.digraph_all_pairs_dijkstra_path_lengths` but returns them
+/// as a dense numpy array instead of a mapping of mappings, which for large
+/// graphs uses much less memory. A Dijkstra search is run from each node and
+/// writes its lengths directly into the matching row of the matrix. This
+/// function is multithreaded and will launch a thread pool with threads equal
+/// to the number of CPUs by default. You can tune the number of threads
+/// with the ``RAYON_NUM_THREADS`` environment variable. For example, setting
+/// ``RAYON_NUM_THREADS=4`` would limit the thread pool to 4 threads.
+///
+/// Like :func:`~retworkx.digraph_floyd_warshall_numpy` the rows and columns are
+/// in node index order with the indices of removed nodes skipped, the
+/// diagonal is ``0`` and the entry for a pair of nodes without a path is
+/// ``np.inf``.
+///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
+/// :param graph: The input :class:`~retworkx.PyDiGraph` to use
+/// :param edge_cost_fn: A callable object that acts as a weight function for
+///     an edge. It will accept a single positional argument, the edge's weight
+///     object and will return a float which will be used to represent the
+///     weight/cost of the edge.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
+///
+/// :returns: A matrix of shortest path lengths between nodes
+/// :rtype: numpy.ndarray
+#[pyfunction]
+#[pyo3(text_signature = "(graph, edge_cost_fn, /)")]
+pub fn digraph_all_pairs_dijkstra_path_lengths_numpy(
+    py: Python,
+    graph: &digraph::PyDiGraph,
+    edge_cost_fn: PyObject,
+) -> PyResult<PyObject> {
+    let sources = graph.graph.node_indices().map(|n| n.index()).collect();
+    _batch_dijkstra_path_lengths_numpy(py, &graph.graph, sources, edge_cost_fn)
+}
+
 /// Find the shortest path from all nodes in a :class:`~retworkx.PyDiGraph`
 /// object
 ///
@@ -2568,11 +3118,15 @@ pub fn digraph_all_pairs_dijkstra_path_lengths(
 /// environment variable. For example, setting ``RAYON_NUM_THREADS=4`` would
 /// limit the thread pool to 4 threads.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param graph: The input :class:`~retworkx.PyDiGraph` object to use
 /// :param edge_cost_fn: A callable object that acts as a weight function for
 ///     an edge. It will accept a single positional argument, the edge's weight
 ///     object and will return a float which will be used to represent the
-///     weight/cost of the edge
+///     weight/cost of the edge.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 ///
 /// :return: A read-only dictionary of paths. The keys are source node indices
 ///     and the values are dicts of the target node and the list of the
@@ -2595,17 +3149,64 @@ pub fn digraph_all_pairs_dijkstra_shortest_paths(
     _all_pairs_dijkstra_shortest_paths(py, &graph.graph, edge_cost_fn)
 }
 
+/// Find the shortest paths between all nodes in a :class:`~retworkx.PyDiGraph`
+/// object as a predecessor matrix
+///
+/// This finds the same paths as
+/// :func:`~retworkx.digraph_all_pairs_dijkstra_shortest_paths` but instead of
+/// storing every path it returns a dense numpy array where the entry in row
+/// ``i`` and column ``j`` is the node before ``j`` on the shortest path from
+/// ``i`` to ``j``. This only needs memory quadratic in the number of nodes,
+/// and any single path can be rebuilt with
+/// :func:`~retworkx.path_from_predecessors`. The searches from each node run
+/// in parallel, you can tune the number of threads with the
+/// ``RAYON_NUM_THREADS`` environment variable.
+///
+/// Like :func:`~retworkx.digraph_all_pairs_dijkstra_path_lengths_numpy` the rows
+/// and columns, and the values of the entries, are positions in node index
+/// order with the indices of removed nodes skipped. These are the node
+/// indices themselves unless nodes have been removed from the graph, in
+/// which case ``graph.node_indexes()[position]`` is the node index at a
+/// position. The diagonal and the entries for pairs of nodes without a path
+/// are ``-1``.
+///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
+/// :param graph: The input :class:`~retworkx.PyDiGraph` to use
+/// :param edge_cost_fn: A callable object that acts as a weight function for
+///     an edge. It will accept a single positional argument, the edge's weight
+///     object and will return a float which will be used to represent the
+///     weight/cost of the edge.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
+///
+/// :returns: A matrix of the predecessors on the shortest paths
+/// :rtype: numpy.ndarray
+#[pyfunction]
+#[pyo3(text_signature = "(graph, edge_cost_fn, /)")]
+pub fn digraph_all_pairs_dijkstra_predecessors(
+    py: Python,
+    graph: &digraph::PyDiGraph,
+    edge_cost_fn: PyObject,
+) -> PyResult<PyObject> {
+    _all_pairs_dijkstra_predecessors(py, &graph.graph, edge_cost_fn)
+}
+
 /// Calculate the the shortest length from all nodes in a
 /// :class:`~retworkx.PyGraph` object
 ///
 /// This function will generate the shortest path from a source node using
 /// Dijkstra's algorithm.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param graph: The input :class:`~retworkx.PyGraph` to use
 /// :param edge_cost_fn: A callable object that acts as a weight function for
 ///     an edge. It will accept a single positional argument, the edge's weight
 ///     object and will return a float which will be used to represent the
-///     weight/cost of the edge
+///     weight/cost of the edge.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 ///
 /// :return: A read-only dictionary of path lengths. The keys are source
 ///     node indices and the values are dicts of the target node and the length
@@ -2628,17 +3229,62 @@ pub fn graph_all_pairs_dijkstra_path_lengths(
     _all_pairs_dijkstra_path_lengths(py, &graph.graph, edge_cost_fn)
 }
 
+/// Calculate the shortest path lengths between all nodes in a
+/// :class:`~retworkx.PyGraph` object as a distance matrix
+///
+/// This computes the same path lengths as
+/// :func:`~retworkx.graph_all_pairs_dijkstra_path_lengths` but returns them
+/// as a dense numpy array instead of a mapping of mappings, which for large
+/// graphs uses much less memory. A Dijkstra search is run from each node and
+/// writes its lengths directly into the matching row of the matrix. This
+/// function is multithreaded and will launch a thread pool with threads equal
+/// to the number of CPUs by default. You can tune the number of threads
+/// with the ``RAYON_NUM_THREADS`` environment variable. For example, setting
+/// ``RAYON_NUM_THREADS=4`` would limit the thread pool to 4 threads.
+///
+/// Like :func:`~retworkx.graph_floyd_warshall_numpy` the rows and columns are
+/// in node index order with the indices of removed nodes skipped, the
+/// diagonal is ``0`` and the entry for a pair of nodes without a path is
+/// ``np.inf``.
+///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
+/// :param graph: The input :class:`~retworkx.PyGraph` to use
+/// :param edge_cost_fn: A callable object that acts as a weight function for
+///     an edge. It will accept a single positional argument, the edge's weight
+///     object and will return a float which will be used to represent the
+///     weight/cost of the edge.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
+///
+/// :returns: A matrix of shortest path lengths between nodes
+/// :rtype: numpy.ndarray
+#[pyfunction]
+#[pyo3(text_signature = "(graph, edge_cost_fn, /)")]
+pub fn graph_all_pairs_dijkstra_path_lengths_numpy(
+    py: Python,
+    graph: &graph::PyGraph,
+    edge_cost_fn: PyObject,
+) -> PyResult<PyObject> {
+    let sources = graph.graph.node_indices().map(|n| n.index()).collect();
+    _batch_dijkstra_path_lengths_numpy(py, &graph.graph, sources, edge_cost_fn)
+}
+
 /// Find the shortest path from all nodes in a :class:`~retworkx.PyGraph`
 /// object
 ///
 /// This function will generate the shortest path from a source node using
 /// Dijkstra's algorithm.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param graph: The input :class:`~retworkx.PyGraph` object to use
 /// :param edge_cost_fn: A callable object that acts as a weight function for
 ///     an edge. It will accept a single positional argument, the edge's weight
 ///     object and will return a float which will be used to represent the
-///     weight/cost of the edge
+///     weight/cost of the edge.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 ///
 /// :return: A read-only dictionary of paths. The keys are destination node
 ///     indices and the values are dicts of the target node and the list of the
@@ -2661,25 +3307,688 @@ pub fn graph_all_pairs_dijkstra_shortest_paths(
     _all_pairs_dijkstra_shortest_paths(py, &graph.graph, edge_cost_fn)
 }
 
-/// Compute the A* shortest path for a PyGraph
+/// Find the shortest paths between all nodes in a :class:`~retworkx.PyGraph`
+/// object as a predecessor matrix
+///
+/// This finds the same paths as
+/// :func:`~retworkx.graph_all_pairs_dijkstra_shortest_paths` but instead of
+/// storing every path it returns a dense numpy array where the entry in row
+/// ``i`` and column ``j`` is the node before ``j`` on the shortest path from
+/// ``i`` to ``j``. This only needs memory quadratic in the number of nodes,
+/// and any single path can be rebuilt with
+/// :func:`~retworkx.path_from_predecessors`. The searches from each node run
+/// in parallel, you can tune the number of threads with the
+/// ``RAYON_NUM_THREADS`` environment variable.
+///
+/// Like :func:`~retworkx.graph_all_pairs_dijkstra_path_lengths_numpy` the rows
+/// and columns, and the values of the entries, are positions in node index
+/// order with the indices of removed nodes skipped. These are the node
+/// indices themselves unless nodes have been removed from the graph, in
+/// which case ``graph.node_indexes()[position]`` is the node index at a
+/// position. The diagonal and the entries for pairs of nodes without a path
+/// are ``-1``.
+///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
 ///
-/// :param PyGraph graph: The input graph to use
-/// :param int node: The node index to compute the path from
-/// :param goal_fn: A python callable that will take in 1 parameter, a node's data
-///     object and will return a boolean which will be True if it is the finish
-///     node.
-/// :param edge_cost_fn: A python callable that will take in 1 parameter, an edge's
-///     data object and will return a float that represents the cost of that
-///     edge. It must be non-negative.
-/// :param estimate_cost_fn: A python callable that will take in 1 parameter, a
-///     node's data object and will return a float which represents the estimated
-///     cost for the next node. The return must be non-negative. For the
-///     algorithm to find the actual shortest path, it should be admissible,
-///     meaning that it should never overestimate the actual cost to get to the
-///     nearest goal node.
+/// :param graph: The input :class:`~retworkx.PyGraph` to use
+/// :param edge_cost_fn: A callable object that acts as a weight function for
+///     an edge. It will accept a single positional argument, the edge's weight
+///     object and will return a float which will be used to represent the
+///     weight/cost of the edge.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 ///
-/// :returns: The computed shortest path between node and finish as a list
-///     of node indices.
+/// :returns: A matrix of the predecessors on the shortest paths
+/// :rtype: numpy.ndarray
+#[pyfunction]
+#[pyo3(text_signature = "(graph, edge_cost_fn, /)")]
+pub fn graph_all_pairs_dijkstra_predecessors(
+    py: Python,
+    graph: &graph::PyGraph,
+    edge_cost_fn: PyObject,
+) -> PyResult<PyObject> {
+    _all_pairs_dijkstra_predecessors(py, &graph.graph, edge_cost_fn)
+}
+
+/// Rebuild a shortest path from a predecessor matrix
+///
+/// The predecessor matrix is the output of
+/// :func:`~retworkx.all_pairs_dijkstra_predecessors`, the path is found by
+/// following the predecessors back from ``target`` to ``source``.
+///
+/// :param numpy.ndarray predecessors: The ``int64`` predecessor matrix
+/// :param int source: The position of the first node of the path
+/// :param int target: The position of the last node of the path
+///
+/// :returns: The positions of the nodes on the path from ``source`` to
+///     ``target``, these are the node indices unless nodes have been removed
+///     from the graph
+/// :rtype: NodeIndices
+/// :raises IndexError: If ``source`` or ``target`` are not positions in the
+///     matrix
+/// :raises NoPathFound: If there is no path from ``source`` to ``target``
+/// :raises ValueError: If the matrix is not square or is not a valid
+///     predecessor matrix
+#[pyfunction]
+#[pyo3(text_signature = "(predecessors, source, target, /)")]
+pub fn path_from_predecessors(
+    predecessors: PyReadonlyArray2<i64>,
+    source: usize,
+    target: usize,
+) -> PyResult<NodeIndices> {
+    let predecessors = predecessors.as_array();
+    let n = predecessors.shape()[0];
+    if predecessors.shape()[1] != n {
+        return Err(PyValueError::new_err(
+            "The predecessor matrix must be square",
+        ));
+    }
+    if source >= n || target >= n {
+        return Err(PyIndexError::new_err(format!(
+            "Source {} or target {} is out of range for a {}x{} matrix",
+            source, target, n, n
+        )));
+    }
+    let mut path = vec![target];
+    let mut node = target;
+    while node != source {
+        let predecessor = predecessors[[source, node]];
+        if predecessor < 0 {
+            return Err(NoPathFound::new_err(format!(
+                "No path found from node {} to node {}",
+                source, target
+            )));
+        }
+        if predecessor as usize >= n || path.len() > n {
+            return Err(PyValueError::new_err(
+                "The predecessor matrix is not a valid shortest path tree",
+            ));
+        }
+        node = predecessor as usize;
+        path.push(node);
+    }
+    path.reverse();
+    Ok(NodeIndices { nodes: path })
+}
+
+fn check_sources<Ty: EdgeType>(
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    sources: &[usize],
+) -> PyResult<Vec<NodeIndex>> {
+    sources
+        .iter()
+        .map(|source| {
+            let index = NodeIndex::new(*source);
+            if graph.contains_node(index) {
+                Ok(index)
+            } else {
+                Err(PyIndexError::new_err(format!(
+                    "Node index {} is not in the graph",
+                    source
+                )))
+            }
+        })
+        .collect()
+}
+
+fn _batch_dijkstra_path_lengths<Ty: EdgeType + Sync>(
+    py: Python,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    sources: Vec<usize>,
+    edge_cost_fn: PyObject,
+) -> PyResult<AllPairsPathLengthMapping> {
+    let sources = check_sources(graph, &sources)?;
+    let edge_weights = EdgeWeights::new(py, graph, Some(edge_cost_fn), 1.0)?
+        .into_vec(py, graph)?;
+    let path_lengths: HashMap<usize, PathLengthMapping> =
+        py.allow_threads(|| {
+            sources
+                .par_iter()
+                .map(|source| {
+                    let lengths = dijkstra::dijkstra(
+                        graph,
+                        *source,
+                        None,
+                        |e| Ok(edge_weights[e.id().index()]),
+                        None,
+                    )
+                    .unwrap();
+                    (
+                        source.index(),
+                        PathLengthMapping {
+                            path_lengths: lengths
+                                .into_iter()
+                                .filter(|(index, _)| index != source)
+                                .map(|(index, cost)| (index.index(), cost))
+                                .collect(),
+                        },
+                    )
+                })
+                .collect()
+        });
+    Ok(AllPairsPathLengthMapping { path_lengths })
+}
+
+fn _batch_dijkstra_path_lengths_numpy<Ty: EdgeType + Sync>(
+    py: Python,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    sources: Vec<usize>,
+    edge_cost_fn: PyObject,
+) -> PyResult<PyObject> {
+    let sources = check_sources(graph, &sources)?;
+    let edge_weights = EdgeWeights::new(py, graph, Some(edge_cost_fn), 1.0)?
+        .into_vec(py, graph)?;
+    let mut position: Vec<usize> = vec![0; graph.node_bound()];
+    for (pos, node) in graph.node_indices().enumerate() {
+        position[node.index()] = pos;
+    }
+    let mut matrix = Array2::<f64>::from_elem(
+        (sources.len(), graph.node_count()),
+        std::f64::INFINITY,
+    );
+    py.allow_threads(|| {
+        matrix
+            .axis_iter_mut(Axis(0))
+            .into_par_iter()
+            .enumerate()
+            .for_each(|(row_index, mut row)| {
+                let lengths = dijkstra::dijkstra(
+                    graph,
+                    sources[row_index],
+                    None,
+                    |e| Ok(edge_weights[e.id().index()]),
+                    None,
+                )
+                .unwrap();
+                for (index, cost) in lengths {
+                    row[[position[index.index()]]] = cost;
+                }
+            })
+    });
+    Ok(matrix.into_pyarray(py).into())
+}
+
+fn _multi_source_dijkstra_path_lengths<Ty: EdgeType>(
+    py: Python,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    sources: Vec<usize>,
+    edge_cost_fn: PyObject,
+) -> PyResult<PathLengthMapping> {
+    let starts = check_sources(graph, &sources)?;
+    let edge_weights = EdgeWeights::new(py, graph, Some(edge_cost_fn), 1.0)?;
+    let lengths = dijkstra::multi_source_dijkstra(
+        graph,
+        &starts,
+        None,
+        |e| edge_weights.weight(py, e.id(), e.weight()),
+        None,
+    )?;
+    let starts: HashSet<NodeIndex> = starts.into_iter().collect();
+    Ok(PathLengthMapping {
+        path_lengths: lengths
+            .into_iter()
+            .filter(|(index, _)| !starts.contains(index))
+            .map(|(index, cost)| (index.index(), cost))
+            .collect(),
+    })
+}
+
+/// Compute the shortest path lengths from several source nodes in a
+/// :class:`~retworkx.PyDiGraph` object
+///
+/// This is equivalent to calling
+/// :func:`~retworkx.digraph_dijkstra_shortest_path_lengths` for each source,
+/// but the edge weights are only computed once and the searches from the
+/// different sources run in parallel without holding the GIL. This function
+/// is multithreaded and will launch a thread pool with threads equal to the
+/// number of CPUs by default. You can tune the number of threads with the
+/// ``RAYON_NUM_THREADS`` environment variable.
+///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
+/// :param graph: The input :class:`~retworkx.PyDiGraph` to use
+/// :param list sources: The node indices to find the shortest path lengths
+///     from
+/// :param edge_cost_fn: A callable object that acts as a weight function for
+///     an edge. It will accept a single positional argument, the edge's weight
+///     object and will return a float which will be used to represent the
+///     weight/cost of the edge. It must be non-negative.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
+///
+/// :return: A read-only dictionary of path lengths. The keys are the source
+///     node indices and the values are dicts of the target node and the length
+///     of the shortest path to that node.
+/// :rtype: AllPairsPathLengthMapping
+/// :raises IndexError: If a source is not a node in the graph
+#[pyfunction]
+#[pyo3(text_signature = "(graph, sources, edge_cost_fn, /)")]
+pub fn digraph_batch_dijkstra_path_lengths(
+    py: Python,
+    graph: &digraph::PyDiGraph,
+    sources: Vec<usize>,
+    edge_cost_fn: PyObject,
+) -> PyResult<AllPairsPathLengthMapping> {
+    _batch_dijkstra_path_lengths(py, &graph.graph, sources, edge_cost_fn)
+}
+
+/// Compute the shortest path lengths from several source nodes in a
+/// :class:`~retworkx.PyDiGraph` object as a numpy array
+///
+/// This is the same as :func:`~retworkx.digraph_batch_dijkstra_path_lengths`
+/// but the output is a dense numpy array with a row for each source.
+///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
+/// :param graph: The input :class:`~retworkx.PyDiGraph` to use
+/// :param list sources: The node indices to find the shortest path lengths
+///     from
+/// :param edge_cost_fn: A callable object that acts as a weight function for
+///     an edge. It will accept a single positional argument, the edge's weight
+///     object and will return a float which will be used to represent the
+///     weight/cost of the edge. It must be non-negative.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
+///
+/// :return: A 2 dimensional ``float64`` array of shape
+///     ``(len(sources), len(graph))``. Element ``[i, j]`` is the length of
+///     the shortest path from ``sources[i]`` to the node at position ``j`` of
+///     :meth:`~retworkx.PyDiGraph.node_indexes`, or ``inf`` if there is no path.
+/// :rtype: numpy.ndarray
+/// :raises IndexError: If a source is not a node in the graph
+#[pyfunction]
+#[pyo3(text_signature = "(graph, sources, edge_cost_fn, /)")]
+pub fn digraph_batch_dijkstra_path_lengths_numpy(
+    py: Python,
+    graph: &digraph::PyDiGraph,
+    sources: Vec<usize>,
+    edge_cost_fn: PyObject,
+) -> PyResult<PyObject> {
+    _batch_dijkstra_path_lengths_numpy(py, &graph.graph, sources, edge_cost_fn)
+}
+
+/// Compute the length of the shortest path from the closest of several
+/// source nodes to every node in a :class:`~retworkx.PyDiGraph` object
+///
+/// This runs a single Dijkstra search which starts from all the sources at
+/// once, as if from a virtual node with a zero cost edge to each source. It
+/// can be used for nearest facility queries.
+///
+/// :param graph: The input :class:`~retworkx.PyDiGraph` to use
+/// :param list sources: The node indices to start the search from
+/// :param edge_cost_fn: A callable object that acts as a weight function for
+///     an edge. It will accept a single positional argument, the edge's weight
+///     object and will return a float which will be used to represent the
+///     weight/cost of the edge. It must be non-negative.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
+///
+/// :return: A read-only dictionary where the keys are the node indices
+///     reachable from a source and the values are the length of the shortest
+///     path from any source to that node. The sources themselves are not
+///     included.
+/// :rtype: PathLengthMapping
+/// :raises IndexError: If a source is not a node in the graph
+#[pyfunction]
+#[pyo3(text_signature = "(graph, sources, edge_cost_fn, /)")]
+pub fn digraph_multi_source_dijkstra_path_lengths(
+    py: Python,
+    graph: &digraph::PyDiGraph,
+    sources: Vec<usize>,
+    edge_cost_fn: PyObject,
+) -> PyResult<PathLengthMapping> {
+    _multi_source_dijkstra_path_lengths(py, &graph.graph, sources, edge_cost_fn)
+}
+
+/// Compute the shortest path lengths from several source nodes in a
+/// :class:`~retworkx.PyGraph` object
+///
+/// This is equivalent to calling
+/// :func:`~retworkx.graph_dijkstra_shortest_path_lengths` for each source,
+/// but the edge weights are only computed once and the searches from the
+/// different sources run in parallel without holding the GIL. This function
+/// is multithreaded and will launch a thread pool with threads equal to the
+/// number of CPUs by default. You can tune the number of threads with the
+/// ``RAYON_NUM_THREADS`` environment variable.
+///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
+/// :param graph: The input :class:`~retworkx.PyGraph` to use
+/// :param list sources: The node indices to find the shortest path lengths
+///     from
+/// :param edge_cost_fn: A callable object that acts as a weight function for
+///     an edge. It will accept a single positional argument, the edge's weight
+///     object and will return a float which will be used to represent the
+///     weight/cost of the edge. It must be non-negative.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
+///
+/// :return: A read-only dictionary of path lengths. The keys are the source
+///     node indices and the values are dicts of the target node and the length
+///     of the shortest path to that node.
+/// :rtype: AllPairsPathLengthMapping
+/// :raises IndexError: If a source is not a node in the graph
+#[pyfunction]
+#[pyo3(text_signature = "(graph, sources, edge_cost_fn, /)")]
+pub fn graph_batch_dijkstra_path_lengths(
+    py: Python,
+    graph: &graph::PyGraph,
+    sources: Vec<usize>,
+    edge_cost_fn: PyObject,
+) -> PyResult<AllPairsPathLengthMapping> {
+    _batch_dijkstra_path_lengths(py, &graph.graph, sources, edge_cost_fn)
+}
+
+/// Compute the shortest path lengths from several source nodes in a
+/// :class:`~retworkx.PyGraph` object as a numpy array
+///
+/// This is the same as :func:`~retworkx.graph_batch_dijkstra_path_lengths`
+/// but the output is a dense numpy array with a row for each source.
+///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
+/// :param graph: The input :class:`~retworkx.PyGraph` to use
+/// :param list sources: The node indices to find the shortest path lengths
+///     from
+/// :param edge_cost_fn: A callable object that acts as a weight function for
+///     an edge. It will accept a single positional argument, the edge's weight
+///     object and will return a float which will be used to represent the
+///     weight/cost of the edge. It must be non-negative.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
+///
+/// :return: A 2 dimensional ``float64`` array of shape
+///     ``(len(sources), len(graph))``. Element ``[i, j]`` is the length of
+///     the shortest path from ``sources[i]`` to the node at position ``j`` of
+///     :meth:`~retworkx.PyGraph.node_indexes`, or ``inf`` if there is no path.
+/// :rtype: numpy.ndarray
+/// :raises IndexError: If a source is not a node in the graph
+#[pyfunction]
+#[pyo3(text_signature = "(graph, sources, edge_cost_fn, /)")]
+pub fn graph_batch_dijkstra_path_lengths_numpy(
+    py: Python,
+    graph: &graph::PyGraph,
+    sources: Vec<usize>,
+    edge_cost_fn: PyObject,
+) -> PyResult<PyObject> {
+    _batch_dijkstra_path_lengths_numpy(py, &graph.graph, sources, edge_cost_fn)
+}
+
+/// Compute the length of the shortest path from the closest of several
+/// source nodes to every node in a :class:`~retworkx.PyGraph` object
+///
+/// This runs a single Dijkstra search which starts from all the sources at
+/// once, as if from a virtual node with a zero cost edge to each source. It
+/// can be used for nearest facility queries.
+///
+/// :param graph: The input :class:`~retworkx.PyGraph` to use
+/// :param list sources: The node indices to start the search from
+/// :param edge_cost_fn: A callable object that acts as a weight function for
+///     an edge. It will accept a single positional argument, the edge's weight
+///     object and will return a float which will be used to represent the
+///     weight/cost of the edge. It must be non-negative.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
+///
+/// :return: A read-only dictionary where the keys are the node indices
+///     reachable from a source and the values are the length of the shortest
+///     path from any source to that node. The sources themselves are not
+///     included.
+/// :rtype: PathLengthMapping
+/// :raises IndexError: If a source is not a node in the graph
+#[pyfunction]
+#[pyo3(text_signature = "(graph, sources, edge_cost_fn, /)")]
+pub fn graph_multi_source_dijkstra_path_lengths(
+    py: Python,
+    graph: &graph::PyGraph,
+    sources: Vec<usize>,
+    edge_cost_fn: PyObject,
+) -> PyResult<PathLengthMapping> {
+    _multi_source_dijkstra_path_lengths(py, &graph.graph, sources, edge_cost_fn)
+}
+
+fn check_endpoints<Ty: EdgeType>(
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    source: usize,
+    target: usize,
+) -> PyResult<(NodeIndex, NodeIndex)> {
+    let endpoints = check_sources(graph, &[source, target])?;
+    Ok((endpoints[0], endpoints[1]))
+}
+
+fn _bidirectional_dijkstra<Ty: EdgeType>(
+    py: Python,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    source: usize,
+    target: usize,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+    as_undirected: bool,
+) -> PyResult<(f64, NodeIndices)> {
+    let (start, goal) = check_endpoints(graph, source, target)?;
+    let edge_weights = EdgeWeights::new(py, graph, weight_fn, default_weight)?;
+    match bidirectional::bidirectional_dijkstra(
+        graph,
+        start,
+        goal,
+        as_undirected,
+        |e| edge_weights.weight(py, e.id(), e.weight()),
+    )? {
+        Some((length, path)) => Ok((
+            length,
+            NodeIndices {
+                nodes: path.into_iter().map(|x| x.index()).collect(),
+            },
+        )),
+        None => Err(NoPathFound::new_err(format!(
+            "No path found from node {} to node {}",
+            source, target
+        ))),
+    }
+}
+
+fn _bidirectional_bfs<Ty: EdgeType + Sync>(
+    py: Python,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    source: usize,
+    target: usize,
+    as_undirected: bool,
+) -> PyResult<(usize, NodeIndices)> {
+    let (start, goal) = check_endpoints(graph, source, target)?;
+    let path = py.allow_threads(|| {
+        bidirectional::bidirectional_bfs(graph, start, goal, as_undirected)
+    });
+    match path {
+        Some(path) => Ok((
+            path.len() - 1,
+            NodeIndices {
+                nodes: path.into_iter().map(|x| x.index()).collect(),
+            },
+        )),
+        None => Err(NoPathFound::new_err(format!(
+            "No path found from node {} to node {}",
+            source, target
+        ))),
+    }
+}
+
+/// Find the shortest path between two nodes in a :class:`~retworkx.PyDiGraph`
+/// with bidirectional Dijkstra's algorithm
+///
+/// A search forward from ``source`` and a search backward from ``target`` are
+/// run in alternation until they meet, which explores far fewer nodes than
+/// :func:`~retworkx.digraph_dijkstra_shortest_paths` with a ``target`` for
+/// most point to point queries.
+///
+/// :param PyDiGraph graph: The input graph to use
+/// :param int source: The node index to find the path from
+/// :param int target: The node index to find the path to
+/// :param weight_fn: An optional weight function for an edge. It will accept
+///     a single argument, the edge's weight object and will return a float which
+///     will be used to represent the weight/cost of the edge. It must be
+///     non-negative.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
+/// :param float default_weight: If ``weight_fn`` isn't specified this optional
+///     float value will be used for the weight/cost of each edge.
+/// :param bool as_undirected: If set to true the graph will be treated as
+///     undirected for finding the shortest path.
+///
+/// :return: A tuple of the length of the shortest path and the node indices
+///     of the path from ``source`` to ``target``
+/// :rtype: tuple
+/// :raises IndexError: If ``source`` or ``target`` is not in the graph
+/// :raises NoPathFound: If there is no path from ``source`` to ``target``
+#[pyfunction(
+    weight_fn = "None",
+    default_weight = "1.0",
+    as_undirected = "false"
+)]
+#[pyo3(
+    text_signature = "(graph, source, target, /, weight_fn=None, default_weight=1.0, as_undirected=False)"
+)]
+pub fn digraph_bidirectional_dijkstra(
+    py: Python,
+    graph: &digraph::PyDiGraph,
+    source: usize,
+    target: usize,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+    as_undirected: bool,
+) -> PyResult<(f64, NodeIndices)> {
+    _bidirectional_dijkstra(
+        py,
+        &graph.graph,
+        source,
+        target,
+        weight_fn,
+        default_weight,
+        as_undirected,
+    )
+}
+
+/// Find the shortest path between two nodes in a :class:`~retworkx.PyGraph`
+/// with bidirectional Dijkstra's algorithm
+///
+/// A search from ``source`` and a search from ``target`` are run in
+/// alternation until they meet, which explores far fewer nodes than
+/// :func:`~retworkx.graph_dijkstra_shortest_paths` with a ``target`` for
+/// most point to point queries.
+///
+/// :param PyGraph graph: The input graph to use
+/// :param int source: The node index to find the path from
+/// :param int target: The node index to find the path to
+/// :param weight_fn: An optional weight function for an edge. It will accept
+///     a single argument, the edge's weight object and will return a float which
+///     will be used to represent the weight/cost of the edge. It must be
+///     non-negative.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
+/// :param float default_weight: If ``weight_fn`` isn't specified this optional
+///     float value will be used for the weight/cost of each edge.
+///
+/// :return: A tuple of the length of the shortest path and the node indices
+///     of the path from ``source`` to ``target``
+/// :rtype: tuple
+/// :raises IndexError: If ``source`` or ``target`` is not in the graph
+/// :raises NoPathFound: If there is no path from ``source`` to ``target``
+#[pyfunction(weight_fn = "None", default_weight = "1.0")]
+#[pyo3(
+    text_signature = "(graph, source, target, /, weight_fn=None, default_weight=1.0)"
+)]
+pub fn graph_bidirectional_dijkstra(
+    py: Python,
+    graph: &graph::PyGraph,
+    source: usize,
+    target: usize,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+) -> PyResult<(f64, NodeIndices)> {
+    _bidirectional_dijkstra(
+        py,
+        &graph.graph,
+        source,
+        target,
+        weight_fn,
+        default_weight,
+        false,
+    )
+}
+
+/// Find a path with the fewest edges between two nodes in a
+/// :class:`~retworkx.PyDiGraph` with a bidirectional breadth first search
+///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
+/// :param PyDiGraph graph: The input graph to use
+/// :param int source: The node index to find the path from
+/// :param int target: The node index to find the path to
+/// :param bool as_undirected: If set to true the graph will be treated as
+///     undirected for finding the shortest path.
+///
+/// :return: A tuple of the number of edges in the shortest path and the node
+///     indices of the path from ``source`` to ``target``
+/// :rtype: tuple
+/// :raises IndexError: If ``source`` or ``target`` is not in the graph
+/// :raises NoPathFound: If there is no path from ``source`` to ``target``
+#[pyfunction(as_undirected = "false")]
+#[pyo3(text_signature = "(graph, source, target, /, as_undirected=False)")]
+pub fn digraph_bidirectional_bfs(
+    py: Python,
+    graph: &digraph::PyDiGraph,
+    source: usize,
+    target: usize,
+    as_undirected: bool,
+) -> PyResult<(usize, NodeIndices)> {
+    _bidirectional_bfs(py, &graph.graph, source, target, as_undirected)
+}
+
+/// Find a path with the fewest edges between two nodes in a
+/// :class:`~retworkx.PyGraph` with a bidirectional breadth first search
+///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
+/// :param PyGraph graph: The input graph to use
+/// :param int source: The node index to find the path from
+/// :param int target: The node index to find the path to
+///
+/// :return: A tuple of the number of edges in the shortest path and the node
+///     indices of the path from ``source`` to ``target``
+/// :rtype: tuple
+/// :raises IndexError: If ``source`` or ``target`` is not in the graph
+/// :raises NoPathFound: If there is no path from ``source`` to ``target``
+#[pyfunction]
+#[pyo3(text_signature = "(graph, source, target, /)")]
+pub fn graph_bidirectional_bfs(
+    py: Python,
+    graph: &graph::PyGraph,
+    source: usize,
+    target: usize,
+) -> PyResult<(usize, NodeIndices)> {
+    _bidirectional_bfs(py, &graph.graph, source, target, false)
+}
+
+/// Compute the A* shortest path for a PyGraph
+///
+/// :param PyGraph graph: The input graph to use
+/// :param int node: The node index to compute the path from
+/// :param goal_fn: A python callable that will take in 1 parameter, a node's data
+///     object and will return a boolean which will be True if it is the finish
+///     node.
+/// :param edge_cost_fn: A python callable that will take in 1 parameter, an edge's
+///     data object and will return a float that represents the cost of that
+///     edge. It must be non-negative.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
+/// :param estimate_cost_fn: A python callable that will take in 1 parameter, a
+///     node's data object and will return a float which represents the estimated
+///     cost for the next node. The return must be non-negative. For the
+///     algorithm to find the actual shortest path, it should be admissible,
+///     meaning that it should never overestimate the actual cost to get to the
+///     nearest goal node.
+///
+/// :returns: The computed shortest path between node and finish as a list
+///     of node indices.
 /// :rtype: NodeIndices
 #[pyfunction]
 #[pyo3(text_signature = "(graph, node, goal_fn, edge_cost, estimate_cost, /)")]
@@ -2698,12 +4007,8 @@ fn graph_astar_shortest_path(
         Ok(output)
     };
 
-    let edge_cost_callable = |a: &PyObject| -> PyResult<f64> {
-        let res = edge_cost_fn.call1(py, (a,))?;
-        let raw = res.to_object(py);
-        let output: f64 = raw.extract(py)?;
-        Ok(output)
-    };
+    let edge_weights =
+        EdgeWeights::new(py, &graph.graph, Some(edge_cost_fn), 1.0)?;
 
     let estimate_cost_callable = |a: &PyObject| -> PyResult<f64> {
         let res = estimate_cost_fn.call1(py, (a,))?;
@@ -2717,7 +4022,7 @@ fn graph_astar_shortest_path(
         graph,
         start,
         |f| goal_fn_callable(graph.graph.node_weight(f).unwrap()),
-        |e| edge_cost_callable(e.weight()),
+        |e| edge_weights.weight(py, e.id(), e.weight()),
         |estimate| {
             estimate_cost_callable(graph.graph.node_weight(estimate).unwrap())
         },
@@ -2745,6 +4050,8 @@ fn graph_astar_shortest_path(
 /// :param edge_cost_fn: A python callable that will take in 1 parameter, an
 ///     edge's data object and will return a float that represents the cost of
 ///     that edge. It must be non-negative.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 /// :param estimate_cost_fn: A python callable that will take in 1 parameter, a
 ///     node's data object and will return a float which represents the
 ///     estimated cost for the next node. The return must be non-negative. For
@@ -2772,12 +4079,8 @@ fn digraph_astar_shortest_path(
         Ok(output)
     };
 
-    let edge_cost_callable = |a: &PyObject| -> PyResult<f64> {
-        let res = edge_cost_fn.call1(py, (a,))?;
-        let raw = res.to_object(py);
-        let output: f64 = raw.extract(py)?;
-        Ok(output)
-    };
+    let edge_weights =
+        EdgeWeights::new(py, &graph.graph, Some(edge_cost_fn), 1.0)?;
 
     let estimate_cost_callable = |a: &PyObject| -> PyResult<f64> {
         let res = estimate_cost_fn.call1(py, (a,))?;
@@ -2791,7 +4094,7 @@ fn digraph_astar_shortest_path(
         graph,
         start,
         |f| goal_fn_callable(graph.graph.node_weight(f).unwrap()),
-        |e| edge_cost_callable(e.weight()),
+        |e| edge_weights.weight(py, e.id(), e.weight()),
         |estimate| {
             estimate_cost_callable(graph.graph.node_weight(estimate).unwrap())
         },
@@ -2910,8 +4213,10 @@ pub fn directed_gnp_random_graph(
     let graph = digraph::PyDiGraph {
         graph: inner_graph,
         cycle_state: algo::DfsSpace::default(),
+        topo_order: None,
         check_cycle: false,
         node_removed: false,
+        cache: AnalysisCache::default(),
         multigraph: true,
     };
     Ok(graph)
@@ -3006,6 +4311,7 @@ pub fn undirected_gnp_random_graph(
     let graph = graph::PyGraph {
         graph: inner_graph,
         node_removed: false,
+        cache: AnalysisCache::default(),
         multigraph: true,
     };
     Ok(graph)
@@ -3084,8 +4390,10 @@ pub fn directed_gnm_random_graph(
     let graph = digraph::PyDiGraph {
         graph: inner_graph,
         cycle_state: algo::DfsSpace::default(),
+        topo_order: None,
         check_cycle: false,
         node_removed: false,
+        cache: AnalysisCache::default(),
         multigraph: true,
     };
     Ok(graph)
@@ -3161,6 +4469,7 @@ pub fn undirected_gnm_random_graph(
     let graph = graph::PyGraph {
         graph: inner_graph,
         node_removed: false,
+        cache: AnalysisCache::default(),
         multigraph: true,
     };
     Ok(graph)
@@ -3270,6 +4579,7 @@ pub fn random_geometric_graph(
     let graph = graph::PyGraph {
         graph: inner_graph,
         node_removed: false,
+        cache: AnalysisCache::default(),
         multigraph: true,
     };
     Ok(graph)
@@ -3284,6 +4594,8 @@ pub fn random_geometric_graph(
 ///
 /// This is adapted from algorithm CACM 491 [1]_.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param PyGraph graph: The graph to find the cycle basis in
 /// :param int root: Optional index for starting node for basis
 ///
@@ -3296,73 +4608,78 @@ pub fn random_geometric_graph(
 #[pyfunction]
 #[pyo3(text_signature = "(graph, /, root=None)")]
 pub fn cycle_basis(
+    py: Python,
     graph: &graph::PyGraph,
     root: Option<usize>,
 ) -> Vec<Vec<usize>> {
-    let mut root_node = root;
-    let mut graph_nodes: HashSet<NodeIndex> =
-        graph.graph.node_indices().collect();
-    let mut cycles: Vec<Vec<usize>> = Vec::new();
-    while !graph_nodes.is_empty() {
-        let temp_value: NodeIndex;
-        // If root_node is not set get an arbitrary node from the set of graph
-        // nodes we've not "examined"
-        let root_index = match root_node {
-            Some(root_value) => NodeIndex::new(root_value),
-            None => {
-                temp_value = *graph_nodes.iter().next().unwrap();
-                graph_nodes.remove(&temp_value);
-                temp_value
-            }
-        };
-        // Stack (ie "pushdown list") of vertices already in the spanning tree
-        let mut stack: Vec<NodeIndex> = vec![root_index];
-        // Map of node index to predecessor node index
-        let mut pred: HashMap<NodeIndex, NodeIndex> = HashMap::new();
-        pred.insert(root_index, root_index);
-        // Set of examined nodes during this iteration
-        let mut used: HashMap<NodeIndex, HashSet<NodeIndex>> = HashMap::new();
-        used.insert(root_index, HashSet::new());
-        // Walk the spanning tree
-        while !stack.is_empty() {
-            // Use the last element added so that cycles are easier to find
-            let z = stack.pop().unwrap();
-            for neighbor in graph.graph.neighbors(z) {
-                // A new node was encountered:
-                if !used.contains_key(&neighbor) {
-                    pred.insert(neighbor, z);
-                    stack.push(neighbor);
-                    let mut temp_set: HashSet<NodeIndex> = HashSet::new();
-                    temp_set.insert(z);
-                    used.insert(neighbor, temp_set);
-                // A self loop:
-                } else if z == neighbor {
-                    let cycle: Vec<usize> = vec![z.index()];
-                    cycles.push(cycle);
-                // A cycle was found:
-                } else if !used.get(&z).unwrap().contains(&neighbor) {
-                    let pn = used.get(&neighbor).unwrap();
-                    let mut cycle: Vec<NodeIndex> = vec![neighbor, z];
-                    let mut p = pred.get(&z).unwrap();
-                    while !pn.contains(p) {
+    py.allow_threads(|| {
+        let mut root_node = root;
+        let mut graph_nodes: HashSet<NodeIndex> =
+            graph.graph.node_indices().collect();
+        let mut cycles: Vec<Vec<usize>> = Vec::new();
+        while !graph_nodes.is_empty() {
+            let temp_value: NodeIndex;
+            // If root_node is not set get an arbitrary node from the set of graph
+            // nodes we've not "examined"
+            let root_index = match root_node {
+                Some(root_value) => NodeIndex::new(root_value),
+                None => {
+                    temp_value = *graph_nodes.iter().next().unwrap();
+                    graph_nodes.remove(&temp_value);
+                    temp_value
+                }
+            };
+            // Stack (ie "pushdown list") of vertices already in the spanning tree
+            let mut stack: Vec<NodeIndex> = vec![root_index];
+            // Map of node index to predecessor node index
+            let mut pred: HashMap<NodeIndex, NodeIndex> = HashMap::new();
+            pred.insert(root_index, root_index);
+            // Set of examined nodes during this iteration
+            let mut used: HashMap<NodeIndex, HashSet<NodeIndex>> =
+                HashMap::new();
+            used.insert(root_index, HashSet::new());
+            // Walk the spanning tree
+            while !stack.is_empty() {
+                // Use the last element added so that cycles are easier to find
+                let z = stack.pop().unwrap();
+                for neighbor in graph.graph.neighbors(z) {
+                    // A new node was encountered:
+                    if !used.contains_key(&neighbor) {
+                        pred.insert(neighbor, z);
+                        stack.push(neighbor);
+                        let mut temp_set: HashSet<NodeIndex> = HashSet::new();
+                        temp_set.insert(z);
+                        used.insert(neighbor, temp_set);
+                    // A self loop:
+                    } else if z == neighbor {
+                        let cycle: Vec<usize> = vec![z.index()];
+                        cycles.push(cycle);
+                    // A cycle was found:
+                    } else if !used.get(&z).unwrap().contains(&neighbor) {
+                        let pn = used.get(&neighbor).unwrap();
+                        let mut cycle: Vec<NodeIndex> = vec![neighbor, z];
+                        let mut p = pred.get(&z).unwrap();
+                        while !pn.contains(p) {
+                            cycle.push(*p);
+                            p = pred.get(p).unwrap();
+                        }
                         cycle.push(*p);
-                        p = pred.get(p).unwrap();
+                        cycles.push(cycle.iter().map(|x| x.index()).collect());
+                        let neighbor_set = used.get_mut(&neighbor).unwrap();
+                        neighbor_set.insert(z);
                     }
-                    cycle.push(*p);
-                    cycles.push(cycle.iter().map(|x| x.index()).collect());
-                    let neighbor_set = used.get_mut(&neighbor).unwrap();
-                    neighbor_set.insert(z);
                 }
             }
+            let mut temp_hashset: HashSet<NodeIndex> = HashSet::new();
+            for key in pred.keys() {
+                temp_hashset.insert(*key);
+            }
+            graph_nodes =
+                graph_nodes.difference(&temp_hashset).copied().collect();
+            root_node = None;
         }
-        let mut temp_hashset: HashSet<NodeIndex> = HashSet::new();
-        for key in pred.keys() {
-            temp_hashset.insert(*key);
-        }
-        graph_nodes = graph_nodes.difference(&temp_hashset).copied().collect();
-        root_node = None;
-    }
-    cycles
+        cycles
+    })
 }
 
 /// Compute a maximum-weighted matching for a :class:`~retworkx.PyGraph`
@@ -3391,6 +4708,8 @@ pub fn cycle_basis(
 ///     if the weights are all integers you can use: ``lambda x: x``. If not
 ///     specified the value for ``default_weight`` will be used for all
 ///     edge weights.
+///     It can also be an edge data key or an ``int64`` weight array, see
+///     :ref:`edge-weights`.
 /// :param int default_weight: The ``int`` value to use for all edge weights
 ///     in the graph if ``weight_fn`` is not specified. Defaults to ``1``.
 /// :param bool verify_optimum: A boolean flag to run a check that the found
@@ -3435,6 +4754,8 @@ pub fn max_weight_matching(
 ///
 /// This function is implemented using Kosaraju's algorithm
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param PyDiGraph graph: The input graph to find the strongly connected
 ///     components for.
 ///
@@ -3443,12 +4764,15 @@ pub fn max_weight_matching(
 #[pyfunction]
 #[pyo3(text_signature = "(graph, /)")]
 pub fn strongly_connected_components(
+    py: Python,
     graph: &digraph::PyDiGraph,
 ) -> Vec<Vec<usize>> {
-    algo::kosaraju_scc(graph)
-        .iter()
-        .map(|x| x.iter().map(|id| id.index()).collect())
-        .collect()
+    py.allow_threads(|| {
+        algo::kosaraju_scc(&graph.graph)
+            .iter()
+            .map(|x| x.iter().map(|id| id.index()).collect())
+            .collect()
+    })
 }
 
 /// Return the first cycle encountered during DFS of a given PyDiGraph,
@@ -3626,31 +4950,6 @@ pub fn is_maximal_matching(
     })
 }
 
-fn _graph_triangles(graph: &graph::PyGraph, node: usize) -> (usize, usize) {
-    let mut triangles: usize = 0;
-
-    let index = NodeIndex::new(node);
-    let mut neighbors: HashSet<NodeIndex> =
-        graph.graph.neighbors(index).collect();
-    neighbors.remove(&index);
-
-    for nodev in &neighbors {
-        triangles += graph
-            .graph
-            .neighbors(*nodev)
-            .filter(|&x| (x != *nodev) && neighbors.contains(&x))
-            .count();
-    }
-
-    let d: usize = neighbors.len();
-    let triples: usize = match d {
-        0 => 0,
-        _ => (d * (d - 1)) / 2,
-    };
-
-    (triangles / 2, triples)
-}
-
 /// Compute the transitivity of an undirected graph.
 ///
 /// The transitivity of a graph is defined as:
@@ -3667,89 +4966,27 @@ fn _graph_triangles(graph: &graph::PyGraph, node: usize) -> (usize, usize) {
 /// environment variable. For example, setting ``RAYON_NUM_THREADS=4`` would
 /// limit the thread pool to 4 threads.
 ///
-/// .. note::
-///
-///     The function implicitly assumes that there are no parallel edges
-///     or self loops. It may produce incorrect/unexpected results if the
-///     input graph has self loops or parallel edges.
-///
+/// The triangles are counted by orienting every edge towards its endpoint
+/// with the higher degree and intersecting the sorted neighbor lists of
+/// the endpoints of each edge. Self loops and parallel edges are ignored.
+///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param PyGraph graph: Graph to be used.
 ///
 /// :returns: Transitivity.
 /// :rtype: float
 #[pyfunction]
 #[pyo3(text_signature = "(graph, /)")]
-fn graph_transitivity(graph: &graph::PyGraph) -> f64 {
-    let node_indices: Vec<NodeIndex> = graph.graph.node_indices().collect();
-    let (triangles, triples) = node_indices
-        .par_iter()
-        .map(|node| _graph_triangles(graph, node.index()))
-        .reduce(
-            || (0, 0),
-            |(sumx, sumy), (resx, resy)| (sumx + resx, sumy + resy),
-        );
-
-    match triangles {
-        0 => 0.0,
-        _ => triangles as f64 / triples as f64,
-    }
-}
-
-fn _digraph_triangles(
-    graph: &digraph::PyDiGraph,
-    node: usize,
-) -> (usize, usize) {
-    let mut triangles: usize = 0;
-
-    let index = NodeIndex::new(node);
-    let mut out_neighbors: HashSet<NodeIndex> = graph
-        .graph
-        .neighbors_directed(index, petgraph::Direction::Outgoing)
-        .collect();
-    out_neighbors.remove(&index);
-
-    let mut in_neighbors: HashSet<NodeIndex> = graph
-        .graph
-        .neighbors_directed(index, petgraph::Direction::Incoming)
-        .collect();
-    in_neighbors.remove(&index);
-
-    let neighbors = out_neighbors.iter().chain(in_neighbors.iter());
-
-    for nodev in neighbors {
-        triangles += graph
-            .graph
-            .neighbors_directed(*nodev, petgraph::Direction::Outgoing)
-            .chain(
-                graph
-                    .graph
-                    .neighbors_directed(*nodev, petgraph::Direction::Incoming),
-            )
-            .map(|x| {
-                let mut res: usize = 0;
-
-                if (x != *nodev) && out_neighbors.contains(&x) {
-                    res += 1;
-                }
-                if (x != *nodev) && in_neighbors.contains(&x) {
-                    res += 1;
-                }
-                res
+fn graph_transitivity(py: Python, graph: &graph::PyGraph) -> f64 {
+    graph.cache.get_or_insert_with(
+        |entries| &mut entries.transitivity,
+        || {
+            py.allow_threads(|| {
+                TriangleCounts::new(&graph.graph).transitivity()
             })
-            .sum::<usize>();
-    }
-
-    let din: usize = in_neighbors.len();
-    let dout: usize = out_neighbors.len();
-
-    let dtot = dout + din;
-    let dbil: usize = out_neighbors.intersection(&in_neighbors).count();
-    let triples: usize = match dtot {
-        0 => 0,
-        _ => dtot * (dtot - 1) - 2 * dbil,
-    };
-
-    (triangles / 2, triples)
+        },
+    )
 }
 
 /// Compute the transitivity of a directed graph.
@@ -3768,11 +5005,11 @@ fn _digraph_triangles(
 /// environment variable. For example, setting ``RAYON_NUM_THREADS=4`` would
 /// limit the thread pool to 4 threads.
 ///
-/// .. note::
+/// The triangles are counted by orienting every edge towards its endpoint
+/// with the higher degree and intersecting the sorted neighbor lists of
+/// the endpoints of each edge. Self loops and parallel edges are ignored.
 ///
-///     The function implicitly assumes that there are no parallel edges
-///     or self loops. It may produce incorrect/unexpected results if the
-///     input graph has self loops or parallel edges.
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
 ///
 /// :param PyDiGraph graph: Directed graph to be used.
 ///
@@ -3783,20 +5020,158 @@ fn _digraph_triangles(
 ///    Physical Review E, 76(2), 026107 (2007)
 #[pyfunction]
 #[pyo3(text_signature = "(graph, /)")]
-fn digraph_transitivity(graph: &digraph::PyDiGraph) -> f64 {
-    let node_indices: Vec<NodeIndex> = graph.graph.node_indices().collect();
-    let (triangles, triples) = node_indices
-        .par_iter()
-        .map(|node| _digraph_triangles(graph, node.index()))
-        .reduce(
-            || (0, 0),
-            |(sumx, sumy), (resx, resy)| (sumx + resx, sumy + resy),
-        );
+fn digraph_transitivity(py: Python, graph: &digraph::PyDiGraph) -> f64 {
+    graph.cache.get_or_insert_with(
+        |entries| &mut entries.transitivity,
+        || {
+            py.allow_threads(|| {
+                TriangleCounts::new(&graph.graph).transitivity()
+            })
+        },
+    )
+}
 
-    match triangles {
-        0 => 0.0,
-        _ => triangles as f64 / triples as f64,
+fn _node_values_dict<T: ToPyObject>(
+    py: Python,
+    nodes: &[NodeIndex],
+    values: &[T],
+) -> PyResult<PyObject> {
+    let out_dict = PyDict::new(py);
+    for (node, value) in nodes.iter().zip(values) {
+        out_dict.set_item(node.index(), value)?;
     }
+    Ok(out_dict.into())
+}
+
+/// Return the number of triangles each node of an undirected graph is part
+/// of
+///
+/// This function is multithreaded and will run
+/// launch a thread pool with threads equal to the number of CPUs by default.
+/// You can tune the number of threads with the ``RAYON_NUM_THREADS``
+/// environment variable. For example, setting ``RAYON_NUM_THREADS=4`` would
+/// limit the thread pool to 4 threads.
+///
+/// Self loops and parallel edges are ignored.
+///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
+/// :param PyGraph graph: The graph to count the triangles of
+///
+/// :returns: A dictionary keyed by node index to the number of triangles
+/// :rtype: dict
+#[pyfunction]
+#[pyo3(text_signature = "(graph, /)")]
+pub fn graph_triangles(
+    py: Python,
+    graph: &graph::PyGraph,
+) -> PyResult<PyObject> {
+    let counts = py.allow_threads(|| TriangleCounts::new(&graph.graph));
+    _node_values_dict(py, &counts.nodes, &counts.triangles)
+}
+
+/// Return the number of directed triangles each node of a directed graph is
+/// part of
+///
+/// As in :func:`~retworkx.digraph_transitivity` different edge orientations
+/// count as different triangles, as defined in [Fag]_, so three nodes with
+/// edges in both directions between every pair form 8 triangles at each
+/// node.
+///
+/// This function is multithreaded and will run
+/// launch a thread pool with threads equal to the number of CPUs by default.
+/// You can tune the number of threads with the ``RAYON_NUM_THREADS``
+/// environment variable. For example, setting ``RAYON_NUM_THREADS=4`` would
+/// limit the thread pool to 4 threads.
+///
+/// Self loops and parallel edges are ignored.
+///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
+/// :param PyDiGraph graph: The directed graph to count the triangles of
+///
+/// :returns: A dictionary keyed by node index to the number of triangles
+/// :rtype: dict
+#[pyfunction]
+#[pyo3(text_signature = "(graph, /)")]
+pub fn digraph_triangles(
+    py: Python,
+    graph: &digraph::PyDiGraph,
+) -> PyResult<PyObject> {
+    let counts = py.allow_threads(|| TriangleCounts::new(&graph.graph));
+    _node_values_dict(py, &counts.nodes, &counts.triangles)
+}
+
+/// Return the local clustering coefficient of each node of an undirected
+/// graph
+///
+/// The local clustering coefficient of a node is the number of triangles it
+/// is part of divided by the number of pairs of its neighbors, or 0 if it
+/// has fewer than 2 neighbors.
+///
+/// This function is multithreaded and will run
+/// launch a thread pool with threads equal to the number of CPUs by default.
+/// You can tune the number of threads with the ``RAYON_NUM_THREADS``
+/// environment variable. For example, setting ``RAYON_NUM_THREADS=4`` would
+/// limit the thread pool to 4 threads.
+///
+/// Self loops and parallel edges are ignored.
+///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
+/// :param PyGraph graph: The graph to compute the clustering coefficients of
+///
+/// :returns: A dictionary keyed by node index to the clustering coefficient
+/// :rtype: dict
+#[pyfunction]
+#[pyo3(text_signature = "(graph, /)")]
+pub fn graph_local_clustering_coefficient(
+    py: Python,
+    graph: &graph::PyGraph,
+) -> PyResult<PyObject> {
+    let (nodes, clustering) = py.allow_threads(|| {
+        let counts = TriangleCounts::new(&graph.graph);
+        let clustering = counts.clustering();
+        (counts.nodes, clustering)
+    });
+    _node_values_dict(py, &nodes, &clustering)
+}
+
+/// Return the local clustering coefficient of each node of a directed graph
+///
+/// The local clustering coefficient of a node is the number of directed
+/// triangles it is part of, as counted by
+/// :func:`~retworkx.digraph_triangles`, divided by the number of directed
+/// triangles it could be part of, as defined in [Fag]_ Eq.6. It is 0 if a
+/// node has no triangles.
+///
+/// This function is multithreaded and will run
+/// launch a thread pool with threads equal to the number of CPUs by default.
+/// You can tune the number of threads with the ``RAYON_NUM_THREADS``
+/// environment variable. For example, setting ``RAYON_NUM_THREADS=4`` would
+/// limit the thread pool to 4 threads.
+///
+/// Self loops and parallel edges are ignored.
+///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
+/// :param PyDiGraph graph: The directed graph to compute the clustering
+///     coefficients of
+///
+/// :returns: A dictionary keyed by node index to the clustering coefficient
+/// :rtype: dict
+#[pyfunction]
+#[pyo3(text_signature = "(graph, /)")]
+pub fn digraph_local_clustering_coefficient(
+    py: Python,
+    graph: &digraph::PyDiGraph,
+) -> PyResult<PyObject> {
+    let (nodes, clustering) = py.allow_threads(|| {
+        let counts = TriangleCounts::new(&graph.graph);
+        let clustering = counts.clustering();
+        (counts.nodes, clustering)
+    });
+    _node_values_dict(py, &nodes, &clustering)
 }
 
 pub fn _core_number<Ty>(
@@ -3804,64 +5179,68 @@ pub fn _core_number<Ty>(
     graph: &StableGraph<PyObject, PyObject, Ty>,
 ) -> PyResult<PyObject>
 where
-    Ty: EdgeType,
+    Ty: EdgeType + Sync,
 {
     let node_num = graph.node_count();
     if node_num == 0 {
         return Ok(PyDict::new(py).into());
     }
 
-    let mut cores: HashMap<NodeIndex, usize> = HashMap::with_capacity(node_num);
-    let mut node_vec: Vec<NodeIndex> = graph.node_indices().collect();
-    let mut degree_map: HashMap<NodeIndex, usize> =
-        HashMap::with_capacity(node_num);
-    let mut nbrs: HashMap<NodeIndex, HashSet<NodeIndex>> =
-        HashMap::with_capacity(node_num);
-    let mut node_pos: HashMap<NodeIndex, usize> =
-        HashMap::with_capacity(node_num);
-
-    for k in node_vec.iter() {
-        let k_nbrs: HashSet<NodeIndex> =
-            graph.neighbors_undirected(*k).collect();
-        let k_deg = k_nbrs.len();
-
-        nbrs.insert(*k, k_nbrs);
-        cores.insert(*k, k_deg);
-        degree_map.insert(*k, k_deg);
-    }
-    node_vec.par_sort_by_key(|k| degree_map.get(k));
-
-    let mut bin_boundaries: Vec<usize> =
-        Vec::with_capacity(degree_map[&node_vec[node_num - 1]] + 1);
-    bin_boundaries.push(0);
-    let mut curr_degree = 0;
-    for (i, v) in node_vec.iter().enumerate() {
-        node_pos.insert(*v, i);
-        let v_degree = degree_map[v];
-        if v_degree > curr_degree {
-            for _ in 0..v_degree - curr_degree {
-                bin_boundaries.push(i);
+    let cores = py.allow_threads(|| {
+        let mut cores: HashMap<NodeIndex, usize> =
+            HashMap::with_capacity(node_num);
+        let mut node_vec: Vec<NodeIndex> = graph.node_indices().collect();
+        let mut degree_map: HashMap<NodeIndex, usize> =
+            HashMap::with_capacity(node_num);
+        let mut nbrs: HashMap<NodeIndex, HashSet<NodeIndex>> =
+            HashMap::with_capacity(node_num);
+        let mut node_pos: HashMap<NodeIndex, usize> =
+            HashMap::with_capacity(node_num);
+
+        for k in node_vec.iter() {
+            let k_nbrs: HashSet<NodeIndex> =
+                graph.neighbors_undirected(*k).collect();
+            let k_deg = k_nbrs.len();
+
+            nbrs.insert(*k, k_nbrs);
+            cores.insert(*k, k_deg);
+            degree_map.insert(*k, k_deg);
+        }
+        node_vec.par_sort_by_key(|k| degree_map.get(k));
+
+        let mut bin_boundaries: Vec<usize> =
+            Vec::with_capacity(degree_map[&node_vec[node_num - 1]] + 1);
+        bin_boundaries.push(0);
+        let mut curr_degree = 0;
+        for (i, v) in node_vec.iter().enumerate() {
+            node_pos.insert(*v, i);
+            let v_degree = degree_map[v];
+            if v_degree > curr_degree {
+                for _ in 0..v_degree - curr_degree {
+                    bin_boundaries.push(i);
+                }
+                curr_degree = v_degree;
             }
-            curr_degree = v_degree;
         }
-    }
 
-    for v_ind in 0..node_vec.len() {
-        let v = node_vec[v_ind];
-        let v_nbrs = nbrs[&v].clone();
-        for u in v_nbrs {
-            if cores[&u] > cores[&v] {
-                nbrs.get_mut(&u).unwrap().remove(&v);
-                let pos = node_pos[&u];
-                let bin_start = bin_boundaries[cores[&u]];
-                *node_pos.get_mut(&u).unwrap() = bin_start;
-                *node_pos.get_mut(&node_vec[bin_start]).unwrap() = pos;
-                node_vec.swap(bin_start, pos);
-                bin_boundaries[cores[&u]] += 1;
-                *cores.get_mut(&u).unwrap() -= 1;
+        for v_ind in 0..node_vec.len() {
+            let v = node_vec[v_ind];
+            let v_nbrs = nbrs[&v].clone();
+            for u in v_nbrs {
+                if cores[&u] > cores[&v] {
+                    nbrs.get_mut(&u).unwrap().remove(&v);
+                    let pos = node_pos[&u];
+                    let bin_start = bin_boundaries[cores[&u]];
+                    *node_pos.get_mut(&u).unwrap() = bin_start;
+                    *node_pos.get_mut(&node_vec[bin_start]).unwrap() = pos;
+                    node_vec.swap(bin_start, pos);
+                    bin_boundaries[cores[&u]] += 1;
+                    *cores.get_mut(&u).unwrap() -= 1;
+                }
             }
         }
-    }
+        cores
+    });
 
     let out_dict = PyDict::new(py);
     for (v_index, core) in cores {
@@ -3880,6 +5259,8 @@ where
 ///     or self loops. It may produce incorrect/unexpected results if the
 ///     input graph has self loops or parallel edges.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param PyGraph: The graph to get core numbers
 ///
 /// :returns: A dictionary keyed by node index to the core number
@@ -3904,6 +5285,8 @@ pub fn graph_core_number(
 ///     or self loops. It may produce incorrect/unexpected results if the
 ///     input graph has self loops or parallel edges.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param PyDiGraph: The directed graph to get core numbers
 ///
 /// :returns: A dictionary keyed by node index to the core number
@@ -3933,6 +5316,8 @@ pub fn digraph_core_number(
 ///         minimum_spanning_edges(graph, weight_fn: float)
 ///
 ///     to cast the edge object as a float as the weight.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 /// :param float default_weight: If ``weight_fn`` isn't specified this optional
 ///     float value will be used for the weight/cost of each edge.
 ///
@@ -3949,11 +5334,12 @@ pub fn minimum_spanning_edges(
 ) -> PyResult<WeightedEdgeList> {
     let mut subgraphs = UnionFind::<usize>::new(graph.graph.node_bound());
 
+    let edge_weights =
+        EdgeWeights::new(py, &graph.graph, weight_fn, default_weight)?;
     let mut edge_list: Vec<(f64, EdgeReference<PyObject>)> =
         Vec::with_capacity(graph.graph.edge_count());
     for edge in graph.edge_references() {
-        let weight =
-            weight_callable(py, &weight_fn, edge.weight(), default_weight)?;
+        let weight = edge_weights.weight(py, edge.id(), edge.weight())?;
         if weight.is_nan() {
             return Err(PyValueError::new_err("NaN found as an edge weight"));
         }
@@ -3996,6 +5382,8 @@ pub fn minimum_spanning_edges(
 ///         minimum_spanning_tree(graph, weight_fn: float)
 ///
 ///     to cast the edge object as a float as the weight.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 /// :param float default_weight: If ``weight_fn`` isn't specified this optional
 ///     float value will be used for the weight/cost of each edge.
 ///
@@ -4126,13 +5514,17 @@ fn _spring_layout<Ty>(
     scale: Option<f64>,
     center: Option<layout::Point>,
     seed: Option<u64>,
+    theta: Option<f64>,
 ) -> PyResult<Pos2DMapping>
 where
-    Ty: EdgeType,
+    Ty: EdgeType + Sync,
 {
     if fixed.is_some() && pos.is_none() {
         return Err(PyValueError::new_err("`fixed` specified but `pos` not."));
     }
+    if theta.map_or(false, |theta| theta.is_nan() || theta < 0.0) {
+        return Err(PyValueError::new_err("`theta` must be non-negative."));
+    }
 
     let mut rng: Pcg64 = match seed {
         Some(seed) => Pcg64::seed_from_u64(seed),
@@ -4158,10 +5550,11 @@ where
     let tol = tol.unwrap_or(1e-6);
     let step = 0.1;
 
+    let edge_weights = EdgeWeights::new(py, graph, weight_fn, default_weight)?;
     let mut weights: HashMap<(usize, usize), f64> =
         HashMap::with_capacity(2 * graph.edge_count());
     for e in graph.edge_references() {
-        let w = weight_callable(py, &weight_fn, e.weight(), default_weight)?;
+        let w = edge_weights.weight(py, e.id(), e.weight())?;
         let source = e.source().index();
         let target = e.target().index();
 
@@ -4169,22 +5562,22 @@ where
         weights.insert((target, source), w);
     }
 
-    let pos = match adaptive_cooling {
+    let pos = py.allow_threads(|| match adaptive_cooling {
         Some(false) => {
             let cs = layout::LinearCoolingScheme::new(step, num_iter);
             layout::evolve(
                 graph, vpos, fixed, f_a, f_r, cs, num_iter, tol, weights,
-                scale, center,
+                scale, center, theta,
             )
         }
         _ => {
             let cs = layout::AdaptiveCoolingScheme::new(step);
             layout::evolve(
                 graph, vpos, fixed, f_a, f_r, cs, num_iter, tol, weights,
-                scale, center,
+                scale, center, theta,
             )
         }
-    };
+    });
 
     Ok(Pos2DMapping {
         pos_map: graph
@@ -4204,6 +5597,8 @@ where
 /// as repelling objects, sometimes called an anti-gravity force.
 /// Simulation continues until the positions are close to an equilibrium.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param PyGraph graph: Graph to be used.
 /// :param dict pos:
 ///     Initial node positions as a dictionary with node ids as keys and values
@@ -4228,6 +5623,8 @@ where
 /// :param weight_fn: An optional weight function for an edge. It will accept
 ///     a single argument, the edge's weight object and will return a float
 ///     which will be used to represent the weight of the edge.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 /// :param float (default=1) default_weight: If ``weight_fn`` isn't specified
 ///     this optional float value will be used for the weight/cost of each edge
 /// :param float|None scale: Scale factor for positions.
@@ -4236,6 +5633,14 @@ where
 /// :param list center: Coordinate pair around which to center
 ///     the layout. Not used unless fixed is ``None``. (``default=None``)
 /// :param int seed: An optional seed to use for the random number generator
+/// :param float theta: If set, approximate the repulsive forces with the
+///     Barnes-Hut algorithm instead of computing them between every pair of
+///     nodes. Groups of nodes whose extent divided by their distance from a
+///     node is less than ``theta`` are treated as a single node, so larger
+///     values are faster but less accurate, a typical value is ``0.5``. In
+///     this mode the forces on all nodes are computed in parallel from the
+///     positions at the start of each iteration. If ``None`` the exact
+///     forces are used. (``default=None``)
 ///
 /// :returns: A dictionary of positions keyed by node id.
 /// :rtype: dict
@@ -4243,7 +5648,7 @@ where
 #[pyo3(
     text_signature = "(graph, pos=None, fixed=None, k=None, repulsive_exponent=2, adaptive_cooling=True,
                      num_iter=50, tol=1e-6, weight_fn=None, default_weight=1, scale=1,
-                     center=None, seed=None, /)"
+                     center=None, seed=None, theta=None, /)"
 )]
 #[allow(clippy::too_many_arguments)]
 pub fn graph_spring_layout(
@@ -4261,6 +5666,7 @@ pub fn graph_spring_layout(
     scale: Option<f64>,
     center: Option<layout::Point>,
     seed: Option<u64>,
+    theta: Option<f64>,
 ) -> PyResult<Pos2DMapping> {
     _spring_layout(
         py,
@@ -4277,6 +5683,7 @@ pub fn graph_spring_layout(
         scale,
         center,
         seed,
+        theta,
     )
 }
 
@@ -4287,6 +5694,8 @@ pub fn graph_spring_layout(
 /// as repelling objects, sometimes called an anti-gravity force.
 /// Simulation continues until the positions are close to an equilibrium.
 ///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
 /// :param PyGraph graph: Graph to be used.
 /// :param dict pos:
 ///     Initial node positions as a dictionary with node ids as keys and values
@@ -4311,6 +5720,8 @@ pub fn graph_spring_layout(
 /// :param weight_fn: An optional weight function for an edge. It will accept
 ///     a single argument, the edge's weight object and will return a float
 ///     which will be used to represent the weight of the edge.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
 /// :param float (default=1) default_weight: If ``weight_fn`` isn't specified
 ///     this optional float value will be used for the weight/cost of each edge
 /// :param float|None scale: Scale factor for positions.
@@ -4319,6 +5730,14 @@ pub fn graph_spring_layout(
 /// :param list center: Coordinate pair around which to center
 ///     the layout. Not used unless fixed is ``None``. (``default=None``)
 /// :param int seed: An optional seed to use for the random number generator
+/// :param float theta: If set, approximate the repulsive forces with the
+///     Barnes-Hut algorithm instead of computing them between every pair of
+///     nodes. Groups of nodes whose extent divided by their distance from a
+///     node is less than ``theta`` are treated as a single node, so larger
+///     values are faster but less accurate, a typical value is ``0.5``. In
+///     this mode the forces on all nodes are computed in parallel from the
+///     positions at the start of each iteration. If ``None`` the exact
+///     forces are used. (``default=None``)
 ///
 /// :returns: A dictionary of positions keyed by node id.
 /// :rtype: dict
@@ -4326,7 +5745,7 @@ pub fn graph_spring_layout(
 #[pyo3(
     text_signature = "(graph, pos=None, fixed=None, k=None, repulsive_exponent=2, adaptive_cooling=True,
                      num_iter=50, tol=1e-6, weight_fn=None, default_weight=1, scale=1,
-                     center=None, seed=None, /)"
+                     center=None, seed=None, theta=None, /)"
 )]
 #[allow(clippy::too_many_arguments)]
 pub fn digraph_spring_layout(
@@ -4344,6 +5763,7 @@ pub fn digraph_spring_layout(
     scale: Option<f64>,
     center: Option<layout::Point>,
     seed: Option<u64>,
+    theta: Option<f64>,
 ) -> PyResult<Pos2DMapping> {
     _spring_layout(
         py,
@@ -4360,6 +5780,237 @@ pub fn digraph_spring_layout(
         scale,
         center,
         seed,
+        theta,
+    )
+}
+
+#[allow(clippy::too_many_arguments)]
+fn _multilevel_layout<Ty>(
+    py: Python,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    k: Option<f64>,
+    repulsive_exponent: i32,
+    num_iter: usize,
+    tol: f64,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+    scale: Option<f64>,
+    center: Option<layout::Point>,
+    seed: Option<u64>,
+    theta: Option<f64>,
+) -> PyResult<Pos2DMapping>
+where
+    Ty: EdgeType + Sync,
+{
+    if theta.map_or(false, |theta| theta.is_nan() || theta < 0.0) {
+        return Err(PyValueError::new_err("`theta` must be non-negative."));
+    }
+    let edge_weights = EdgeWeights::new(py, graph, weight_fn, default_weight)?
+        .into_vec(py, graph)?;
+    let pos = py.allow_threads(|| {
+        layout::multilevel_layout(
+            graph,
+            edge_weights,
+            k,
+            repulsive_exponent,
+            num_iter,
+            tol,
+            scale,
+            center,
+            seed,
+            theta,
+        )
+    });
+    Ok(Pos2DMapping {
+        pos_map: graph
+            .node_indices()
+            .map(|n| {
+                let n = n.index();
+                (n, pos[n])
+            })
+            .collect(),
+    })
+}
+
+/// Position nodes with a multilevel force-directed layout.
+///
+/// The graph is repeatedly coarsened by merging the endpoints of a heavy
+/// edge matching until it has only a few nodes. The coarsest graph is laid
+/// out with the Fruchterman-Reingold force-directed algorithm used by
+/// :func:`~retworkx.graph_spring_layout`, then the positions are carried
+/// back to each finer graph, placing every node close to the node it was
+/// merged into, and refined there. This untangles large graphs in far fewer
+/// iterations than starting the spring layout from random positions.
+///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
+/// :param PyGraph graph: Graph to be used.
+/// :param float k:
+///     Optimal distance between nodes. If ``None`` the distance is set to
+///     :math:`\frac{1}{\sqrt{n}}` where :math:`n` is the number of nodes.
+///     Increase this value to move nodes farther apart. (``default=None``)
+/// :param int repulsive_exponent:
+///     Repulsive force exponent. (``default=2``)
+/// :param int num_iter:
+///     Maximum number of iterations at each level. (``default=50``)
+/// :param float tol:
+///     Threshold for relative error in node position changes.
+///     The iterations at a level stop if the error is below this threshold.
+///     (``default = 1e-6``)
+/// :param weight_fn: An optional weight function for an edge. It will accept
+///     a single argument, the edge's weight object and will return a float
+///     which will be used to represent the weight of the edge.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
+/// :param float default_weight: If ``weight_fn`` isn't specified
+///     this optional float value will be used for the weight of each edge.
+///     (``default=1.0``)
+/// :param float|None scale: Scale factor for positions. If scale is ``None``,
+///     no re-scaling is performed. (``default=1.0``)
+/// :param list center: Coordinate pair around which to center
+///     the layout. (``default=None``)
+/// :param int seed: An optional seed to use for the random number generator
+/// :param float theta: If set, approximate the repulsive forces with the
+///     Barnes-Hut algorithm, see :func:`~retworkx.graph_spring_layout`.
+///     (``default=None``)
+///
+/// :returns: A dictionary of positions keyed by node id.
+/// :rtype: Pos2DMapping
+#[pyfunction(
+    k = "None",
+    repulsive_exponent = "2",
+    num_iter = "50",
+    tol = "1e-6",
+    weight_fn = "None",
+    default_weight = "1.0",
+    scale = "Some(1.0)",
+    center = "None",
+    seed = "None",
+    theta = "None"
+)]
+#[pyo3(
+    text_signature = "(graph, /, k=None, repulsive_exponent=2, num_iter=50, tol=1e-6, weight_fn=None,
+                     default_weight=1.0, scale=1.0, center=None, seed=None, theta=None)"
+)]
+#[allow(clippy::too_many_arguments)]
+pub fn graph_multilevel_layout(
+    py: Python,
+    graph: &graph::PyGraph,
+    k: Option<f64>,
+    repulsive_exponent: i32,
+    num_iter: usize,
+    tol: f64,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+    scale: Option<f64>,
+    center: Option<layout::Point>,
+    seed: Option<u64>,
+    theta: Option<f64>,
+) -> PyResult<Pos2DMapping> {
+    _multilevel_layout(
+        py,
+        &graph.graph,
+        k,
+        repulsive_exponent,
+        num_iter,
+        tol,
+        weight_fn,
+        default_weight,
+        scale,
+        center,
+        seed,
+        theta,
+    )
+}
+
+/// Position nodes with a multilevel force-directed layout.
+///
+/// The graph is repeatedly coarsened by merging the endpoints of a heavy
+/// edge matching until it has only a few nodes. The coarsest graph is laid
+/// out with the Fruchterman-Reingold force-directed algorithm used by
+/// :func:`~retworkx.digraph_spring_layout`, then the positions are carried
+/// back to each finer graph, placing every node close to the node it was
+/// merged into, and refined there. This untangles large graphs in far fewer
+/// iterations than starting the spring layout from random positions.
+///
+/// This function can release the GIL while it runs, see :ref:`gil-release`.
+///
+/// :param PyDiGraph graph: Graph to be used.
+/// :param float k:
+///     Optimal distance between nodes. If ``None`` the distance is set to
+///     :math:`\frac{1}{\sqrt{n}}` where :math:`n` is the number of nodes.
+///     Increase this value to move nodes farther apart. (``default=None``)
+/// :param int repulsive_exponent:
+///     Repulsive force exponent. (``default=2``)
+/// :param int num_iter:
+///     Maximum number of iterations at each level. (``default=50``)
+/// :param float tol:
+///     Threshold for relative error in node position changes.
+///     The iterations at a level stop if the error is below this threshold.
+///     (``default = 1e-6``)
+/// :param weight_fn: An optional weight function for an edge. It will accept
+///     a single argument, the edge's weight object and will return a float
+///     which will be used to represent the weight of the edge.
+///     It can also be an edge data key or a weight array, see
+///     :ref:`edge-weights`.
+/// :param float default_weight: If ``weight_fn`` isn't specified
+///     this optional float value will be used for the weight of each edge.
+///     (``default=1.0``)
+/// :param float|None scale: Scale factor for positions. If scale is ``None``,
+///     no re-scaling is performed. (``default=1.0``)
+/// :param list center: Coordinate pair around which to center
+///     the layout. (``default=None``)
+/// :param int seed: An optional seed to use for the random number generator
+/// :param float theta: If set, approximate the repulsive forces with the
+///     Barnes-Hut algorithm, see :func:`~retworkx.digraph_spring_layout`.
+///     (``default=None``)
+///
+/// :returns: A dictionary of positions keyed by node id.
+/// :rtype: Pos2DMapping
+#[pyfunction(
+    k = "None",
+    repulsive_exponent = "2",
+    num_iter = "50",
+    tol = "1e-6",
+    weight_fn = "None",
+    default_weight = "1.0",
+    scale = "Some(1.0)",
+    center = "None",
+    seed = "None",
+    theta = "None"
+)]
+#[pyo3(
+    text_signature = "(graph, /, k=None, repulsive_exponent=2, num_iter=50, tol=1e-6, weight_fn=None,
+                     default_weight=1.0, scale=1.0, center=None, seed=None, theta=None)"
+)]
+#[allow(clippy::too_many_arguments)]
+pub fn digraph_multilevel_layout(
+    py: Python,
+    graph: &digraph::PyDiGraph,
+    k: Option<f64>,
+    repulsive_exponent: i32,
+    num_iter: usize,
+    tol: f64,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+    scale: Option<f64>,
+    center: Option<layout::Point>,
+    seed: Option<u64>,
+    theta: Option<f64>,
+) -> PyResult<Pos2DMapping> {
+    _multilevel_layout(
+        py,
+        &graph.graph,
+        k,
+        repulsive_exponent,
+        num_iter,
+        tol,
+        weight_fn,
+        default_weight,
+        scale,
+        center,
+        seed,
+        theta,
     )
 }
 
@@ -4774,6 +6425,10 @@ fn retworkx(py: Python<'_>, m: &PyModule) -> PyResult<()> {
     m.add_wrapped(wrap_pyfunction!(graph_is_isomorphic))?;
     m.add_wrapped(wrap_pyfunction!(digraph_is_subgraph_isomorphic))?;
     m.add_wrapped(wrap_pyfunction!(graph_is_subgraph_isomorphic))?;
+    m.add_wrapped(wrap_pyfunction!(digraph_vf2_mapping))?;
+    m.add_wrapped(wrap_pyfunction!(graph_vf2_mapping))?;
+    m.add_wrapped(wrap_pyfunction!(digraph_weisfeiler_lehman_graph_hash))?;
+    m.add_wrapped(wrap_pyfunction!(graph_weisfeiler_lehman_graph_hash))?;
     m.add_wrapped(wrap_pyfunction!(digraph_union))?;
     m.add_wrapped(wrap_pyfunction!(topological_sort))?;
     m.add_wrapped(wrap_pyfunction!(descendants))?;
@@ -4789,6 +6444,8 @@ fn retworkx(py: Python<'_>, m: &PyModule) -> PyResult<()> {
     m.add_wrapped(wrap_pyfunction!(digraph_distance_matrix))?;
     m.add_wrapped(wrap_pyfunction!(digraph_adjacency_matrix))?;
     m.add_wrapped(wrap_pyfunction!(graph_adjacency_matrix))?;
+    m.add_wrapped(wrap_pyfunction!(digraph_sparse_adjacency_matrix))?;
+    m.add_wrapped(wrap_pyfunction!(graph_sparse_adjacency_matrix))?;
     m.add_wrapped(wrap_pyfunction!(graph_all_simple_paths))?;
     m.add_wrapped(wrap_pyfunction!(digraph_all_simple_paths))?;
     m.add_wrapped(wrap_pyfunction!(graph_dijkstra_shortest_paths))?;
@@ -4796,9 +6453,30 @@ fn retworkx(py: Python<'_>, m: &PyModule) -> PyResult<()> {
     m.add_wrapped(wrap_pyfunction!(graph_dijkstra_shortest_path_lengths))?;
     m.add_wrapped(wrap_pyfunction!(digraph_dijkstra_shortest_path_lengths))?;
     m.add_wrapped(wrap_pyfunction!(digraph_all_pairs_dijkstra_path_lengths))?;
+    m.add_wrapped(wrap_pyfunction!(
+        digraph_all_pairs_dijkstra_path_lengths_numpy
+    ))?;
     m.add_wrapped(wrap_pyfunction!(digraph_all_pairs_dijkstra_shortest_paths))?;
+    m.add_wrapped(wrap_pyfunction!(digraph_all_pairs_dijkstra_predecessors))?;
     m.add_wrapped(wrap_pyfunction!(graph_all_pairs_dijkstra_path_lengths))?;
+    m.add_wrapped(wrap_pyfunction!(
+        graph_all_pairs_dijkstra_path_lengths_numpy
+    ))?;
     m.add_wrapped(wrap_pyfunction!(graph_all_pairs_dijkstra_shortest_paths))?;
+    m.add_wrapped(wrap_pyfunction!(graph_all_pairs_dijkstra_predecessors))?;
+    m.add_wrapped(wrap_pyfunction!(path_from_predecessors))?;
+    m.add_wrapped(wrap_pyfunction!(digraph_batch_dijkstra_path_lengths))?;
+    m.add_wrapped(wrap_pyfunction!(digraph_batch_dijkstra_path_lengths_numpy))?;
+    m.add_wrapped(wrap_pyfunction!(
+        digraph_multi_source_dijkstra_path_lengths
+    ))?;
+    m.add_wrapped(wrap_pyfunction!(graph_batch_dijkstra_path_lengths))?;
+    m.add_wrapped(wrap_pyfunction!(graph_batch_dijkstra_path_lengths_numpy))?;
+    m.add_wrapped(wrap_pyfunction!(graph_multi_source_dijkstra_path_lengths))?;
+    m.add_wrapped(wrap_pyfunction!(digraph_bidirectional_dijkstra))?;
+    m.add_wrapped(wrap_pyfunction!(digraph_bidirectional_bfs))?;
+    m.add_wrapped(wrap_pyfunction!(graph_bidirectional_dijkstra))?;
+    m.add_wrapped(wrap_pyfunction!(graph_bidirectional_bfs))?;
     m.add_wrapped(wrap_pyfunction!(graph_astar_shortest_path))?;
     m.add_wrapped(wrap_pyfunction!(digraph_astar_shortest_path))?;
     m.add_wrapped(wrap_pyfunction!(graph_greedy_color))?;
@@ -4823,6 +6501,10 @@ fn retworkx(py: Python<'_>, m: &PyModule) -> PyResult<()> {
     m.add_wrapped(wrap_pyfunction!(digraph_transitivity))?;
     m.add_wrapped(wrap_pyfunction!(graph_core_number))?;
     m.add_wrapped(wrap_pyfunction!(digraph_core_number))?;
+    m.add_wrapped(wrap_pyfunction!(graph_triangles))?;
+    m.add_wrapped(wrap_pyfunction!(digraph_triangles))?;
+    m.add_wrapped(wrap_pyfunction!(graph_local_clustering_coefficient))?;
+    m.add_wrapped(wrap_pyfunction!(digraph_local_clustering_coefficient))?;
     m.add_wrapped(wrap_pyfunction!(graph_complement))?;
     m.add_wrapped(wrap_pyfunction!(digraph_complement))?;
     m.add_wrapped(wrap_pyfunction!(graph_random_layout))?;
@@ -4837,6 +6519,8 @@ fn retworkx(py: Python<'_>, m: &PyModule) -> PyResult<()> {
     m.add_wrapped(wrap_pyfunction!(digraph_spiral_layout))?;
     m.add_wrapped(wrap_pyfunction!(graph_spring_layout))?;
     m.add_wrapped(wrap_pyfunction!(digraph_spring_layout))?;
+    m.add_wrapped(wrap_pyfunction!(graph_multilevel_layout))?;
+    m.add_wrapped(wrap_pyfunction!(digraph_multilevel_layout))?;
     m.add_wrapped(wrap_pyfunction!(digraph_num_shortest_paths_unweighted))?;
     m.add_wrapped(wrap_pyfunction!(graph_num_shortest_paths_unweighted))?;
     m.add_class::<digraph::PyDiGraph>()?;
@@ -4854,6 +6538,8 @@ fn retworkx(py: Python<'_>, m: &PyModule) -> PyResult<()> {
     m.add_class::<iterators::AllPairsPathMapping>()?;
     m.add_class::<iterators::NodesCountMapping>()?;
     m.add_class::<iterators::NodeMap>()?;
+    m.add_class::<isomorphism::DiGraphVf2Mapping>()?;
+    m.add_class::<isomorphism::GraphVf2Mapping>()?;
     m.add_wrapped(wrap_pymodule!(generators))?;
     Ok(())
 }
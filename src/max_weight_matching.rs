@@ -27,22 +27,55 @@ use petgraph::graph::NodeIndex;
 use petgraph::visit::{EdgeRef, IntoEdgeReferences};
 
 use crate::graph::PyGraph;
-use pyo3::exceptions::PyException;
+use numpy::PyReadonlyArray1;
+use pyo3::exceptions::{PyException, PyValueError};
 use pyo3::prelude::*;
+use pyo3::types::PyString;
 
-fn weight_callable(
+/// Get the integer weight of every edge in the graph indexed by edge index
+///
+/// ``weight_fn`` can either be a callable that is passed the edge's data
+/// payload, the name of the key to look up the weight with in each edge's
+/// data payload, or a 1 dimensional ``int64`` numpy array indexed by edge
+/// index.
+fn edge_weights(
     py: Python,
-    weight: PyObject,
+    graph: &PyGraph,
     weight_fn: &Option<PyObject>,
     default: i128,
-) -> PyResult<i128> {
-    match weight_fn {
-        Some(weight_fn) => {
-            let res = weight_fn.call1(py, (weight,))?;
-            res.extract(py)
+) -> PyResult<Vec<i128>> {
+    let edge_bound = graph.graph.edge_bound();
+    let mut weights: Vec<i128> = vec![default; edge_bound];
+    let weight_fn = match weight_fn {
+        Some(weight_fn) => weight_fn,
+        None => return Ok(weights),
+    };
+    let weight_obj = weight_fn.as_ref(py);
+    if let Ok(array) = weight_obj.extract::<PyReadonlyArray1<i64>>() {
+        let array = array.as_array();
+        if array.len() < edge_bound {
+            return Err(PyValueError::new_err(format!(
+                "Weight array has {} elements but the graph has an edge \
+                 index bound of {}",
+                array.len(),
+                edge_bound
+            )));
+        }
+        for (weight, value) in weights.iter_mut().zip(array.iter()) {
+            *weight = *value as i128;
+        }
+    } else if weight_obj.cast_as::<PyString>().is_ok() {
+        for edge in graph.graph.edge_references() {
+            weights[edge.id().index()] =
+                edge.weight().as_ref(py).get_item(weight_fn)?.extract()?;
+        }
+    } else {
+        for edge in graph.graph.edge_references() {
+            weights[edge.id().index()] =
+                weight_fn.call1(py, (edge.weight(),))?.extract(py)?;
         }
-        None => Ok(default),
     }
+    Ok(weights)
 }
 
 /// Return 2 * slack of edge k (does not work inside blossoms).
@@ -883,15 +916,11 @@ pub fn max_weight_matching(
         .enumerate()
         .map(|(index, node_index)| (node_index, index))
         .collect();
+    let weights = edge_weights(py, graph, &weight_fn, default_weight)?;
     let mut edges: Vec<(usize, usize, i128)> = Vec::with_capacity(num_edges);
     let mut max_weight: i128 = 0;
     for edge in graph.graph.edge_references() {
-        let edge_weight: i128 = weight_callable(
-            py,
-            edge.weight().clone_ref(py),
-            &weight_fn,
-            default_weight,
-        )?;
+        let edge_weight: i128 = weights[edge.id().index()];
         if edge_weight > max_weight {
             max_weight = edge_weight;
         };
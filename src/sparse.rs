@@ -0,0 +1,369 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+use std::convert::TryInto;
+
+use ndarray::ArrayView1;
+use numpy::{IntoPyArray, PyReadonlyArray1};
+use pyo3::exceptions::{PyTypeError, PyValueError};
+use pyo3::prelude::*;
+
+use petgraph::graph::NodeIndex;
+use petgraph::stable_graph::StableGraph;
+use petgraph::visit::{EdgeRef, IntoEdgeReferences};
+use petgraph::EdgeType;
+
+use super::weights::EdgeWeights;
+
+/// The edges of a graph in compressed sparse row (CSR) form
+///
+/// Rows and columns are compact node positions, ``node_map[position]`` is
+/// the node index at that position. For undirected graphs every edge which
+/// is not a self loop is stored in the rows of both of its endpoints.
+pub struct CsrGraph {
+    pub indptr: Vec<i64>,
+    pub indices: Vec<i64>,
+    pub edge_ids: Vec<i64>,
+    pub node_map: Vec<i64>,
+}
+
+impl CsrGraph {
+    pub fn new<Ty: EdgeType>(
+        graph: &StableGraph<PyObject, PyObject, Ty>,
+    ) -> Self {
+        let mut position: Vec<usize> = vec![0; graph.node_bound()];
+        let node_map: Vec<i64> = graph
+            .node_indices()
+            .enumerate()
+            .map(|(pos, node)| {
+                position[node.index()] = pos;
+                node.index() as i64
+            })
+            .collect();
+        let num_nodes = node_map.len();
+        let mut indptr: Vec<i64> = vec![0; num_nodes + 1];
+        for edge in graph.edge_references() {
+            indptr[position[edge.source().index()] + 1] += 1;
+            if !Ty::is_directed() && edge.source() != edge.target() {
+                indptr[position[edge.target().index()] + 1] += 1;
+            }
+        }
+        for i in 0..num_nodes {
+            indptr[i + 1] += indptr[i];
+        }
+        let num_entries = indptr[num_nodes] as usize;
+        let mut next: Vec<i64> = indptr[..num_nodes].to_vec();
+        let mut indices: Vec<i64> = vec![0; num_entries];
+        let mut edge_ids: Vec<i64> = vec![0; num_entries];
+        let mut insert = |row: usize, col: usize, edge: usize| {
+            let pos = next[row] as usize;
+            next[row] += 1;
+            indices[pos] = col as i64;
+            edge_ids[pos] = edge as i64;
+        };
+        for edge in graph.edge_references() {
+            let source = position[edge.source().index()];
+            let target = position[edge.target().index()];
+            insert(source, target, edge.id().index());
+            if !Ty::is_directed() && source != target {
+                insert(target, source, edge.id().index());
+            }
+        }
+        CsrGraph {
+            indptr,
+            indices,
+            edge_ids,
+            node_map,
+        }
+    }
+
+    /// Return the row of every entry
+    pub fn rows(&self) -> Vec<i64> {
+        let mut rows: Vec<i64> = Vec::with_capacity(self.indices.len());
+        for (row, bounds) in self.indptr.windows(2).enumerate() {
+            for _ in bounds[0]..bounds[1] {
+                rows.push(row as i64);
+            }
+        }
+        rows
+    }
+
+    /// Return the weight of every entry
+    pub fn weights<Ty: EdgeType>(
+        &self,
+        py: Python,
+        graph: &StableGraph<PyObject, PyObject, Ty>,
+        weight_fn: Option<PyObject>,
+        default_weight: f64,
+    ) -> PyResult<Vec<f64>> {
+        let edge_weights =
+            EdgeWeights::new(py, graph, weight_fn, default_weight)?
+                .into_vec(py, graph)?;
+        Ok(self
+            .edge_ids
+            .iter()
+            .map(|edge| edge_weights[*edge as usize])
+            .collect())
+    }
+}
+
+/// Return the ``(indptr, indices, edge_ids, weights, node_map)`` CSR arrays
+/// for a graph, ``weights`` is ``None`` if there is no ``weight_fn``
+pub fn to_csr<Ty: EdgeType>(
+    py: Python,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    weight_fn: Option<PyObject>,
+) -> PyResult<PyObject> {
+    let csr = CsrGraph::new(graph);
+    let weights = match weight_fn {
+        Some(weight_fn) => Some(
+            csr.weights(py, graph, Some(weight_fn), 1.0)?
+                .into_pyarray(py),
+        ),
+        None => None,
+    };
+    Ok((
+        csr.indptr.into_pyarray(py),
+        csr.indices.into_pyarray(py),
+        csr.edge_ids.into_pyarray(py),
+        weights,
+        csr.node_map.into_pyarray(py),
+    )
+        .into_py(py))
+}
+
+/// Return the ``(row, col, edge_ids, weights, node_map)`` COO arrays for a
+/// graph, ``weights`` is ``None`` if there is no ``weight_fn``
+pub fn to_coo<Ty: EdgeType>(
+    py: Python,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    weight_fn: Option<PyObject>,
+) -> PyResult<PyObject> {
+    let csr = CsrGraph::new(graph);
+    let weights = match weight_fn {
+        Some(weight_fn) => Some(
+            csr.weights(py, graph, Some(weight_fn), 1.0)?
+                .into_pyarray(py),
+        ),
+        None => None,
+    };
+    Ok((
+        csr.rows().into_pyarray(py),
+        csr.indices.into_pyarray(py),
+        csr.edge_ids.into_pyarray(py),
+        weights,
+        csr.node_map.into_pyarray(py),
+    )
+        .into_py(py))
+}
+
+/// Return the adjacency matrix of a graph as ``(data, indices, indptr)``
+/// CSR arrays
+///
+/// The values are the same as the dense adjacency matrix: the weights of
+/// parallel edges are summed and, for undirected graphs, the weight of a self
+/// loop is counted twice on the diagonal. The column indices of each row are
+/// sorted.
+pub fn sparse_adjacency_matrix<Ty: EdgeType>(
+    py: Python,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    weight_fn: Option<PyObject>,
+    default_weight: f64,
+) -> PyResult<PyObject> {
+    let csr = CsrGraph::new(graph);
+    let weights = csr.weights(py, graph, weight_fn, default_weight)?;
+    let num_nodes = csr.node_map.len();
+    let mut data: Vec<f64> = Vec::with_capacity(weights.len());
+    let mut indices: Vec<i64> = Vec::with_capacity(weights.len());
+    let mut indptr: Vec<i64> = Vec::with_capacity(num_nodes + 1);
+    indptr.push(0);
+    let mut row: Vec<(i64, f64)> = Vec::new();
+    for (row_index, bounds) in csr.indptr.windows(2).enumerate() {
+        row.clear();
+        for pos in bounds[0] as usize..bounds[1] as usize {
+            let col = csr.indices[pos];
+            let weight = if !Ty::is_directed() && col == row_index as i64 {
+                2. * weights[pos]
+            } else {
+                weights[pos]
+            };
+            row.push((col, weight));
+        }
+        row.sort_by_key(|(col, _)| *col);
+        let row_start = indices.len();
+        for (col, weight) in row.iter() {
+            if indices.len() > row_start && indices[indices.len() - 1] == *col {
+                *data.last_mut().unwrap() += weight;
+            } else {
+                indices.push(*col);
+                data.push(*weight);
+            }
+        }
+        indptr.push(indices.len() as i64);
+    }
+    Ok((
+        data.into_pyarray(py),
+        indices.into_pyarray(py),
+        indptr.into_pyarray(py),
+    )
+        .into_py(py))
+}
+
+fn indices_from_view<T>(array: ArrayView1<T>) -> PyResult<Vec<usize>>
+where
+    T: Copy + TryInto<usize>,
+{
+    array
+        .iter()
+        .map(|value| {
+            (*value).try_into().map_err(|_| {
+                PyValueError::new_err(
+                    "Index arrays can't contain negative values",
+                )
+            })
+        })
+        .collect()
+}
+
+fn extract_indices(array: &PyAny) -> PyResult<Vec<usize>> {
+    if let Ok(array) = array.extract::<PyReadonlyArray1<i64>>() {
+        indices_from_view(array.as_array())
+    } else if let Ok(array) = array.extract::<PyReadonlyArray1<i32>>() {
+        indices_from_view(array.as_array())
+    } else if let Ok(array) = array.extract::<PyReadonlyArray1<u64>>() {
+        indices_from_view(array.as_array())
+    } else if let Ok(array) = array.extract::<PyReadonlyArray1<u32>>() {
+        indices_from_view(array.as_array())
+    } else {
+        Err(PyTypeError::new_err(
+            "Index arrays must be 1 dimensional numpy arrays with an integer \
+             data type",
+        ))
+    }
+}
+
+/// Build a graph from the ``(data, indices, indptr)`` CSR arrays of an
+/// adjacency matrix
+///
+/// Like ``from_adjacency_matrix`` the node weights are the node indices and
+/// every entry with a value greater than 0 becomes an edge with the value as
+/// its weight. Duplicate entries in a row are summed first. For undirected
+/// graphs only the entries on or above the diagonal are used.
+pub fn from_sparse_adjacency_matrix<Ty: EdgeType>(
+    py: Python,
+    data: PyReadonlyArray1<f64>,
+    indices: &PyAny,
+    indptr: &PyAny,
+) -> PyResult<StableGraph<PyObject, PyObject, Ty>> {
+    let data = data.as_array();
+    let indices = extract_indices(indices)?;
+    let indptr = extract_indices(indptr)?;
+    if indptr.is_empty() {
+        return Err(PyValueError::new_err("indptr must not be empty"));
+    }
+    let num_nodes = indptr.len() - 1;
+    if indices.len() != data.len()
+        || indptr[num_nodes] != indices.len()
+        || indptr.windows(2).any(|bounds| bounds[0] > bounds[1])
+    {
+        return Err(PyValueError::new_err(
+            "indptr must be non-decreasing and end at the length of indices \
+             and data, which must have the same length",
+        ));
+    }
+    if indices.iter().any(|col| *col >= num_nodes) {
+        return Err(PyValueError::new_err(format!(
+            "Column index out of range for a {}x{} matrix",
+            num_nodes, num_nodes
+        )));
+    }
+    let mut graph = StableGraph::<PyObject, PyObject, Ty>::with_capacity(
+        num_nodes,
+        indices.len(),
+    );
+    for node in 0..num_nodes {
+        graph.add_node(node.to_object(py));
+    }
+    let mut row: Vec<(usize, f64)> = Vec::new();
+    for source in 0..num_nodes {
+        row.clear();
+        row.extend(
+            (indptr[source]..indptr[source + 1])
+                .map(|pos| (indices[pos], data[pos]))
+                .filter(|(target, _)| Ty::is_directed() || *target >= source),
+        );
+        row.sort_by_key(|(target, _)| *target);
+        let mut pos = 0;
+        while pos < row.len() {
+            let target = row[pos].0;
+            let mut weight = 0.;
+            while pos < row.len() && row[pos].0 == target {
+                weight += row[pos].1;
+                pos += 1;
+            }
+            if weight > 0.0 {
+                graph.add_edge(
+                    NodeIndex::new(source),
+                    NodeIndex::new(target),
+                    weight.to_object(py),
+                );
+            }
+        }
+    }
+    Ok(graph)
+}
+
+/// Extract a list of node indices from a numpy integer array or a sequence
+/// of ints
+fn extract_nodes(py: Python, nodes: &PyAny) -> PyResult<Vec<usize>> {
+    match extract_indices(nodes) {
+        Ok(nodes) => Ok(nodes),
+        Err(err) if err.is_instance::<PyValueError>(py) => Err(err),
+        Err(_) => nodes.extract(),
+    }
+}
+
+/// Return the ``(offsets, indices)`` arrays of the neighbors of every node
+/// in ``nodes``
+///
+/// The neighbors of ``nodes[i]`` are ``indices[offsets[i]:offsets[i + 1]]``
+/// in ascending order without duplicates, for directed graphs these are
+/// the successors. An index which isn't in the graph has no neighbors.
+pub fn neighbors_of<Ty: EdgeType>(
+    py: Python,
+    graph: &StableGraph<PyObject, PyObject, Ty>,
+    nodes: &PyAny,
+) -> PyResult<PyObject> {
+    let nodes = extract_nodes(py, nodes)?;
+    let mut offsets: Vec<i64> = Vec::with_capacity(nodes.len() + 1);
+    let mut indices: Vec<i64> = Vec::new();
+    offsets.push(0);
+    for node in nodes {
+        let row_start = indices.len();
+        indices.extend(
+            graph
+                .neighbors(NodeIndex::new(node))
+                .map(|neighbor| neighbor.index() as i64),
+        );
+        indices[row_start..].sort_unstable();
+        let mut row_end = row_start;
+        for pos in row_start..indices.len() {
+            if row_end == row_start || indices[row_end - 1] != indices[pos] {
+                indices[row_end] = indices[pos];
+                row_end += 1;
+            }
+        }
+        indices.truncate(row_end);
+        offsets.push(row_end as i64);
+    }
+    Ok((offsets.into_pyarray(py), indices.into_pyarray(py)).into_py(py))
+}
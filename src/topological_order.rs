@@ -0,0 +1,334 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+use hashbrown::HashSet;
+
+use petgraph::algo;
+use petgraph::graph::NodeIndex;
+use petgraph::stable_graph::StableDiGraph;
+use petgraph::{Incoming, Outgoing};
+
+use pyo3::prelude::*;
+
+/// A topological order of a DAG which is updated incrementally as edges are
+/// added, using the dynamic topological sort algorithm of Pearce and Kelly.
+///
+/// Every node has a position and every edge goes from a lower position to a
+/// higher one. The positions only need to be unique, not contiguous: new
+/// positions are always taken from below the smallest or above the largest
+/// one handed out so far, so positions left behind by removed nodes are never
+/// reused by another node. Nodes which are not covered by ``positions`` yet
+/// are placed after every other node the first time they are looked up. Once
+/// the positions span more than twice as many values as there are indices
+/// they are renumbered from 0, so the nodes can always be put in order by
+/// bucketing them by position in linear time.
+///
+/// Adding an edge which already agrees with the order is O(1). Otherwise only
+/// the nodes positioned between the two endpoints which are reachable from
+/// the target, or can reach the source, are searched and moved, instead of
+/// the whole graph.
+#[derive(Clone, Debug)]
+pub struct TopologicalOrder {
+    positions: Vec<i64>,
+    min: i64,
+    max: i64,
+}
+
+impl TopologicalOrder {
+    /// Build the order of a graph from a full topological sort, returns
+    /// ``None`` if the graph has a cycle
+    pub fn new(graph: &StableDiGraph<PyObject, PyObject>) -> Option<Self> {
+        let nodes = algo::toposort(graph, None).ok()?;
+        Some(TopologicalOrder::from_sorted(graph, nodes))
+    }
+
+    /// Build the order of a graph from its nodes in topological order
+    pub fn from_sorted(
+        graph: &StableDiGraph<PyObject, PyObject>,
+        nodes: Vec<NodeIndex>,
+    ) -> Self {
+        let mut order = TopologicalOrder {
+            positions: vec![0; graph.node_bound()],
+            min: 0,
+            max: -1,
+        };
+        for node in nodes {
+            order.max += 1;
+            order.positions[node.index()] = order.max;
+        }
+        // Indices of removed nodes get their own positions so a node added in
+        // their place later can't collide with an existing one
+        for index in 0..graph.node_bound() {
+            if !graph.contains_node(NodeIndex::new(index)) {
+                order.max += 1;
+                order.positions[index] = order.max;
+            }
+        }
+        order
+    }
+
+    /// Give every index below ``bound`` a position
+    fn cover(&mut self, bound: usize) {
+        while self.positions.len() < bound {
+            self.max += 1;
+            self.positions.push(self.max);
+        }
+    }
+
+    /// Renumber the positions from 0 keeping their order, if they span more
+    /// than twice as many values as there are indices
+    ///
+    /// This is linear in the span, and the span only grows by one for each
+    /// node moved first or last, so it's amortized O(1) per move.
+    fn compact(&mut self) {
+        if self.max - self.min < 2 * self.positions.len() as i64 {
+            return;
+        }
+        let mut slots: Vec<Option<usize>> =
+            vec![None; (self.max - self.min + 1) as usize];
+        for (index, pos) in self.positions.iter().enumerate() {
+            slots[(pos - self.min) as usize] = Some(index);
+        }
+        for (pos, index) in slots.into_iter().flatten().enumerate() {
+            self.positions[index] = pos as i64;
+        }
+        self.min = 0;
+        self.max = self.positions.len() as i64 - 1;
+    }
+
+    fn position(&mut self, node: NodeIndex) -> i64 {
+        self.cover(node.index() + 1);
+        self.positions[node.index()]
+    }
+
+    /// Move a node without in edges before every other node
+    ///
+    /// Every other node of ``graph`` is given its position first, otherwise
+    /// a neighbor without one yet would later be placed after ``node``.
+    pub fn place_first(
+        &mut self,
+        graph: &StableDiGraph<PyObject, PyObject>,
+        node: NodeIndex,
+    ) {
+        self.cover(graph.node_bound());
+        self.min -= 1;
+        self.positions[node.index()] = self.min;
+        self.compact();
+    }
+
+    /// Move a node without out edges after every other node
+    ///
+    /// Every other node of ``graph`` is given its position first, otherwise
+    /// a neighbor without one yet would later be placed after ``node``.
+    pub fn place_last(
+        &mut self,
+        graph: &StableDiGraph<PyObject, PyObject>,
+        node: NodeIndex,
+    ) {
+        self.cover(graph.node_bound());
+        self.max += 1;
+        self.positions[node.index()] = self.max;
+        self.compact();
+    }
+
+    /// Update the order for a new edge from ``source`` to ``target``, which
+    /// must not have been added to ``graph`` yet
+    ///
+    /// Returns ``false`` and leaves the order unchanged if the edge would
+    /// create a cycle.
+    pub fn add_edge(
+        &mut self,
+        graph: &StableDiGraph<PyObject, PyObject>,
+        source: NodeIndex,
+        target: NodeIndex,
+    ) -> bool {
+        let lower = self.position(target);
+        let upper = self.position(source);
+        if upper < lower {
+            return true;
+        }
+        // Search forward from target through the nodes positioned before
+        // source, reaching source means the edge closes a cycle
+        let mut seen: HashSet<NodeIndex> = HashSet::new();
+        let mut stack: Vec<NodeIndex> = vec![target];
+        let mut forward: Vec<NodeIndex> = Vec::new();
+        seen.insert(target);
+        while let Some(node) = stack.pop() {
+            if node == source {
+                return false;
+            }
+            forward.push(node);
+            for next in graph.neighbors_directed(node, Outgoing) {
+                if self.position(next) <= upper && seen.insert(next) {
+                    stack.push(next);
+                }
+            }
+        }
+        // Search backward from source through the nodes positioned after
+        // target
+        seen.clear();
+        stack.push(source);
+        let mut backward: Vec<NodeIndex> = Vec::new();
+        seen.insert(source);
+        while let Some(node) = stack.pop() {
+            backward.push(node);
+            for prev in graph.neighbors_directed(node, Incoming) {
+                if self.position(prev) >= lower && seen.insert(prev) {
+                    stack.push(prev);
+                }
+            }
+        }
+        // Reassign the positions of both sets so every node which can reach
+        // source comes before every node reachable from target, keeping the
+        // relative order within each set
+        let positions = &mut self.positions;
+        backward.sort_unstable_by_key(|node| positions[node.index()]);
+        forward.sort_unstable_by_key(|node| positions[node.index()]);
+        let mut pool: Vec<i64> = backward
+            .iter()
+            .chain(forward.iter())
+            .map(|node| positions[node.index()])
+            .collect();
+        pool.sort_unstable();
+        for (node, pos) in backward.iter().chain(forward.iter()).zip(pool) {
+            positions[node.index()] = pos;
+        }
+        true
+    }
+
+    /// Return the nodes of ``graph`` in topological order
+    ///
+    /// The nodes are bucketed by position, which is linear in the number of
+    /// node indices since the positions span at most about twice as many
+    /// values. Nodes without a position yet come last, in index order.
+    pub fn sorted_nodes(
+        &self,
+        graph: &StableDiGraph<PyObject, PyObject>,
+    ) -> Vec<NodeIndex> {
+        let mut slots: Vec<Option<NodeIndex>> =
+            vec![None; (self.max - self.min + 1) as usize];
+        let mut uncovered: Vec<NodeIndex> = Vec::new();
+        for node in graph.node_indices() {
+            match self.positions.get(node.index()) {
+                Some(pos) => slots[(pos - self.min) as usize] = Some(node),
+                None => uncovered.push(node),
+            }
+        }
+        slots.into_iter().flatten().chain(uncovered).collect()
+    }
+}
+
+/// Return the nodes of ``graph`` in topological order as if ``edges`` were
+/// added to it, without modifying the graph
+///
+/// ``graph`` has to be acyclic, so every cycle goes through at least one of
+/// ``edges``. If there is a cycle the position in ``edges`` of the first edge
+/// which closes a cycle together with the edges before it is returned as the
+/// error, the same edge adding them one at a time would fail on. This is a
+/// single pass of Kahn's algorithm over the graph and the new edges, so it
+/// takes linear time no matter how many edges are checked, only finding the
+/// edge for the error takes a logarithmic number of passes more.
+pub fn sort_with_edges(
+    graph: &StableDiGraph<PyObject, PyObject>,
+    edges: &[(NodeIndex, NodeIndex)],
+) -> Result<Vec<NodeIndex>, usize> {
+    let last = match kahn_with_edges(graph, edges) {
+        Ok(nodes) => return Ok(nodes),
+        Err(last) => last,
+    };
+    // The edges up to ``high`` are known to close a cycle and the ones
+    // before ``low`` are known not to
+    let (mut low, mut high) = (0, last);
+    while low < high {
+        let mid = (low + high) / 2;
+        if kahn_with_edges(graph, &edges[..=mid]).is_err() {
+            high = mid;
+        } else {
+            low = mid + 1;
+        }
+    }
+    Err(low)
+}
+
+/// Kahn's algorithm over ``graph`` and ``edges``, on a cycle the position in
+/// ``edges`` of the last new edge on one cycle is returned as the error
+fn kahn_with_edges(
+    graph: &StableDiGraph<PyObject, PyObject>,
+    edges: &[(NodeIndex, NodeIndex)],
+) -> Result<Vec<NodeIndex>, usize> {
+    let bound = graph.node_bound();
+    let mut new_out: Vec<Vec<usize>> = vec![Vec::new(); bound];
+    let mut new_in: Vec<Vec<usize>> = vec![Vec::new(); bound];
+    let mut in_degree: Vec<usize> = vec![0; bound];
+    for (pos, (source, target)) in edges.iter().enumerate() {
+        new_out[source.index()].push(pos);
+        new_in[target.index()].push(pos);
+        in_degree[target.index()] += 1;
+    }
+    let mut stack: Vec<NodeIndex> = Vec::new();
+    for node in graph.node_indices() {
+        in_degree[node.index()] +=
+            graph.neighbors_directed(node, Incoming).count();
+        if in_degree[node.index()] == 0 {
+            stack.push(node);
+        }
+    }
+    let mut order: Vec<NodeIndex> = Vec::with_capacity(graph.node_count());
+    while let Some(node) = stack.pop() {
+        order.push(node);
+        let new_targets = new_out[node.index()].iter().map(|pos| edges[*pos].1);
+        for next in graph.neighbors_directed(node, Outgoing).chain(new_targets)
+        {
+            in_degree[next.index()] -= 1;
+            if in_degree[next.index()] == 0 {
+                stack.push(next);
+            }
+        }
+    }
+    if order.len() == graph.node_count() {
+        return Ok(order);
+    }
+    // Every node left has a predecessor which is also left, so walking
+    // backwards over them from any of them has to run into a cycle. Each
+    // step records the new edge it followed, if any.
+    let mut node = graph
+        .node_indices()
+        .find(|node| in_degree[node.index()] > 0)
+        .unwrap();
+    let mut walk: Vec<NodeIndex> = Vec::new();
+    let mut steps: Vec<Option<usize>> = Vec::new();
+    let mut walked: HashSet<NodeIndex> = HashSet::new();
+    while walked.insert(node) {
+        walk.push(node);
+        let (prev, step) = match new_in[node.index()]
+            .iter()
+            .find(|pos| in_degree[edges[**pos].0.index()] > 0)
+        {
+            Some(pos) => (edges[*pos].0, Some(*pos)),
+            None => (
+                graph
+                    .neighbors_directed(node, Incoming)
+                    .find(|prev| in_degree[prev.index()] > 0)
+                    .unwrap(),
+                None,
+            ),
+        };
+        steps.push(step);
+        node = prev;
+    }
+    let cycle_start = walk.iter().position(|walk_node| *walk_node == node);
+    Err(steps[cycle_start.unwrap()..]
+        .iter()
+        .filter_map(|step| *step)
+        .max()
+        .unwrap())
+}
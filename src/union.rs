@@ -10,6 +10,7 @@
 // License for the specific language governing permissions and limitations
 // under the License.
 
+use crate::analysis_cache::AnalysisCache;
 use crate::digraph::PyDiGraph;
 use hashbrown::{HashMap, HashSet};
 use petgraph::algo;
@@ -46,8 +47,10 @@ pub fn digraph_union(
     let mut combined = PyDiGraph {
         graph: first.clone(),
         cycle_state: algo::DfsSpace::default(),
+        topo_order: None,
         check_cycle: false,
         node_removed: false,
+        cache: AnalysisCache::default(),
         multigraph: true,
     };
     let mut node_map = HashMap::with_capacity(second.node_count());
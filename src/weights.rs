@@ -0,0 +1,122 @@
+// Licensed under the Apache License, Version 2.0 (the "License"); you may
+// not use this file except in compliance with the License. You may obtain
+// a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+// WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+// License for the specific language governing permissions and limitations
+// under the License.
+
+use petgraph::stable_graph::{EdgeIndex, StableGraph};
+use petgraph::visit::{EdgeRef, IntoEdgeReferences};
+use petgraph::EdgeType;
+
+use numpy::PyReadonlyArray1;
+use pyo3::exceptions::{PyTypeError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::types::PyString;
+
+/// The weights of a graph's edges as specified by a ``weight_fn`` argument
+///
+/// A ``weight_fn`` can be a Python callable which is passed an edge's data
+/// payload and returns the weight of the edge, the name of the key to look up
+/// the weight with in each edge's data payload, or a 1 dimensional numpy
+/// array of ``float64`` weights indexed by edge index. In the latter two
+/// cases the weights are extracted for every edge up front so algorithms
+/// using them don't need to call into Python while running.
+pub enum EdgeWeights {
+    /// Every edge has the same weight
+    Default(f64),
+    /// A Python callable which is passed the edge's data payload
+    Callable(PyObject),
+    /// The weight of every edge indexed by edge index
+    Precomputed(Vec<f64>),
+}
+
+impl EdgeWeights {
+    pub fn new<Ty: EdgeType>(
+        py: Python,
+        graph: &StableGraph<PyObject, PyObject, Ty>,
+        weight_fn: Option<PyObject>,
+        default_weight: f64,
+    ) -> PyResult<Self> {
+        let weight_fn = match weight_fn {
+            Some(weight_fn) => weight_fn,
+            None => return Ok(EdgeWeights::Default(default_weight)),
+        };
+        let edge_bound = graph.edge_bound();
+        let weight_obj = weight_fn.as_ref(py);
+        if let Ok(array) = weight_obj.extract::<PyReadonlyArray1<f64>>() {
+            let array = array.as_array();
+            if array.len() < edge_bound {
+                return Err(PyValueError::new_err(format!(
+                    "Weight array has {} elements but the graph has an edge \
+                     index bound of {}",
+                    array.len(),
+                    edge_bound
+                )));
+            }
+            Ok(EdgeWeights::Precomputed(
+                array.iter().take(edge_bound).copied().collect(),
+            ))
+        } else if weight_obj.cast_as::<PyString>().is_ok() {
+            let mut weights: Vec<f64> = vec![default_weight; edge_bound];
+            for edge in graph.edge_references() {
+                weights[edge.id().index()] =
+                    edge.weight().as_ref(py).get_item(&weight_fn)?.extract()?;
+            }
+            Ok(EdgeWeights::Precomputed(weights))
+        } else if weight_obj.is_callable() {
+            Ok(EdgeWeights::Callable(weight_fn))
+        } else {
+            Err(PyTypeError::new_err(
+                "Weights must be a callable, the name of an edge attribute \
+                 or a 1 dimensional float64 array indexed by edge index",
+            ))
+        }
+    }
+
+    /// Return the weight of a single edge
+    pub fn weight(
+        &self,
+        py: Python,
+        edge: EdgeIndex,
+        payload: &PyObject,
+    ) -> PyResult<f64> {
+        match self {
+            EdgeWeights::Default(weight) => Ok(*weight),
+            EdgeWeights::Callable(weight_fn) => {
+                weight_fn.call1(py, (payload,))?.extract(py)
+            }
+            EdgeWeights::Precomputed(weights) => Ok(weights[edge.index()]),
+        }
+    }
+
+    /// Return the weight of every edge in the graph indexed by edge index
+    ///
+    /// The value at the index of a removed edge is unspecified.
+    pub fn into_vec<Ty: EdgeType>(
+        self,
+        py: Python,
+        graph: &StableGraph<PyObject, PyObject, Ty>,
+    ) -> PyResult<Vec<f64>> {
+        match self {
+            EdgeWeights::Precomputed(weights) => Ok(weights),
+            EdgeWeights::Default(weight) => {
+                Ok(vec![weight; graph.edge_bound()])
+            }
+            EdgeWeights::Callable(weight_fn) => {
+                let mut weights: Vec<f64> =
+                    vec![std::f64::NAN; graph.edge_bound()];
+                for edge in graph.edge_references() {
+                    weights[edge.id().index()] =
+                        weight_fn.call1(py, (edge.weight(),))?.extract(py)?;
+                }
+                Ok(weights)
+            }
+        }
+    }
+}
@@ -12,6 +12,8 @@
 
 import unittest
 
+import numpy
+
 import retworkx
 
 
@@ -96,3 +98,22 @@ class TestAdj(unittest.TestCase):
         for i in range(5):
             dag.add_child(node_a, i, None)
         self.assertEqual(5, dag.out_degree(node_a))
+
+    def test_in_out_degrees(self):
+        dag = retworkx.PyDAG()
+        dag.extend_from_edge_list([(0, 1), (0, 2), (1, 2), (0, 1), (3, 3)])
+        dag.remove_node(2)
+        in_degrees = dag.in_degrees()
+        out_degrees = dag.out_degrees()
+        self.assertIsInstance(in_degrees, numpy.ndarray)
+        self.assertEqual(numpy.int64, in_degrees.dtype)
+        numpy.testing.assert_array_equal(in_degrees, [0, 2, 0, 1])
+        numpy.testing.assert_array_equal(out_degrees, [2, 0, 0, 1])
+        for node in dag.node_indexes():
+            self.assertEqual(dag.in_degree(node), in_degrees[node])
+            self.assertEqual(dag.out_degree(node), out_degrees[node])
+
+    def test_in_out_degrees_empty(self):
+        dag = retworkx.PyDAG()
+        self.assertEqual((0,), dag.in_degrees().shape)
+        self.assertEqual((0,), dag.out_degrees().shape)
@@ -0,0 +1,140 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import pickle
+import unittest
+
+import retworkx
+
+
+class TestAnalysisCache(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyDiGraph()
+        self.graph.extend_from_edge_list([(0, 1), (1, 2), (3, 4)])
+
+    def test_disabled_by_default(self):
+        self.assertFalse(self.graph.analysis_cache)
+        retworkx.topological_sort(self.graph)
+        info = self.graph.analysis_cache_info()
+        self.assertEqual(0, info["hits"])
+        self.assertEqual(0, info["misses"])
+
+    def test_hits_and_misses(self):
+        self.graph.analysis_cache = True
+        expected = retworkx.topological_sort(self.graph)
+        self.assertEqual(expected, retworkx.topological_sort(self.graph))
+        self.assertTrue(retworkx.is_directed_acyclic_graph(self.graph))
+        self.assertTrue(retworkx.is_directed_acyclic_graph(self.graph))
+        info = self.graph.analysis_cache_info()
+        self.assertEqual(2, info["hits"])
+        self.assertEqual(2, info["misses"])
+
+    def test_weakly_connected_components(self):
+        self.graph.analysis_cache = True
+        self.assertEqual(
+            [{0, 1, 2}, {3, 4}],
+            retworkx.weakly_connected_components(self.graph),
+        )
+        self.assertEqual(
+            2, retworkx.number_weakly_connected_components(self.graph)
+        )
+        self.assertFalse(retworkx.is_weakly_connected(self.graph))
+        info = self.graph.analysis_cache_info()
+        self.assertEqual(2, info["hits"])
+        self.assertEqual(1, info["misses"])
+
+    def test_invalidated_by_changes(self):
+        self.graph.analysis_cache = True
+        self.assertEqual(
+            2, retworkx.number_weakly_connected_components(self.graph)
+        )
+        generation = self.graph.analysis_cache_info()["generation"]
+        self.graph.add_edge(2, 3, None)
+        self.assertEqual(
+            1, retworkx.number_weakly_connected_components(self.graph)
+        )
+        node = self.graph.add_node(None)
+        self.assertEqual(
+            2, retworkx.number_weakly_connected_components(self.graph)
+        )
+        self.graph.remove_node(node)
+        self.graph.remove_edge(2, 3)
+        self.assertEqual(
+            2, retworkx.number_weakly_connected_components(self.graph)
+        )
+        self.graph.add_edge(4, 0, None)
+        self.assertEqual([3, 4, 0, 1, 2], retworkx.topological_sort(self.graph))
+        self.graph.add_edge(2, 3, None)
+        self.assertFalse(retworkx.is_directed_acyclic_graph(self.graph))
+        with self.assertRaises(retworkx.DAGHasCycle):
+            retworkx.topological_sort(self.graph)
+        info = self.graph.analysis_cache_info()
+        self.assertEqual(0, info["hits"])
+        self.assertEqual(7, info["misses"])
+        self.assertGreater(info["generation"], generation)
+
+    def test_not_invalidated_by_weight_changes(self):
+        self.graph.analysis_cache = True
+        retworkx.topological_sort(self.graph)
+        self.graph[0] = "a"
+        self.graph.update_edge(0, 1, "b")
+        retworkx.topological_sort(self.graph)
+        self.assertEqual(1, self.graph.analysis_cache_info()["hits"])
+
+    def test_cached_cycle(self):
+        self.graph.add_edge(2, 0, None)
+        self.graph.analysis_cache = True
+        for _ in range(2):
+            with self.assertRaises(retworkx.DAGHasCycle):
+                retworkx.topological_sort(self.graph)
+        self.assertEqual(1, self.graph.analysis_cache_info()["hits"])
+
+    def test_transitivity(self):
+        graph = retworkx.PyDiGraph()
+        graph.extend_from_edge_list([(0, 1), (1, 2), (2, 0), (0, 2)])
+        graph.analysis_cache = True
+        expected = retworkx.transitivity(graph)
+        self.assertEqual(expected, retworkx.transitivity(graph))
+        self.assertEqual(1, graph.analysis_cache_info()["hits"])
+        graph.remove_edge(0, 2)
+        retworkx.transitivity(graph)
+        self.assertEqual(2, graph.analysis_cache_info()["misses"])
+
+    def test_disable_drops_results(self):
+        self.graph.analysis_cache = True
+        retworkx.topological_sort(self.graph)
+        self.graph.analysis_cache = False
+        self.graph.analysis_cache = True
+        retworkx.topological_sort(self.graph)
+        info = self.graph.analysis_cache_info()
+        self.assertEqual(0, info["hits"])
+        self.assertEqual(2, info["misses"])
+
+    def test_copy_starts_empty(self):
+        self.graph.analysis_cache = True
+        self.assertEqual(
+            2, retworkx.number_weakly_connected_components(self.graph)
+        )
+        copy = self.graph.copy()
+        self.assertTrue(copy.analysis_cache)
+        copy.add_edge(2, 3, None)
+        self.assertEqual(1, retworkx.number_weakly_connected_components(copy))
+        self.assertEqual(0, copy.analysis_cache_info()["hits"])
+
+    def test_pickle(self):
+        self.graph.analysis_cache = True
+        retworkx.topological_sort(self.graph)
+        graph = pickle.loads(pickle.dumps(self.graph))
+        self.assertEqual(
+            retworkx.topological_sort(self.graph),
+            retworkx.topological_sort(graph),
+        )
@@ -0,0 +1,172 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import os
+import struct
+import tempfile
+import unittest
+
+import numpy
+
+import retworkx
+
+
+class TestBinary(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+    def test_round_trip(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(["a", "b", "c"])
+        graph.add_edges_from([(0, 1, {"weight": 2}), (1, 2, None)])
+        graph.add_edge(2, 0, (1, 2))
+        graph.write_binary(self.path)
+        new_graph = retworkx.PyDiGraph.read_binary(self.path)
+        self.assertEqual(new_graph.nodes(), ["a", "b", "c"])
+        self.assertEqual(
+            new_graph.weighted_edge_list(), graph.weighted_edge_list()
+        )
+        self.assertEqual(new_graph.edge_indices(), graph.edge_indices())
+        self.assertTrue(new_graph.multigraph)
+
+    def test_round_trip_with_removals(self):
+        graph = retworkx.PyDiGraph(multigraph=False)
+        graph.add_nodes_from(list(range(6)))
+        graph.add_edges_from([(0, 1, "a"), (1, 2, "b"), (3, 4, "c")])
+        graph.add_edge(4, 5, "d")
+        graph.remove_node(2)
+        graph.remove_edge_from_index(2)
+        graph.write_binary(self.path)
+        new_graph = retworkx.PyDiGraph.read_binary(self.path)
+        self.assertEqual(new_graph.node_indexes(), [0, 1, 3, 4, 5])
+        self.assertEqual(new_graph.nodes(), [0, 1, 3, 4, 5])
+        self.assertEqual(new_graph.edge_indices(), [0, 3])
+        self.assertEqual(
+            new_graph.weighted_edge_list(), [(0, 1, "a"), (4, 5, "d")]
+        )
+        self.assertFalse(new_graph.multigraph)
+        self.assertEqual(new_graph.add_node(6), graph.add_node(6))
+
+    def test_weight_column_without_payloads(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(["a", "b", "c"])
+        graph.add_edges_from([(0, 1, {"weight": 2}), (1, 2, {"weight": 3})])
+        graph.write_binary(self.path, weight_fn="weight")
+        new_graph = retworkx.PyDiGraph.read_binary(self.path, payloads=False)
+        self.assertEqual(new_graph.nodes(), [None, None, None])
+        self.assertEqual(
+            new_graph.weighted_edge_list(), [(0, 1, 2.0), (1, 2, 3.0)]
+        )
+        new_graph = retworkx.PyDiGraph.read_binary(self.path)
+        self.assertEqual(
+            new_graph.weighted_edge_list(),
+            [(0, 1, {"weight": 2}), (1, 2, {"weight": 3})],
+        )
+
+    def test_weight_array(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(["a", "b", "c"])
+        graph.add_edges_from([(0, 1, None), (1, 2, None)])
+        graph.write_binary(
+            self.path, weight_fn=numpy.array([0.5, 1.5]), payloads=False
+        )
+        new_graph = retworkx.PyDiGraph.read_binary(self.path)
+        self.assertEqual(
+            new_graph.weighted_edge_list(), [(0, 1, 0.5), (1, 2, 1.5)]
+        )
+
+    def test_empty_graph(self):
+        retworkx.PyDiGraph().write_binary(self.path)
+        new_graph = retworkx.PyDiGraph.read_binary(self.path)
+        self.assertEqual(len(new_graph), 0)
+        self.assertEqual(new_graph.edge_list(), [])
+
+    def test_index_arrays_can_be_memory_mapped(self):
+        graph = retworkx.generators.directed_path_graph(4)
+        graph.write_binary(self.path, payloads=False)
+        header = numpy.fromfile(self.path, dtype="<u8", count=7)
+        node_bound, node_count, _, edge_count = header[2:6]
+        indptr = numpy.memmap(
+            self.path,
+            dtype="<u8",
+            mode="r",
+            offset=8 * (7 + node_count),
+            shape=(node_bound + 1,),
+        )
+        indices = numpy.memmap(
+            self.path,
+            dtype="<u8",
+            mode="r",
+            offset=8 * (8 + node_count + node_bound),
+            shape=(edge_count,),
+        )
+        self.assertEqual(indptr.tolist(), [0, 1, 2, 3, 3])
+        self.assertEqual(indices.tolist(), [1, 2, 3])
+
+    def test_wrong_graph_type(self):
+        retworkx.PyGraph().write_binary(self.path)
+        with self.assertRaises(ValueError):
+            retworkx.PyDiGraph.read_binary(self.path)
+
+    def test_not_a_binary_file(self):
+        with open(self.path, "wt") as fd:
+            fd.write("0 1\n" * 10)
+        with self.assertRaises(ValueError):
+            retworkx.PyDiGraph.read_binary(self.path)
+
+    def _corrupt(self, offset, data):
+        retworkx.generators.directed_path_graph(3).write_binary(self.path)
+        with open(self.path, "r+b") as fd:
+            fd.seek(offset)
+            fd.write(data)
+
+    def test_truncated_header(self):
+        retworkx.generators.directed_path_graph(3).write_binary(self.path)
+        with open(self.path, "r+b") as fd:
+            fd.truncate(30)
+        with self.assertRaises(ValueError):
+            retworkx.PyDiGraph.read_binary(self.path)
+
+    def test_truncated_arrays(self):
+        retworkx.generators.directed_path_graph(3).write_binary(
+            self.path, payloads=False
+        )
+        with open(self.path, "r+b") as fd:
+            fd.truncate(100)
+        with self.assertRaises(ValueError):
+            retworkx.PyDiGraph.read_binary(self.path)
+
+    def test_counts_larger_than_file(self):
+        self._corrupt(24, struct.pack("<Q", 2 ** 40))
+        with self.assertRaises(ValueError):
+            retworkx.PyDiGraph.read_binary(self.path)
+        self._corrupt(40, struct.pack("<Q", 2 ** 62))
+        with self.assertRaises(ValueError):
+            retworkx.PyDiGraph.read_binary(self.path)
+
+    def test_corrupted_edge_target(self):
+        # The targets start after the header, 3 nodes and 4 offsets
+        self._corrupt(8 * (7 + 3 + 4), struct.pack("<Q", 1000))
+        with self.assertRaises(ValueError):
+            retworkx.PyDiGraph.read_binary(self.path)
+
+    def test_corrupted_edge_offsets(self):
+        self._corrupt(8 * (7 + 3 + 1), struct.pack("<Q", 2 ** 32))
+        with self.assertRaises(ValueError):
+            retworkx.PyDiGraph.read_binary(self.path)
+
+    def test_invalid_path(self):
+        path = os.path.join(tempfile.gettempdir(), "fake_file_name.rxg")
+        with self.assertRaises(FileNotFoundError):
+            retworkx.PyDiGraph.read_binary(path)
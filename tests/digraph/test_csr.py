@@ -0,0 +1,77 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import numpy
+
+import retworkx
+
+
+class TestCSR(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyDiGraph()
+        self.graph.add_nodes_from(list(range(4)))
+        self.graph.add_edges_from(
+            [(0, 1, 1.5), (0, 2, 2.5), (2, 3, 3.5), (3, 0, 4.5)]
+        )
+
+    def test_to_csr(self):
+        indptr, indices, edge_ids, weights, node_map = self.graph.to_csr()
+        self.assertEqual(indptr.tolist(), [0, 2, 2, 3, 4])
+        self.assertEqual(indices.tolist(), [1, 2, 3, 0])
+        self.assertEqual(edge_ids.tolist(), [0, 1, 2, 3])
+        self.assertIsNone(weights)
+        self.assertEqual(node_map.tolist(), [0, 1, 2, 3])
+
+    def test_to_csr_weights(self):
+        weights = self.graph.to_csr(float)[3]
+        self.assertEqual(weights.dtype, numpy.float64)
+        self.assertEqual(weights.tolist(), [1.5, 2.5, 3.5, 4.5])
+
+    def test_to_csr_removed_node(self):
+        self.graph.remove_node(1)
+        indptr, indices, edge_ids, _, node_map = self.graph.to_csr()
+        self.assertEqual(node_map.tolist(), [0, 2, 3])
+        self.assertEqual(indptr.tolist(), [0, 1, 2, 3])
+        self.assertEqual(indices.tolist(), [1, 2, 0])
+        self.assertEqual(edge_ids.tolist(), [1, 2, 3])
+
+    def test_to_csr_parallel_edges(self):
+        self.graph.add_edge(0, 1, 5.5)
+        indptr, indices, edge_ids, weights, _ = self.graph.to_csr(float)
+        self.assertEqual(indptr.tolist(), [0, 3, 3, 4, 5])
+        self.assertEqual(indices.tolist(), [1, 2, 1, 3, 0])
+        self.assertEqual(edge_ids.tolist(), [0, 1, 4, 2, 3])
+        self.assertEqual(weights.tolist(), [1.5, 2.5, 5.5, 3.5, 4.5])
+
+    def test_to_csr_empty(self):
+        (
+            indptr,
+            indices,
+            edge_ids,
+            weights,
+            node_map,
+        ) = retworkx.PyDiGraph().to_csr()
+        self.assertEqual(indptr.tolist(), [0])
+        self.assertEqual(indices.tolist(), [])
+        self.assertEqual(edge_ids.tolist(), [])
+        self.assertEqual(node_map.tolist(), [])
+
+    def test_to_coo(self):
+        self.graph.remove_node(1)
+        row, col, edge_ids, weights, node_map = self.graph.to_coo(float)
+        self.assertEqual(row.tolist(), [0, 1, 2])
+        self.assertEqual(col.tolist(), [1, 2, 0])
+        self.assertEqual(edge_ids.tolist(), [1, 2, 3])
+        self.assertEqual(weights.tolist(), [2.5, 3.5, 4.5])
+        self.assertEqual(node_map.tolist(), [0, 2, 3])
@@ -10,8 +10,11 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import random
 import unittest
 
+import numpy
+
 import retworkx
 
 
@@ -225,6 +228,194 @@ class TestEdges(unittest.TestCase):
         with self.assertRaises(retworkx.DAGWouldCycle):
             dag.add_edge(node_b, node_a, {})
 
+    def assertTopologicalOrder(self, dag):
+        order = retworkx.topological_sort(dag)
+        self.assertEqual(sorted(order), sorted(dag.node_indexes()))
+        position = {node: pos for pos, node in enumerate(order)}
+        for source, target in dag.edge_list():
+            self.assertLess(position[source], position[target])
+
+    def test_cycle_checking_random_edges(self):
+        rng = random.Random(42)
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(list(range(40)))
+        for _ in range(400):
+            source = rng.randrange(40)
+            target = rng.randrange(40)
+            would_cycle = source == target or source in retworkx.descendants(
+                dag, target
+            )
+            num_edges = dag.num_edges()
+            if would_cycle:
+                with self.assertRaises(retworkx.DAGWouldCycle):
+                    dag.add_edge(source, target, None)
+                self.assertEqual(num_edges, dag.num_edges())
+            else:
+                dag.add_edge(source, target, None)
+        self.assertTrue(retworkx.is_directed_acyclic_graph(dag))
+        self.assertTopologicalOrder(dag)
+
+    def test_cycle_checking_self_loop(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        node_a = dag.add_node("a")
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.add_edge(node_a, node_a, None)
+
+    def test_cycle_checking_order_with_children_and_parents(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        node_a = dag.add_node("a")
+        node_b = dag.add_child(node_a, "b", None)
+        node_c = dag.add_parent(node_a, "c", None)
+        node_d = dag.add_node("d")
+        dag.add_edge(node_d, node_c, None)
+        dag.add_edge(node_d, node_b, None)
+        self.assertTopologicalOrder(dag)
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.add_edge(node_b, node_c, None)
+        dag.remove_node(node_d)
+        node_e = dag.add_child(node_b, "e", None)
+        node_f = dag.add_parent(node_c, "f", None)
+        dag.add_edge(node_f, node_e, None)
+        node_g = dag.add_node("g")
+        dag.add_edge(node_g, node_f, None)
+        self.assertTopologicalOrder(dag)
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.add_edge(node_e, node_g, None)
+        self.assertTopologicalOrder(dag)
+
+    def test_cycle_checking_add_child_of_new_node_reusing_index(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(list(range(3)))
+        dag.add_edge(0, 1, None)
+        parent = dag.add_node(None)
+        dag.remove_node(2)
+        child = dag.add_child(parent, None, None)
+        self.assertEqual(2, child)
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.add_edge(child, parent, None)
+        self.assertTopologicalOrder(dag)
+
+    def test_cycle_checking_add_parent_of_new_node_reusing_index(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(list(range(3)))
+        dag.add_edge(0, 1, None)
+        child = dag.add_node(None)
+        dag.remove_node(2)
+        parent = dag.add_parent(child, None, None)
+        self.assertEqual(2, parent)
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.add_edge(child, parent, None)
+        self.assertTopologicalOrder(dag)
+
+    def test_cycle_checking_order_after_many_moves(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        first = last = dag.add_node(None)
+        for i in range(50):
+            last = dag.add_child(last, None, None)
+            first = dag.add_parent(first, None, None)
+            if i % 5 == 0:
+                self.assertTopologicalOrder(dag)
+            if i % 7 == 0:
+                node = dag.add_child(last, None, None)
+                dag.remove_node(node)
+        dag.add_edge(first, last, None)
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.add_edge(last, first, None)
+        self.assertTopologicalOrder(dag)
+
+    def test_cycle_checking_enabled_after_edges(self):
+        dag = retworkx.PyDAG()
+        dag.extend_from_edge_list([(0, 1), (1, 2), (3, 0)])
+        dag.check_cycle = True
+        self.assertTopologicalOrder(dag)
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.add_edge(2, 3, None)
+        node = dag.add_node(None)
+        dag.add_edge(2, node, None)
+        dag.check_cycle = False
+        dag.add_edge(node, 3, None)
+        with self.assertRaises(retworkx.DAGHasCycle):
+            retworkx.topological_sort(dag)
+
+    def test_add_edges_from_cycle_check_atomic(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(list(range(4)))
+        dag.add_edge(0, 1, None)
+        with self.assertRaisesRegex(retworkx.DAGWouldCycle, "edge from 3 to 0"):
+            dag.add_edges_from([(1, 2, "a"), (2, 3, "b"), (3, 0, "c")])
+        self.assertEqual([(0, 1)], dag.edge_list())
+        self.assertEqual([1, 2], dag.add_edges_from_no_data([(1, 2), (2, 3)]))
+        self.assertTopologicalOrder(dag)
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.add_edges_from_no_data([(0, 2), (3, 3)])
+        self.assertEqual([(0, 1), (1, 2), (2, 3)], dag.edge_list())
+
+    def test_extend_from_edge_list_cycle_check_atomic(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.extend_from_edge_list([(0, 1), (1, 2)])
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.extend_from_edge_list([(2, 3), (3, 4), (4, 0)])
+        self.assertEqual([0, 1, 2], list(dag.node_indexes()))
+        self.assertEqual([(0, 1), (1, 2)], dag.edge_list())
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.extend_from_weighted_edge_list([(2, 3, "a"), (3, 1, "b")])
+        self.assertEqual([0, 1, 2], list(dag.node_indexes()))
+        dag.extend_from_weighted_edge_list([(2, 3, "a"), (0, 3, "b")])
+        self.assertEqual([0, 1, 2, 3], list(dag.node_indexes()))
+        self.assertTopologicalOrder(dag)
+
+    def test_add_edges_from_cycle_check_random_batches(self):
+        rng = random.Random(1234)
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.add_nodes_from(list(range(30)))
+        for _ in range(60):
+            batch = [
+                (rng.randrange(30), rng.randrange(30))
+                for _ in range(rng.randrange(2, 6))
+            ]
+            reference = retworkx.PyDiGraph()
+            reference.add_nodes_from(list(range(30)))
+            reference.add_edges_from_no_data(list(dag.edge_list()) + batch)
+            edges = list(dag.edge_list())
+            if retworkx.is_directed_acyclic_graph(reference):
+                dag.add_edges_from_no_data(batch)
+                self.assertEqual(edges + batch, dag.edge_list())
+            else:
+                with self.assertRaises(retworkx.DAGWouldCycle):
+                    dag.add_edges_from_no_data(batch)
+                self.assertEqual(edges, dag.edge_list())
+        self.assertTopologicalOrder(dag)
+
+    def test_add_edges_from_cycle_check_small_batches(self):
+        # Batches of at most an eighth as many edges as the graph has nodes
+        # are added one at a time and rolled back, larger ones are sorted
+        # with the whole graph, both report the same edge
+        dag = retworkx.PyDAG(check_cycle=True, multigraph=False)
+        dag.add_nodes_from(list(range(100)))
+        dag.add_edges_from_no_data([(i, i + 1) for i in range(99)])
+        self.assertEqual(
+            [99, 100], dag.add_edges_from([(0, 50, "a"), (50, 99, "b")])
+        )
+        edges = list(dag.edge_list())
+        with self.assertRaisesRegex(
+            retworkx.DAGWouldCycle, "edge from 60 to 5 "
+        ):
+            dag.add_edges_from(
+                [(0, 1, "x"), (10, 20, "y"), (60, 5, "z"), (99, 0, "w")]
+            )
+        self.assertEqual(edges, dag.edge_list())
+        self.assertIsNone(dag.get_edge_data(0, 1))
+        large_batch = [(i, i + 2) for i in range(15)] + [(60, 5), (99, 0)]
+        with self.assertRaisesRegex(
+            retworkx.DAGWouldCycle, "edge from 60 to 5 "
+        ):
+            dag.add_edges_from_no_data(large_batch)
+        self.assertEqual(edges, dag.edge_list())
+        self.assertEqual(
+            [101, 102], dag.add_edges_from_no_data([(10, 20), (30, 40)])
+        )
+        self.assertTopologicalOrder(dag)
+
     def test_find_adjacent_node_by_edge(self):
         dag = retworkx.PyDAG()
         node_a = dag.add_node("a")
@@ -632,6 +823,70 @@ class TestEdges(unittest.TestCase):
         graph = retworkx.PyDiGraph()
         self.assertEqual({}, graph.edge_index_map())
 
+    def test_from_edge_array(self):
+        edges = numpy.array([[0, 1], [1, 2], [0, 2], [2, 3], [0, 3]])
+        graph = retworkx.PyDiGraph.from_edge_array(edges)
+        self.assertEqual(len(graph), 4)
+        self.assertEqual([None] * 5, graph.edges())
+        self.assertEqual(
+            [(0, 1), (1, 2), (0, 2), (2, 3), (0, 3)], graph.edge_list()
+        )
+
+    def test_from_edge_array_weights(self):
+        edges = numpy.array([[0, 1], [1, 2]], dtype=numpy.uint32)
+        graph = retworkx.PyDiGraph.from_edge_array(
+            edges, numpy.array([0.5, 1.5])
+        )
+        self.assertEqual([(0, 1, 0.5), (1, 2, 1.5)], graph.weighted_edge_list())
+        graph = retworkx.PyDiGraph.from_edge_array(edges, numpy.array([3, 4]))
+        self.assertEqual([(0, 1, 3), (1, 2, 4)], graph.weighted_edge_list())
+
+    def test_from_edge_array_empty(self):
+        graph = retworkx.PyDiGraph.from_edge_array(
+            numpy.zeros((0, 2), dtype=numpy.int64)
+        )
+        self.assertEqual(0, len(graph))
+
+    def test_from_edge_array_invalid(self):
+        with self.assertRaises(ValueError):
+            retworkx.PyDiGraph.from_edge_array(numpy.array([[0, 1, 2]]))
+        with self.assertRaises(ValueError):
+            retworkx.PyDiGraph.from_edge_array(numpy.array([[0, -1]]))
+        with self.assertRaises(TypeError):
+            retworkx.PyDiGraph.from_edge_array(numpy.array([[0.0, 1.0]]))
+        with self.assertRaises(ValueError):
+            retworkx.PyDiGraph.from_edge_array(
+                numpy.array([[0, 1]]), numpy.array([1.0, 2.0])
+            )
+
+    def test_extend_from_edge_array(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(["a", "b", "c"])
+        graph.remove_node(1)
+        graph.extend_from_edge_array(
+            numpy.array([[0, 1], [2, 4]]), numpy.array([1.0, 2.0])
+        )
+        self.assertEqual(["a", None, "c", None, None], graph.nodes())
+        self.assertEqual([(0, 1, 1.0), (2, 4, 2.0)], graph.weighted_edge_list())
+
+    def test_extend_from_edge_array_index_too_large(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(["a", "b", "c"])
+        graph.extend_from_edge_array(numpy.array([[0, 4], [5, 6]]))
+        self.assertEqual(7, len(graph))
+        with self.assertRaises(ValueError):
+            graph.extend_from_edge_array(numpy.array([[0, 1], [2, 2 ** 40]]))
+        with self.assertRaises(ValueError):
+            retworkx.PyDiGraph.from_edge_array(numpy.array([[0, 2 ** 40]]))
+        self.assertEqual(7, len(graph))
+        self.assertEqual([(0, 4), (5, 6)], graph.edge_list())
+
+    def test_extend_from_edge_array_cycle_check(self):
+        dag = retworkx.PyDAG(check_cycle=True)
+        dag.extend_from_edge_array(numpy.array([[0, 1], [1, 2]]))
+        with self.assertRaises(retworkx.DAGWouldCycle):
+            dag.extend_from_edge_array(numpy.array([[2, 0]]))
+
 
 class TestEdgesMultigraphFalse(unittest.TestCase):
     def test_multigraph_attr(self):
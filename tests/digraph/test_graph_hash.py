@@ -0,0 +1,110 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import random
+import unittest
+
+import retworkx
+
+
+class TestWeisfeilerLehmanGraphHash(unittest.TestCase):
+    def test_hash_is_hex_string(self):
+        graph = retworkx.generators.directed_cycle_graph(5)
+        graph_hash = retworkx.weisfeiler_lehman_graph_hash(graph)
+        self.assertIsInstance(graph_hash, str)
+        self.assertEqual(len(graph_hash), 16)
+        int(graph_hash, 16)
+        self.assertEqual(
+            graph_hash, retworkx.weisfeiler_lehman_graph_hash(graph)
+        )
+
+    def test_isomorphic_graphs_same_hash(self):
+        graph = retworkx.generators.directed_grid_graph(4, 5)
+        order = list(graph.node_indices())
+        random.Random(42).shuffle(order)
+        permuted = retworkx.PyDiGraph()
+        permuted.add_node(None)
+        permuted.add_nodes_from([None] * len(order))
+        permuted.remove_node(0)
+        position = {node: index + 1 for index, node in enumerate(order)}
+        edges = [
+            (position[source], position[target])
+            for source, target in graph.edge_list()
+        ]
+        random.Random(7).shuffle(edges)
+        permuted.add_edges_from_no_data(edges)
+        self.assertTrue(retworkx.is_isomorphic(graph, permuted))
+        for iterations in [0, 1, 3, 5]:
+            with self.subTest(iterations=iterations):
+                self.assertEqual(
+                    retworkx.weisfeiler_lehman_graph_hash(
+                        graph, iterations=iterations
+                    ),
+                    retworkx.weisfeiler_lehman_graph_hash(
+                        permuted, iterations=iterations
+                    ),
+                )
+
+    def test_different_graphs_different_hash(self):
+        path = retworkx.generators.directed_path_graph(4)
+        star = retworkx.generators.directed_star_graph(4)
+        self.assertEqual(path.num_edges(), star.num_edges())
+        self.assertNotEqual(
+            retworkx.weisfeiler_lehman_graph_hash(path),
+            retworkx.weisfeiler_lehman_graph_hash(star),
+        )
+
+    def test_node_key(self):
+        graph_a = retworkx.generators.directed_path_graph(3)
+        graph_b = retworkx.generators.directed_path_graph(3)
+        for index, node in enumerate(graph_a.node_indices()):
+            graph_a[node] = "a" if index == 0 else "b"
+        for index, node in enumerate(graph_b.node_indices()):
+            graph_b[node] = "a" if index == 1 else "b"
+        self.assertEqual(
+            retworkx.weisfeiler_lehman_graph_hash(graph_a),
+            retworkx.weisfeiler_lehman_graph_hash(graph_b),
+        )
+        self.assertNotEqual(
+            retworkx.weisfeiler_lehman_graph_hash(
+                graph_a, node_key=lambda x: x
+            ),
+            retworkx.weisfeiler_lehman_graph_hash(
+                graph_b, node_key=lambda x: x
+            ),
+        )
+
+    def test_edge_key(self):
+        graph_a = retworkx.PyDiGraph()
+        graph_a.add_nodes_from(range(3))
+        graph_a.add_edges_from([(0, 1, 1), (1, 2, 2)])
+        graph_b = retworkx.PyDiGraph()
+        graph_b.add_nodes_from(range(3))
+        graph_b.add_edges_from([(0, 1, 1), (1, 2, 1)])
+        self.assertEqual(
+            retworkx.weisfeiler_lehman_graph_hash(graph_a),
+            retworkx.weisfeiler_lehman_graph_hash(graph_b),
+        )
+        self.assertNotEqual(
+            retworkx.weisfeiler_lehman_graph_hash(
+                graph_a, edge_key=lambda x: x
+            ),
+            retworkx.weisfeiler_lehman_graph_hash(
+                graph_b, edge_key=lambda x: x
+            ),
+        )
+
+    def test_empty_graph(self):
+        self.assertEqual(
+            retworkx.weisfeiler_lehman_graph_hash(retworkx.PyDiGraph()),
+            retworkx.weisfeiler_lehman_graph_hash(retworkx.PyDiGraph()),
+        )
@@ -12,6 +12,8 @@
 
 import unittest
 
+import numpy
+
 import retworkx
 
 
@@ -57,3 +59,34 @@ class TestAdj(unittest.TestCase):
         dag = retworkx.PyDAG()
         node_a = dag.add_node("a")
         self.assertEqual([], dag.neighbors(node_a))
+
+    def test_neighbors_of(self):
+        dag = retworkx.PyDAG()
+        dag.extend_from_edge_list([(0, 2), (0, 1), (0, 2), (1, 2), (3, 0)])
+        offsets, indices = dag.neighbors_of([0, 2, 3, 1, 7])
+        numpy.testing.assert_array_equal(offsets, [0, 2, 2, 3, 4, 4])
+        numpy.testing.assert_array_equal(indices, [1, 2, 0, 2])
+        self.assertEqual(numpy.int64, offsets.dtype)
+        self.assertEqual(numpy.int64, indices.dtype)
+
+    def test_neighbors_of_numpy_array(self):
+        dag = retworkx.PyDAG()
+        dag.extend_from_edge_list([(0, 1), (1, 2), (1, 0)])
+        for dtype in (numpy.int64, numpy.int32, numpy.uint64):
+            offsets, indices = dag.neighbors_of(
+                numpy.array([1, 0], dtype=dtype)
+            )
+            numpy.testing.assert_array_equal(offsets, [0, 2, 3])
+            numpy.testing.assert_array_equal(indices, [0, 2, 1])
+
+    def test_neighbors_of_negative_index(self):
+        dag = retworkx.PyDAG()
+        dag.add_node(None)
+        with self.assertRaises(ValueError):
+            dag.neighbors_of(numpy.array([-1]))
+
+    def test_neighbors_of_empty(self):
+        dag = retworkx.PyDAG()
+        offsets, indices = dag.neighbors_of([])
+        numpy.testing.assert_array_equal(offsets, [0])
+        self.assertEqual((0,), indices.shape)
@@ -402,3 +402,10 @@ class TestNodes(unittest.TestCase):
         graph.add_nodes_from(["a", "b"])
         with self.assertRaises(IndexError):
             graph.merge_nodes(0, 3)
+
+    def test_class_docstring(self):
+        self.assertTrue(
+            retworkx.PyDiGraph.__doc__.startswith(
+                "A class for creating directed graphs"
+            )
+        )
@@ -71,3 +71,99 @@ class TestSpringLayout(unittest.TestCase):
         self.assertTrue(nodes[0] in res)
         self.assertTrue(nodes[2] in res)
         self.assertFalse(nodes[1] in res)
+
+    def test_barnes_hut(self):
+        graph = retworkx.generators.directed_grid_graph(10, 10)
+        res = retworkx.spring_layout(graph, seed=42, theta=0.5)
+        self.assertEqual(len(res), 100)
+        for x, y in res.values():
+            self.assertLessEqual(abs(x), 1.0 + 1e-9)
+            self.assertLessEqual(abs(y), 1.0 + 1e-9)
+        self.assertEqual(res, retworkx.spring_layout(graph, seed=42, theta=0.5))
+
+    def test_barnes_hut_fixed(self):
+        pos = {0: [0.1, 0.1]}
+        res = retworkx.spring_layout(self.graph, pos=pos, fixed={0}, theta=0.5)
+        self.assertEqual(res[0], pos[0])
+
+    def test_barnes_hut_coincident_nodes(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(4)))
+        pos = {node: [0.5, 0.5] for node in range(4)}
+        res = retworkx.spring_layout(graph, pos=pos, theta=0.5)
+        self.assertEqual(len(res), 4)
+
+    def test_barnes_hut_near_coincident_nodes(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(5)))
+        pos = {
+            0: [0.0, 0.0],
+            1: [1e-13, 0.0],
+            2: [0.0, 1e-13],
+            3: [1.0, 1.0],
+            4: [1.0, 1.0],
+        }
+        res = retworkx.spring_layout(graph, pos=pos, theta=1.5)
+        self.assertEqual(len(res), 5)
+        for x, y in res.values():
+            self.assertLessEqual(abs(x), 1.0 + 1e-9)
+            self.assertLessEqual(abs(y), 1.0 + 1e-9)
+
+    def test_barnes_hut_invalid_theta(self):
+        with self.assertRaises(ValueError):
+            retworkx.spring_layout(self.graph, theta=-1.0)
+
+
+class TestMultilevelLayout(unittest.TestCase):
+    def test_empty_graph(self):
+        res = retworkx.multilevel_layout(retworkx.PyDiGraph())
+        self.assertEqual({}, res)
+
+    def test_single_node(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_node(0)
+        res = retworkx.digraph_multilevel_layout(graph, seed=42)
+        self.assertEqual([0], list(res.keys()))
+
+    def test_grid_graph(self):
+        graph = retworkx.generators.directed_grid_graph(20, 20)
+        res = retworkx.digraph_multilevel_layout(graph, seed=42)
+        self.assertIsInstance(res, retworkx.Pos2DMapping)
+        self.assertEqual(len(res), 400)
+        for x, y in res.values():
+            self.assertLessEqual(abs(x), 1.0 + 1e-9)
+            self.assertLessEqual(abs(y), 1.0 + 1e-9)
+        self.assertEqual(
+            res, retworkx.digraph_multilevel_layout(graph, seed=42)
+        )
+
+    def test_grid_graph_barnes_hut(self):
+        graph = retworkx.generators.directed_grid_graph(20, 20)
+        res = retworkx.multilevel_layout(graph, seed=42, theta=0.5)
+        self.assertEqual(len(res), 400)
+
+    def test_star_graph(self):
+        graph = retworkx.generators.directed_star_graph(100)
+        res = retworkx.multilevel_layout(graph, seed=42)
+        self.assertEqual(len(res), 100)
+
+    def test_removed_nodes(self):
+        graph = retworkx.generators.directed_grid_graph(10, 10)
+        graph.remove_nodes_from([0, 42, 99])
+        res = retworkx.multilevel_layout(graph, seed=42, center=[1.0, 1.0])
+        self.assertEqual(set(graph.node_indexes()), set(res.keys()))
+
+    def test_edge_weights(self):
+        graph = retworkx.generators.directed_grid_graph(10, 10)
+        res = retworkx.multilevel_layout(
+            graph, weight_fn=lambda _: 2.0, seed=42
+        )
+        expected = retworkx.multilevel_layout(
+            graph, default_weight=2.0, seed=42
+        )
+        self.assertEqual(expected, res)
+
+    def test_invalid_theta(self):
+        graph = retworkx.generators.directed_grid_graph(3, 3)
+        with self.assertRaises(ValueError):
+            retworkx.multilevel_layout(graph, theta=-0.5)
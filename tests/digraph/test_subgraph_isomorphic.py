@@ -204,3 +204,88 @@ class TestSubgraphIsomorphic(unittest.TestCase):
         self.assertTrue(
             retworkx.is_subgraph_isomorphic(g_a, g_b, induced=False)
         )
+
+    def test_large_subgraph_isomorphic(self):
+        g_a = retworkx.generators.directed_grid_graph(10, 10)
+        for id_order in [False, True]:
+            with self.subTest(id_order=id_order):
+                self.assertTrue(
+                    retworkx.is_subgraph_isomorphic(
+                        g_a,
+                        retworkx.generators.directed_grid_graph(3, 3),
+                        id_order=id_order,
+                    )
+                )
+                self.assertFalse(
+                    retworkx.is_subgraph_isomorphic(
+                        g_a,
+                        retworkx.generators.directed_cycle_graph(3),
+                        id_order=id_order,
+                    )
+                )
+                self.assertFalse(
+                    retworkx.is_subgraph_isomorphic(
+                        g_a,
+                        retworkx.generators.directed_cycle_graph(3),
+                        id_order=id_order,
+                        induced=False,
+                    )
+                )
+
+    def test_subgraph_isomorphic_node_key(self):
+        g_a = retworkx.generators.directed_grid_graph(10, 10)
+        for node in g_a.node_indices():
+            g_a[node] = node % 3
+        g_b = retworkx.generators.directed_path_graph(3)
+        for id_order in [False, True]:
+            with self.subTest(id_order=id_order):
+                for labels, expected in [([0, 1, 2], True), ([0, 0, 0], False)]:
+                    for node, label in zip(g_b.node_indices(), labels):
+                        g_b[node] = label
+                    self.assertEqual(
+                        retworkx.is_subgraph_isomorphic(
+                            g_a,
+                            g_b,
+                            id_order=id_order,
+                            node_key=lambda x: x,
+                        ),
+                        expected,
+                    )
+
+    def test_non_induced_subgraph_isomorphic_edge_key(self):
+        g_a = retworkx.PyDiGraph()
+        g_b = retworkx.PyDiGraph()
+
+        nodes = g_a.add_nodes_from(["a_1", "a_2", "a_3"])
+        g_a.add_edges_from(
+            [
+                (nodes[0], nodes[1], "a_1"),
+                (nodes[1], nodes[2], "a_2"),
+                (nodes[2], nodes[0], "a_3"),
+            ]
+        )
+
+        nodes = g_b.add_nodes_from(["a_1", "a_2", "a_3"])
+        for id_order in [False, True]:
+            for labels, expected in [
+                (["a_1", "a_2"], True),
+                (["b", "b"], False),
+            ]:
+                with self.subTest(id_order=id_order, labels=labels):
+                    g_b.remove_edges_from(list(g_b.edge_list()))
+                    g_b.add_edges_from(
+                        [
+                            (nodes[0], nodes[1], labels[0]),
+                            (nodes[1], nodes[2], labels[1]),
+                        ]
+                    )
+                    self.assertEqual(
+                        retworkx.is_subgraph_isomorphic(
+                            g_a,
+                            g_b,
+                            id_order=id_order,
+                            induced=False,
+                            edge_key=lambda x: x,
+                        ),
+                        expected,
+                    )
@@ -43,3 +43,42 @@ class TestTransitivity(unittest.TestCase):
         graph = retworkx.PyDiGraph()
         res = retworkx.transitivity(graph)
         self.assertEqual(res, 0.0)
+
+    def test_transitivity_ignores_self_loops_and_parallel_edges(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(3)))
+        graph.add_edges_from_no_data([(0, 1), (0, 2), (1, 2), (0, 1), (2, 2)])
+        res = retworkx.transitivity(graph)
+        self.assertEqual(res, 0.5)
+
+
+class TestTriangles(unittest.TestCase):
+    def test_triangles(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(4)))
+        graph.add_edges_from_no_data([(0, 1), (0, 2), (1, 2), (2, 3)])
+        res = retworkx.triangles(graph)
+        self.assertEqual({0: 1, 1: 1, 2: 1, 3: 0}, res)
+
+    def test_triangles_fulltriangle(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(3)))
+        graph.add_edges_from_no_data(
+            [(0, 1), (1, 0), (0, 2), (2, 0), (1, 2), (2, 1)]
+        )
+        res = retworkx.digraph_triangles(graph)
+        self.assertEqual({0: 8, 1: 8, 2: 8}, res)
+        res = retworkx.digraph_local_clustering_coefficient(graph)
+        self.assertEqual({0: 1.0, 1: 1.0, 2: 1.0}, res)
+
+    def test_local_clustering_coefficient(self):
+        graph = retworkx.PyDiGraph()
+        graph.add_nodes_from(list(range(4)))
+        graph.add_edges_from_no_data([(0, 1), (0, 2), (1, 2), (2, 3)])
+        res = retworkx.local_clustering_coefficient(graph)
+        self.assertEqual({0: 0.5, 1: 0.5, 2: 1 / 6, 3: 0.0}, res)
+
+    def test_triangles_empty(self):
+        graph = retworkx.PyDiGraph()
+        self.assertEqual({}, retworkx.triangles(graph))
+        self.assertEqual({}, retworkx.local_clustering_coefficient(graph))
@@ -0,0 +1,134 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import retworkx
+
+
+class TestVf2Mapping(unittest.TestCase):
+    def test_all_mappings_of_cycle(self):
+        graph = retworkx.generators.directed_cycle_graph(4)
+        for id_order in [False, True]:
+            with self.subTest(id_order=id_order):
+                mappings = [
+                    dict(mapping.items())
+                    for mapping in retworkx.vf2_mapping(
+                        graph, graph, id_order=id_order
+                    )
+                ]
+                self.assertEqual(len(mappings), 4)
+                self.assertIn({0: 0, 1: 1, 2: 2, 3: 3}, mappings)
+                for mapping in mappings:
+                    self.assertEqual(sorted(mapping.values()), [0, 1, 2, 3])
+
+    def test_limit(self):
+        graph = retworkx.generators.directed_cycle_graph(4)
+        mappings = retworkx.vf2_mapping(graph, graph, limit=3)
+        self.assertEqual(len(list(mappings)), 3)
+
+    def test_lazy_iteration(self):
+        graph = retworkx.generators.directed_path_graph(3)
+        mappings = retworkx.vf2_mapping(graph, graph)
+        self.assertIsInstance(next(mappings), retworkx.NodeMap)
+        self.assertEqual(
+            len(list(mappings)) + 1,
+            len(list(retworkx.vf2_mapping(graph, graph))),
+        )
+        self.assertEqual(list(mappings), [])
+
+    def test_no_mappings(self):
+        first = retworkx.generators.directed_path_graph(3)
+        second = retworkx.generators.directed_path_graph(4)
+        self.assertEqual(list(retworkx.vf2_mapping(first, second)), [])
+        self.assertEqual(
+            list(retworkx.vf2_mapping(first, second, subgraph=True)), []
+        )
+
+    def test_node_matcher(self):
+        first = retworkx.PyDiGraph()
+        first.add_nodes_from(["a", "b", "c"])
+        first.add_edges_from_no_data([(0, 1), (1, 2)])
+        second = retworkx.PyDiGraph()
+        second.add_nodes_from(["a", "b", "c"])
+        second.add_edges_from_no_data([(0, 1), (1, 2)])
+        mappings = retworkx.vf2_mapping(
+            first, second, node_matcher=lambda x, y: x == y
+        )
+        self.assertEqual(
+            [dict(mapping.items()) for mapping in mappings],
+            [{0: 0, 1: 1, 2: 2}],
+        )
+
+    def test_subgraph(self):
+        first = retworkx.generators.directed_path_graph(3)
+        second = retworkx.generators.directed_path_graph(2)
+        for id_order in [False, True]:
+            with self.subTest(id_order=id_order):
+                mappings = [
+                    dict(mapping.items())
+                    for mapping in retworkx.vf2_mapping(
+                        first, second, subgraph=True, id_order=id_order
+                    )
+                ]
+                self.assertEqual(len(mappings), 2)
+                self.assertIn({0: 0, 1: 1}, mappings)
+
+    def test_removed_nodes(self):
+        first = retworkx.PyDiGraph()
+        first.add_nodes_from(range(4))
+        first.remove_node(0)
+        first.add_edges_from_no_data([(1, 2), (2, 3)])
+        second = retworkx.generators.directed_path_graph(3)
+        for id_order in [False, True]:
+            with self.subTest(id_order=id_order):
+                mappings = [
+                    dict(mapping.items())
+                    for mapping in retworkx.vf2_mapping(
+                        first, second, id_order=id_order
+                    )
+                ]
+                self.assertIn({1: 0, 2: 1, 3: 2}, mappings)
+                for mapping in mappings:
+                    self.assertEqual(sorted(mapping), [1, 2, 3])
+
+    def test_node_key(self):
+        first = retworkx.PyDiGraph()
+        first.add_nodes_from(["a", "b", "c"])
+        first.add_edges_from_no_data([(0, 1), (1, 2)])
+        second = retworkx.PyDiGraph()
+        second.add_nodes_from(["a", "b", "c"])
+        second.add_edges_from_no_data([(0, 1), (1, 2)])
+        mappings = retworkx.vf2_mapping(first, second, node_key=lambda x: x)
+        self.assertEqual(
+            [dict(mapping.items()) for mapping in mappings],
+            [{0: 0, 1: 1, 2: 2}],
+        )
+
+    def test_vf2_mapping_removed_nodes(self):
+        g_a = retworkx.PyDiGraph()
+        g_a.add_nodes_from(list(range(6)))
+        g_a.add_edges_from_no_data([(0, 3), (3, 5), (5, 1)])
+        g_a.remove_nodes_from([2, 4])
+        g_b = retworkx.PyDiGraph()
+        g_b.add_nodes_from([0, 3, 5, 1])
+        g_b.add_edges_from_no_data([(0, 1), (1, 2), (2, 3)])
+        for id_order in [False, True]:
+            with self.subTest(id_order=id_order):
+                mapping = next(
+                    retworkx.vf2_mapping(
+                        g_a, g_b, lambda x, y: x == y, id_order=id_order
+                    )
+                )
+                self.assertEqual(
+                    {0: 0, 3: 1, 5: 2, 1: 3}, dict(mapping.items())
+                )
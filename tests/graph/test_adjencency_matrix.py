@@ -158,3 +158,94 @@ class TestGraphAdjacencyMatrix(unittest.TestCase):
     def test_graph_to_digraph_adjacency_matrix(self):
         graph = retworkx.PyGraph()
         self.assertRaises(TypeError, retworkx.digraph_adjacency_matrix, graph)
+
+
+def csr_to_dense(data, indices, indptr):
+    num_nodes = len(indptr) - 1
+    dense = np.zeros((num_nodes, num_nodes))
+    for row in range(num_nodes):
+        for pos in range(indptr[row], indptr[row + 1]):
+            dense[row, indices[pos]] += data[pos]
+    return dense
+
+
+class TestSparseAdjacencyMatrix(unittest.TestCase):
+    def test_matches_dense(self):
+        graph = retworkx.undirected_gnm_random_graph(20, 60, seed=42)
+        graph.add_edge(3, 3, None)
+        graph.add_edge(0, 1, None)
+        graph.add_edge(0, 1, None)
+        graph.remove_node(5)
+        weights = np.arange(100.0)
+        data, indices, indptr = retworkx.graph_sparse_adjacency_matrix(
+            graph, weights
+        )
+        self.assertEqual(len(indptr), len(graph) + 1)
+        self.assertTrue(
+            np.array_equal(
+                retworkx.graph_adjacency_matrix(graph, weights),
+                csr_to_dense(data, indices, indptr),
+            )
+        )
+
+    def test_sums_parallel_edges(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(3)))
+        graph.add_edges_from([(0, 1, 1.0), (0, 1, 2.0), (1, 2, 4.0)])
+        data, indices, indptr = retworkx.sparse_adjacency_matrix(graph, float)
+        self.assertEqual(len(data), len(indices))
+        self.assertEqual(csr_to_dense(data, indices, indptr)[0, 1], 3.0)
+        self.assertEqual(indptr[1] - indptr[0], 1)
+
+    def test_default_weight(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(2)))
+        graph.add_edge(0, 1, None)
+        data, indices, indptr = retworkx.sparse_adjacency_matrix(
+            graph, default_weight=4
+        )
+        self.assertEqual(data.tolist()[0], 4.0)
+
+    def test_empty(self):
+        data, indices, indptr = retworkx.sparse_adjacency_matrix(
+            retworkx.PyGraph()
+        )
+        self.assertEqual(data.tolist(), [])
+        self.assertEqual(indices.tolist(), [])
+        self.assertEqual(indptr.tolist(), [0])
+
+    def test_round_trip(self):
+        graph = retworkx.undirected_gnm_random_graph(15, 40, seed=7)
+        sparse = retworkx.sparse_adjacency_matrix(graph, lambda _: 1.5)
+        new_graph = retworkx.PyGraph.from_sparse_adjacency_matrix(*sparse)
+        expected = retworkx.PyGraph.from_adjacency_matrix(
+            retworkx.adjacency_matrix(graph, lambda _: 1.5)
+        )
+        self.assertEqual(new_graph.nodes(), expected.nodes())
+        self.assertEqual(
+            sorted(new_graph.weighted_edge_list()),
+            sorted(expected.weighted_edge_list()),
+        )
+
+    def test_from_sparse_sums_duplicates(self):
+        graph = retworkx.PyGraph.from_sparse_adjacency_matrix(
+            np.array([1.0, 2.0, -5.0]),
+            np.array([1, 1, 0]),
+            np.array([0, 2, 3]),
+        )
+        self.assertEqual(graph.nodes(), [0, 1])
+        self.assertEqual(graph.weighted_edge_list(), [(0, 1, 3.0)])
+
+    def test_from_sparse_invalid(self):
+        with self.assertRaises(ValueError):
+            retworkx.PyGraph.from_sparse_adjacency_matrix(
+                np.array([1.0]), np.array([2]), np.array([0, 1])
+            )
+        with self.assertRaises(ValueError):
+            retworkx.PyGraph.from_sparse_adjacency_matrix(
+                np.array([1.0]), np.array([0]), np.array([0, 2])
+            )
+        with self.assertRaises(TypeError):
+            retworkx.PyGraph.from_sparse_adjacency_matrix(
+                np.array([1.0]), np.array([0.0]), np.array([0, 1])
+            )
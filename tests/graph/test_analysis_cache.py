@@ -0,0 +1,58 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import retworkx
+
+
+class TestAnalysisCache(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyGraph()
+        self.graph.extend_from_edge_list([(0, 1), (1, 2), (2, 0), (2, 3)])
+
+    def test_disabled_by_default(self):
+        self.assertFalse(self.graph.analysis_cache)
+        retworkx.transitivity(self.graph)
+        info = self.graph.analysis_cache_info()
+        self.assertEqual(0, info["hits"])
+        self.assertEqual(0, info["misses"])
+
+    def test_transitivity(self):
+        self.graph.analysis_cache = True
+        expected = retworkx.transitivity(self.graph)
+        self.assertEqual(expected, retworkx.transitivity(self.graph))
+        info = self.graph.analysis_cache_info()
+        self.assertEqual(1, info["hits"])
+        self.assertEqual(1, info["misses"])
+
+    def test_invalidated_by_changes(self):
+        self.graph.analysis_cache = True
+        self.assertEqual(0.6, retworkx.transitivity(self.graph))
+        self.graph.remove_edge(2, 3)
+        self.assertEqual(1.0, retworkx.transitivity(self.graph))
+        self.graph.add_edges_from_no_data([(0, 3), (1, 3), (2, 3)])
+        self.assertEqual(1.0, retworkx.transitivity(self.graph))
+        self.graph.remove_nodes_from([3])
+        self.assertEqual(1.0, retworkx.transitivity(self.graph))
+        info = self.graph.analysis_cache_info()
+        self.assertEqual(0, info["hits"])
+        self.assertEqual(4, info["misses"])
+
+    def test_copy_starts_empty(self):
+        self.graph.analysis_cache = True
+        retworkx.transitivity(self.graph)
+        copy = self.graph.copy()
+        self.assertTrue(copy.analysis_cache)
+        copy.remove_edge(2, 3)
+        self.assertEqual(1.0, retworkx.transitivity(copy))
+        self.assertEqual(0, copy.analysis_cache_info()["hits"])
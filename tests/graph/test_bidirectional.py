@@ -0,0 +1,163 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import random
+import unittest
+
+import retworkx
+
+
+class TestBidirectional(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyGraph()
+        self.graph.add_nodes_from(list(range(6)))
+        self.graph.add_edges_from(
+            [
+                (0, 1, 7),
+                (2, 0, 9),
+                (0, 3, 14),
+                (1, 2, 10),
+                (3, 2, 2),
+                (3, 4, 9),
+                (1, 5, 15),
+                (2, 5, 11),
+                (4, 5, 6),
+            ]
+        )
+
+    def assertValidPath(self, graph, length, path, source, target):
+        self.assertEqual(source, path[0])
+        self.assertEqual(target, path[-1])
+        total = 0.0
+        for edge_source, edge_target in zip(path, path[1:]):
+            total += min(graph.get_all_edge_data(edge_source, edge_target))
+        self.assertAlmostEqual(length, total)
+
+    def test_bidirectional_dijkstra(self):
+        length, path = retworkx.graph_bidirectional_dijkstra(
+            self.graph, 0, 5, weight_fn=float
+        )
+        expected = retworkx.graph_dijkstra_shortest_path_lengths(
+            self.graph, 0, float, 5
+        )
+        self.assertEqual(expected[5], length)
+        self.assertValidPath(self.graph, length, path, 0, 5)
+
+    def test_bidirectional_dijkstra_same_node(self):
+        length, path = retworkx.graph_bidirectional_dijkstra(self.graph, 3, 3)
+        self.assertEqual(0.0, length)
+        self.assertEqual([3], path)
+
+    def test_bidirectional_dijkstra_default_weight(self):
+        length, path = retworkx.graph_bidirectional_dijkstra(
+            self.graph, 0, 5, default_weight=2.0
+        )
+        self.assertEqual(4.0, length)
+        self.assertEqual(3, len(path))
+        self.assertEqual((0, 5), (path[0], path[-1]))
+
+    def test_bidirectional_dijkstra_grid(self):
+        graph = retworkx.generators.grid_graph(20, 20)
+        for edge in graph.edge_indices():
+            graph.update_edge_by_index(edge, random.Random(edge).random())
+        expected = retworkx.graph_dijkstra_shortest_path_lengths(
+            graph, 0, float, 399
+        )
+        length, path = retworkx.graph_bidirectional_dijkstra(
+            graph, 0, 399, weight_fn=float
+        )
+        self.assertAlmostEqual(expected[399], length)
+        self.assertValidPath(graph, length, path, 0, 399)
+
+    def test_bidirectional_dijkstra_random_graph(self):
+        graph = retworkx.undirected_gnp_random_graph(50, 0.05, seed=1234)
+        rng = random.Random(42)
+        for edge in graph.edge_indices():
+            graph.update_edge_by_index(edge, rng.random())
+        for target in range(1, 50, 7):
+            expected = retworkx.graph_dijkstra_shortest_path_lengths(
+                graph, 0, float, target
+            )
+            if target not in expected:
+                with self.assertRaises(retworkx.NoPathFound):
+                    retworkx.graph_bidirectional_dijkstra(
+                        graph, 0, target, weight_fn=float
+                    )
+                continue
+            length, path = retworkx.graph_bidirectional_dijkstra(
+                graph, 0, target, weight_fn=float
+            )
+            self.assertAlmostEqual(expected[target], length)
+            self.assertValidPath(graph, length, path, 0, target)
+
+    def test_bidirectional_dijkstra_no_path(self):
+        self.graph.add_node(6)
+        with self.assertRaises(retworkx.NoPathFound):
+            retworkx.graph_bidirectional_dijkstra(self.graph, 0, 6)
+
+    def test_bidirectional_dijkstra_invalid_node(self):
+        with self.assertRaises(IndexError):
+            retworkx.graph_bidirectional_dijkstra(self.graph, 0, 42)
+
+    def test_bidirectional_bfs(self):
+        length, path = retworkx.graph_bidirectional_bfs(self.graph, 0, 5)
+        self.assertEqual(2, length)
+        self.assertEqual(3, len(path))
+        self.assertEqual((0, 5), (path[0], path[-1]))
+
+    def test_bidirectional_bfs_same_node(self):
+        self.assertEqual(
+            (0, [2]), retworkx.graph_bidirectional_bfs(self.graph, 2, 2)
+        )
+
+    def test_bidirectional_bfs_grid(self):
+        graph = retworkx.generators.grid_graph(20, 20)
+        length, path = retworkx.graph_bidirectional_bfs(graph, 0, 399)
+        self.assertEqual(38, length)
+        self.assertEqual(39, len(path))
+        for source, target in zip(path, path[1:]):
+            self.assertTrue(graph.has_edge(source, target))
+
+    def test_bidirectional_bfs_random_graph(self):
+        graph = retworkx.undirected_gnp_random_graph(50, 0.05, seed=1234)
+        for target in range(1, 50, 7):
+            expected = retworkx.graph_dijkstra_shortest_path_lengths(
+                graph, 0, lambda _: 1.0, target
+            )
+            if target not in expected:
+                with self.assertRaises(retworkx.NoPathFound):
+                    retworkx.graph_bidirectional_bfs(graph, 0, target)
+                continue
+            length, path = retworkx.graph_bidirectional_bfs(graph, 0, target)
+            self.assertEqual(expected[target], length)
+            self.assertEqual(length + 1, len(path))
+
+    def test_bidirectional_bfs_no_path(self):
+        self.graph.add_node(6)
+        with self.assertRaises(retworkx.NoPathFound):
+            retworkx.graph_bidirectional_bfs(self.graph, 6, 0)
+
+    def test_bidirectional_bfs_invalid_node(self):
+        with self.assertRaises(IndexError):
+            retworkx.graph_bidirectional_bfs(self.graph, 42, 0)
+
+    def test_dispatch(self):
+        self.assertEqual(
+            retworkx.graph_bidirectional_dijkstra(
+                self.graph, 0, 5, weight_fn=float
+            ),
+            retworkx.bidirectional_dijkstra(self.graph, 0, 5, weight_fn=float),
+        )
+        self.assertEqual(
+            retworkx.graph_bidirectional_bfs(self.graph, 0, 5),
+            retworkx.bidirectional_bfs(self.graph, 0, 5),
+        )
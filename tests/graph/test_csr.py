@@ -0,0 +1,66 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+import numpy
+
+import retworkx
+
+
+class TestCSR(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyGraph()
+        self.graph.add_nodes_from(list(range(4)))
+        self.graph.add_edges_from(
+            [(0, 1, {"weight": 1.5}), (1, 2, {"weight": 2.5})]
+        )
+        self.graph.add_edge(3, 3, {"weight": 3.5})
+
+    def test_to_csr(self):
+        indptr, indices, edge_ids, weights, node_map = self.graph.to_csr()
+        self.assertEqual(indptr.tolist(), [0, 1, 3, 4, 5])
+        self.assertEqual(indices.tolist(), [1, 0, 2, 1, 3])
+        self.assertEqual(edge_ids.tolist(), [0, 0, 1, 1, 2])
+        self.assertIsNone(weights)
+        self.assertEqual(node_map.tolist(), [0, 1, 2, 3])
+
+    def test_to_csr_weights(self):
+        weights = self.graph.to_csr("weight")[3]
+        self.assertEqual(weights.dtype, numpy.float64)
+        self.assertEqual(weights.tolist(), [1.5, 1.5, 2.5, 2.5, 3.5])
+
+    def test_to_csr_symmetric(self):
+        indptr, indices, _, weights, _ = self.graph.to_csr("weight")
+        dense = numpy.zeros((4, 4))
+        for row in range(4):
+            for pos in range(indptr[row], indptr[row + 1]):
+                dense[row, indices[pos]] += weights[pos]
+        self.assertTrue(numpy.array_equal(dense, dense.T))
+
+    def test_to_csr_removed_node(self):
+        self.graph.remove_node(0)
+        indptr, indices, edge_ids, _, node_map = self.graph.to_csr()
+        self.assertEqual(node_map.tolist(), [1, 2, 3])
+        self.assertEqual(indptr.tolist(), [0, 1, 2, 3])
+        self.assertEqual(indices.tolist(), [1, 0, 2])
+        self.assertEqual(edge_ids.tolist(), [1, 1, 2])
+
+    def test_to_coo(self):
+        row, col, edge_ids, weights, node_map = self.graph.to_coo(
+            lambda edge: edge["weight"]
+        )
+        self.assertEqual(row.tolist(), [0, 1, 1, 2, 3])
+        self.assertEqual(col.tolist(), [1, 0, 2, 1, 3])
+        self.assertEqual(edge_ids.tolist(), [0, 0, 1, 1, 2])
+        self.assertEqual(weights.tolist(), [1.5, 1.5, 2.5, 2.5, 3.5])
+        self.assertEqual(node_map.tolist(), [0, 1, 2, 3])
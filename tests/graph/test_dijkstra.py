@@ -12,6 +12,8 @@
 
 import unittest
 
+import numpy
+
 import retworkx
 
 
@@ -121,6 +123,135 @@ class TestDijkstraGraph(unittest.TestCase):
         }
         self.assertEqual(expected, lengths)
 
+    def test_dijkstra_all_pair_path_lengths_weight_array(self):
+        weights = numpy.array(self.graph.edges(), dtype=numpy.float64)
+        lengths = retworkx.graph_all_pairs_dijkstra_path_lengths(
+            self.graph, weights
+        )
+        expected = retworkx.graph_all_pairs_dijkstra_path_lengths(
+            self.graph, float
+        )
+        self.assertEqual(expected, lengths)
+
+    def test_dijkstra_all_pair_path_lengths_weight_attribute(self):
+        for edge in self.graph.edge_list():
+            weight = self.graph.get_edge_data(*edge)
+            self.graph.update_edge(*edge, {"weight": weight})
+        lengths = retworkx.graph_all_pairs_dijkstra_path_lengths(
+            self.graph, "weight"
+        )
+        self.assertEqual(20.0, lengths[0][4])
+        self.assertEqual(13.0, lengths[5][3])
+
+    def test_dijkstra_all_pair_path_lengths_numpy(self):
+        self.graph.remove_node(3)
+        matrix = retworkx.graph_all_pairs_dijkstra_path_lengths_numpy(
+            self.graph, float
+        )
+        lengths = retworkx.graph_all_pairs_dijkstra_path_lengths(
+            self.graph, float
+        )
+        nodes = self.graph.node_indexes()
+        expected = numpy.full((len(nodes), len(nodes)), numpy.inf)
+        for i, source in enumerate(nodes):
+            expected[i, i] = 0.0
+            for j, target in enumerate(nodes):
+                if target in lengths[source]:
+                    expected[i, j] = lengths[source][target]
+        numpy.testing.assert_array_equal(matrix, expected)
+        numpy.testing.assert_array_equal(
+            matrix,
+            retworkx.all_pairs_dijkstra_path_lengths_numpy(self.graph, float),
+        )
+
+    def test_dijkstra_all_pair_path_lengths_numpy_unreachable(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(3)))
+        graph.add_edge(0, 1, 2.0)
+        matrix = retworkx.graph_all_pairs_dijkstra_path_lengths_numpy(
+            graph, float
+        )
+        expected = numpy.array(
+            [
+                [0.0, 2.0, numpy.inf],
+                [2.0, 0.0, numpy.inf],
+                [numpy.inf, numpy.inf, 0.0],
+            ]
+        )
+        numpy.testing.assert_array_equal(matrix, expected)
+
+    def test_dijkstra_all_pair_path_lengths_numpy_empty_graph(self):
+        graph = retworkx.PyGraph()
+        matrix = retworkx.graph_all_pairs_dijkstra_path_lengths_numpy(
+            graph, float
+        )
+        self.assertEqual(matrix.shape, (0, 0))
+
+    def test_dijkstra_all_pair_predecessors(self):
+        predecessors = retworkx.graph_all_pairs_dijkstra_predecessors(
+            self.graph, float
+        )
+        self.assertEqual(predecessors.dtype, numpy.int64)
+        lengths = retworkx.graph_all_pairs_dijkstra_path_lengths(
+            self.graph, float
+        )
+        for source in self.graph.node_indexes():
+            self.assertEqual(predecessors[source, source], -1)
+            for target in self.graph.node_indexes():
+                if target == source:
+                    continue
+                if target not in lengths[source]:
+                    self.assertEqual(predecessors[source, target], -1)
+                    with self.assertRaises(retworkx.NoPathFound):
+                        retworkx.path_from_predecessors(
+                            predecessors, source, target
+                        )
+                    continue
+                path = retworkx.path_from_predecessors(
+                    predecessors, source, target
+                )
+                self.assertEqual(path[0], source)
+                self.assertEqual(path[-1], target)
+                length = sum(
+                    self.graph.get_edge_data(path[i], path[i + 1])
+                    for i in range(len(path) - 1)
+                )
+                self.assertEqual(length, lengths[source][target])
+
+    def test_dijkstra_all_pair_predecessors_with_node_removal(self):
+        self.graph.remove_node(3)
+        predecessors = retworkx.all_pairs_dijkstra_predecessors(
+            self.graph, float
+        )
+        self.assertEqual(predecessors.shape, (5, 5))
+        nodes = list(self.graph.node_indexes())
+        paths = retworkx.graph_all_pairs_dijkstra_shortest_paths(
+            self.graph, float
+        )
+        for source, target in [(0, 2), (1, 5), (2, 1)]:
+            path = retworkx.path_from_predecessors(
+                predecessors, nodes.index(source), nodes.index(target)
+            )
+            self.assertEqual(
+                [nodes[pos] for pos in path], list(paths[source][target])
+            )
+
+    def test_path_from_predecessors_invalid(self):
+        predecessors = retworkx.graph_all_pairs_dijkstra_predecessors(
+            self.graph, float
+        )
+        self.assertEqual(
+            [0], retworkx.path_from_predecessors(predecessors, 0, 0)
+        )
+        with self.assertRaises(IndexError):
+            retworkx.path_from_predecessors(predecessors, 0, 6)
+        with self.assertRaises(ValueError):
+            retworkx.path_from_predecessors(predecessors[:2], 0, 1)
+        with self.assertRaises(ValueError):
+            retworkx.path_from_predecessors(
+                numpy.array([[-1, 1], [-1, -1]]), 0, 1
+            )
+
     def test_dijkstra_all_pair_paths(self):
         lengths = retworkx.graph_all_pairs_dijkstra_shortest_paths(
             self.graph, float
@@ -192,3 +323,84 @@ class TestDijkstraGraph(unittest.TestCase):
             expected,
             retworkx.graph_all_pairs_dijkstra_shortest_paths(graph, float),
         )
+
+    def test_batch_dijkstra_path_lengths(self):
+        sources = [self.a, self.c, self.e]
+        res = retworkx.graph_batch_dijkstra_path_lengths(
+            self.graph, sources, float
+        )
+        expected = {
+            source: retworkx.graph_dijkstra_shortest_path_lengths(
+                self.graph, source, float
+            )
+            for source in sources
+        }
+        self.assertEqual(expected, res)
+
+    def test_batch_dijkstra_path_lengths_numpy(self):
+        self.graph.remove_node(self.b)
+        sources = [self.a, self.f]
+        res = retworkx.graph_batch_dijkstra_path_lengths_numpy(
+            self.graph, sources, float
+        )
+        self.assertEqual((2, 5), res.shape)
+        nodes = self.graph.node_indexes()
+        for row, source in enumerate(sources):
+            lengths = retworkx.graph_dijkstra_shortest_path_lengths(
+                self.graph, source, float
+            )
+            for col, node in enumerate(nodes):
+                if node == source:
+                    self.assertEqual(0.0, res[row, col])
+                elif node in lengths:
+                    self.assertEqual(lengths[node], res[row, col])
+                else:
+                    self.assertTrue(numpy.isinf(res[row, col]))
+
+    def test_multi_source_dijkstra_path_lengths(self):
+        sources = [self.a, self.e]
+        res = retworkx.graph_multi_source_dijkstra_path_lengths(
+            self.graph, sources, float
+        )
+        per_source = [
+            retworkx.graph_dijkstra_shortest_path_lengths(
+                self.graph, source, float
+            )
+            for source in sources
+        ]
+        nodes = set(per_source[0]).union(per_source[1]) - set(sources)
+        expected = {
+            node: min(
+                lengths[node] for lengths in per_source if node in lengths
+            )
+            for node in nodes
+        }
+        self.assertEqual(expected, res)
+
+    def test_batch_dijkstra_invalid_source(self):
+        with self.assertRaises(IndexError):
+            retworkx.graph_batch_dijkstra_path_lengths(self.graph, [42], float)
+        with self.assertRaises(IndexError):
+            retworkx.graph_batch_dijkstra_path_lengths_numpy(
+                self.graph, [42], float
+            )
+        with self.assertRaises(IndexError):
+            retworkx.graph_multi_source_dijkstra_path_lengths(
+                self.graph, [42], float
+            )
+
+    def test_batch_dijkstra_dispatch(self):
+        self.assertEqual(
+            retworkx.graph_batch_dijkstra_path_lengths(
+                self.graph, [self.a], float
+            ),
+            retworkx.batch_dijkstra_path_lengths(self.graph, [self.a], float),
+        )
+        self.assertEqual(
+            retworkx.graph_multi_source_dijkstra_path_lengths(
+                self.graph, [self.a], float
+            ),
+            retworkx.multi_source_dijkstra_path_lengths(
+                self.graph, [self.a], float
+            ),
+        )
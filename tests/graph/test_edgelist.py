@@ -10,6 +10,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import gzip
 import os
 import tempfile
 import unittest
@@ -115,6 +116,63 @@ class TestEdgeList(unittest.TestCase):
         self.assertFalse(graph.has_edge(0, 2))
         self.assertEqual(graph.edges(), ["0", "1"])
 
+    def test_float_weight_type(self):
+        with tempfile.NamedTemporaryFile("wt") as fd:
+            fd.write("0 1 0.5\n")
+            fd.write("1 2 2 # test comments\n")
+            fd.flush()
+            graph = retworkx.PyGraph.read_edge_list(
+                fd.name, comment="#", weight_type="float"
+            )
+        self.assertEqual(graph.weighted_edge_list(), [(0, 1, 0.5), (1, 2, 2.0)])
+
+    def test_int_weight_type(self):
+        with tempfile.NamedTemporaryFile("wt") as fd:
+            fd.write("0,1,-3\n")
+            fd.write("1,2\n")
+            fd.flush()
+            graph = retworkx.PyGraph.read_edge_list(
+                fd.name, deliminator=",", weight_type="int"
+            )
+        self.assertEqual(graph.weighted_edge_list(), [(0, 1, -3), (1, 2, None)])
+
+    def test_invalid_weight(self):
+        with tempfile.NamedTemporaryFile("wt") as fd:
+            fd.write("0 1 a\n")
+            fd.flush()
+            with self.assertRaises(ValueError):
+                retworkx.PyGraph.read_edge_list(fd.name, weight_type="float")
+
+    def test_invalid_weight_type(self):
+        with tempfile.NamedTemporaryFile("wt") as fd:
+            fd.write("0 1 1\n")
+            fd.flush()
+            with self.assertRaises(ValueError):
+                retworkx.PyGraph.read_edge_list(fd.name, weight_type="complex")
+
+    def test_gzip(self):
+        with tempfile.NamedTemporaryFile() as fd:
+            with gzip.open(fd.name, "wt") as gzip_file:
+                gzip_file.write("0 1 1.5\n")
+                gzip_file.write("1 2 2.5\n")
+            graph = retworkx.PyGraph.read_edge_list(
+                fd.name, weight_type="float"
+            )
+        self.assertEqual(graph.weighted_edge_list(), [(0, 1, 1.5), (1, 2, 2.5)])
+
+    def test_large_file(self):
+        num_edges = 200000
+        with tempfile.NamedTemporaryFile("wt") as fd:
+            for i in range(num_edges):
+                fd.write("%s %s %s\n" % (i, i + 1, i))
+            fd.flush()
+            graph = retworkx.PyGraph.read_edge_list(fd.name, weight_type="int")
+        self.assertEqual(len(graph), num_edges + 1)
+        self.assertEqual(
+            graph.weighted_edge_list(),
+            [(i, i + 1, i) for i in range(num_edges)],
+        )
+
     def test_write_edge_list_empty_digraph(self):
         path = os.path.join(tempfile.gettempdir(), "empty.txt")
         graph = retworkx.PyGraph()
@@ -12,6 +12,8 @@
 
 import unittest
 
+import numpy
+
 import retworkx
 
 
@@ -224,6 +226,16 @@ class TestEdges(unittest.TestCase):
         graph.add_edge(node_b, node_c, "Super edgy")
         self.assertEqual(2, graph.degree(node_b))
 
+    def test_degrees(self):
+        graph = retworkx.PyGraph()
+        graph.extend_from_edge_list([(0, 1), (1, 2), (0, 1), (3, 3)])
+        graph.remove_node(2)
+        degrees = graph.degrees()
+        self.assertEqual(numpy.int64, degrees.dtype)
+        numpy.testing.assert_array_equal(degrees, [2, 2, 0, 1])
+        for node in graph.node_indexes():
+            self.assertEqual(graph.degree(node), degrees[node])
+
     def test_add_edge_from(self):
         graph = retworkx.PyGraph()
         nodes = list(range(4))
@@ -422,6 +434,62 @@ class TestEdges(unittest.TestCase):
         graph = retworkx.PyDiGraph()
         self.assertEqual({}, graph.edge_index_map())
 
+    def test_from_edge_array(self):
+        edges = numpy.array([[0, 1], [1, 2], [0, 2], [2, 3], [0, 3]])
+        graph = retworkx.PyGraph.from_edge_array(edges)
+        self.assertEqual(len(graph), 4)
+        self.assertEqual([None] * 5, graph.edges())
+        self.assertEqual(
+            [(0, 1), (1, 2), (0, 2), (2, 3), (0, 3)], graph.edge_list()
+        )
+
+    def test_from_edge_array_weights(self):
+        edges = numpy.array([[0, 1], [1, 2]], dtype=numpy.uint32)
+        graph = retworkx.PyGraph.from_edge_array(edges, numpy.array([0.5, 1.5]))
+        self.assertEqual([(0, 1, 0.5), (1, 2, 1.5)], graph.weighted_edge_list())
+        graph = retworkx.PyGraph.from_edge_array(edges, numpy.array([3, 4]))
+        self.assertEqual([(0, 1, 3), (1, 2, 4)], graph.weighted_edge_list())
+
+    def test_from_edge_array_empty(self):
+        graph = retworkx.PyGraph.from_edge_array(
+            numpy.zeros((0, 2), dtype=numpy.int64)
+        )
+        self.assertEqual(0, len(graph))
+
+    def test_from_edge_array_invalid(self):
+        with self.assertRaises(ValueError):
+            retworkx.PyGraph.from_edge_array(numpy.array([[0, 1, 2]]))
+        with self.assertRaises(ValueError):
+            retworkx.PyGraph.from_edge_array(numpy.array([[0, -1]]))
+        with self.assertRaises(TypeError):
+            retworkx.PyGraph.from_edge_array(numpy.array([[0.0, 1.0]]))
+        with self.assertRaises(ValueError):
+            retworkx.PyGraph.from_edge_array(
+                numpy.array([[0, 1]]), numpy.array([1.0, 2.0])
+            )
+
+    def test_extend_from_edge_array(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(["a", "b", "c"])
+        graph.remove_node(1)
+        graph.extend_from_edge_array(
+            numpy.array([[0, 1], [2, 4]]), numpy.array([1.0, 2.0])
+        )
+        self.assertEqual(["a", None, "c", None, None], graph.nodes())
+        self.assertEqual([(0, 1, 1.0), (2, 4, 2.0)], graph.weighted_edge_list())
+
+    def test_extend_from_edge_array_index_too_large(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(["a", "b", "c"])
+        graph.extend_from_edge_array(numpy.array([[0, 4], [5, 6]]))
+        self.assertEqual(7, len(graph))
+        with self.assertRaises(ValueError):
+            graph.extend_from_edge_array(numpy.array([[0, 1], [2, 2 ** 40]]))
+        with self.assertRaises(ValueError):
+            retworkx.PyGraph.from_edge_array(numpy.array([[0, 2 ** 40]]))
+        self.assertEqual(7, len(graph))
+        self.assertEqual([(0, 4), (5, 6)], graph.edge_list())
+
 
 class TestEdgesMultigraphFalse(unittest.TestCase):
     def test_multigraph_attr(self):
@@ -87,6 +87,63 @@ class TestFloydWarshall(unittest.TestCase):
 
         self.assertEqual(result, expected)
 
+    def test_vs_dijkstra_all_pairs_multiple_blocks(self):
+        graph = retworkx.undirected_gnp_random_graph(150, 0.05, seed=42)
+        for index, edge in enumerate(graph.edge_list()):
+            graph.update_edge(*edge, index % 7 + 1)
+        graph.remove_node(13)
+
+        dijkstra_lengths = retworkx.graph_all_pairs_dijkstra_path_lengths(
+            graph, float
+        )
+        expected = {k: {**v, k: 0.0} for k, v in dijkstra_lengths.items()}
+
+        result = retworkx.graph_floyd_warshall(
+            graph, float, parallel_threshold=self.parallel_threshold
+        )
+        self.assertEqual(result, expected)
+
+        dist = retworkx.graph_floyd_warshall_numpy(
+            graph, float, parallel_threshold=self.parallel_threshold
+        )
+        for i, source in enumerate(graph.node_indexes()):
+            for j, target in enumerate(graph.node_indexes()):
+                self.assertEqual(
+                    dist[i, j], expected[source].get(target, numpy.inf)
+                )
+
+    def test_vs_dijkstra_all_pairs_sparse(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(10)))
+        graph.add_edges_from([(0, 1, 2), (1, 2, 3), (5, 6, 1), (6, 7, 4)])
+
+        dijkstra_lengths = retworkx.graph_all_pairs_dijkstra_path_lengths(
+            graph, float
+        )
+        expected = {k: {**v, k: 0.0} for k, v in dijkstra_lengths.items()}
+
+        result = retworkx.graph_floyd_warshall(
+            graph, float, parallel_threshold=self.parallel_threshold
+        )
+        self.assertEqual(result, expected)
+
+    def test_floyd_warshall_numpy_weight_array(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(4)))
+        graph.add_edges_from_no_data([(0, 1), (1, 2), (2, 3), (0, 3)])
+        dist = retworkx.graph_floyd_warshall_numpy(
+            graph,
+            numpy.array([1.0, 1.0, 1.0, 5.0]),
+            parallel_threshold=self.parallel_threshold,
+        )
+        self.assertEqual(dist[0, 3], 3.0)
+        result = retworkx.graph_floyd_warshall(
+            graph,
+            numpy.array([1.0, 1.0, 1.0, 5.0]),
+            parallel_threshold=self.parallel_threshold,
+        )
+        self.assertEqual(result[0][3], 3.0)
+
     def test_floyd_warshall_empty_graph(self):
         graph = retworkx.PyGraph()
         self.assertEqual({}, retworkx.graph_floyd_warshall(graph, float))
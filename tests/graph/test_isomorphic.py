@@ -228,3 +228,126 @@ class TestIsomorphic(unittest.TestCase):
                 self.assertFalse(
                     retworkx.is_isomorphic(g_a, g_b, id_order=id_order)
                 )
+
+    def test_large_isomorphic(self):
+        g_a = retworkx.generators.cycle_graph(100)
+        g_b = retworkx.PyGraph()
+        g_b.add_nodes_from(range(100))
+        g_b.add_edges_from_no_data(
+            [(i, (i + 1) % 50) for i in range(50)]
+            + [(50 + i, 50 + (i + 1) % 50) for i in range(50)]
+        )
+        for id_order in [False, True]:
+            with self.subTest(id_order=id_order):
+                self.assertTrue(
+                    retworkx.is_isomorphic(g_a, g_a.copy(), id_order=id_order)
+                )
+                self.assertFalse(
+                    retworkx.is_isomorphic(g_a, g_b, id_order=id_order)
+                )
+
+    def test_isomorphic_node_key(self):
+        g_a = retworkx.PyGraph()
+        g_a.add_nodes_from(["a", "b", "c", "d"])
+        g_a.add_edges_from_no_data([(0, 1), (1, 2), (2, 3), (3, 0)])
+        g_b = retworkx.PyGraph()
+        g_b.add_nodes_from(["c", "d", "a", "b"])
+        g_b.add_edges_from_no_data([(0, 1), (1, 2), (2, 3), (3, 0)])
+        g_c = retworkx.PyGraph()
+        g_c.add_nodes_from(["a", "c", "b", "d"])
+        g_c.add_edges_from_no_data([(0, 1), (1, 2), (2, 3), (3, 0)])
+        for id_order in [False, True]:
+            with self.subTest(id_order=id_order):
+                self.assertTrue(
+                    retworkx.is_isomorphic(
+                        g_a, g_b, id_order=id_order, node_key=lambda x: x
+                    )
+                )
+                self.assertFalse(
+                    retworkx.is_isomorphic(
+                        g_a, g_c, id_order=id_order, node_key=lambda x: x
+                    )
+                )
+
+    def test_isomorphic_node_key_counts(self):
+        g_a = retworkx.generators.cycle_graph(4)
+        g_b = retworkx.generators.cycle_graph(4)
+        for node in g_b.node_indices():
+            g_b[node] = node
+        calls = []
+
+        def key(node):
+            calls.append(node)
+            return node is None
+
+        self.assertFalse(retworkx.is_isomorphic(g_a, g_b, node_key=key))
+        self.assertEqual(len(calls), 8)
+
+    def test_isomorphic_node_key_and_matcher(self):
+        g_a = retworkx.PyGraph()
+        g_a.add_nodes_from([("a", 1), ("b", 2), ("a", 3)])
+        g_a.add_edges_from_no_data([(0, 1), (1, 2)])
+        g_b = retworkx.PyGraph()
+        g_b.add_nodes_from([("a", 3), ("b", 2), ("a", 1)])
+        g_b.add_edges_from_no_data([(0, 1), (1, 2)])
+        compared = []
+
+        def matcher(x, y):
+            compared.append((x, y))
+            return x[1] == y[1]
+
+        self.assertEqual(
+            retworkx.is_isomorphic(
+                g_a, g_b, node_matcher=matcher, node_key=lambda x: x[0]
+            ),
+            retworkx.is_isomorphic(g_a, g_b, node_matcher=lambda x, y: x == y),
+        )
+        self.assertTrue(compared)
+        for x, y in compared:
+            self.assertEqual(x[0], y[0])
+
+    def test_isomorphic_edge_key(self):
+        g_a = retworkx.PyGraph()
+        g_a.add_nodes_from(range(3))
+        g_a.add_edges_from([(0, 1, "x"), (1, 2, "y")])
+        g_b = retworkx.PyGraph()
+        g_b.add_nodes_from(range(3))
+        g_b.add_edges_from([(0, 1, "x"), (1, 2, "x")])
+        self.assertTrue(retworkx.is_isomorphic(g_a, g_b))
+        self.assertFalse(retworkx.is_isomorphic(g_a, g_b, edge_key=lambda x: x))
+        self.assertTrue(
+            retworkx.is_isomorphic(g_a, g_a.copy(), edge_key=lambda x: x)
+        )
+
+    def test_isomorphic_unhashable_key(self):
+        graph = retworkx.generators.path_graph(2)
+        with self.assertRaises(TypeError):
+            retworkx.is_isomorphic(graph, graph, node_key=lambda x: [x])
+
+    def test_isomorphic_removed_nodes(self):
+        g_a = retworkx.PyGraph()
+        nodes = g_a.add_nodes_from(list(range(8)))
+        g_a.add_edges_from_no_data(
+            [(nodes[i], nodes[i + 1]) for i in range(7)] + [(7, 0)]
+        )
+        g_a.remove_nodes_from([1, 4])
+        g_a.add_edge(0, 2, None)
+        g_a.add_edge(3, 5, None)
+        g_b = retworkx.PyGraph()
+        g_b.add_nodes_from([0, 2, 3, 5, 6, 7])
+        g_b.add_edges_from_no_data(
+            [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 0)]
+        )
+        for id_order in [False, True]:
+            with self.subTest(id_order=id_order):
+                self.assertTrue(
+                    retworkx.is_isomorphic(
+                        g_a,
+                        g_b,
+                        lambda x, y: x == y,
+                        id_order=id_order,
+                    )
+                )
+                self.assertTrue(
+                    retworkx.is_isomorphic(g_b, g_a, id_order=id_order)
+                )
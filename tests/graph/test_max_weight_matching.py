@@ -17,6 +17,7 @@ import random
 
 import fixtures
 import networkx
+import numpy
 import testtools
 
 import retworkx
@@ -135,6 +136,20 @@ class TestMaxWeightMatching(testtools.TestCase):
             },
         )
 
+    def test_small_graph_weight_array(self):
+        graph = retworkx.PyGraph()
+        graph.extend_from_weighted_edge_list([(1, 2, 10), (2, 3, 11)])
+        self.compare_match_sets(
+            retworkx.max_weight_matching(
+                graph,
+                weight_fn=numpy.array([10, 11], dtype=numpy.int64),
+                verify_optimum=True,
+            ),
+            {
+                (2, 3),
+            },
+        )
+
     def test_path_graph(self):
         graph = retworkx.PyGraph()
         graph.extend_from_weighted_edge_list([(1, 2, 5), (2, 3, 11), (3, 4, 5)])
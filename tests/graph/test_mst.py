@@ -58,6 +58,23 @@ class TestMinimumSpanningTree(unittest.TestCase):
         for edge in mst_edges:
             self.assertTrue(edge in self.expected_edges)
 
+    def test_edges_weight_attribute(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(4)))
+        graph.add_edges_from(
+            [
+                (0, 1, {"weight": 3}),
+                (1, 2, {"weight": 1}),
+                (0, 2, {"weight": 2}),
+                (2, 3, {"weight": 4}),
+            ]
+        )
+        mst_edges = retworkx.minimum_spanning_edges(graph, weight_fn="weight")
+        self.assertEqual(
+            [(1, 2), (0, 2), (2, 3)],
+            [(edge[0], edge[1]) for edge in mst_edges],
+        )
+
     def test_tree(self):
         mst_graph = retworkx.minimum_spanning_tree(
             self.graph, weight_fn=lambda x: x
@@ -12,6 +12,8 @@
 
 import unittest
 
+import numpy
+
 import retworkx
 
 
@@ -41,3 +43,13 @@ class TestNeighbors(unittest.TestCase):
         graph = retworkx.PyGraph()
         node_a = graph.add_node("a")
         self.assertEqual([], graph.neighbors(node_a))
+
+    def test_neighbors_of(self):
+        graph = retworkx.PyGraph()
+        graph.extend_from_edge_list([(0, 2), (1, 0), (0, 2), (1, 2), (3, 3)])
+        offsets, indices = graph.neighbors_of(numpy.array([0, 3, 2, 5]))
+        numpy.testing.assert_array_equal(offsets, [0, 2, 3, 5, 5])
+        numpy.testing.assert_array_equal(indices, [1, 2, 3, 0, 1])
+        for node in range(4):
+            offsets, indices = graph.neighbors_of([node])
+            self.assertEqual(sorted(graph.neighbors(node)), list(indices))
@@ -47,3 +47,56 @@ class TestTransitivity(unittest.TestCase):
         graph.add_nodes_from(list(range(3)))
         res = retworkx.transitivity(graph)
         self.assertEqual(res, 0.0)
+
+    def test_transitivity_ignores_self_loops_and_parallel_edges(self):
+        graph = retworkx.PyGraph()
+        graph.add_nodes_from(list(range(4)))
+        graph.add_edges_from_no_data(
+            [(0, 1), (1, 2), (2, 0), (2, 3), (0, 1), (3, 3)]
+        )
+        res = retworkx.transitivity(graph)
+        self.assertEqual(res, 3 / 5)
+
+
+class TestTriangles(unittest.TestCase):
+    def setUp(self):
+        self.graph = retworkx.PyGraph()
+        self.graph.add_nodes_from(list(range(4)))
+        self.graph.add_edges_from_no_data([(0, 1), (1, 2), (2, 0), (2, 3)])
+
+    def test_triangles(self):
+        res = retworkx.triangles(self.graph)
+        self.assertEqual({0: 1, 1: 1, 2: 1, 3: 0}, res)
+
+    def test_local_clustering_coefficient(self):
+        res = retworkx.local_clustering_coefficient(self.graph)
+        self.assertEqual({0: 1.0, 1: 1.0, 2: 1 / 3, 3: 0.0}, res)
+
+    def test_triangles_complete_graph(self):
+        graph = retworkx.generators.mesh_graph(5)
+        self.assertEqual(
+            {node: 6 for node in range(5)}, retworkx.graph_triangles(graph)
+        )
+        self.assertEqual(
+            {node: 1.0 for node in range(5)},
+            retworkx.graph_local_clustering_coefficient(graph),
+        )
+
+    def test_triangles_with_removed_node(self):
+        self.graph.remove_node(1)
+        self.assertEqual({0: 0, 2: 0, 3: 0}, retworkx.triangles(self.graph))
+        self.assertEqual(
+            {0: 0.0, 2: 0.0, 3: 0.0},
+            retworkx.local_clustering_coefficient(self.graph),
+        )
+
+    def test_triangles_empty(self):
+        graph = retworkx.PyGraph()
+        self.assertEqual({}, retworkx.triangles(graph))
+        self.assertEqual({}, retworkx.local_clustering_coefficient(graph))
+
+    def test_triangles_invalid_type(self):
+        with self.assertRaises(TypeError):
+            retworkx.triangles(None)
+        with self.assertRaises(TypeError):
+            retworkx.local_clustering_coefficient(None)
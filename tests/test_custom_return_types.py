@@ -14,6 +14,8 @@ import copy
 import pickle
 import unittest
 
+import numpy
+
 import retworkx
 
 
@@ -150,6 +152,13 @@ class TestNodeIndicesComparisons(unittest.TestCase):
         # Assert hash is stable
         self.assertEqual(hash_res, hash(res))
 
+    def test_as_array(self):
+        self.dag.remove_node(0)
+        self.dag.add_node("c")
+        array = self.dag.node_indexes().as_array()
+        self.assertEqual(array.dtype, numpy.int64)
+        numpy.testing.assert_array_equal(array, numpy.array([0, 1]))
+
 
 class TestNodesCountMapping(unittest.TestCase):
     def setUp(self):
@@ -334,6 +343,11 @@ class TestEdgeIndicesComparisons(unittest.TestCase):
         # Assert hash is stable
         self.assertEqual(hash_res, hash(res))
 
+    def test_as_array(self):
+        array = self.dag.edge_indices().as_array()
+        self.assertEqual(array.dtype, numpy.int64)
+        numpy.testing.assert_array_equal(array, numpy.array([0, 1]))
+
 
 class TestEdgeListComparisons(unittest.TestCase):
     def setUp(self):
@@ -391,6 +405,16 @@ class TestEdgeListComparisons(unittest.TestCase):
         # Assert hash is stable
         self.assertEqual(hash_res, hash(res))
 
+    def test_as_array(self):
+        self.dag.add_child(1, "c", None)
+        array = self.dag.edge_list().as_array()
+        self.assertEqual(array.dtype, numpy.int64)
+        numpy.testing.assert_array_equal(array, numpy.array([[0, 1], [1, 2]]))
+
+    def test_as_array_empty(self):
+        array = retworkx.PyDiGraph().edge_list().as_array()
+        self.assertEqual(array.shape, (0, 2))
+
 
 class TestWeightedEdgeListComparisons(unittest.TestCase):
     def setUp(self):
@@ -731,6 +755,18 @@ class TestPathLengthMapping(unittest.TestCase):
         res = retworkx.dijkstra_shortest_path_lengths(self.dag, 0, self.fn)
         self.assertNotIn(0, res)
 
+    def test_as_arrays(self):
+        self.dag.add_child(1, "c", None)
+        res = retworkx.dijkstra_shortest_path_lengths(self.dag, 0, self.fn)
+        targets, lengths = res.as_arrays()
+        self.assertEqual(targets.dtype, numpy.int64)
+        self.assertEqual(lengths.dtype, numpy.float64)
+        self.assertEqual(list(targets), list(res.keys()))
+        self.assertEqual(list(lengths), list(res.values()))
+        self.assertEqual(
+            dict(zip(targets.tolist(), lengths.tolist())), {1: 1.0, 2: 2.0}
+        )
+
 
 class TestPos2DMapping(unittest.TestCase):
     def setUp(self):
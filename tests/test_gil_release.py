@@ -0,0 +1,97 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import threading
+import unittest
+
+import retworkx
+
+
+class TestGILRelease(unittest.TestCase):
+    def assertOtherThreadsProgress(self, func, *args, **kwargs):
+        """Assert that another Python thread makes progress during func.
+
+        A background thread counts loop iterations for as long as it holds
+        the GIL. If ``func`` held the GIL for its whole duration the count
+        couldn't change while it runs.
+        """
+        started = threading.Event()
+        stop = threading.Event()
+        count = [0]
+
+        def counter():
+            started.set()
+            while not stop.is_set():
+                count[0] += 1
+
+        thread = threading.Thread(target=counter)
+        thread.start()
+        try:
+            started.wait()
+            before = count[0]
+            func(*args, **kwargs)
+            progress = count[0] - before
+        finally:
+            stop.set()
+            thread.join()
+        self.assertGreater(progress, 0)
+
+    def test_digraph_distance_matrix(self):
+        graph = retworkx.generators.directed_grid_graph(
+            40, 40, bidirectional=True
+        )
+        self.assertOtherThreadsProgress(
+            retworkx.digraph_distance_matrix, graph, parallel_threshold=5000
+        )
+
+    def test_graph_distance_matrix(self):
+        graph = retworkx.generators.grid_graph(40, 40)
+        self.assertOtherThreadsProgress(
+            retworkx.graph_distance_matrix, graph, parallel_threshold=5000
+        )
+
+    def test_all_pairs_dijkstra_path_lengths(self):
+        graph = retworkx.generators.grid_graph(40, 40)
+        self.assertOtherThreadsProgress(
+            retworkx.all_pairs_dijkstra_path_lengths, graph, lambda _: 1.0
+        )
+
+    def test_floyd_warshall_numpy(self):
+        graph = retworkx.generators.grid_graph(30, 30)
+        self.assertOtherThreadsProgress(retworkx.floyd_warshall_numpy, graph)
+
+    def test_strongly_connected_components(self):
+        graph = retworkx.generators.directed_grid_graph(
+            300, 300, bidirectional=True
+        )
+        self.assertOtherThreadsProgress(
+            retworkx.strongly_connected_components, graph
+        )
+
+    def test_topological_sort(self):
+        graph = retworkx.generators.directed_grid_graph(300, 300)
+        self.assertOtherThreadsProgress(retworkx.topological_sort, graph)
+
+    def test_cycle_basis(self):
+        graph = retworkx.generators.grid_graph(150, 150)
+        self.assertOtherThreadsProgress(retworkx.cycle_basis, graph, 0)
+
+    def test_core_number(self):
+        graph = retworkx.generators.grid_graph(200, 200)
+        self.assertOtherThreadsProgress(retworkx.core_number, graph)
+
+    def test_is_isomorphic(self):
+        first = retworkx.generators.grid_graph(100, 100)
+        second = retworkx.generators.grid_graph(100, 100)
+        self.assertOtherThreadsProgress(
+            retworkx.is_isomorphic, first, second, id_order=True
+        )